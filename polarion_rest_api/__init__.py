@@ -7,5 +7,8 @@ __author__ = 'Your Name'
 __email__ = 'your.email@example.com'
 
 from .polarion_rest_api import PolarionRestApi
+from .async_polarion_rest_api import AsyncPolarionRestApi
+from .modules.scheduler import RequestScheduler
+from .modules.compound import CompoundDocument
 
-__all__ = ['PolarionRestApi']
+__all__ = ['PolarionRestApi', 'AsyncPolarionRestApi', 'RequestScheduler', 'CompoundDocument']
@@ -0,0 +1,197 @@
+"""
+Asynchronous Polarion REST API class.
+This class provides asyncio access to all Polarion REST API modules.
+"""
+from typing import Optional
+
+try:
+    # Try relative import (when used as package)
+    from .modules.async_base import AsyncPolarionBase, async_module, DEFAULT_MAX_CONNECTIONS
+    from .modules.collections import Collections
+    from .modules.document_attachments import DocumentAttachments
+    from .modules.document_comments import DocumentComments
+    from .modules.document_parts import DocumentParts
+    from .modules.documents import Documents
+    from .modules.enumerations import Enumerations
+    from .modules.externally_linked_work_items import ExternallyLinkedWorkItems
+    from .modules.feature_selections import FeatureSelections
+    from .modules.icons import Icons
+    from .modules.jobs import Jobs
+    from .modules.linked_oslc_resources import LinkedOslcResources
+    from .modules.linked_work_items import LinkedWorkItems
+    from .modules.page_attachments import PageAttachments
+    from .modules.pages import Pages
+    from .modules.plans import Plans
+    from .modules.project_templates import ProjectTemplates
+    from .modules.projects import Projects
+    from .modules.revisions import Revisions
+    from .modules.roles import Roles
+    from .modules.test_record_attachments import TestRecordAttachments
+    from .modules.test_records import TestRecords
+    from .modules.test_run_attachments import TestRunAttachments
+    from .modules.test_run_comments import TestRunComments
+    from .modules.test_runs import TestRuns
+    from .modules.test_step_result_attachments import TestStepResultAttachments
+    from .modules.test_step_results import TestStepResults
+    from .modules.test_steps import TestSteps
+    from .modules.user_groups import UserGroups
+    from .modules.users import Users
+    from .modules.work_item_approvals import WorkItemApprovals
+    from .modules.work_item_attachments import WorkItemAttachments
+    from .modules.work_item_comments import WorkItemComments
+    from .modules.work_item_work_records import WorkItemWorkRecords
+    from .modules.work_items import WorkItems
+except ImportError:
+    # Fall back to absolute import (when used as standalone script)
+    import os
+    import sys
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    modules_dir = os.path.join(current_dir, 'modules')
+    if modules_dir not in sys.path:
+        sys.path.insert(0, modules_dir)
+    from modules.async_base import AsyncPolarionBase, async_module, DEFAULT_MAX_CONNECTIONS
+    from modules.collections import Collections
+    from modules.document_attachments import DocumentAttachments
+    from modules.document_comments import DocumentComments
+    from modules.document_parts import DocumentParts
+    from modules.documents import Documents
+    from modules.enumerations import Enumerations
+    from modules.externally_linked_work_items import ExternallyLinkedWorkItems
+    from modules.feature_selections import FeatureSelections
+    from modules.icons import Icons
+    from modules.jobs import Jobs
+    from modules.linked_oslc_resources import LinkedOslcResources
+    from modules.linked_work_items import LinkedWorkItems
+    from modules.page_attachments import PageAttachments
+    from modules.pages import Pages
+    from modules.plans import Plans
+    from modules.project_templates import ProjectTemplates
+    from modules.projects import Projects
+    from modules.revisions import Revisions
+    from modules.roles import Roles
+    from modules.test_record_attachments import TestRecordAttachments
+    from modules.test_records import TestRecords
+    from modules.test_run_attachments import TestRunAttachments
+    from modules.test_run_comments import TestRunComments
+    from modules.test_runs import TestRuns
+    from modules.test_step_result_attachments import TestStepResultAttachments
+    from modules.test_step_results import TestStepResults
+    from modules.test_steps import TestSteps
+    from modules.user_groups import UserGroups
+    from modules.users import Users
+    from modules.work_item_approvals import WorkItemApprovals
+    from modules.work_item_attachments import WorkItemAttachments
+    from modules.work_item_comments import WorkItemComments
+    from modules.work_item_work_records import WorkItemWorkRecords
+    from modules.work_items import WorkItems
+
+
+# Module attribute names and classes, same as PolarionRestApi
+MODULES = {
+    'collections': Collections,
+    'document_attachments': DocumentAttachments,
+    'document_comments': DocumentComments,
+    'document_parts': DocumentParts,
+    'documents': Documents,
+    'enumerations': Enumerations,
+    'externally_linked_work_items': ExternallyLinkedWorkItems,
+    'feature_selections': FeatureSelections,
+    'icons': Icons,
+    'jobs': Jobs,
+    'linked_oslc_resources': LinkedOslcResources,
+    'linked_work_items': LinkedWorkItems,
+    'page_attachments': PageAttachments,
+    'pages': Pages,
+    'plans': Plans,
+    'project_templates': ProjectTemplates,
+    'projects': Projects,
+    'revisions': Revisions,
+    'roles': Roles,
+    'test_record_attachments': TestRecordAttachments,
+    'test_records': TestRecords,
+    'test_run_attachments': TestRunAttachments,
+    'test_run_comments': TestRunComments,
+    'test_runs': TestRuns,
+    'test_step_result_attachments': TestStepResultAttachments,
+    'test_step_results': TestStepResults,
+    'test_steps': TestSteps,
+    'user_groups': UserGroups,
+    'users': Users,
+    'work_item_approvals': WorkItemApprovals,
+    'work_item_attachments': WorkItemAttachments,
+    'work_item_comments': WorkItemComments,
+    'work_item_work_records': WorkItemWorkRecords,
+    'work_items': WorkItems,
+}
+
+
+class AsyncPolarionRestApi(AsyncPolarionBase):
+    """
+    Asynchronous variant of PolarionRestApi for asyncio applications.
+
+    Exposes the same modules and endpoint methods as PolarionRestApi, with the same
+    parameter handling, but every endpoint method is a coroutine returning an
+    httpx.Response. All modules share one httpx.AsyncClient, so its connection pool
+    bounds the number of requests in flight across the whole API object and hundreds
+    of concurrent requests can be awaited from a single thread.
+
+    The thread based bulk helpers (bulk_* and ingest_* methods) are only available on
+    PolarionRestApi; await the endpoint methods with asyncio.gather instead.
+
+    Requires the optional httpx dependency: pip install polarion-rest-api[async]
+    """
+
+    def __init__(self, base_url: str = "https://testdrive.polarion.com/polarion/rest/v1",
+                 token: Optional[str] = None,
+                 debug_request: bool = False,
+                 debug_response: bool = False,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 timeout: Optional[float] = None,
+                 client=None,
+                 validate_requests: bool = False):
+        """
+        Initialize asynchronous Polarion API client.
+
+        Args:
+            base_url: Base URL for Polarion REST API
+            token: Bearer token for authentication (can be set later using set_token())
+            debug_request: Enable debug mode to print request details (default: False)
+            debug_response: Enable debug mode to print response details (default: False)
+            max_connections: Size of the shared connection pool (default: 100)
+            timeout: Request timeout in seconds (default: None, no timeout)
+            client: Optional httpx.AsyncClient to use instead of creating one
+            validate_requests: Validate JSON request bodies against the request schemas of the
+                               OpenAPI specification before sending (default: False)
+
+        Example:
+            async with AsyncPolarionRestApi(token="your_bearer_token") as api:
+                responses = await asyncio.gather(*(
+                    api.work_items.get_work_item("project_id", work_item_id)
+                    for work_item_id in work_item_ids
+                ))
+        """
+        super().__init__(base_url, token, debug_request, debug_response, client=client,
+                         max_connections=max_connections, timeout=timeout)
+        self.validate_requests = validate_requests
+        self._load_modules()
+
+    def _load_modules(self):
+        """
+        Initialize all asynchronous module instances on the shared client.
+        """
+        for name, module_class in MODULES.items():
+            setattr(self, name, async_module(module_class)(
+                self.base_url, self._token, self.debug_request, self.debug_response, client=self._session
+            ))
+            getattr(self, name).validate_requests = self.validate_requests
+
+    def set_token(self, token: str):
+        """
+        Set or update the authentication token of the shared client.
+
+        Args:
+            token: Bearer token for authentication
+        """
+        super().set_token(token)
+        for name in MODULES:
+            getattr(self, name)._token = token
@@ -3,26 +3,47 @@ Modules package for Polarion REST API
 """
 
 __all__ = [
+    'async_base',
+    'attachment_mirror',
     'base',
+    'builders',
+    'bulk',
     'collections',
+    'columnar',
+    'compound',
     'document_attachments',
     'document_comments',
     'document_parts',
     'documents',
+    'downloads',
     'enumerations',
     'externally_linked_work_items',
+    'fanout',
     'feature_selections',
     'icons',
+    'job_waiter',
     'jobs',
+    'journal',
+    'json_backend',
+    'json_benchmark',
     'linked_oslc_resources',
     'linked_work_items',
+    'model',
+    'model_generator',
+    'models',
+    'multipart',
     'page_attachments',
     'pages',
+    'pagination',
     'plans',
+    'project_mirror',
     'project_templates',
     'projects',
+    'request_schemas',
     'revisions',
     'roles',
+    'scheduler',
+    'schema_generator',
     'test_record_attachments',
     'test_records',
     'test_run_attachments',
@@ -31,11 +52,14 @@ __all__ = [
     'test_step_result_attachments',
     'test_step_results',
     'test_steps',
+    'unit_of_work',
     'user_groups',
     'users',
+    'validation',
     'work_item_approvals',
     'work_item_attachments',
     'work_item_comments',
     'work_item_work_records',
     'work_items',
+    'xunit',
 ]
@@ -0,0 +1,325 @@
+"""
+Asynchronous base module for Polarion REST API communication.
+Contains the base class turning any API module into its asyncio counterpart,
+sending requests through a shared non-blocking httpx client.
+"""
+import asyncio
+import functools
+import os
+from typing import Optional, Dict, Any, AsyncIterator, BinaryIO, Type, Union
+from .base import PolarionBase
+from .json_backend import encode_body
+from .validation import validate_request
+
+try:
+    import httpx
+except ImportError:  # Optional dependency: pip install polarion-rest-api[async]
+    httpx = None
+
+
+DEFAULT_MAX_CONNECTIONS = 100
+
+# Number of bytes read per chunk of a streamed file body
+FILE_CHUNK_SIZE = 1024 * 1024
+
+# Headers of the bodies encoded with the JSON backend
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Methods driving their requests from worker threads (bulk, job waiting, streaming and upload
+# helpers). They are not available on the asynchronous modules, where asyncio.gather over
+# the endpoint methods gives the same concurrency without threads.
+SYNC_ONLY_PREFIXES = ('bulk_', 'ingest_', 'submit_', 'stream_', 'save_', 'upload_', 'wait_', 'job_waiter')
+
+
+def create_client(max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                  timeout: Optional[float] = None) -> 'httpx.AsyncClient':
+    """
+    Create the httpx client whose connection pool is shared by all asynchronous modules.
+
+    Args:
+        max_connections: Maximum number of concurrent connections (default: 100)
+        timeout: Request timeout in seconds (default: None, no timeout like requests)
+
+    Returns:
+        httpx.AsyncClient instance
+
+    Raises:
+        ImportError: If httpx is not installed
+    """
+    if httpx is None:
+        raise ImportError("The asynchronous client requires httpx: pip install polarion-rest-api[async]")
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        timeout=httpx.Timeout(timeout)
+    )
+
+
+class AsyncPolarionBase(PolarionBase):
+    """
+    Base class for asynchronous Polarion REST API communication.
+
+    Overrides the HTTP helpers of PolarionBase with coroutines sending the requests
+    through an httpx.AsyncClient. Module methods return the result of these helpers,
+    so every endpoint method of a module combined with this class returns an awaitable
+    resolving to an httpx.Response, while parameter handling (_apply_default_fields,
+    body validation) stays exactly the same as in the synchronous client.
+    """
+
+    def __init__(self, base_url: str, token: Optional[str] = None, debug_request: bool = False,
+                 debug_response: bool = False, client: Optional['httpx.AsyncClient'] = None,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS, timeout: Optional[float] = None):
+        """
+        Initialize the asynchronous base class.
+
+        Args:
+            base_url: Base URL for Polarion REST API (e.g., 'https://testdrive.polarion.com/polarion/rest/v1')
+            token: Bearer token for authentication
+            debug_request: Enable debug mode to print request details (default: False)
+            debug_response: Enable debug mode to print response details (default: False)
+            client: Shared httpx.AsyncClient (a new one, closed by close(), is created if omitted)
+            max_connections: Size of the connection pool of a created client (default: 100)
+            timeout: Request timeout in seconds of a created client (default: None, no timeout)
+        """
+        self.base_url = base_url.rstrip('/')
+        self._token = token
+        self.debug_request = debug_request
+        self.debug_response = debug_response
+        self._owns_client = client is None
+        self._session = client if client is not None else create_client(max_connections, timeout)
+        self._update_headers()
+
+    def _update_headers(self):
+        """
+        Update client headers with authentication token.
+        Content-Type is set per request by httpx (JSON, form or multipart body).
+        """
+        headers = {'Accept': 'application/json'}
+
+        if self._token:
+            headers['Authorization'] = f'Bearer {self._token}'
+
+        self._session.headers.update(headers)
+
+    def _ensure_pool_size(self, size: int):
+        """
+        No-op: the shared client pool is sized by max_connections.
+        """
+
+    async def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> 'httpx.Response':
+        """
+        Perform GET request.
+
+        Args:
+            endpoint: API endpoint (will be appended to base_url)
+            params: Query parameters
+
+        Returns:
+            Response object
+        """
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        self._print_request_debug('GET', url, params=params)
+        response = await self._session.get(url, params=params)
+        self._print_response_debug('GET', response)
+        return response
+
+    async def _send_body(self, method: str, endpoint: str, data: Optional[Any] = None,
+                         json: Optional[Dict[str, Any]] = None,
+                         files: Optional[Any] = None,
+                         params: Optional[Dict[str, Any]] = None,
+                         headers: Optional[Dict[str, str]] = None) -> 'httpx.Response':
+        """
+        Perform a request with a JSON, form, binary or multipart body.
+        """
+        if isinstance(json, dict) and self.validate_requests:
+            validate_request(method, endpoint, json)
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        self._print_request_debug(method, url, params=params, json_data=json, form_data=data, files=files)
+        kwargs: Dict[str, Any] = {'params': params, 'files': files}
+        if headers:
+            kwargs['headers'] = headers
+        if json is not None and data is None and files is None:
+            kwargs['content'] = encode_body(json)
+            kwargs['headers'] = dict(JSON_HEADERS, **(headers or {}))
+        elif isinstance(data, (bytes, bytearray, str)) or hasattr(data, '__aiter__'):
+            kwargs['content'] = data
+        else:
+            kwargs['json'] = json
+            kwargs['data'] = data
+        response = await self._session.request(method, url, **kwargs)
+        self._print_response_debug(method, response)
+        return response
+
+    async def _post(self, endpoint: str, data: Optional[Dict[str, Any]] = None,
+                    json: Optional[Dict[str, Any]] = None,
+                    files: Optional[Any] = None,
+                    params: Optional[Dict[str, Any]] = None,
+                    headers: Optional[Dict[str, str]] = None) -> 'httpx.Response':
+        """
+        Perform POST request.
+
+        Args:
+            endpoint: API endpoint (will be appended to base_url)
+            data: Form data (or raw bytes)
+            json: JSON data
+            files: Files for multipart/form-data upload (can be dict or list of tuples)
+            params: Query parameters
+            headers: Additional request headers
+
+        Returns:
+            Response object
+        """
+        return await self._send_body('POST', endpoint, data=data, json=json, files=files, params=params,
+                                     headers=headers)
+
+    async def _patch(self, endpoint: str, data: Optional[Dict[str, Any]] = None,
+                     json: Optional[Dict[str, Any]] = None,
+                     files: Optional[Dict[str, Any]] = None,
+                     params: Optional[Dict[str, Any]] = None,
+                     headers: Optional[Dict[str, str]] = None) -> 'httpx.Response':
+        """
+        Perform PATCH request.
+
+        Args:
+            endpoint: API endpoint (will be appended to base_url)
+            data: Form data (or raw bytes)
+            json: JSON data
+            files: Files for multipart/form-data upload
+            params: Query parameters
+            headers: Additional request headers
+
+        Returns:
+            Response object
+        """
+        return await self._send_body('PATCH', endpoint, data=data, json=json, files=files, params=params,
+                                     headers=headers)
+
+    async def _post_file(self, endpoint: str, source: Union[bytes, BinaryIO, str, os.PathLike],
+                         headers: Optional[Dict[str, str]] = None) -> 'httpx.Response':
+        """
+        Perform POST request with a raw body given as bytes, a binary file object or a path.
+        Files are read chunk by chunk (off the event loop) while the request is sent and
+        a path is kept open until the response arrives.
+        """
+        if isinstance(source, (bytes, bytearray)):
+            return await self._post(endpoint, data=source, headers=headers)
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'rb') as file:
+                return await self._post(endpoint, data=_read_chunks(file), headers=_with_length(headers, file))
+        return await self._post(endpoint, data=_read_chunks(source), headers=_with_length(headers, source))
+
+    async def _delete(self, endpoint: str, json: Optional[Dict[str, Any]] = None) -> 'httpx.Response':
+        """
+        Perform DELETE request.
+
+        Args:
+            endpoint: API endpoint (will be appended to base_url)
+            json: JSON data (for DELETE requests with body)
+
+        Returns:
+            Response object
+        """
+        if isinstance(json, dict) and self.validate_requests:
+            validate_request('DELETE', endpoint, json)
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        self._print_request_debug('DELETE', url, json_data=json)
+        if json is None:
+            response = await self._session.request('DELETE', url)
+        else:
+            response = await self._session.request('DELETE', url, content=encode_body(json), headers=JSON_HEADERS)
+        self._print_response_debug('DELETE', response)
+        return response
+
+    async def _delete_with_body(self, endpoint: str, json: Optional[Dict[str, Any]] = None,
+                                **kwargs) -> 'httpx.Response':
+        """
+        Perform DELETE request with JSON body.
+        Replaces the requests based _delete_with_body helpers of the modules.
+
+        Args:
+            endpoint: API endpoint (will be appended to base_url)
+            json: JSON data
+
+        Returns:
+            Response object
+        """
+        return await self._delete(endpoint, json=json)
+
+    async def close(self):
+        """
+        Close the client, if it is owned by this instance.
+        """
+        if self._owns_client:
+            await self._session.aclose()
+
+    async def __aenter__(self):
+        """
+        Async context manager entry.
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """
+        Async context manager exit - closes the client.
+        """
+        await self.close()
+
+
+async def _read_chunks(file: BinaryIO) -> AsyncIterator[bytes]:
+    """
+    Read a binary file in chunks without blocking the event loop.
+    """
+    while True:
+        chunk = await asyncio.to_thread(file.read, FILE_CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _with_length(headers: Optional[Dict[str, str]], file: BinaryIO) -> Optional[Dict[str, str]]:
+    """
+    Add the Content-Length of the rest of a file to the headers, when it can be known.
+    """
+    try:
+        length = os.fstat(file.fileno()).st_size - file.tell()
+    except (AttributeError, OSError, ValueError):
+        return headers
+    return dict(headers or {}, **{'Content-Length': str(length)})
+
+
+def _sync_only(name: str, is_property: bool = False) -> Any:
+    """
+    Build a stand-in for a thread based helper (method or property) on an asynchronous module.
+    """
+    def method(self, *args, **kwargs):
+        raise NotImplementedError(
+            f"{name} sends its requests from worker threads and is only available on PolarionRestApi; "
+            f"await the endpoint methods with asyncio.gather instead"
+        )
+    method.__name__ = name
+    return property(method) if is_property else method
+
+
+@functools.lru_cache(maxsize=None)
+def async_module(module_class: Type[PolarionBase]) -> Type[AsyncPolarionBase]:
+    """
+    Create the asynchronous counterpart of an API module class.
+
+    Args:
+        module_class: Module class, e.g. WorkItems
+
+    Returns:
+        Class named Async<module_class> whose endpoint methods are coroutines
+
+    Example:
+        >>> AsyncWorkItems = async_module(WorkItems)
+        >>> work_items = AsyncWorkItems(base_url, token)
+        >>> response = await work_items.get_work_items("MyProjectId")
+    """
+    namespace = {
+        name: _sync_only(name, isinstance(getattr(module_class, name), property))
+        for name in dir(module_class)
+        if name.startswith(SYNC_ONLY_PREFIXES)
+    }
+    namespace['__doc__'] = f"Asynchronous variant of {module_class.__name__}.\n{module_class.__doc__ or ''}"
+    namespace['__module__'] = module_class.__module__
+    return type(f"Async{module_class.__name__}", (AsyncPolarionBase, module_class), namespace)
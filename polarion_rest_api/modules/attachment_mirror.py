@@ -0,0 +1,434 @@
+"""
+Attachment mirror module for Polarion REST API.
+Mirrors every attachment of a project (work items, documents, pages, test runs,
+test records and test step results) into a local content-addressed store,
+downloading concurrently, deduplicating by hash and skipping unchanged files.
+"""
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List, Tuple
+from .compound import CompoundDocument
+from .downloads import DEFAULT_ALGORITHM
+from .fanout import FanOut, DEFAULT_MAX_WORKERS
+from .journal import content_key
+from .json_backend import response_json
+from .pagination import iter_resources
+
+
+# Kinds of attachment owners: kind -> (attachments module attribute, list method,
+# streaming save method)
+KINDS = {
+    'workitem': ('work_item_attachments', 'get_work_item_attachments', 'save_work_item_attachment_content'),
+    'document': ('document_attachments', 'get_document_attachments', 'save_document_attachment_content'),
+    'page': ('page_attachments', None, 'save_page_attachment_content'),    # listed with Pages.get_page
+    'testrun': ('test_run_attachments', 'get_test_run_attachments', 'save_test_run_attachment_content'),
+    'testrecord': ('test_record_attachments', 'get_test_record_attachments', 'save_test_record_attachment_content'),
+    'teststepresult': ('test_step_result_attachments', 'get_test_step_result_attachments',
+                       'save_test_step_result_attachment_content'),
+}
+
+# Attachment attributes identifying a version of the file content
+FINGERPRINT_ATTRIBUTES = ('fileName', 'length', 'updated', 'contentType', 'revision')
+
+# Outcomes of a mirrored attachment
+DOWNLOADED = 'downloaded'        # new content, stored
+DEDUPLICATED = 'deduplicated'    # downloaded, but the content was already stored
+UNCHANGED = 'unchanged'          # fingerprint unchanged and content present, not downloaded
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS attachments (
+    project_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    attachment_id TEXT NOT NULL,
+    file_name TEXT,
+    fingerprint TEXT NOT NULL,
+    checksum TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mirrored_at REAL NOT NULL,
+    PRIMARY KEY (project_id, kind, owner, attachment_id)
+)
+"""
+
+
+class AttachmentRef:
+    """
+    An attachment found in the project.
+
+    Attributes:
+        kind: Owner kind ('workitem', 'document', 'page', 'testrun', 'testrecord', 'teststepresult')
+        owner: Path of the owner below the project, e.g. ('MyTestRunId',) or
+               ('MyTestRunId', 'MyProjectId', 'MyTestCaseId', '0')
+        attachment_id: The Attachment ID
+        file_name: File name of the attachment
+        fingerprint: Digest of the attachment attributes identifying its content version
+    """
+
+    __slots__ = ('kind', 'owner', 'attachment_id', 'file_name', 'fingerprint')
+
+    def __init__(self, kind: str, owner: Tuple[str, ...], attachment_id: str,
+                 file_name: Optional[str], fingerprint: str):
+        self.kind = kind
+        self.owner = owner
+        self.attachment_id = attachment_id
+        self.file_name = file_name
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def from_resource(cls, kind: str, owner: Tuple[str, ...], resource: Dict[str, Any]) -> 'AttachmentRef':
+        """
+        Build the reference of an attachment from its JSON:API resource.
+        """
+        attributes = resource.get('attributes') or {}
+        attachment_id = attributes.get('id') or str(resource.get('id', '')).rsplit('/', 1)[-1]
+        version = {name: attributes[name] for name in FINGERPRINT_ATTRIBUTES if name in attributes}
+        return cls(kind, owner, attachment_id, attributes.get('fileName'), content_key(version))
+
+    def __repr__(self) -> str:
+        return f"AttachmentRef(kind={self.kind!r}, owner={self.owner!r}, attachment_id={self.attachment_id!r})"
+
+
+class MirrorFailure:
+    """
+    An owner that could not be listed or an attachment that could not be mirrored.
+
+    Attributes:
+        kind: Owner kind
+        owner: Path of the owner below the project
+        attachment_id: The Attachment ID, None when listing the owner failed
+        error: Exception raised
+    """
+
+    __slots__ = ('kind', 'owner', 'attachment_id', 'error')
+
+    def __init__(self, kind: str, owner: Tuple[str, ...], attachment_id: Optional[str], error: BaseException):
+        self.kind = kind
+        self.owner = owner
+        self.attachment_id = attachment_id
+        self.error = error
+
+    def __repr__(self) -> str:
+        return (f"MirrorFailure(kind={self.kind!r}, owner={self.owner!r}, "
+                f"attachment_id={self.attachment_id!r}, error={self.error!r})")
+
+
+class MirrorResult:
+    """
+    Outcome of a mirror run.
+
+    Attributes:
+        downloaded: Attachments downloaded with new content
+        deduplicated: Attachments downloaded whose content was already stored
+        unchanged: Attachments skipped because they did not change
+        bytes_downloaded: Number of bytes downloaded
+        failed: MirrorFailure objects
+    """
+
+    def __init__(self):
+        self.downloaded = 0
+        self.deduplicated = 0
+        self.unchanged = 0
+        self.bytes_downloaded = 0
+        self.failed: List[MirrorFailure] = []
+
+    @property
+    def total(self) -> int:
+        """
+        Number of attachments processed.
+        """
+        return self.downloaded + self.deduplicated + self.unchanged + len(self.failed)
+
+    @property
+    def ok(self) -> bool:
+        """
+        True when every owner was listed and every attachment mirrored.
+        """
+        return not self.failed
+
+    def __repr__(self) -> str:
+        return (f"MirrorResult(downloaded={self.downloaded}, deduplicated={self.deduplicated}, "
+                f"unchanged={self.unchanged}, failed={len(self.failed)}, bytes={self.bytes_downloaded})")
+
+
+class MirrorManifest:
+    """
+    Local record of the mirrored attachments, backed by SQLite.
+
+    Each attachment is recorded once its content is stored, so a run that was
+    interrupted resumes where it stopped.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the manifest.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(_SCHEMA)
+
+    def get(self, project_id: str, ref: AttachmentRef) -> Optional[Tuple[str, str, int]]:
+        """
+        Return (fingerprint, checksum, size) of a mirrored attachment, None if never mirrored.
+        """
+        with self._lock:
+            return self._connection.execute(
+                'SELECT fingerprint, checksum, size FROM attachments '
+                'WHERE project_id = ? AND kind = ? AND owner = ? AND attachment_id = ?',
+                (project_id, ref.kind, '/'.join(ref.owner), ref.attachment_id)
+            ).fetchone()
+
+    def record(self, project_id: str, ref: AttachmentRef, checksum: str, size: int):
+        """
+        Record the stored content of an attachment.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO attachments '
+                '(project_id, kind, owner, attachment_id, file_name, fingerprint, checksum, size, mirrored_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (project_id, ref.kind, '/'.join(ref.owner), ref.attachment_id, ref.file_name,
+                 ref.fingerprint, checksum, size, time.time())
+            )
+
+    def entries(self, project_id: str) -> List[Tuple[str, str, str, Optional[str], str, int]]:
+        """
+        Return (kind, owner, attachment_id, file_name, checksum, size) of the mirrored attachments of a project.
+        """
+        with self._lock:
+            return self._connection.execute(
+                'SELECT kind, owner, attachment_id, file_name, checksum, size FROM attachments '
+                'WHERE project_id = ? ORDER BY kind, owner, attachment_id', (project_id,)
+            ).fetchall()
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+
+class AttachmentMirror:
+    """
+    Mirror of the attachments of a project in a local content-addressed store.
+
+    The store directory contains:
+        - objects/<checksum[:2]>/<checksum>: attachment contents, stored once per content
+        - manifest.db: which attachment has which content (see MirrorManifest)
+        - tmp/: downloads in progress
+
+    Owners are listed and attachments downloaded concurrently, through the API
+    modules of one client. An attachment whose attributes (file name, length,
+    update time...) did not change since the last run and whose content is
+    present is not downloaded again. Contents shared by several attachments are
+    stored once.
+
+    Example:
+        >>> with AttachmentMirror(api, "/backup/polarion") as mirror:
+        ...     result = mirror.run("MyProjectId", documents=[("_default", "MyDocument")])
+        >>> print(result.downloaded, result.unchanged, result.failed)
+    """
+
+    def __init__(self, api: Any, root: str,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 algorithm: str = DEFAULT_ALGORITHM):
+        """
+        Initialize the mirror.
+
+        Args:
+            api: PolarionRestApi (or any object exposing its modules as attributes)
+            root: Directory of the store (created if missing)
+            max_workers: Maximum number of listing and download requests in parallel (default: 8)
+            algorithm: hashlib algorithm addressing the contents (default: 'sha256')
+        """
+        self.api = api
+        self.root = os.fspath(root)
+        self.max_workers = max_workers
+        self.algorithm = algorithm
+        os.makedirs(os.path.join(self.root, 'objects'), exist_ok=True)
+        self._tmp = os.path.join(self.root, 'tmp')
+        self.manifest = MirrorManifest(os.path.join(self.root, 'manifest.db'))
+        # Serializes storing objects, so two downloads of the same content are counted once
+        self._store_lock = threading.Lock()
+
+    def object_path(self, checksum: str) -> str:
+        """
+        Return the path of the stored content with the given checksum.
+        """
+        return os.path.join(self.root, 'objects', checksum[:2], checksum)
+
+    def run(self, project_id: str,
+            documents: Iterable[Tuple[str, str]] = (),
+            pages: Iterable[Tuple[str, str]] = (),
+            kinds: Iterable[str] = tuple(KINDS),
+            on_progress: Optional[Callable[[MirrorResult], None]] = None) -> MirrorResult:
+        """
+        Mirror the attachments of a project.
+
+        Work items, test runs, test records and test step results are discovered
+        through the list endpoints. Documents and pages cannot be listed through the
+        REST API and are given explicitly.
+
+        Args:
+            project_id: The Project ID
+            documents: (space_id, document_name) of the documents to mirror
+            pages: (space_id, page_name) of the pages to mirror
+            kinds: Owner kinds to mirror (default: all of KINDS)
+            on_progress: Optional callable invoked with the MirrorResult after every attachment
+
+        Returns:
+            MirrorResult with the outcome counters and failures
+
+        Raises:
+            ValueError: If a kind is unknown
+            requests.HTTPError: If the work items, test runs or test records cannot be listed
+        """
+        kinds = set(kinds)
+        unknown = kinds - set(KINDS)
+        if unknown:
+            raise ValueError(f"Unknown attachment kinds {sorted(unknown)}, expected some of {list(KINDS)}")
+        # Downloads interrupted by a previous run are restarted from scratch
+        shutil.rmtree(self._tmp, ignore_errors=True)
+        os.makedirs(self._tmp, exist_ok=True)
+        ensure_pool_size = getattr(self.api, '_ensure_pool_size', None)
+        if ensure_pool_size is not None:
+            ensure_pool_size(self.max_workers * 2)
+
+        result = MirrorResult()
+        owners = self._owners(project_id, kinds, documents, pages)
+        listings = FanOut(self._list_owner, ((project_id, kind, owner, kinds) for kind, owner in owners),
+                          max_workers=self.max_workers, ordered=False)
+
+        def refs() -> Iterator[AttachmentRef]:
+            for listing in listings:
+                if listing.error is not None:
+                    kind, owner = listing.args[1:3]
+                    result.failed.append(MirrorFailure(kind, owner, None, listing.error))
+                    continue
+                yield from listing.value
+
+        mirrored = FanOut(self._mirror_one, ((project_id, ref) for ref in refs()),
+                          max_workers=self.max_workers, ordered=False)
+        for call in mirrored:
+            ref = call.args[1]
+            if call.error is not None:
+                result.failed.append(MirrorFailure(ref.kind, ref.owner, ref.attachment_id, call.error))
+            else:
+                outcome, size = call.value
+                setattr(result, outcome, getattr(result, outcome) + 1)
+                if outcome != UNCHANGED:
+                    result.bytes_downloaded += size
+            if on_progress is not None:
+                on_progress(result)
+        return result
+
+    def _owners(self, project_id: str, kinds: set,
+                documents: Iterable[Tuple[str, str]],
+                pages: Iterable[Tuple[str, str]]) -> Iterator[Tuple[str, Tuple[str, ...]]]:
+        """
+        Yield (kind, owner) of every attachment owner of the project.
+
+        Test step results are listed per test record in _list_owner.
+        """
+        if 'workitem' in kinds:
+            for work_item in iter_resources(self.api.work_items.get_work_items, project_id):
+                yield 'workitem', _owner_of(work_item)
+        for space_id, document_name in documents if 'document' in kinds else ():
+            yield 'document', (space_id, document_name)
+        for space_id, page_name in pages if 'page' in kinds else ():
+            yield 'page', (space_id, page_name)
+        if kinds & {'testrun', 'testrecord', 'teststepresult'}:
+            for test_run in iter_resources(self.api.test_runs.get_test_runs, project_id):
+                run_owner = _owner_of(test_run)
+                if 'testrun' in kinds:
+                    yield 'testrun', run_owner
+                if kinds & {'testrecord', 'teststepresult'}:
+                    for test_record in iter_resources(self.api.test_records.get_test_records,
+                                                      project_id, run_owner[0]):
+                        yield 'testrecord', _owner_of(test_record)
+
+    def _list_owner(self, project_id: str, kind: str, owner: Tuple[str, ...], kinds: set) -> List[AttachmentRef]:
+        """
+        List the attachments of one owner (and of the test step results of a test record).
+        """
+        module_name, list_method, _ = KINDS[kind]
+        refs = []
+        if kind == 'page':
+            response = self.api.pages.get_page(project_id, *owner, include='attachments')
+            if response.status_code >= 300:
+                raise ValueError(f"Listing the attachments of page {'/'.join(owner)} failed "
+                                 f"(status {response.status_code})")
+            document = CompoundDocument(response_json(response))
+            return [AttachmentRef.from_resource(kind, owner, attachment.raw)
+                    for attachment in document.resources('page_attachments')]
+
+        if kind in kinds:
+            method = getattr(getattr(self.api, module_name), list_method)
+            refs.extend(AttachmentRef.from_resource(kind, owner, resource)
+                        for resource in iter_resources(method, project_id, *owner))
+        if kind == 'testrecord' and 'teststepresult' in kinds:
+            list_step_attachments = self.api.test_step_result_attachments.get_test_step_result_attachments
+            for step_result in iter_resources(self.api.test_step_results.get_test_step_results, project_id, *owner):
+                step_owner = _owner_of(step_result)
+                refs.extend(AttachmentRef.from_resource('teststepresult', step_owner, resource)
+                            for resource in iter_resources(list_step_attachments, project_id, *step_owner))
+        return refs
+
+    def _mirror_one(self, project_id: str, ref: AttachmentRef) -> Tuple[str, int]:
+        """
+        Mirror one attachment and return (outcome, size).
+        """
+        known = self.manifest.get(project_id, ref)
+        if known is not None:
+            fingerprint, checksum, size = known
+            if fingerprint == ref.fingerprint and os.path.exists(self.object_path(checksum)):
+                return UNCHANGED, size
+
+        module_name, _, save_method = KINDS[ref.kind]
+        save = getattr(getattr(self.api, module_name), save_method)
+        download_path = os.path.join(self._tmp, uuid.uuid4().hex)
+        try:
+            download = save(project_id, *ref.owner, ref.attachment_id, download_path, algorithm=self.algorithm)
+            object_path = self.object_path(download.checksum)
+            with self._store_lock:
+                if os.path.exists(object_path):
+                    outcome = DEDUPLICATED
+                else:
+                    os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                    os.replace(download_path, object_path)
+                    outcome = DOWNLOADED
+        finally:
+            if os.path.exists(download_path):
+                os.remove(download_path)
+        self.manifest.record(project_id, ref, download.checksum, download.size)
+        return outcome, download.size
+
+    def close(self):
+        """
+        Close the manifest.
+        """
+        self.manifest.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _owner_of(resource: Dict[str, Any]) -> Tuple[str, ...]:
+    """
+    Return the path below the project of a resource ID, e.g.
+    'MyProjectId/MyTestRunId/MyProjectId/MyTestCaseId/0' -> ('MyTestRunId', 'MyProjectId', 'MyTestCaseId', '0').
+    """
+    return tuple(str(resource.get('id', '')).split('/')[1:])
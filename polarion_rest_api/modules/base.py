@@ -2,8 +2,22 @@
 Base module for Polarion REST API communication.
 Contains the base class for storing authentication token and common HTTP methods.
 """
+import os
+import threading
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, Callable, List, Union, BinaryIO
+from .compound import CompoundDocument
+from .json_backend import JsonSession
+from .model import Model, decode_models
+from .validation import validate_request, item_validator
+
+
+# Serializes the growth of the connection pools of sessions shared by several modules
+_POOL_LOCK = threading.Lock()
+
+# Attribute of a session holding the JobWaiter shared by the modules using it (see jobs.shared_job_waiter)
+JOB_WAITER_ATTRIBUTE = '_polarion_job_waiter'
 
 
 class PolarionBase:
@@ -12,7 +26,16 @@ class PolarionBase:
     Stores authentication token and provides common HTTP methods.
     """
     
-    def __init__(self, base_url: str, token: Optional[str] = None, debug_request: bool = False, debug_response: bool = False):
+    # Optional RequestScheduler admitting the requests by priority class
+    # (set on all modules by PolarionRestApi.set_scheduler)
+    _scheduler = None
+    
+    # Validate JSON request bodies against the request schemas before sending
+    # (set on all modules by PolarionRestApi.set_request_validation)
+    validate_requests = False
+    
+    def __init__(self, base_url: str, token: Optional[str] = None, debug_request: bool = False, debug_response: bool = False,
+                 session: Optional[requests.Session] = None):
         """
         Initialize the base class.
         
@@ -21,12 +44,13 @@ class PolarionBase:
             token: Bearer token for authentication
             debug_request: Enable debug mode to print request details (default: False)
             debug_response: Enable debug mode to print response details (default: False)
+            session: Optional session to share its connection pool (a new JsonSession is created if omitted)
         """
         self.base_url = base_url.rstrip('/')
         self._token = token
         self.debug_request = debug_request
         self.debug_response = debug_response
-        self._session = requests.Session()
+        self._session = session if session is not None else JsonSession()
         self._update_headers()
     
     def set_token(self, token: str):
@@ -62,6 +86,50 @@ class PolarionBase:
         
         self._session.headers.update(headers)
     
+    def _ensure_pool_size(self, size: int):
+        """
+        Make sure the session connection pool can serve `size` parallel requests.
+        
+        Used by bulk methods before sending requests from several threads, so that
+        connections are reused instead of being discarded when the pool is full.
+        The size is read from the adapter mounted on the session, which is shared by
+        all modules of a client, so the pool only ever grows. Custom transport
+        adapters are left in place.
+        
+        Args:
+            size: Number of connections that may be used in parallel
+        """
+        adapters = getattr(self._session, 'adapters', None)
+        if not isinstance(adapters, dict):
+            return
+        with _POOL_LOCK:
+            current = adapters.get('https://')
+            if not isinstance(current, HTTPAdapter) or size <= current._pool_maxsize:
+                return
+            previous = {current, adapters.get('http://')}
+            adapter = HTTPAdapter(pool_connections=size, pool_maxsize=size, max_retries=current.max_retries)
+            self._session.mount('https://', adapter)
+            self._session.mount('http://', adapter)
+            for old in previous:
+                if isinstance(old, HTTPAdapter):
+                    old.close()
+    
+    def _send(self, send: Callable[..., requests.Response], *args, **kwargs) -> requests.Response:
+        """
+        Call a session method, waiting for a slot of the request scheduler if one is set.
+        
+        Args:
+            send: Session method (e.g. self._session.get)
+            *args, **kwargs: Arguments of the session method
+            
+        Returns:
+            Response object
+        """
+        if self._scheduler is None:
+            return send(*args, **kwargs)
+        with self._scheduler.slot():
+            return send(*args, **kwargs)
+    
     def _print_request_debug(self, method: str, url: str, 
                             params: Optional[Dict[str, Any]] = None,
                             json_data: Optional[Dict[str, Any]] = None,
@@ -99,6 +167,8 @@ class PolarionBase:
         if json_data:
             print(f"\nJSON Body:")
             import json as json_lib
+            if isinstance(json_data, (bytes, bytearray)):
+                json_data = json_lib.loads(json_data)
             print(f"  {json_lib.dumps(json_data, indent=2)}")
         
         # Print form data
@@ -137,7 +207,9 @@ class PolarionBase:
         print("\n" + "="*70)
         print(f"POLARION API RESPONSE (_{method.lower()} method):")
         print("="*70)
-        print(f"Status Code: {response.status_code} {response.reason}")
+        # requests exposes the reason phrase as 'reason', httpx as 'reason_phrase'
+        reason = getattr(response, 'reason', None) or getattr(response, 'reason_phrase', '')
+        print(f"Status Code: {response.status_code} {reason}")
         print(f"URL: {response.url}")
         
         # Print response headers
@@ -221,6 +293,53 @@ class PolarionBase:
         
         return result
     
+    def decode(self, response: requests.Response) -> CompoundDocument:
+        """
+        Decode a JSON:API response of any module into a CompoundDocument.
+        
+        The (type, id) index of the primary data and of the 'included' resources is
+        built once, so relationships of resources fetched with include= resolve in
+        constant time (resource.related('author')).
+        
+        Args:
+            response: Response of a module method
+            
+        Returns:
+            CompoundDocument of the response body
+            
+        Raises:
+            requests.HTTPError: If the response is an error response
+            
+        Example:
+            >>> document = api.decode(api.work_items.get_work_items("MyProjectId", include="author"))
+            >>> [(wi['title'], wi.related('author')['name']) for wi in document]
+        """
+        return CompoundDocument.from_response(response)
+    
+    def decode_models(self, response: requests.Response) -> Union[Model, List[Model], None]:
+        """
+        Decode the primary data of a JSON:API response into typed models.
+        
+        Models are generated from the OpenAPI specification (see modules/models.py)
+        and keep their attributes as compact JSON until the first access, so large
+        result sets take a fraction of the memory of the decoded dictionaries.
+        
+        Args:
+            response: Response of a module method
+            
+        Returns:
+            A list of models for list endpoints, a model for single resource endpoints,
+            None when the response has no data
+            
+        Raises:
+            requests.HTTPError: If the response is an error response
+            
+        Example:
+            >>> work_items = api.decode_models(api.work_items.get_work_items("MyProjectId"))
+            >>> [(wi.id, wi.title, wi.due_date) for wi in work_items]
+        """
+        return decode_models(response)
+    
     def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
         """
         Perform GET request.
@@ -234,14 +353,37 @@ class PolarionBase:
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         self._print_request_debug('GET', url, params=params)
-        response = self._session.get(url, params=params)
+        response = self._send(self._session.get, url, params=params)
         self._print_response_debug('GET', response)
         return response
     
+    def _get_stream(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                    headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        Perform GET request without downloading the body up front.
+        
+        The body is read with response.iter_content() and the caller must close the
+        response. It is not printed by the response debug output, which would read it.
+        
+        Args:
+            endpoint: API endpoint (will be appended to base_url)
+            params: Query parameters
+            headers: Additional request headers (e.g. Range)
+        
+        Returns:
+            Streamed Response object
+        """
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        self._print_request_debug('GET', url, params=params)
+        if headers:
+            return self._send(self._session.get, url, params=params, headers=headers, stream=True)
+        return self._send(self._session.get, url, params=params, stream=True)
+    
     def _post(self, endpoint: str, data: Optional[Dict[str, Any]] = None, 
               json: Optional[Dict[str, Any]] = None,
               files: Optional[Any] = None,
-              params: Optional[Dict[str, Any]] = None) -> requests.Response:
+              params: Optional[Dict[str, Any]] = None,
+              headers: Optional[Dict[str, str]] = None) -> requests.Response:
         """
         Perform POST request.
         
@@ -251,26 +393,39 @@ class PolarionBase:
             json: JSON data
             files: Files for multipart/form-data upload (can be dict or list of tuples)
             params: Query parameters
+            headers: Additional request headers (e.g. the Content-Type of a raw or streamed body)
             
         Returns:
             Response object
+            
+        Raises:
+            ValidationError: If request validation is enabled and json does not match the request schema
+                             (bodies already encoded to bytes, e.g. by BodyBuilder.encoded_chunks,
+                             are sent unchecked)
         """
+        if isinstance(json, dict) and self.validate_requests:
+            validate_request('POST', endpoint, json)
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         self._print_request_debug('POST', url, params=params, json_data=json, form_data=data, files=files)
         
         # Remove Content-Type header for multipart/form-data (requests will set it automatically)
-        headers = None
+        request_headers = None
         if files is not None or (data is not None and json is None):
             # Remove Content-Type for multipart or form data
-            headers = {k: v for k, v in self._session.headers.items() if k.lower() != 'content-type'}
-        response = self._session.post(url, data=data, json=json, files=files, headers=headers, params=params)
+            request_headers = {k: v for k, v in self._session.headers.items() if k.lower() != 'content-type'}
+        if headers:
+            request_headers = dict(self._session.headers if request_headers is None else request_headers)
+            request_headers.update(headers)
+        response = self._send(self._session.post, url, data=data, json=json, files=files, headers=request_headers,
+                              params=params)
         self._print_response_debug('POST', response)
         return response
     
     def _patch(self, endpoint: str, data: Optional[Dict[str, Any]] = None,
                json: Optional[Dict[str, Any]] = None,
                files: Optional[Dict[str, Any]] = None,
-               params: Optional[Dict[str, Any]] = None) -> requests.Response:
+               params: Optional[Dict[str, Any]] = None,
+               headers: Optional[Dict[str, str]] = None) -> requests.Response:
         """
         Perform PATCH request.
         
@@ -280,19 +435,31 @@ class PolarionBase:
             json: JSON data
             files: Files for multipart/form-data upload
             params: Query parameters
+            headers: Additional request headers (e.g. the Content-Type of a raw or streamed body)
             
         Returns:
             Response object
+            
+        Raises:
+            ValidationError: If request validation is enabled and json does not match the request schema
+                             (bodies already encoded to bytes, e.g. by BodyBuilder.encoded_chunks,
+                             are sent unchecked)
         """
+        if isinstance(json, dict) and self.validate_requests:
+            validate_request('PATCH', endpoint, json)
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         self._print_request_debug('PATCH', url, params=params, json_data=json, form_data=data, files=files)
         
         # Remove Content-Type header for multipart/form-data (requests will set it automatically)
-        headers = None
+        request_headers = None
         if files is not None or (data is not None and json is None):
             # Remove Content-Type for multipart or form data
-            headers = {k: v for k, v in self._session.headers.items() if k.lower() != 'content-type'}
-        response = self._session.patch(url, data=data, json=json, files=files, headers=headers, params=params)
+            request_headers = {k: v for k, v in self._session.headers.items() if k.lower() != 'content-type'}
+        if headers:
+            request_headers = dict(self._session.headers if request_headers is None else request_headers)
+            request_headers.update(headers)
+        response = self._send(self._session.patch, url, data=data, json=json, files=files, headers=request_headers,
+                              params=params)
         self._print_response_debug('PATCH', response)
         return response
     
@@ -306,13 +473,39 @@ class PolarionBase:
             
         Returns:
             Response object
+            
+        Raises:
+            ValidationError: If request validation is enabled and json does not match the request schema
+                             (bodies already encoded to bytes, e.g. by BodyBuilder.encoded_chunks,
+                             are sent unchecked)
         """
+        if isinstance(json, dict) and self.validate_requests:
+            validate_request('DELETE', endpoint, json)
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         self._print_request_debug('DELETE', url, json_data=json)
-        response = self._session.delete(url, json=json)
+        response = self._send(self._session.delete, url, json=json)
         self._print_response_debug('DELETE', response)
         return response
     
+    def _post_file(self, endpoint: str, source: Union[bytes, BinaryIO, str, os.PathLike],
+                   headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        Perform POST request with a raw body given as bytes, a binary file object or a path.
+        Files are streamed from disk while the request is sent.
+        
+        Args:
+            endpoint: API endpoint (will be appended to base_url)
+            source: The body, a binary file object or the path of the file to send
+            headers: Additional request headers (e.g. the Content-Type of the body)
+            
+        Returns:
+            Response object
+        """
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'rb') as file:
+                return self._post(endpoint, data=file, headers=headers)
+        return self._post(endpoint, data=source, headers=headers)
+    
     def _delete_with_body(self, endpoint: str, json: Optional[Dict[str, Any]] = None) -> requests.Response:
         """
         Perform DELETE request with JSON body.
@@ -327,8 +520,26 @@ class PolarionBase:
         """
         return self._delete(endpoint, json=json)
     
+    def _item_validator(self, method: str, endpoint: str) -> Optional[Callable[[Any], List[str]]]:
+        """
+        Validator of the items of a bulk request body, None if request validation is disabled.
+        
+        Args:
+            method: HTTP method ('POST', 'PATCH', 'DELETE')
+            endpoint: API endpoint
+            
+        Returns:
+            Function returning the error messages of one item (empty when it is valid)
+        """
+        if not self.validate_requests:
+            return None
+        return item_validator(method, endpoint)
+    
     def close(self):
         """
-        Close the session.
+        Stop the job waiter of the session, if any, and close the session.
         """
+        waiter = vars(self._session).pop(JOB_WAITER_ATTRIBUTE, None)
+        if waiter is not None:
+            waiter.close()
         self._session.close()
@@ -0,0 +1,382 @@
+"""
+Request body builders module for Polarion REST API.
+Typed builders for the list request bodies of the bulk endpoints (Work Items, Test
+Records, Test Step Results, Linked Work Items and Work Item Approvals). Every add()
+call writes one resource straight into the {'data': [...]} wire structure, and the
+body can be taken whole, in chunks, or encoded chunk by chunk.
+"""
+import datetime
+from typing import Optional, Dict, Any, Iterator, List, Sequence, Union
+from .json_backend import dumps
+
+
+# Dates and timestamps are given as ISO 8601 strings or as date/datetime objects
+DateValue = Union[str, datetime.date]
+
+
+def _iso(value: DateValue) -> str:
+    return value if isinstance(value, str) else value.isoformat()
+
+
+def text(value: str, text_type: str = 'text/html') -> Dict[str, str]:
+    """
+    Rich text attribute value, e.g. text('<p>Steps</p>') or text('Passed', 'text/plain').
+    """
+    return {'type': text_type, 'value': value}
+
+
+def to_one(resource_type: str, resource_id: str) -> Dict[str, Any]:
+    """
+    To-one relationship value, e.g. to_one('users', 'jdoe').
+    """
+    return {'data': {'type': resource_type, 'id': resource_id}}
+
+
+def to_many(resource_type: str, resource_ids: Sequence[str]) -> Dict[str, Any]:
+    """
+    To-many relationship value, e.g. to_many('users', ['jdoe', 'asmith']).
+    """
+    return {'data': [{'type': resource_type, 'id': resource_id} for resource_id in resource_ids]}
+
+
+class BodyBuilder:
+    """
+    Builder of a list request body {'data': [resource, ...]}.
+
+    The resources are created directly in their wire form and are never copied:
+    body, chunks() and iteration hand out the same dictionaries. A builder can be
+    passed as the items of a bulk method, e.g.
+    api.work_items.bulk_post_work_items("MyProjectId", builder).
+    """
+
+    __slots__ = ('_data',)
+
+    resource_type = ''
+
+    def __init__(self):
+        self._data: List[Dict[str, Any]] = []
+
+    def _add(self, resource_id: Optional[str], attributes: Dict[str, Any],
+             relationships: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        resource: Dict[str, Any] = {'type': self.resource_type}
+        if resource_id is not None:
+            resource['id'] = resource_id
+        if attributes:
+            resource['attributes'] = attributes
+        if relationships:
+            resource['relationships'] = relationships
+        self._data.append(resource)
+        return resource
+
+    @property
+    def body(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        The request body with all resources (not copied).
+        """
+        return {'data': self._data}
+
+    def chunks(self, size: int) -> Iterator[Dict[str, List[Dict[str, Any]]]]:
+        """
+        Request bodies of at most `size` resources each.
+
+        Raises:
+            ValueError: If size is lower than 1
+        """
+        if size < 1:
+            raise ValueError(f"Chunk size must be at least 1, got {size}")
+        for start in range(0, len(self._data), size):
+            yield {'data': self._data[start:start + size]}
+
+    def encoded_chunks(self, size: int) -> Iterator[bytes]:
+        """
+        Request bodies of at most `size` resources each, encoded with the selected JSON
+        backend one chunk at a time. The bytes can be passed to the post/patch methods
+        in place of a body dictionary. Encoded bodies are not checked by request
+        validation: validate body (or the chunks) with validation.validate_request first.
+
+        Example:
+            >>> for body in builder.encoded_chunks(100):
+            ...     api.work_items.post_work_items("MyProjectId", body)
+        """
+        for chunk in self.chunks(size):
+            yield dumps(chunk)
+
+    def clear(self):
+        """
+        Remove all resources, e.g. after the body was sent.
+        """
+        self._data = []
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(resources={len(self._data)})"
+
+
+class WorkItemsBuilder(BodyBuilder):
+    """
+    Body of post_work_items / patch_work_items.
+
+    Example:
+        >>> builder = WorkItemsBuilder()
+        >>> builder.add('requirement', 'Login', description='<p>Users can log in</p>', assignees=['jdoe'])
+        >>> builder.add('task', 'Write tests', severity='major', customer='ACME')  # custom field
+        >>> api.work_items.post_work_items("MyProjectId", builder.body)
+    """
+
+    __slots__ = ()
+
+    resource_type = 'workitems'
+
+    def add(self,
+            work_item_type: Optional[str] = None,
+            title: Optional[str] = None,
+            *,
+            id: Optional[str] = None,
+            description: Optional[str] = None,
+            description_type: str = 'text/html',
+            status: Optional[str] = None,
+            severity: Optional[str] = None,
+            priority: Optional[str] = None,
+            resolution: Optional[str] = None,
+            due_date: Optional[DateValue] = None,
+            assignees: Optional[Sequence[str]] = None,
+            author: Optional[str] = None,
+            categories: Optional[Sequence[str]] = None,
+            relationships: Optional[Dict[str, Any]] = None,
+            **attributes: Any) -> Dict[str, Any]:
+        """
+        Add a Work Item.
+
+        Args:
+            work_item_type: The Work Item type (required to create, e.g. 'requirement')
+            title: The title
+            id: The Work Item ID (e.g. 'MyProjectId/WI-1'), for updates
+            description: The description
+            description_type: Type of the description (default: 'text/html')
+            status: The status ID
+            severity: The severity ID
+            priority: The priority
+            resolution: The resolution ID
+            due_date: The due date
+            assignees: User IDs of the assignees
+            author: User ID of the author
+            categories: Category IDs
+            relationships: Other relationships, in wire form
+            **attributes: Other attributes by their API name, including custom fields
+
+        Returns:
+            The added resource
+        """
+        if work_item_type is not None:
+            attributes['type'] = work_item_type
+        if title is not None:
+            attributes['title'] = title
+        if description is not None:
+            attributes['description'] = text(description, description_type)
+        if status is not None:
+            attributes['status'] = status
+        if severity is not None:
+            attributes['severity'] = severity
+        if priority is not None:
+            attributes['priority'] = priority
+        if resolution is not None:
+            attributes['resolution'] = resolution
+        if due_date is not None:
+            attributes['dueDate'] = _iso(due_date)
+        if assignees is not None or author is not None or categories is not None:
+            relationships = dict(relationships or {})
+            if assignees is not None:
+                relationships['assignee'] = to_many('users', assignees)
+            if author is not None:
+                relationships['author'] = to_one('users', author)
+            if categories is not None:
+                relationships['categories'] = to_many('categories', categories)
+        return self._add(id, attributes, relationships)
+
+
+class TestRecordsBuilder(BodyBuilder):
+    """
+    Body of post_test_records / patch_test_records.
+
+    Example:
+        >>> builder = TestRecordsBuilder()
+        >>> builder.add('MyProjectId/TC-1', 'passed', duration=1.5, executed_by='jdoe')
+        >>> api.test_records.post_test_records("MyProjectId", "MyTestRunId", builder.body)
+    """
+
+    __slots__ = ()
+
+    resource_type = 'testrecords'
+
+    def add(self,
+            test_case: Optional[str] = None,
+            result: Optional[str] = None,
+            *,
+            id: Optional[str] = None,
+            executed: Optional[DateValue] = None,
+            duration: Optional[float] = None,
+            comment: Optional[str] = None,
+            comment_type: str = 'text/plain',
+            test_case_revision: Optional[str] = None,
+            executed_by: Optional[str] = None,
+            defect: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Add a Test Record.
+
+        Args:
+            test_case: Work Item ID of the Test Case (e.g. 'MyProjectId/TC-1'), to create
+            result: The result ID (e.g. 'passed', 'failed', 'blocked')
+            id: The Test Record ID (e.g. 'MyProjectId/MyTestRunId/MyProjectId/TC-1/0'), for updates
+            executed: Time of the execution
+            duration: Duration of the execution in seconds
+            comment: The comment
+            comment_type: Type of the comment (default: 'text/plain')
+            test_case_revision: Revision of the executed Test Case
+            executed_by: User ID of the executing user
+            defect: Work Item ID of the defect
+
+        Returns:
+            The added resource
+        """
+        attributes: Dict[str, Any] = {}
+        if result is not None:
+            attributes['result'] = result
+        if executed is not None:
+            attributes['executed'] = _iso(executed)
+        if duration is not None:
+            attributes['duration'] = duration
+        if comment is not None:
+            attributes['comment'] = text(comment, comment_type)
+        if test_case_revision is not None:
+            attributes['testCaseRevision'] = test_case_revision
+        relationships: Dict[str, Any] = {}
+        if test_case is not None:
+            relationships['testCase'] = to_one('workitems', test_case)
+        if executed_by is not None:
+            relationships['executedBy'] = to_one('users', executed_by)
+        if defect is not None:
+            relationships['defect'] = to_one('workitems', defect)
+        return self._add(id, attributes, relationships)
+
+
+class TestStepResultsBuilder(BodyBuilder):
+    """
+    Body of post_test_step_results / patch_test_step_results.
+
+    Example:
+        >>> builder = TestStepResultsBuilder()
+        >>> builder.add('passed')
+        >>> builder.add('failed', comment='Timeout after 30 s')
+        >>> api.test_step_results.bulk_post_test_step_results("MyProjectId", "MyTestRunId",
+        ...                                                   {("MyProjectId", "TC-1", 0): builder})
+    """
+
+    __slots__ = ()
+
+    resource_type = 'teststep_results'
+
+    def add(self,
+            result: Optional[str] = None,
+            *,
+            id: Optional[str] = None,
+            comment: Optional[str] = None,
+            comment_type: str = 'text/plain') -> Dict[str, Any]:
+        """
+        Add a Test Step Result.
+
+        Args:
+            result: The result ID (e.g. 'passed', 'failed', 'blocked')
+            id: The Test Step Result ID, for updates
+            comment: The comment
+            comment_type: Type of the comment (default: 'text/plain')
+
+        Returns:
+            The added resource
+        """
+        attributes: Dict[str, Any] = {}
+        if result is not None:
+            attributes['result'] = result
+        if comment is not None:
+            attributes['comment'] = text(comment, comment_type)
+        return self._add(id, attributes)
+
+
+class LinkedWorkItemsBuilder(BodyBuilder):
+    """
+    Body of post_linked_work_items.
+
+    Example:
+        >>> builder = LinkedWorkItemsBuilder()
+        >>> builder.add('relates_to', 'MyProjectId/WI-2')
+        >>> api.linked_work_items.post_linked_work_items("MyProjectId", "WI-1", builder.body)
+    """
+
+    __slots__ = ()
+
+    resource_type = 'linkedworkitems'
+
+    def add(self,
+            role: str,
+            target: str,
+            *,
+            suspect: Optional[bool] = None,
+            revision: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Add a link to a target Work Item.
+
+        Args:
+            role: The link role ID (e.g. 'relates_to')
+            target: Work Item ID of the target (e.g. 'MyProjectId/WI-2')
+            suspect: The suspect flag of the link
+            revision: Revision of the target Work Item
+
+        Returns:
+            The added resource
+        """
+        attributes: Dict[str, Any] = {'role': role}
+        if suspect is not None:
+            attributes['suspect'] = suspect
+        if revision is not None:
+            attributes['revision'] = revision
+        return self._add(None, attributes, {'workItem': to_one('workitems', target)})
+
+
+class WorkItemApprovalsBuilder(BodyBuilder):
+    """
+    Body of post_work_item_approvals / patch_work_item_approvals.
+
+    Example:
+        >>> builder = WorkItemApprovalsBuilder()
+        >>> builder.add('jdoe')
+        >>> builder.add('asmith', status='approved')
+        >>> api.work_item_approvals.post_work_item_approvals("MyProjectId", "WI-1", builder.body)
+    """
+
+    __slots__ = ()
+
+    resource_type = 'workitem_approvals'
+
+    def add(self,
+            user: Optional[str] = None,
+            status: Optional[str] = 'waiting',
+            *,
+            id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Add an approval.
+
+        Args:
+            user: User ID of the approver, to create
+            status: 'waiting', 'approved' or 'disapproved' (default: 'waiting')
+            id: The approval ID (e.g. 'MyProjectId/WI-1/jdoe'), for updates
+
+        Returns:
+            The added resource
+        """
+        attributes = {'status': status} if status is not None else {}
+        relationships = {'user': to_one('users', user)} if user is not None else None
+        return self._add(id, attributes, relationships)
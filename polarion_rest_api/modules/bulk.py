@@ -0,0 +1,686 @@
+"""
+Bulk operations helper module for Polarion REST API.
+Contains chunking, bounded parallel execution and per-item result reporting
+shared by the bulk methods of the API modules.
+"""
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List, Tuple
+import requests
+from urllib3.exceptions import ConnectTimeoutError
+from .json_backend import response_json
+from .scheduler import run_in_context
+from .validation import delete_item_errors
+
+
+DEFAULT_CHUNK_SIZE = 100
+DEFAULT_MAX_WORKERS = 4
+
+# Status codes for which a failed multi-item chunk is split in halves and re-sent,
+# so a single bad item does not fail every other item of the chunk.
+SPLIT_STATUS_CODES = (400, 413, 422)
+
+# Status codes of transient failures for which a request is retried
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+DEFAULT_BACKOFF = 0.5
+
+# Status codes telling that the server did not process the request, so that even a
+# non-idempotent create can be retried (a 502 or 504 may come after it was applied)
+UNPROCESSED_STATUS_CODES = (429, 503)
+
+# A chunk is a list of (input index, item) pairs
+Chunk = List[Tuple[int, Any]]
+
+
+class BulkItemResult:
+    """
+    Outcome of a single item of a bulk operation.
+
+    Attributes:
+        index: Position of the item in the input iterable
+        status: One of 'created', 'updated', 'deleted', 'not_found', 'skipped' or 'failed'
+        id: Resource ID returned by (or sent to) the server, if known
+        status_code: HTTP status code of the request that carried the item
+        error: Error detail for failed items
+    """
+
+    __slots__ = ('index', 'status', 'id', 'status_code', 'error')
+
+    def __init__(self, index: int, status: str, id: Optional[str] = None,
+                 status_code: Optional[int] = None, error: Optional[str] = None):
+        self.index = index
+        self.status = status
+        self.id = id
+        self.status_code = status_code
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """
+        True when the item did not fail.
+        """
+        return self.status != 'failed'
+
+    def __repr__(self) -> str:
+        return (f"BulkItemResult(index={self.index}, status={self.status!r}, id={self.id!r}, "
+                f"status_code={self.status_code}, error={self.error!r})")
+
+
+class BulkResult:
+    """
+    Aggregated outcome of a bulk operation.
+    Item results are kept per input index, so they can be read back in input order
+    regardless of the order in which the parallel chunks completed.
+
+    The object also acts as a live progress counter: `processed`, `failed_count`,
+    `requests_sent`, `elapsed` and `items_per_second` are updated while the
+    operation runs and can be read from a progress callback.
+    """
+
+    def __init__(self, keep_succeeded: bool = True):
+        """
+        Initialize the result.
+
+        Args:
+            keep_succeeded: Keep the results of successful items (default). When False
+                            only failed items are kept, so memory use stays flat for
+                            very large operations while the counters remain exact.
+        """
+        self._items: Dict[int, BulkItemResult] = {}
+        self._lock = threading.Lock()
+        self.keep_succeeded = keep_succeeded
+        self.requests_sent = 0
+        self.requests_saved = 0
+        self.processed = 0
+        self.failed_count = 0
+        self.started_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+
+    def add(self, item_result: BulkItemResult):
+        """
+        Record the result of a single item.
+
+        Args:
+            item_result: Result to record
+        """
+        with self._lock:
+            self.processed += 1
+            if not item_result.ok:
+                self.failed_count += 1
+            elif not self.keep_succeeded:
+                return
+            self._items[item_result.index] = item_result
+
+    def count_request(self):
+        """
+        Increment the number of HTTP requests sent (thread-safe).
+        """
+        with self._lock:
+            self.requests_sent += 1
+
+    def finish(self):
+        """
+        Stop the clock used for `elapsed` and `items_per_second`.
+        """
+        self.finished_at = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Seconds since the operation started (until it finished, once finished).
+        """
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return end - self.started_at
+
+    @property
+    def items_per_second(self) -> float:
+        """
+        Average throughput in processed items per second.
+        """
+        elapsed = self.elapsed
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def items(self) -> List[BulkItemResult]:
+        """
+        All item results in input order.
+        """
+        return [self._items[index] for index in sorted(self._items)]
+
+    @property
+    def ids(self) -> List[Optional[str]]:
+        """
+        Resource IDs in input order (None for items that failed).
+        """
+        return [item.id if item.ok else None for item in self.items]
+
+    @property
+    def succeeded(self) -> List[BulkItemResult]:
+        """
+        Results of the items that did not fail.
+        """
+        return [item for item in self.items if item.ok]
+
+    @property
+    def failed(self) -> List[BulkItemResult]:
+        """
+        Results of the items that failed.
+        """
+        return [item for item in self.items if not item.ok]
+
+    @property
+    def ok(self) -> bool:
+        """
+        True when no item failed.
+        """
+        return self.failed_count == 0
+
+    @property
+    def outcomes(self) -> Dict[Optional[str], str]:
+        """
+        Status of every item keyed by resource ID.
+        """
+        return {item.id: item.status for item in self.items}
+
+    def __len__(self) -> int:
+        return self.processed
+
+    def __repr__(self) -> str:
+        return (f"BulkResult(items={len(self)}, failed={self.failed_count}, "
+                f"requests_sent={self.requests_sent}, requests_saved={self.requests_saved})")
+
+
+class UpdateCollector:
+    """
+    Collects updates of resources and coalesces updates of the same resource.
+
+    Several updates of one resource are merged into a single payload: attributes
+    are merged key by key and relationships are replaced per relationship name,
+    later updates winning. Resources are kept in the order of their first update.
+
+    Example:
+        >>> updates = UpdateCollector('workitems')
+        >>> updates.add('MyProjectId/WI-1', attributes={'status': 'open'})
+        >>> updates.add('MyProjectId/WI-1', attributes={'title': 'New title'})
+        >>> len(updates), updates.received
+        (1, 2)
+    """
+
+    def __init__(self, resource_type: str):
+        """
+        Initialize the collector.
+
+        Args:
+            resource_type: JSON:API type of the collected resources (e.g. 'workitems')
+        """
+        self.resource_type = resource_type
+        self.received = 0
+        self._resources: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, resource_id: str,
+            attributes: Optional[Dict[str, Any]] = None,
+            relationships: Optional[Dict[str, Any]] = None):
+        """
+        Add an update of a resource.
+
+        Args:
+            resource_id: The resource ID (e.g. 'MyProjectId/MyWorkItemId')
+            attributes: Attributes to update
+            relationships: Relationships to update
+        """
+        self.received += 1
+        resource = self._resources.get(resource_id)
+        if resource is None:
+            resource = {'type': self.resource_type, 'id': resource_id}
+            self._resources[resource_id] = resource
+        if attributes:
+            resource.setdefault('attributes', {}).update(attributes)
+        if relationships:
+            resource.setdefault('relationships', {}).update(relationships)
+
+    def add_resource(self, resource: Dict[str, Any]):
+        """
+        Add an update given as a JSON:API resource.
+
+        Args:
+            resource: Resource with 'id' and optional 'attributes' and 'relationships'
+
+        Raises:
+            ValueError: If the resource has no 'id'
+        """
+        if 'id' not in resource:
+            raise ValueError(f"Update must contain an 'id' key, got {sorted(resource)}")
+        self.add(resource['id'], resource.get('attributes'), resource.get('relationships'))
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._resources.values())
+
+    def __len__(self) -> int:
+        return len(self._resources)
+
+
+def chunked(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Split an iterable into lists of at most `size` items.
+    The iterable is consumed lazily, so generators of any length can be chunked.
+
+    Args:
+        iterable: Items to split
+        size: Maximum chunk size
+
+    Returns:
+        Iterator over lists of items
+
+    Raises:
+        ValueError: If size is lower than 1
+    """
+    if size < 1:
+        raise ValueError(f"Chunk size must be at least 1, got {size}")
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _item_id(item: Any) -> Optional[str]:
+    """
+    Return the 'id' of a resource item, or None for items without one.
+    """
+    return item.get('id') if isinstance(item, dict) else None
+
+
+def error_detail(response: requests.Response) -> str:
+    """
+    Extract a human readable error message from a Polarion error response.
+
+    Args:
+        response: Failed response object
+
+    Returns:
+        Error detail from the JSON:API 'errors' array, or the beginning of the response body
+    """
+    try:
+        errors = response_json(response).get('errors') or []
+    except (ValueError, AttributeError):
+        errors = []
+    if errors:
+        return '; '.join(str(error.get('detail') or error.get('title') or error) for error in errors)
+    return f"HTTP {response.status_code}: {str(response.text)[:200]}"
+
+
+def retry_delay(attempt: int, backoff: float, response: Optional[requests.Response] = None) -> float:
+    """
+    Compute the delay before retrying a request.
+
+    The Retry-After header of the response is honoured when present, otherwise the
+    delay grows exponentially with the attempt number and is jittered by +/-50%
+    so parallel workers do not retry in lockstep.
+
+    Args:
+        attempt: Number of the failed attempt (0 for the first one)
+        backoff: Base delay in seconds
+        response: Failed response, if any
+
+    Returns:
+        Delay in seconds
+    """
+    if response is not None:
+        retry_after = (response.headers or {}).get('Retry-After')
+        if retry_after is not None and str(retry_after).isdigit():
+            return float(retry_after)
+    return backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+def not_sent(error: requests.RequestException) -> bool:
+    """
+    True for connection errors raised before the request reached the server (connection
+    refused, name resolution failure, connect timeout), after which a non-idempotent
+    request can be retried without being applied twice.
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.ConnectionError) or not error.args:
+        return False
+    # requests wraps the urllib3 MaxRetryError, whose reason is the original error
+    reason = getattr(error.args[0], 'reason', error.args[0])
+    return isinstance(reason, ConnectTimeoutError)
+
+
+def send_chunk(request: Callable[[List[Any]], requests.Response],
+               chunk: Chunk,
+               on_success: Callable[[Chunk, requests.Response], List[BulkItemResult]],
+               result: BulkResult,
+               split_status_codes: Tuple[int, ...] = SPLIT_STATUS_CODES,
+               on_failure: Optional[Callable[[Chunk, requests.Response], List[BulkItemResult]]] = None,
+               retries: int = 0,
+               backoff: float = DEFAULT_BACKOFF,
+               retry_status_codes: Tuple[int, ...] = RETRY_STATUS_CODES,
+               retry_error: Optional[Callable[[requests.RequestException], bool]] = None) -> List[BulkItemResult]:
+    """
+    Send one chunk and translate the response into per-item results.
+
+    When the server rejects a multi-item chunk with one of `split_status_codes`,
+    the chunk is split in halves which are sent separately, until the rejected
+    items are isolated. Connection errors and transient statuses (429, 502, 503, 504)
+    are retried up to `retries` times with jittered exponential backoff.
+    Other errors fail every item of the chunk.
+
+    Args:
+        request: Callable sending a list of items and returning the response
+        chunk: List of (input index, item) pairs
+        on_success: Callable translating a successful response into item results
+        result: BulkResult used to count the requests sent
+        split_status_codes: Status codes for which the chunk is split and re-sent
+        on_failure: Optional callable translating an error response into item results
+                    (default: every item of the chunk fails with the error detail)
+        retries: Number of retries of transient failures (default: 0)
+        backoff: Base delay in seconds between retries (default: 0.5)
+        retry_status_codes: Statuses retried (default: RETRY_STATUS_CODES); use
+                            UNPROCESSED_STATUS_CODES for non-idempotent requests
+        retry_error: Optional callable telling whether a request exception is retried
+                     (default: every one); use not_sent for non-idempotent requests
+
+    Returns:
+        List of item results for the chunk
+    """
+    items = [item for _, item in chunk]
+    attempt = 0
+    while True:
+        try:
+            response = request(items)
+        except requests.RequestException as e:
+            result.count_request()
+            if attempt >= retries or (retry_error is not None and not retry_error(e)):
+                return [BulkItemResult(index, 'failed', id=_item_id(item), error=str(e)) for index, item in chunk]
+            time.sleep(retry_delay(attempt, backoff))
+        else:
+            result.count_request()
+            if response.status_code not in retry_status_codes or attempt >= retries:
+                break
+            time.sleep(retry_delay(attempt, backoff, response))
+        attempt += 1
+
+    if response.status_code < 300:
+        return on_success(chunk, response)
+
+    if response.status_code in split_status_codes and len(chunk) > 1:
+        middle = len(chunk) // 2
+        return (send_chunk(request, chunk[:middle], on_success, result, split_status_codes, on_failure,
+                           retries, backoff, retry_status_codes, retry_error) +
+                send_chunk(request, chunk[middle:], on_success, result, split_status_codes, on_failure,
+                           retries, backoff, retry_status_codes, retry_error))
+
+    if on_failure is not None:
+        return on_failure(chunk, response)
+    detail = error_detail(response)
+    return [BulkItemResult(index, 'failed', id=_item_id(item), status_code=response.status_code, error=detail)
+            for index, item in chunk]
+
+
+def reject_invalid(chunk: Chunk,
+                   validate: Optional[Callable[[Any], List[str]]]) -> Tuple[List[BulkItemResult], Chunk]:
+    """
+    Split a chunk into the results of its invalid items and the items to send.
+
+    Args:
+        chunk: List of (input index, item) pairs
+        validate: Callable returning the error messages of an item (empty when it is
+                  valid), e.g. from PolarionBase._item_validator; None accepts every item
+
+    Returns:
+        Tuple (failed results of the invalid items, chunk of the valid items)
+    """
+    if validate is None:
+        return [], chunk
+    rejected = []
+    valid = []
+    for index, item in chunk:
+        errors = validate(item)
+        if errors:
+            rejected.append(BulkItemResult(index, 'failed', id=_item_id(item), error=f"Invalid item: {'; '.join(errors)}"))
+        else:
+            valid.append((index, item))
+    return rejected, valid
+
+
+def run_chunks(send: Callable[[Chunk], List[BulkItemResult]],
+               chunks: Iterable[Chunk],
+               max_workers: int = DEFAULT_MAX_WORKERS,
+               result: Optional[BulkResult] = None,
+               on_progress: Optional[Callable[[BulkResult], None]] = None) -> BulkResult:
+    """
+    Run `send` for every chunk with at most `max_workers` chunks in flight.
+
+    Chunks are pulled from the iterable only when a worker is about to become free
+    (backpressure), so memory use does not depend on the total number of items.
+
+    Args:
+        send: Callable sending one chunk and returning its item results
+        chunks: Iterable of chunks (lists of (input index, item) pairs)
+        max_workers: Maximum number of chunks sent in parallel
+        result: Optional BulkResult to fill (a new one is created if omitted)
+        on_progress: Optional callable invoked with the BulkResult after every completed chunk
+
+    Returns:
+        BulkResult with the results of all items
+
+    Raises:
+        ValueError: If max_workers is lower than 1
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+    if result is None:
+        result = BulkResult()
+
+    def guarded_send(chunk: Chunk) -> List[BulkItemResult]:
+        try:
+            return send(chunk)
+        except Exception as e:
+            return [BulkItemResult(index, 'failed', id=_item_id(item), error=f"{type(e).__name__}: {e}")
+                    for index, item in chunk]
+
+    def collect(futures):
+        for future in futures:
+            for item_result in future.result():
+                result.add(item_result)
+            if on_progress is not None:
+                on_progress(result)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        for chunk in chunks:
+            if len(pending) >= max_workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending.add(executor.submit(run_in_context(guarded_send), chunk))
+        collect(wait(pending)[0])
+
+    result.finish()
+    return result
+
+
+def run_bulk(request: Callable[[List[Any]], requests.Response],
+             items: Iterable[Any],
+             on_success: Callable[[Chunk, requests.Response], List[BulkItemResult]],
+             chunk_size: int = DEFAULT_CHUNK_SIZE,
+             max_workers: int = DEFAULT_MAX_WORKERS,
+             split_status_codes: Tuple[int, ...] = SPLIT_STATUS_CODES,
+             on_failure: Optional[Callable[[Chunk, requests.Response], List[BulkItemResult]]] = None,
+             on_progress: Optional[Callable[[BulkResult], None]] = None,
+             keep_succeeded: bool = True,
+             retries: int = 0,
+             backoff: float = DEFAULT_BACKOFF,
+             validate: Optional[Callable[[Any], List[str]]] = None) -> BulkResult:
+    """
+    Chunk `items`, send the chunks in parallel and collect per-item results.
+
+    Args:
+        request: Callable sending a list of items and returning the response
+        items: Iterable of items (consumed lazily)
+        on_success: Callable translating a successful response into item results
+        chunk_size: Maximum number of items per request
+        max_workers: Maximum number of requests in flight
+        split_status_codes: Status codes for which a chunk is split and re-sent
+        on_failure: Optional callable translating an error response into item results
+        on_progress: Optional callable invoked with the BulkResult after every completed chunk
+        keep_succeeded: Keep the results of successful items (only failures when False)
+        retries: Number of retries of transient failures per request (default: 0)
+        backoff: Base delay in seconds between retries (default: 0.5)
+        validate: Optional callable returning the error messages of an item; invalid
+                  items fail with their errors and are not sent (see reject_invalid)
+
+    Returns:
+        BulkResult with the results of all items
+    """
+    result = BulkResult(keep_succeeded=keep_succeeded)
+
+    def send(chunk: Chunk) -> List[BulkItemResult]:
+        rejected, chunk = reject_invalid(chunk, validate)
+        if not chunk:
+            return rejected
+        return rejected + send_chunk(request, chunk, on_success, result, split_status_codes, on_failure,
+                                     retries, backoff)
+
+    return run_chunks(send, chunked(enumerate(items), chunk_size), max_workers, result, on_progress)
+
+
+def updated_ids(chunk: Chunk, response: requests.Response) -> List[BulkItemResult]:
+    """
+    Mark the items of a successful list PATCH request as updated.
+
+    Args:
+        chunk: List of (input index, item) pairs that was sent
+        response: Successful response object
+
+    Returns:
+        List of item results with status 'updated'
+    """
+    return [BulkItemResult(index, 'updated', id=item.get('id'), status_code=response.status_code)
+            for index, item in chunk]
+
+
+def created_ids(chunk: Chunk, response: requests.Response) -> List[BulkItemResult]:
+    """
+    Map the resources of a successful list POST response back to the sent items.
+    The server returns created resources in the order of the request 'data' array.
+
+    Args:
+        chunk: List of (input index, item) pairs that was sent
+        response: Successful response object
+
+    Returns:
+        List of item results with status 'created'
+    """
+    try:
+        data = response_json(response).get('data') or []
+    except (ValueError, AttributeError):
+        data = []
+    results = []
+    for position, (index, _) in enumerate(chunk):
+        if position < len(data):
+            results.append(BulkItemResult(index, 'created', id=data[position].get('id'),
+                                          status_code=response.status_code))
+        else:
+            results.append(BulkItemResult(index, 'failed', status_code=response.status_code,
+                                          error='Resource missing from the server response'))
+    return results
+
+
+def deleted_ids(chunk: Chunk, response: requests.Response) -> List[BulkItemResult]:
+    """
+    Mark the items of a successful list DELETE request as deleted.
+
+    Args:
+        chunk: List of (input index, item) pairs that was sent
+        response: Successful response object
+
+    Returns:
+        List of item results with status 'deleted'
+    """
+    return [BulkItemResult(index, 'deleted', id=_item_id(item), status_code=response.status_code)
+            for index, item in chunk]
+
+
+def _missing_as_deleted(chunk: Chunk, response: requests.Response) -> List[BulkItemResult]:
+    """
+    Report items of a rejected DELETE request, treating 404 as already deleted.
+    """
+    if response.status_code == 404:
+        return [BulkItemResult(index, 'not_found', id=_item_id(item), status_code=404) for index, item in chunk]
+    detail = error_detail(response)
+    return [BulkItemResult(index, 'failed', id=_item_id(item), status_code=response.status_code, error=detail)
+            for index, item in chunk]
+
+
+def bulk_delete(delete_method: Callable[..., requests.Response],
+                *args: Any,
+                resources: Iterable[Any],
+                resource_type: Optional[str] = None,
+                chunk_size: int = DEFAULT_CHUNK_SIZE,
+                max_workers: int = DEFAULT_MAX_WORKERS,
+                wrap_data: bool = True,
+                validate: Optional[Callable[[Any], List[str]]] = None) -> BulkResult:
+    """
+    Delete any number of resources through a DELETE-with-body list endpoint.
+
+    The resources are split into chunks which are sent in parallel with
+    `delete_method(*args, {"data": chunk})`. A 404 response is treated as
+    "already deleted", so a bulk delete can be retried safely: multi-item chunks
+    rejected with 404 are split until the missing resources are isolated and
+    reported with status 'not_found' while the others are deleted.
+
+    Args:
+        delete_method: Bound list delete method, e.g. api.work_items.delete_work_items,
+                       api.test_runs.delete_test_runs, api.collections.delete_collections,
+                       api.work_item_approvals.delete_work_item_approvals,
+                       api.test_steps.delete_test_steps or an attachments list delete
+        *args: Leading positional arguments of delete_method (everything before the body),
+               e.g. project_id, or project_id and work_item_id
+        resources: Iterable of resources ({"type": ..., "id": ...}) or plain resource IDs
+        resource_type: JSON:API type used for plain resource IDs (e.g. "workitems")
+        chunk_size: Maximum number of resources per request (default: 100)
+        max_workers: Maximum number of requests sent in parallel (default: 4)
+        wrap_data: Wrap every chunk as {"data": chunk} (default). Use False for methods
+                   taking the bare list, like delete_project_test_parameter_definitions.
+        validate: Optional callable returning the error messages of a resource (see
+                  reject_invalid). Defaults to the delete schema of every resource's type
+                  when request validation is enabled on the module of delete_method.
+
+    Returns:
+        BulkResult with one result per resource (status 'deleted', 'not_found' or 'failed').
+        BulkResult.outcomes maps every resource ID to its status.
+
+    Raises:
+        ValueError: If a plain resource ID is given without resource_type
+
+    Example:
+        >>> result = bulk_delete(api.test_runs.delete_test_runs, "MyProjectId",
+        ...                      resources=test_run_ids, resource_type="testruns")
+        >>> result.outcomes
+        {'MyProjectId/Run-1': 'deleted', 'MyProjectId/Run-2': 'not_found'}
+    """
+    def as_resource(resource: Any) -> Dict[str, Any]:
+        if isinstance(resource, dict):
+            return resource
+        if resource_type is None:
+            raise ValueError(f"resource_type is required to delete plain resource IDs (got {resource!r})")
+        return {'type': resource_type, 'id': resource}
+
+    owner = getattr(delete_method, '__self__', None)
+    if hasattr(owner, '_ensure_pool_size'):
+        owner._ensure_pool_size(max_workers)
+    if validate is None and wrap_data and getattr(owner, 'validate_requests', False):
+        validate = delete_item_errors
+
+    def request(items: List[Dict[str, Any]]) -> requests.Response:
+        return delete_method(*args, {'data': items} if wrap_data else items)
+
+    return run_bulk(request, (as_resource(resource) for resource in resources), deleted_ids,
+                    chunk_size=chunk_size, max_workers=max_workers,
+                    split_status_codes=SPLIT_STATUS_CODES + (404,),
+                    on_failure=_missing_as_deleted, validate=validate)
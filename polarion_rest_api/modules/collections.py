@@ -5,6 +5,7 @@ Handles all Collections related endpoints.
 from typing import Optional, Dict, Any
 import requests
 from .base import PolarionBase
+from .validation import validate_request
 
 
 class Collections(PolarionBase):
@@ -584,5 +585,7 @@ class Collections(PolarionBase):
         Returns:
             Response object
         """
+        if isinstance(kwargs.get('json'), dict) and self.validate_requests:
+            validate_request('DELETE', endpoint, kwargs['json'])
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        return self._session.request('DELETE', url, **kwargs)
+        return self._send(self._session.request, 'DELETE', url, **kwargs)
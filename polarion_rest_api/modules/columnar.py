@@ -0,0 +1,249 @@
+"""
+Columnar collection module for Polarion REST API.
+Accumulates chosen fields of the resources of list endpoints straight into one
+list per column while paginating, instead of keeping a dictionary per resource,
+with optional export to pandas, Arrow and Parquet.
+"""
+import os
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List, Sequence, Tuple, Union
+import requests
+from .pagination import iter_pages, DEFAULT_PAGE_SIZE
+
+
+# Repeated short strings (status, type, author, ...) are stored once per column
+POOLED_STRING_LENGTH = 64
+MAX_POOL_SIZE = 4096
+
+# Column prefixes read from the resource object instead of its attributes
+RESOURCE_MEMBERS = ('relationships', 'links', 'meta')
+
+
+def column_getter(column: str) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Build the function reading a column from a resource object.
+
+    Columns are 'id', 'type' and 'revision' of the resource, an attribute
+    ('title', or a dotted path such as 'description.value'), a relationship
+    ('relationships.author': the related ID, or a list of IDs for to-many
+    relationships), or a 'links.' / 'meta.' path.
+
+    Args:
+        column: Column name
+
+    Returns:
+        Function returning the value of the column, None when it is missing
+    """
+    if column in ('id', 'type', 'revision'):
+        return lambda resource: resource.get(column)
+    path = column.split('.')
+    if path[0] == 'relationships' and len(path) == 2:
+        name = path[1]
+
+        def relationship(resource: Dict[str, Any]) -> Any:
+            data = ((resource.get('relationships') or {}).get(name) or {}).get('data')
+            if isinstance(data, list):
+                return [identifier.get('id') for identifier in data]
+            return data.get('id') if data else None
+        return relationship
+    if path[0] not in RESOURCE_MEMBERS:
+        path = ['attributes'] + path
+    if len(path) == 2:
+        member, name = path
+        return lambda resource: (resource.get(member) or {}).get(name)
+
+    def nested(resource: Dict[str, Any]) -> Any:
+        value: Any = resource
+        for key in path:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+    return nested
+
+
+def sparse_fields(resource_type: str, columns: Sequence[str]) -> Dict[str, str]:
+    """
+    Sparse fieldset requesting only the attributes and relationships of the columns.
+    """
+    names = []
+    for column in columns:
+        path = column.split('.')
+        if column in ('id', 'type', 'revision') or path[0] in ('links', 'meta'):
+            continue
+        name = path[1] if path[0] == 'relationships' and len(path) == 2 else path[0]
+        if name not in names:
+            names.append(name)
+    return {resource_type: ','.join(names) if names else '@basic'}
+
+
+class ColumnarResult:
+    """
+    Resources stored as one list per column.
+
+    A resource costs one list slot per column, and repeated short strings are
+    stored once per column, so large result sets take a fraction of the memory of
+    row dictionaries and convert to data frames without a per-row step.
+
+    Example:
+        >>> table = ColumnarResult(['id', 'title', 'status', 'relationships.author'])
+        >>> table.extend(page['data'])
+        >>> table.column('status')[:3]
+        ['open', 'open', 'done']
+    """
+
+    __slots__ = ('columns', '_values', '_getters', '_pools')
+
+    def __init__(self, columns: Sequence[str]):
+        """
+        Args:
+            columns: Column names (see column_getter)
+
+        Raises:
+            ValueError: If no column is given or a column is given twice
+        """
+        if not columns:
+            raise ValueError("At least one column is required")
+        if len(set(columns)) != len(columns):
+            raise ValueError(f"Duplicate columns in {list(columns)}")
+        self.columns: Tuple[str, ...] = tuple(columns)
+        self._values: List[List[Any]] = [[] for _ in self.columns]
+        self._getters = [column_getter(column) for column in self.columns]
+        self._pools: List[Dict[str, str]] = [{} for _ in self.columns]
+
+    def append(self, resource: Dict[str, Any]):
+        """
+        Add the columns of a resource object.
+        """
+        for values, getter, pool in zip(self._values, self._getters, self._pools):
+            value = getter(resource)
+            if type(value) is str and len(value) <= POOLED_STRING_LENGTH:
+                pooled = pool.get(value)
+                if pooled is not None:
+                    value = pooled
+                elif len(pool) < MAX_POOL_SIZE:
+                    pool[value] = value
+            values.append(value)
+
+    def extend(self, resources: Iterable[Dict[str, Any]]):
+        """
+        Add the columns of several resource objects (e.g. the 'data' of a page).
+        """
+        for resource in resources:
+            self.append(resource)
+
+    def column(self, name: str) -> List[Any]:
+        """
+        Values of a column, in resource order.
+
+        Raises:
+            KeyError: If the column was not collected
+        """
+        try:
+            return self._values[self.columns.index(name)]
+        except ValueError:
+            raise KeyError(name) from None
+
+    def __getitem__(self, name: str) -> List[Any]:
+        return self.column(name)
+
+    def __len__(self) -> int:
+        return len(self._values[0])
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """
+        Column name -> list of values (the lists are not copied).
+        """
+        return dict(zip(self.columns, self._values))
+
+    def rows(self) -> Iterator[Tuple[Any, ...]]:
+        """
+        Iterate over the resources as tuples of column values.
+        """
+        return zip(*self._values)
+
+    def to_pandas(self) -> 'pandas.DataFrame':
+        """
+        Build a pandas DataFrame with one column per collected column.
+
+        Raises:
+            ImportError: If pandas is not installed
+        """
+        try:
+            import pandas
+        except ImportError:
+            raise ImportError("DataFrame export requires pandas: pip install polarion-rest-api[columnar]") from None
+        return pandas.DataFrame(self.to_dict(), columns=list(self.columns))
+
+    def to_arrow(self) -> 'pyarrow.Table':
+        """
+        Build a pyarrow Table with one column per collected column.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("Arrow export requires pyarrow: pip install polarion-rest-api[columnar]") from None
+        return pyarrow.table(self.to_dict())
+
+    def to_parquet(self, path: Union[str, os.PathLike], **kwargs: Any):
+        """
+        Write the columns to a Parquet file.
+
+        Args:
+            path: Destination file
+            **kwargs: Options of pyarrow.parquet.write_table (e.g. compression='zstd')
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        table = self.to_arrow()
+        import pyarrow.parquet
+        pyarrow.parquet.write_table(table, os.fspath(path), **kwargs)
+
+    def __repr__(self) -> str:
+        return f"ColumnarResult(columns={list(self.columns)}, rows={len(self)})"
+
+
+def collect_columns(list_method: Callable[..., requests.Response],
+                    *args: Any,
+                    columns: Sequence[str],
+                    resource_type: Optional[str] = None,
+                    page_size: int = DEFAULT_PAGE_SIZE,
+                    **kwargs: Any) -> ColumnarResult:
+    """
+    Collect columns of all resources of a list endpoint, page by page.
+
+    Each page is added to the columns and released before the next one is
+    requested. With resource_type (and no fields= given), only the attributes and
+    relationships of the columns are requested (sparse fieldset).
+
+    Args:
+        list_method: Bound list method accepting page_size and page_number,
+                     e.g. api.work_items.get_work_items
+        *args: Positional arguments of list_method (e.g. project_id)
+        columns: Column names (see column_getter)
+        resource_type: Resource type of the endpoint (e.g. 'workitems'), enables the sparse fieldset
+        page_size: Number of resources per page (default: 100)
+        **kwargs: Other keyword arguments of list_method (e.g. query)
+
+    Returns:
+        ColumnarResult with the columns of every resource
+
+    Raises:
+        requests.HTTPError: If a page request fails
+        ValueError: If the columns are invalid
+
+    Example:
+        >>> table = collect_columns(api.work_items.get_work_items, "MyProjectId",
+        ...                         columns=['id', 'title', 'status', 'relationships.author'],
+        ...                         resource_type='workitems', query="type:requirement")
+        >>> table.to_pandas().groupby('status').size()
+    """
+    result = ColumnarResult(columns)
+    if resource_type is not None and kwargs.get('fields') is None:
+        kwargs['fields'] = sparse_fields(resource_type, result.columns)
+    for page in iter_pages(list_method, *args, page_size=page_size, **kwargs):
+        result.extend(page.get('data') or [])
+    return result
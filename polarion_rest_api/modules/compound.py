@@ -0,0 +1,233 @@
+"""
+Compound document module for Polarion REST API.
+Decodes JSON:API responses (primary data plus the 'included' resources requested
+with include=) into resource objects whose relationships are resolved through a
+(type, id) index built once per response.
+"""
+from typing import Optional, Dict, Any, List, Tuple, Union, Iterator
+import requests
+from .bulk import error_detail
+from .json_backend import response_json
+
+
+# Index key of a resource: (type, id)
+ResourceKey = Tuple[str, str]
+
+
+class Resource:
+    """
+    A JSON:API resource of a compound document.
+
+    Attributes are available as resource['title'] or resource.attributes, related
+    resources with resource.related('author'). Relationships are resolved the first
+    time they are asked for, through the index of the document, and then cached.
+
+    Attributes:
+        document: CompoundDocument the resource belongs to
+        raw: The resource object as decoded from the response
+    """
+
+    __slots__ = ('document', 'raw', '_related')
+
+    def __init__(self, document: 'CompoundDocument', raw: Dict[str, Any]):
+        self.document = document
+        self.raw = raw
+        self._related: Dict[str, Any] = {}
+
+    @property
+    def type(self) -> str:
+        return self.raw.get('type')
+
+    @property
+    def id(self) -> str:
+        return self.raw.get('id')
+
+    @property
+    def key(self) -> ResourceKey:
+        """(type, id) of the resource"""
+        return self.type, self.id
+
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        return self.raw.get('attributes') or {}
+
+    @property
+    def relationships(self) -> Dict[str, Any]:
+        """Raw relationship objects, by name"""
+        return self.raw.get('relationships') or {}
+
+    @property
+    def links(self) -> Dict[str, Any]:
+        return self.raw.get('links') or {}
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        return self.raw.get('meta') or {}
+
+    @property
+    def loaded(self) -> bool:
+        """
+        False for a resource that was only referenced (not included), which has
+        a type and an id but no attributes.
+        """
+        return self.key in self.document
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """
+        Value of an attribute, default when the resource does not have it.
+        """
+        return self.attributes.get(name, default)
+
+    def __getitem__(self, name: str) -> Any:
+        return self.attributes[name]
+
+    def related(self, name: str) -> Union['Resource', List['Resource'], None]:
+        """
+        Resolve a relationship.
+
+        Args:
+            name: Relationship name (e.g. 'author', 'linkedWorkItems')
+
+        Returns:
+            The related Resource for to-one relationships, a list of Resources for
+            to-many relationships, None for an empty or unknown relationship.
+            Resources missing from 'included' are returned with loaded == False.
+        """
+        if name not in self._related:
+            data = (self.relationships.get(name) or {}).get('data')
+            if isinstance(data, list):
+                self._related[name] = [self.document.resolve(identifier) for identifier in data]
+            else:
+                self._related[name] = self.document.resolve(data) if data else None
+        return self._related[name]
+
+    def related_ids(self, name: str) -> List[str]:
+        """
+        IDs of the resources of a relationship, without resolving them.
+        """
+        data = (self.relationships.get(name) or {}).get('data')
+        if data is None:
+            return []
+        return [identifier.get('id') for identifier in (data if isinstance(data, list) else [data])]
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Resource) and other.key == self.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __repr__(self) -> str:
+        return f"Resource(type={self.type!r}, id={self.id!r}, loaded={self.loaded})"
+
+
+class CompoundDocument:
+    """
+    Decoded JSON:API response with a (type, id) index of its resources.
+
+    The index over the primary data and the 'included' array is built once, so
+    resolving the relationships of every resource of a page costs one dictionary
+    lookup each instead of a scan of 'included'. Resource objects are created on
+    first access.
+
+    Example:
+        >>> response = api.work_items.get_work_items("MyProjectId", include="author,assignee")
+        >>> document = CompoundDocument.from_response(response)
+        >>> for work_item in document.resources():
+        ...     author = work_item.related('author')
+        ...     print(work_item['title'], author['name'] if author else None)
+    """
+
+    __slots__ = ('raw', '_index', '_resources')
+
+    def __init__(self, body: Dict[str, Any]):
+        self.raw = body
+        self._index: Dict[ResourceKey, Dict[str, Any]] = {}
+        self._resources: Dict[ResourceKey, Resource] = {}
+        for resource in self._primary() + list(body.get('included') or []):
+            key = (resource.get('type'), resource.get('id'))
+            # Primary data wins over an included copy of the same resource
+            if key[1] is not None and key not in self._index:
+                self._index[key] = resource
+
+    @classmethod
+    def from_response(cls, response: requests.Response) -> 'CompoundDocument':
+        """
+        Decode the body of a response of any module.
+
+        Raises:
+            requests.HTTPError: If the response is an error response
+        """
+        if response.status_code >= 300:
+            raise requests.HTTPError(error_detail(response), response=response)
+        return cls(response_json(response))
+
+    def _primary(self) -> List[Dict[str, Any]]:
+        data = self.raw.get('data')
+        if data is None:
+            return []
+        return data if isinstance(data, list) else [data]
+
+    def _wrap(self, raw: Dict[str, Any]) -> Resource:
+        key = (raw.get('type'), raw.get('id'))
+        resource = self._resources.get(key)
+        if resource is None:
+            resource = self._resources[key] = Resource(self, raw)
+        return resource
+
+    @property
+    def data(self) -> Union[Resource, List[Resource], None]:
+        """Primary data: a Resource, a list of Resources (list endpoints) or None"""
+        data = self.raw.get('data')
+        if isinstance(data, list):
+            return [self._wrap(self._index.get((item.get('type'), item.get('id')), item)) for item in data]
+        return self._wrap(self._index.get((data.get('type'), data.get('id')), data)) if data else None
+
+    @property
+    def included(self) -> List[Resource]:
+        return [self._wrap(self._index.get((item.get('type'), item.get('id')), item))
+                for item in self.raw.get('included') or []]
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        return self.raw.get('meta') or {}
+
+    @property
+    def links(self) -> Dict[str, Any]:
+        return self.raw.get('links') or {}
+
+    def resources(self, resource_type: Optional[str] = None) -> List[Resource]:
+        """
+        Primary resources (default), or all resources of the document of one type.
+        """
+        if resource_type is None:
+            data = self.data
+            return data if isinstance(data, list) else ([data] if data else [])
+        return [self._wrap(raw) for key, raw in self._index.items() if key[0] == resource_type]
+
+    def get(self, resource_type: str, resource_id: str) -> Optional[Resource]:
+        """
+        Resource of the document with this type and id, None if it is not in the document.
+        """
+        raw = self._index.get((resource_type, resource_id))
+        return self._wrap(raw) if raw is not None else None
+
+    def resolve(self, identifier: Dict[str, Any]) -> Resource:
+        """
+        Resource of a resource identifier ({'type': ..., 'id': ...}); a resource that
+        is not in the document is returned with only its type and id (loaded == False).
+        """
+        key = (identifier.get('type'), identifier.get('id'))
+        raw = self._index.get(key)
+        return self._wrap(raw if raw is not None else {'type': key[0], 'id': key[1]})
+
+    def __contains__(self, key: ResourceKey) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[Resource]:
+        return iter(self.resources())
+
+    def __repr__(self) -> str:
+        return f"CompoundDocument(data={len(self._primary())}, indexed={len(self._index)})"
@@ -2,9 +2,11 @@
 Document Attachments module for Polarion REST API.
 Handles all Document Attachments related endpoints.
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Iterable, Sequence
 import requests
 from .base import PolarionBase
+from .downloads import DownloadResult, Destination, save_stream, DEFAULT_CHUNK_SIZE, DEFAULT_ALGORITHM
+from .multipart import FileSpec, upload_files, DEFAULT_MAX_FILES, DEFAULT_MAX_BYTES
 
 
 class DocumentAttachments(PolarionBase):
@@ -16,6 +18,7 @@ class DocumentAttachments(PolarionBase):
     - GET methods: Retrieve document attachments
     - PATCH methods: Update document attachments
     - POST methods: Create document attachments
+    - Upload methods: Stream files from disk, several per request
     """
     
     # ========== GET methods ==========
@@ -99,6 +102,46 @@ class DocumentAttachments(PolarionBase):
             params=params if params else None
         )
     
+    def save_document_attachment_content(self,
+                                         project_id: str,
+                                         space_id: str,
+                                         document_name: str,
+                                         attachment_id: str,
+                                         destination: Destination,
+                                         revision: Optional[str] = None,
+                                         chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                         algorithm: str = DEFAULT_ALGORITHM) -> DownloadResult:
+        """
+        Downloads the file content for a specified Document Attachment to a path or file object.
+        
+        Streaming variant of get_document_attachment_content: the content is written in chunks of
+        chunk_size bytes and hashed on the fly, so memory use does not depend on the
+        file size.
+        
+        Args:
+            project_id: The Project ID
+            space_id: The Space ID (Use '_default' for the default Space)
+            document_name: The Document name
+            attachment_id: The Attachment ID
+            destination: Path of the file to write, or binary file object
+            revision: The revision ID
+            chunk_size: Number of bytes read per chunk (default: 1 MiB)
+            algorithm: hashlib algorithm of the checksum (default: 'sha256')
+            
+        Returns:
+            DownloadResult with the size and checksum of the content
+            
+        Raises:
+            ValueError: If the download failed or was incomplete
+        """
+        params = {}
+        if revision:
+            params['revision'] = revision
+        
+        response = self._get_stream(f'projects/{project_id}/spaces/{space_id}/documents/{document_name}/attachments/{attachment_id}/content',
+                                    params=params if params else None)
+        return save_stream(response, destination, chunk_size=chunk_size, algorithm=algorithm)
+    
     def get_document_attachments(self,
                                 project_id: str,
                                 space_id: str,
@@ -328,3 +371,43 @@ class DocumentAttachments(PolarionBase):
             data=data,
             files=files_dict
         )
+    
+    # ========== Upload methods ==========
+    
+    def upload_document_attachments(self,
+                                    project_id: str,
+                                    space_id: str,
+                                    document_name: str,
+                                    files: Iterable[FileSpec],
+                                    titles: Optional[Sequence[Optional[str]]] = None,
+                                    max_files: int = DEFAULT_MAX_FILES,
+                                    max_bytes: int = DEFAULT_MAX_BYTES,
+                                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[requests.Response]:
+        """
+        Uploads files as Document Attachments, streaming them from disk.
+        
+        Several files are sent per request (up to max_files and max_bytes) in a streamed
+        multipart/form-data body, so memory use does not depend on the file sizes.
+        
+        Args:
+            project_id: The Project ID
+            space_id: The Space ID (Use '_default' for the default Space)
+            document_name: The Document name
+            files: Paths, named binary file objects or (filename, source[, content_type]) tuples,
+                   where source is a path, bytes, a file object or an iterator of bytes
+            titles: Optional attachment titles matched with the files by order
+            max_files: Maximum number of files per request (default: 20)
+            max_bytes: Maximum total size of the files of a request (default: 1 GiB)
+            chunk_size: Number of bytes read from the files per chunk (default: 1 MiB)
+        
+        Returns:
+            List of Response objects (201 Created), one per request. Uploading stops
+            at the first failed request.
+        
+        Example:
+            responses = api.document_attachments.upload_document_attachments(
+                "MyProject", "_default", "MyDoc", ["/specs/a.pdf", "/specs/b.pdf"])
+        """
+        return upload_files(self, f'projects/{project_id}/spaces/{space_id}/documents/{document_name}/attachments',
+                            'document_attachments', files, titles=titles, max_files=max_files,
+                            max_bytes=max_bytes, chunk_size=chunk_size)
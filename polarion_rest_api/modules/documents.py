@@ -5,6 +5,8 @@ Handles all Documents related endpoints.
 from typing import Optional, Dict, Any
 import requests
 from .base import PolarionBase
+from .job_waiter import JobHandle
+from .jobs import start_job
 
 
 class Documents(PolarionBase):
@@ -16,6 +18,7 @@ class Documents(PolarionBase):
     - GET methods: Retrieve documents and document field options
     - PATCH methods: Update documents
     - POST methods: Create documents and perform document actions (branch, copy, merge)
+    - Job methods: Start the asynchronous (202 Accepted) operations and return a JobHandle right away
     """
     
     # ========== GET methods ==========
@@ -446,3 +449,70 @@ class Documents(PolarionBase):
             'all/documents/actions/branch',
             json=branch_data
         )
+
+    
+    # ========== Job methods ==========
+    
+    def submit_merge_document_from_master(self,
+                                          project_id: str,
+                                          space_id: str,
+                                          document_name: str,
+                                          merge_data: Optional[Dict[str, Any]] = None,
+                                          timeout: Optional[float] = None) -> JobHandle:
+        """
+        Starts post_merge_document_from_master and returns a handle of its job right away.
+        
+        Args:
+            project_id: The Project ID
+            space_id: The Space ID (Use '_default' for the default Space)
+            document_name: The Branch Document Name
+            merge_data: Merge Document parameters (see post_merge_document_from_master)
+            timeout: Maximum number of seconds to poll the job (default: no limit)
+            
+        Returns:
+            JobHandle with done(), result(timeout) and add_done_callback(fn)
+        """
+        return start_job(self, self.post_merge_document_from_master(project_id, space_id, document_name, merge_data),
+                         timeout=timeout)
+    
+    def submit_merge_document_to_master(self,
+                                        project_id: str,
+                                        space_id: str,
+                                        document_name: str,
+                                        merge_data: Optional[Dict[str, Any]] = None,
+                                        timeout: Optional[float] = None) -> JobHandle:
+        """
+        Starts post_merge_document_to_master and returns a handle of its job right away.
+        
+        Args:
+            project_id: The Project ID
+            space_id: The Space ID (Use '_default' for the default Space)
+            document_name: The Branch Document Name
+            merge_data: Merge Document parameters (see post_merge_document_to_master)
+            timeout: Maximum number of seconds to poll the job (default: no limit)
+            
+        Returns:
+            JobHandle with done(), result(timeout) and add_done_callback(fn)
+        """
+        return start_job(self, self.post_merge_document_to_master(project_id, space_id, document_name, merge_data),
+                         timeout=timeout)
+    
+    def submit_branch_documents(self,
+                                branch_data: Dict[str, Any],
+                                timeout: Optional[float] = None) -> JobHandle:
+        """
+        Starts post_branch_documents and returns a handle of its job right away.
+        
+        Args:
+            branch_data: Branch Documents parameters (see post_branch_documents)
+            timeout: Maximum number of seconds to poll the job (default: no limit)
+            
+        Returns:
+            JobHandle with done(), result(timeout) and add_done_callback(fn)
+            
+        Example:
+            >>> handles = [api.documents.submit_branch_documents(config) for config in configs]
+            >>> for handle in handles:
+            ...     print(handle.job_id, handle.result().status)
+        """
+        return start_job(self, self.post_branch_documents(branch_data), timeout=timeout)
@@ -0,0 +1,444 @@
+"""
+Download helper module for Polarion REST API.
+Writes streamed responses (attachment contents, job result files) to a path or a
+file object in fixed-size chunks, computing a checksum on the fly. Large files can
+be fetched with HTTP Range requests, resuming after connection failures and
+optionally in parallel segments.
+"""
+import hashlib
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union, BinaryIO, Callable, Tuple
+import requests
+from .bulk import error_detail
+from .scheduler import run_in_context
+
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_ALGORITHM = 'sha256'
+DEFAULT_RETRIES = 3
+DEFAULT_RETRY_DELAY = 1.0
+DEFAULT_SEGMENT_WORKERS = 4
+
+# A download target: path of the file to write, or binary file object
+Destination = Union[str, os.PathLike, BinaryIO]
+
+# Inclusive byte range (first, last); last is None for "until the end of the file"
+ByteRange = Tuple[int, Optional[int]]
+
+# Errors after which a ranged download is resumed from the last byte received
+RESUMABLE_ERRORS = (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)
+
+_CONTENT_RANGE = re.compile(r'bytes\s+(?:(\d+)-(\d+)|\*)/(\d+|\*)')
+
+
+class DownloadResult:
+    """
+    Outcome of a streamed download.
+
+    Attributes:
+        path: Path of the written file, None when written to a file object
+        size: Number of bytes written
+        checksum: Hex digest of the content
+        algorithm: hashlib algorithm of the checksum (e.g. 'sha256')
+        content_type: Content-Type reported by the server
+    """
+
+    __slots__ = ('path', 'size', 'checksum', 'algorithm', 'content_type')
+
+    def __init__(self, path: Optional[str], size: int, checksum: str, algorithm: str,
+                 content_type: Optional[str] = None):
+        self.path = path
+        self.size = size
+        self.checksum = checksum
+        self.algorithm = algorithm
+        self.content_type = content_type
+
+    def __repr__(self) -> str:
+        return (f"DownloadResult(path={self.path!r}, size={self.size}, "
+                f"{self.algorithm}={self.checksum[:16]}...)")
+
+
+def copy_stream(response: requests.Response, file: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                digest: Optional['hashlib._Hash'] = None) -> int:
+    """
+    Write the body of a streamed response to a file object chunk by chunk.
+
+    Args:
+        response: Response sent with stream=True
+        file: Binary file object to write to
+        chunk_size: Number of bytes read per chunk
+        digest: Optional hashlib object updated with every chunk
+
+    Returns:
+        Number of bytes written
+    """
+    written = 0
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        if chunk:
+            file.write(chunk)
+            if digest is not None:
+                digest.update(chunk)
+            written += len(chunk)
+    return written
+
+
+def _check_size(size: int, expected: Optional[str]) -> int:
+    """
+    Raise ValueError when fewer or more bytes were received than announced.
+    """
+    if expected is not None and size != int(expected):
+        raise ValueError(f"Incomplete download: received {size} of {expected} bytes")
+    return size
+
+
+def save_stream(response: requests.Response, destination: Destination,
+                chunk_size: int = DEFAULT_CHUNK_SIZE,
+                algorithm: str = DEFAULT_ALGORITHM) -> DownloadResult:
+    """
+    Save a streamed response to a path or a binary file object.
+
+    Memory use is bounded by chunk_size whatever the size of the content. A path is
+    written to '<path>.part' first and renamed once the download is complete, so an
+    interrupted download never leaves a truncated file under the final name. The
+    response is closed in all cases.
+
+    Args:
+        response: Response sent with stream=True
+        destination: Path of the file to write, or binary file object
+        chunk_size: Number of bytes read per chunk (default: 1 MiB)
+        algorithm: hashlib algorithm of the checksum (default: 'sha256')
+
+    Returns:
+        DownloadResult with the size and checksum of the content
+
+    Raises:
+        ValueError: If the server refused the download or sent less content than announced
+    """
+    digest = hashlib.new(algorithm)
+    try:
+        if response.status_code >= 300:
+            raise ValueError(f"Download failed: {error_detail(response)}")
+        headers = response.headers or {}
+        expected = headers.get('Content-Length')
+        # requests decodes gzip transparently; the length is then the one of the encoded body
+        if headers.get('Content-Encoding') or not str(expected).isdigit():
+            expected = None
+
+        if hasattr(destination, 'write'):
+            path = None
+            size = _check_size(copy_stream(response, destination, chunk_size, digest), expected)
+        else:
+            path = os.fspath(destination)
+            partial = f"{path}.part"
+            try:
+                with open(partial, 'wb') as file:
+                    size = _check_size(copy_stream(response, file, chunk_size, digest), expected)
+                os.replace(partial, path)
+            except BaseException:
+                if os.path.exists(partial):
+                    os.remove(partial)
+                raise
+        return DownloadResult(path, size, digest.hexdigest(), algorithm, headers.get('Content-Type'))
+    finally:
+        response.close()
+
+
+class _RangeRequest(tuple):
+    """
+    Byte range (first, last) continuing an earlier response, with the validator
+    (ETag or Last-Modified) of that response.
+    """
+
+    def __new__(cls, first: int, last: Optional[int], if_range: Optional[str] = None):
+        request = super().__new__(cls, (first, last))
+        request.if_range = if_range
+        return request
+
+
+def range_header(byte_range: Optional[ByteRange]) -> Optional[dict]:
+    """
+    Request headers asking for a byte range, None for the whole content.
+
+    Ranges continuing an earlier response of save_ranged also send its validator as
+    If-Range, so a file changed on the server is sent whole instead of being spliced
+    onto the bytes already received.
+    """
+    if byte_range is None:
+        return None
+    first, last = byte_range
+    headers = {'Range': f"bytes={first}-{'' if last is None else last}"}
+    if_range = getattr(byte_range, 'if_range', None)
+    if if_range:
+        headers['If-Range'] = if_range
+    return headers
+
+
+def _validator(headers) -> Optional[str]:
+    """
+    Validator of a response usable in If-Range: a strong ETag, or else Last-Modified.
+    """
+    etag = headers.get('ETag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return headers.get('Last-Modified')
+
+
+def _content_range(response: requests.Response) -> Tuple[Optional[int], Optional[int]]:
+    """
+    First byte and total size announced by the Content-Range header of a response.
+    """
+    match = _CONTENT_RANGE.match((response.headers or {}).get('Content-Range', ''))
+    if not match:
+        return None, None
+    first, _, total = match.groups()
+    return (int(first) if first is not None else None), (int(total) if total != '*' else None)
+
+
+class _Interrupted(Exception):
+    """The connection was closed before the end of the requested range."""
+
+
+class _RangeIgnored(Exception):
+    """The server answered a Range request with the whole content."""
+
+
+class _Segment:
+    """
+    Part of a ranged download and how far it got.
+    """
+
+    __slots__ = ('first', 'last', 'position', 'total', 'content_type', 'validator')
+
+    def __init__(self, first: int, last: Optional[int], position: Optional[int] = None,
+                 validator: Optional[str] = None):
+        self.first = first
+        self.last = last
+        self.position = first if position is None else position
+        self.total = None
+        self.content_type = None
+        self.validator = validator
+
+    @property
+    def end(self) -> Optional[int]:
+        """Offset after the last byte of the segment, None when it is not known yet"""
+        if self.last is not None:
+            return self.last + 1
+        return self.total
+
+    def byte_range(self) -> Optional[ByteRange]:
+        if self.position == 0 and self.last is None:
+            return None
+        return _RangeRequest(self.position, self.last, self.validator)
+
+
+def _fetch_segment(open_range: Callable[[Optional[ByteRange]], requests.Response], path: str,
+                   segment: _Segment, chunk_size: int, retries: int, retry_delay: float):
+    """
+    Download a segment into the file at path, resuming with a Range request after
+    each connection failure. Failures are counted again from zero once a resumed
+    request made progress.
+    """
+    failures = 0
+    while True:
+        position = segment.position
+        try:
+            response = open_range(segment.byte_range())
+            try:
+                _write_segment(response, path, segment, chunk_size)
+                return
+            finally:
+                response.close()
+        except (_Interrupted,) + RESUMABLE_ERRORS as error:
+            failures = 1 if segment.position > position else failures + 1
+            if failures > retries:
+                raise ValueError(f"Download interrupted at byte {segment.position} "
+                                 f"after {retries} retries: {error}") from error
+            time.sleep(retry_delay * 2 ** (failures - 1))
+
+
+def _write_segment(response: requests.Response, path: str, segment: _Segment, chunk_size: int):
+    """
+    Write the body of one response of a segment at its position in the file.
+    """
+    ranged = segment.byte_range() is not None
+    if response.status_code == 416 and segment.last is None:
+        # Resuming a file that is already complete, or larger than the current content
+        _, total = _content_range(response)
+        if total is not None and total == segment.position:
+            segment.total = total
+            return
+        segment.position = 0
+        raise _Interrupted("stored part does not match the remote file, restarting")
+    if response.status_code >= 300:
+        raise ValueError(f"Download failed: {error_detail(response)}")
+    headers = response.headers or {}
+    segment.content_type = headers.get('Content-Type')
+    if response.status_code == 206:
+        first, total = _content_range(response)
+        if first != segment.position:
+            raise ValueError(f"Download failed: asked for byte {segment.position}, received byte {first}")
+        segment.total = total
+        if total is not None and segment.last is not None and segment.last >= total:
+            # The range asked for more bytes than the file has
+            segment.last = total - 1
+        if segment.validator is None:
+            segment.validator = _validator(headers)
+    else:
+        if ranged:
+            if segment.first != 0 or segment.last is not None:
+                raise _RangeIgnored()
+            # Server ignored the Range header of a resumed download, or the file changed: start over
+            segment.position = 0
+        segment.validator = _validator(headers)
+        expected = headers.get('Content-Length')
+        if not headers.get('Content-Encoding') and str(expected).isdigit():
+            segment.total = int(expected)
+
+    end = segment.end
+    with open(path, 'r+b') as file:
+        file.seek(segment.position)
+        if segment.last is None:
+            file.truncate()
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            if not chunk:
+                continue
+            if end is not None:
+                chunk = chunk[:end - segment.position]
+            file.write(chunk)
+            segment.position += len(chunk)
+            if end is not None and segment.position >= end:
+                break
+    if end is not None and segment.position < end:
+        raise _Interrupted(f"received {segment.position - segment.first} of {end - segment.first} bytes")
+
+
+def _file_checksum(path: str, algorithm: str, chunk_size: int) -> str:
+    digest = hashlib.new(algorithm)
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def save_ranged(open_range: Callable[[Optional[ByteRange]], requests.Response],
+                destination: Union[str, os.PathLike],
+                chunk_size: int = DEFAULT_CHUNK_SIZE,
+                algorithm: str = DEFAULT_ALGORITHM,
+                segment_size: Optional[int] = None,
+                max_workers: int = DEFAULT_SEGMENT_WORKERS,
+                retries: int = DEFAULT_RETRIES,
+                retry_delay: float = DEFAULT_RETRY_DELAY,
+                expected_checksum: Optional[str] = None,
+                resume: bool = True) -> DownloadResult:
+    """
+    Save a large file to a path with HTTP Range requests.
+
+    The content is written to '<path>.part'. When the connection fails the download
+    continues from the last byte received instead of starting over. Without
+    segment_size the file is fetched by one stream and a '.part' file left by an
+    earlier, failed call is resumed as well. With segment_size the file is split
+    into ranges of that size fetched by max_workers threads. When the server ignores
+    the Range header the whole content is streamed once, as by save_stream. Resumed
+    ranges send the ETag or Last-Modified of the first response as If-Range (kept in
+    '<path>.part.validator' between calls), so a file changed on the server is
+    fetched again from the start. The size announced by the server and, if given,
+    expected_checksum are verified before the file is renamed to its final name.
+
+    Args:
+        open_range: Callable sending the streamed request for a byte range (None for
+                    the whole content) with the headers of range_header(), e.g.
+                    lambda r: jobs.stream_job_result_file_content(job_id, filename, byte_range=r)
+        destination: Path of the file to write
+        chunk_size: Number of bytes read per chunk (default: 1 MiB)
+        algorithm: hashlib algorithm of the checksum (default: 'sha256')
+        segment_size: Size of the ranges fetched in parallel (default: one stream)
+        max_workers: Number of ranges fetched at the same time (default: 4)
+        retries: Number of resumptions of a range without progress (default: 3)
+        retry_delay: Delay before the first resumption in seconds, doubled for the next
+        expected_checksum: Hex digest the content must have
+        resume: Continue from a '.part' file left by an earlier call (single stream only)
+
+    Returns:
+        DownloadResult with the size and checksum of the file
+
+    Raises:
+        ValueError: If the server refused the download, the connection kept failing
+                    (the '.part' file is kept for the next call), or the size or
+                    checksum of the content is wrong
+    """
+    path = os.fspath(destination)
+    partial = f"{path}.part"
+    validator_path = f"{partial}.validator"
+    if segment_size is not None and segment_size < 1:
+        raise ValueError("segment_size must be at least 1")
+    if segment_size is None and resume and os.path.exists(partial):
+        first = _Segment(0, None, position=os.path.getsize(partial), validator=_read_validator(validator_path))
+    else:
+        open(partial, 'wb').close()
+        first = _Segment(0, None if segment_size is None else segment_size - 1)
+
+    try:
+        try:
+            _fetch_segment(open_range, partial, first, chunk_size, retries, retry_delay)
+        except _RangeIgnored:
+            first = _Segment(0, None)
+            _fetch_segment(open_range, partial, first, chunk_size, retries, retry_delay)
+        total = first.total
+        if first.last is not None and total is not None and total > first.end:
+            segments = [_Segment(start, min(start + segment_size, total) - 1, validator=first.validator)
+                        for start in range(first.end, total, segment_size)]
+            with open(partial, 'r+b') as file:
+                file.truncate(total)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(run_in_context(_fetch_segment), open_range, partial, segment,
+                                           chunk_size, retries, retry_delay)
+                           for segment in segments]
+                for future in futures:
+                    future.result()
+
+        size = os.path.getsize(partial)
+        if total is not None and size != total:
+            raise ValueError(f"Incomplete download: received {size} of {total} bytes")
+        checksum = _file_checksum(partial, algorithm, chunk_size)
+        if expected_checksum is not None and checksum != expected_checksum.lower():
+            raise ValueError(f"Checksum mismatch: expected {expected_checksum}, received {checksum}")
+        os.replace(partial, path)
+        _remove(validator_path)
+        return DownloadResult(path, size, checksum, algorithm, first.content_type)
+    except _RangeIgnored:
+        # A segment after the first one got the whole content: ranges are not honoured
+        # or the file changed since the first response
+        _remove(partial, validator_path)
+        return save_ranged(open_range, path, chunk_size=chunk_size, algorithm=algorithm,
+                           retries=retries, retry_delay=retry_delay,
+                           expected_checksum=expected_checksum, resume=False)
+    except BaseException as error:
+        keep = segment_size is None and isinstance(error.__cause__, RESUMABLE_ERRORS + (_Interrupted,))
+        if not keep:
+            _remove(partial, validator_path)
+        elif first.validator:
+            with open(validator_path, 'w', encoding='utf-8') as file:
+                file.write(first.validator)
+        else:
+            _remove(validator_path)
+        raise
+
+
+def _read_validator(path: str) -> Optional[str]:
+    """
+    Validator saved with a '.part' file by an earlier call, None if there is none.
+    """
+    try:
+        with open(path, encoding='utf-8') as file:
+            return file.read().strip() or None
+    except OSError:
+        return None
+
+
+def _remove(*paths: str):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
@@ -0,0 +1,201 @@
+"""
+Fan-out helper module for Polarion REST API.
+Runs one API method over many arguments concurrently, with per-call error
+capture, ordered or as-completed results, cancellation and progress callbacks.
+"""
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator
+from .scheduler import run_in_context
+
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class CallResult:
+    """
+    Outcome of a single call of a fan-out.
+
+    Attributes:
+        index: Position of the arguments in the input iterable
+        args: Arguments the method was called with
+        value: Return value of the call (usually a Response object), None if it raised
+        error: Exception raised by the call, None if it returned
+    """
+
+    __slots__ = ('index', 'args', 'value', 'error')
+
+    def __init__(self, index: int, args: Any, value: Any = None, error: Optional[BaseException] = None):
+        self.index = index
+        self.args = args
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """
+        True when the call returned and, for responses, with a status code below 300.
+        """
+        if self.error is not None:
+            return False
+        status_code = getattr(self.value, 'status_code', None)
+        return status_code is None or status_code < 300
+
+    def __repr__(self) -> str:
+        return f"CallResult(index={self.index}, args={self.args!r}, value={self.value!r}, error={self.error!r})"
+
+
+def call_with(method: Callable[..., Any], args: Any) -> Any:
+    """
+    Call a method with one element of a fan-out argument iterable.
+
+    Tuples are passed as positional arguments, dicts as keyword arguments and
+    any other value as the single positional argument.
+
+    Args:
+        method: Method to call
+        args: Arguments of the call
+
+    Returns:
+        Return value of the method
+    """
+    if isinstance(args, tuple):
+        return method(*args)
+    if isinstance(args, dict):
+        return method(**args)
+    return method(args)
+
+
+class FanOut:
+    """
+    Concurrent execution of one method over an iterable of arguments.
+
+    Calls are started lazily while the results are iterated, with at most
+    `max_workers` calls running and `2 * max_workers` submitted at a time, so
+    argument iterables of any length can be used. Exceptions raised by a call are
+    captured in its CallResult instead of interrupting the other calls.
+
+    The counters `submitted`, `completed` and `failed` are updated while the
+    fan-out runs and can be read from the progress callback.
+
+    Example:
+        >>> fan_out = FanOut(api.work_items.get_work_item, (("MyProjectId", wi) for wi in ids))
+        >>> for call in fan_out:
+        ...     if not call.ok:
+        ...         print(call.args, call.error or call.value.status_code)
+    """
+
+    def __init__(self, method: Callable[..., Any],
+                 arg_iterable: Iterable[Any],
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 ordered: bool = True,
+                 on_progress: Optional[Callable[['FanOut'], None]] = None):
+        """
+        Initialize the fan-out.
+
+        Args:
+            method: Method called for every element of arg_iterable
+            arg_iterable: Arguments of the calls (tuple: positional, dict: keyword,
+                          other: single positional argument)
+            max_workers: Maximum number of calls running in parallel (default: 8)
+            ordered: Yield results in input order (default) or as they complete
+            on_progress: Optional callable invoked with the FanOut after every completed call
+
+        Raises:
+            ValueError: If max_workers is lower than 1
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self.method = method
+        self.max_workers = max_workers
+        self.ordered = ordered
+        self.on_progress = on_progress
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self._arg_iterable = arg_iterable
+        self._cancelled = threading.Event()
+        self._started = False
+
+    def cancel(self):
+        """
+        Stop starting new calls. Calls already running complete and are still yielded,
+        calls not started yet are dropped. Safe to call from any thread or from the
+        progress callback.
+        """
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        True once cancel() was called.
+        """
+        return self._cancelled.is_set()
+
+    def results(self) -> list:
+        """
+        Run all calls and return the list of CallResult objects.
+        """
+        return list(self)
+
+    def _call(self, index: int, args: Any) -> CallResult:
+        """
+        Run one call, capturing any exception.
+        """
+        try:
+            return CallResult(index, args, value=call_with(self.method, args))
+        except Exception as e:
+            return CallResult(index, args, error=e)
+
+    def _done(self, call: CallResult):
+        """
+        Update the counters and report progress for a completed call.
+        """
+        self.completed += 1
+        if not call.ok:
+            self.failed += 1
+        if self.on_progress is not None:
+            self.on_progress(self)
+
+    def __iter__(self) -> Iterator[CallResult]:
+        if self._started:
+            raise RuntimeError("A FanOut can only be iterated once")
+        self._started = True
+
+        arguments = enumerate(self._arg_iterable)
+        buffered: Dict[int, CallResult] = {}
+        next_index = 0
+        pending = set()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                while True:
+                    if not self.cancelled:
+                        # Results held back behind a slow call count against the window, so
+                        # ordered fan-outs do not keep running ahead of the consumer
+                        window = self.max_workers * 2 - len(pending) - len(buffered)
+                        for index, args in itertools.islice(arguments, window):
+                            pending.add(executor.submit(run_in_context(self._call), index, args))
+                            self.submitted += 1
+                    if not pending:
+                        break
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    if self.cancelled:
+                        pending = {future for future in pending if not future.cancel()}
+                    for future in sorted(done, key=lambda future: future.result().index):
+                        call = future.result()
+                        self._done(call)
+                        if not self.ordered:
+                            yield call
+                            continue
+                        buffered[call.index] = call
+                        while next_index in buffered:
+                            yield buffered.pop(next_index)
+                            next_index += 1
+            finally:
+                # Consumer stopped early: do not start the calls still queued
+                for future in pending:
+                    future.cancel()
+        # Cancelled fan-outs may leave gaps; yield what completed after the gap
+        for index in sorted(buffered):
+            yield buffered[index]
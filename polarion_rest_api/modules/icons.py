@@ -2,9 +2,10 @@
 Icons module for Polarion REST API.
 Handles all Icons related endpoints.
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Iterable
 import requests
 from .base import PolarionBase
+from .multipart import FileSpec, upload_files, DEFAULT_CHUNK_SIZE, DEFAULT_MAX_FILES, DEFAULT_MAX_BYTES
 
 
 class Icons(PolarionBase):
@@ -15,6 +16,7 @@ class Icons(PolarionBase):
     Methods are organized by HTTP method type (same order as Swagger documentation):
     - GET methods: Retrieve icons from different contexts
     - POST methods: Create icons in global and project contexts
+    - Upload methods: Stream icon files from disk, several per request
     """
     
     # ========== GET methods ==========
@@ -318,3 +320,67 @@ class Icons(PolarionBase):
         """
         return self._post(f'projects/{project_id}/enumerations/icons',
                          data=data, files=files)
+    
+    # ========== Upload methods ==========
+    
+    def upload_global_icons(self,
+                            files: Iterable[FileSpec],
+                            max_files: int = DEFAULT_MAX_FILES,
+                            max_bytes: int = DEFAULT_MAX_BYTES,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[requests.Response]:
+        """
+        Uploads files as Icons in the Global context, streaming them from disk.
+        
+        Several files are sent per request (up to max_files and max_bytes) in a streamed
+        multipart/form-data body, so memory use does not depend on the file sizes.
+        
+        Args:
+            files: Paths, named binary file objects or (filename, source[, content_type]) tuples,
+                   where source is a path, bytes, a file object or an iterator of bytes
+            max_files: Maximum number of files per request (default: 20)
+            max_bytes: Maximum total size of the files of a request (default: 1 GiB)
+            chunk_size: Number of bytes read from the files per chunk (default: 1 MiB)
+        
+        Returns:
+            List of Response objects (201 Created), one per request. Uploading stops
+            at the first failed request.
+        
+        Example:
+            responses = api.icons.upload_global_icons(
+                ["/icons/bug.png", "/icons/story.png"])
+        """
+        return upload_files(self, 'enumerations/icons',
+                            'icons', files, file_attributes=False, max_files=max_files,
+                            max_bytes=max_bytes, chunk_size=chunk_size)
+    
+    def upload_project_icons(self,
+                             project_id: str,
+                             files: Iterable[FileSpec],
+                             max_files: int = DEFAULT_MAX_FILES,
+                             max_bytes: int = DEFAULT_MAX_BYTES,
+                             chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[requests.Response]:
+        """
+        Uploads files as Icons in the Project context, streaming them from disk.
+        
+        Several files are sent per request (up to max_files and max_bytes) in a streamed
+        multipart/form-data body, so memory use does not depend on the file sizes.
+        
+        Args:
+            project_id: The Project ID
+            files: Paths, named binary file objects or (filename, source[, content_type]) tuples,
+                   where source is a path, bytes, a file object or an iterator of bytes
+            max_files: Maximum number of files per request (default: 20)
+            max_bytes: Maximum total size of the files of a request (default: 1 GiB)
+            chunk_size: Number of bytes read from the files per chunk (default: 1 MiB)
+        
+        Returns:
+            List of Response objects (201 Created), one per request. Uploading stops
+            at the first failed request.
+        
+        Example:
+            responses = api.icons.upload_project_icons(
+                "MyProject", ["/icons/bug.png"])
+        """
+        return upload_files(self, f'projects/{project_id}/enumerations/icons',
+                            'icons', files, file_attributes=False, max_files=max_files,
+                            max_bytes=max_bytes, chunk_size=chunk_size)
@@ -0,0 +1,517 @@
+"""
+Job waiter module for Polarion REST API.
+Polls asynchronous Polarion jobs (returned by the 202 Accepted operations) with
+jittered exponential backoff, many jobs at once from a single scheduler thread.
+"""
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, List, Iterable, Union, Callable
+import requests
+from .bulk import RETRY_STATUS_CODES, error_detail
+from .downloads import (DownloadResult, Destination, save_stream, DEFAULT_CHUNK_SIZE, DEFAULT_ALGORITHM,
+                        DEFAULT_RETRIES)
+from .json_backend import response_json
+
+
+DEFAULT_INITIAL_INTERVAL = 0.5
+DEFAULT_MAX_INTERVAL = 10.0
+BACKOFF_FACTOR = 1.5
+
+# Seconds the scheduler thread waits for new jobs before it stops
+IDLE_TIMEOUT = 5.0
+
+# Job states and status types after which a job does not change anymore
+TERMINAL_STATES = ('FINISHED', 'ABORTED', 'CANCELLED', 'CANCELED', 'FAILED')
+FINAL_STATUSES = ('OK', 'FAILED', 'CANCELLED')
+
+# A job given as its ID, as the 202 response of the operation that started it,
+# or as the job resource of such a response
+JobReference = Union[str, requests.Response, Dict[str, Any]]
+
+
+def job_id_of(job: JobReference) -> str:
+    """
+    Return the ID of a job.
+
+    Args:
+        job: Job ID, 202 Accepted response returning the job, or job resource
+
+    Returns:
+        The Job ID
+
+    Raises:
+        ValueError: If no job ID can be found (e.g. the operation failed)
+    """
+    if isinstance(job, str):
+        return job
+    resource = job
+    if not isinstance(job, dict):
+        if job.status_code >= 300:
+            raise ValueError(f"The operation did not start a job: {error_detail(job)}")
+        try:
+            resource = response_json(job)
+        except ValueError:
+            raise ValueError("The response does not contain a job resource")
+    if isinstance(resource.get('data'), dict):
+        resource = resource['data']
+    job_id = resource.get('id') or (resource.get('attributes') or {}).get('jobId')
+    if not job_id:
+        raise ValueError(f"No job ID found in {resource!r}")
+    return job_id
+
+
+class JobResultFile:
+    """
+    Handle of a file produced by a job (e.g. an Excel export).
+
+    Attributes:
+        job_id: The Job ID
+        filename: The Download File Name
+        url: Download URL reported by the job
+    """
+
+    __slots__ = ('job_id', 'filename', 'url', '_jobs')
+
+    def __init__(self, jobs: Any, job_id: str, filename: str, url: Optional[str] = None):
+        self._jobs = jobs
+        self.job_id = job_id
+        self.filename = filename
+        self.url = url
+
+    def download(self) -> requests.Response:
+        """
+        Download the file content with Jobs.get_job_result_file_content.
+
+        Returns:
+            Response object containing the file content
+        """
+        return self._jobs.get_job_result_file_content(self.job_id, self.filename)
+
+    def save(self, destination: Destination,
+             chunk_size: int = DEFAULT_CHUNK_SIZE,
+             algorithm: str = DEFAULT_ALGORITHM,
+             segment_size: Optional[int] = None,
+             retries: int = DEFAULT_RETRIES,
+             expected_checksum: Optional[str] = None) -> DownloadResult:
+        """
+        Stream the file content to a path or a binary file object without loading
+        it into memory. Downloads to a path resume with Range requests after a
+        connection failure (see Jobs.save_job_result_file_content); file objects
+        are written by a single stream (see downloads.save_stream).
+
+        Args:
+            destination: Path of the file to write, or binary file object
+            chunk_size: Number of bytes read per chunk (default: 1 MiB)
+            algorithm: hashlib algorithm of the checksum (default: 'sha256')
+            segment_size: Size in bytes of the ranges fetched in parallel (paths only)
+            retries: Number of resumptions of a range without progress (paths only)
+            expected_checksum: Hex digest the file must have (paths only)
+
+        Returns:
+            DownloadResult with the size and checksum of the file
+
+        Raises:
+            ValueError: If the server refuses the download, or it keeps failing
+        """
+        if hasattr(destination, 'write'):
+            response = self._jobs.stream_job_result_file_content(self.job_id, self.filename)
+            return save_stream(response, destination, chunk_size=chunk_size, algorithm=algorithm)
+        return self._jobs.save_job_result_file_content(
+            self.job_id, self.filename, destination, segment_size=segment_size, retries=retries,
+            expected_checksum=expected_checksum, chunk_size=chunk_size, algorithm=algorithm)
+
+    def __repr__(self) -> str:
+        return f"JobResultFile(job_id={self.job_id!r}, filename={self.filename!r})"
+
+
+class JobResult:
+    """
+    Final outcome of a job.
+
+    Attributes:
+        job_id: The Job ID (None when the operation did not start a job)
+        state: Last state reported by the server (e.g. 'FINISHED')
+        status: Status type ('OK', 'FAILED', 'CANCELLED', 'UNKNOWN'), None if never received
+        message: Status message
+        files: Handles of the files produced by the job
+        data: Last job resource received
+        polls: Number of GET requests made for the job
+        error: Error detail when the job could not be polled
+        timed_out: True when the job was still running at the timeout
+    """
+
+    def __init__(self, job_id: Optional[str], data: Optional[Dict[str, Any]] = None, files: Optional[List[JobResultFile]] = None,
+                 polls: int = 0, error: Optional[str] = None, timed_out: bool = False):
+        attributes = (data or {}).get('attributes') or {}
+        status = attributes.get('status') or {}
+        self.job_id = job_id
+        self.state = attributes.get('state')
+        self.status = status.get('type')
+        self.message = status.get('message')
+        self.files = files or []
+        self.data = data
+        self.polls = polls
+        self.error = error
+        self.timed_out = timed_out
+
+    @property
+    def ok(self) -> bool:
+        """
+        True when the job finished with status 'OK'.
+        """
+        return self.status == 'OK' and self.error is None and not self.timed_out
+
+    def __repr__(self) -> str:
+        return (f"JobResult(job_id={self.job_id!r}, state={self.state!r}, status={self.status!r}, "
+                f"files={len(self.files)}, polls={self.polls}, timed_out={self.timed_out})")
+
+
+class JobHandle:
+    """
+    Future-style handle of a job started by a 202 Accepted operation.
+
+    Returned right away by the submit_* methods of the modules; the job is polled
+    in the background by the JobWaiter shared by all modules of a client. When the
+    operation did not start a job, the handle is already done and its result
+    carries the error.
+
+    Attributes:
+        response: Response of the operation that started the job
+        job_id: The Job ID, None when the operation did not start a job
+
+    Example:
+        >>> handle = api.test_runs.submit_export_excel_tests("MyProjectId", "MyTestRunId")
+        >>> handle.add_done_callback(lambda h: print(h.job_id, h.result().status))
+        >>> handle.save_result_file("export.xlsx", timeout=600)
+    """
+
+    __slots__ = ('response', 'job_id', '_future')
+
+    def __init__(self, response: Any, job_id: Optional[str], future: 'Future[JobResult]'):
+        self.response = response
+        self.job_id = job_id
+        self._future = future
+
+    def done(self) -> bool:
+        """
+        True once the job finished, timed out or could not be polled.
+        """
+        return self._future.done()
+
+    def result(self, timeout: Optional[float] = None) -> JobResult:
+        """
+        Wait for the job and return its JobResult.
+
+        Args:
+            timeout: Maximum number of seconds to block (default: no limit). This only
+                     bounds this call; the job itself keeps being polled.
+
+        Returns:
+            JobResult of the job
+
+        Raises:
+            concurrent.futures.TimeoutError: If the job is not done within timeout
+        """
+        return self._future.result(timeout)
+
+    def add_done_callback(self, fn: Callable[['JobHandle'], Any]):
+        """
+        Call fn with this handle once the job is done (immediately if it already is).
+        Callbacks run on the scheduler thread and should return quickly.
+        """
+        self._future.add_done_callback(lambda _: fn(self))
+
+    def save_result_file(self, destination: Destination,
+                         filename: Optional[str] = None,
+                         timeout: Optional[float] = None,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE,
+                         segment_size: Optional[int] = None,
+                         retries: int = DEFAULT_RETRIES) -> JobResultFile:
+        """
+        Wait for the job and stream one of its result files to destination.
+
+        Args:
+            destination: Path of the file to write, or binary file object
+            filename: Name of the result file (default: the first file of the job)
+            timeout: Maximum number of seconds to wait for the job (default: no limit)
+            chunk_size: Number of bytes read per chunk (default: 1 MiB)
+            segment_size: Size in bytes of the ranges fetched in parallel (default: one stream)
+            retries: Number of resumptions of a range without progress (default: 3)
+
+        Returns:
+            The JobResultFile that was saved
+
+        Raises:
+            ValueError: If the job did not finish with status 'OK' or has no such file
+            concurrent.futures.TimeoutError: If the job is not done within timeout
+        """
+        result = self.result(timeout)
+        if not result.ok:
+            raise ValueError(f"Job {result.job_id} did not succeed: "
+                             f"{result.error or result.message or result.state}")
+        files = [f for f in result.files if filename is None or f.filename == filename]
+        if not files:
+            raise ValueError(f"Job {result.job_id} produced no result file {filename or ''}".rstrip())
+        files[0].save(destination, chunk_size=chunk_size, segment_size=segment_size, retries=retries)
+        return files[0]
+
+    def __repr__(self) -> str:
+        return f"JobHandle(job_id={self.job_id!r}, done={self.done()})"
+
+
+def is_finished(data: Dict[str, Any]) -> bool:
+    """
+    True when a job resource reports a terminal state or a final status.
+    """
+    attributes = data.get('attributes') or {}
+    state = str(attributes.get('state') or '').upper()
+    status = str((attributes.get('status') or {}).get('type') or '').upper()
+    return state in TERMINAL_STATES or status in FINAL_STATUSES
+
+
+class _PolledJob:
+    """
+    Polling state of one job.
+    """
+
+    __slots__ = ('job_id', 'future', 'deadline', 'interval', 'max_interval', 'polls', 'data')
+
+    def __init__(self, job_id: str, future: Future, deadline: Optional[float],
+                 interval: float, max_interval: float):
+        self.job_id = job_id
+        self.future = future
+        self.deadline = deadline
+        self.interval = interval
+        self.max_interval = max_interval
+        self.polls = 0
+        self.data: Optional[Dict[str, Any]] = None
+
+
+class JobWaiter:
+    """
+    Single scheduler polling any number of jobs.
+
+    Jobs are kept in a queue ordered by their next poll time and polled one after
+    the other by one background thread (started on demand and stopped after
+    idle_timeout seconds without jobs), each with its own jittered exponential
+    backoff (the interval grows by 1.5x per poll up to max_interval, +/-20% jitter).
+    Waiting on hundreds of jobs therefore costs one thread and spreads the GET
+    requests over time instead of hammering the server.
+
+    Example:
+        >>> waiter = JobWaiter(api.jobs)
+        >>> results = waiter.wait([export_response, import_response], timeout=600)
+        >>> for result in results:
+        ...     print(result.job_id, result.status, [f.filename for f in result.files])
+    """
+
+    def __init__(self, jobs: Any,
+                 initial_interval: float = DEFAULT_INITIAL_INTERVAL,
+                 max_interval: float = DEFAULT_MAX_INTERVAL):
+        """
+        Initialize the waiter.
+
+        Args:
+            jobs: Jobs module used to poll the jobs
+            initial_interval: Delay in seconds before the first poll of a job (default: 0.5)
+            max_interval: Maximum delay in seconds between two polls of a job (default: 10.0)
+        """
+        self.jobs = jobs
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self._queue: List[Any] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.idle_timeout = IDLE_TIMEOUT
+
+    def submit(self, job: JobReference, timeout: Optional[float] = None,
+               initial_interval: Optional[float] = None,
+               max_interval: Optional[float] = None) -> 'Future[JobResult]':
+        """
+        Start waiting for a job.
+
+        Args:
+            job: Job ID, 202 Accepted response returning the job, or job resource
+            timeout: Maximum number of seconds to wait (default: no limit)
+            initial_interval: Delay before the first poll (default: the waiter's)
+            max_interval: Maximum delay between two polls (default: the waiter's)
+
+        Returns:
+            Future resolved with the JobResult once the job finished, timed out or
+            could not be polled
+
+        Raises:
+            ValueError: If no job ID can be found
+            RuntimeError: If the waiter is closed
+        """
+        job_id = job_id_of(job)
+        future: Future = Future()
+        future.set_running_or_notify_cancel()
+        now = time.monotonic()
+        polled = _PolledJob(job_id, future,
+                            now + timeout if timeout is not None else None,
+                            initial_interval if initial_interval is not None else self.initial_interval,
+                            max_interval if max_interval is not None else self.max_interval)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("JobWaiter is closed")
+            self._schedule(polled, now + polled.interval)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='polarion-job-waiter', daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return future
+
+    def handle(self, response: Any, timeout: Optional[float] = None,
+               initial_interval: Optional[float] = None,
+               max_interval: Optional[float] = None) -> JobHandle:
+        """
+        Start waiting for the job of an operation response and return its handle.
+
+        Unlike submit, an operation that did not start a job does not raise: the
+        handle is returned already done with the error in its result.
+
+        Args:
+            response: Response of the operation that started the job
+            timeout: Maximum number of seconds to wait (default: no limit)
+            initial_interval: Delay before the first poll (default: the waiter's)
+            max_interval: Maximum delay between two polls (default: the waiter's)
+
+        Returns:
+            JobHandle of the job
+        """
+        try:
+            job_id = job_id_of(response)
+        except ValueError as e:
+            future: Future = Future()
+            future.set_running_or_notify_cancel()
+            future.set_result(JobResult(None, error=str(e)))
+            return JobHandle(response, None, future)
+        return JobHandle(response, job_id, self.submit(job_id, timeout=timeout, initial_interval=initial_interval,
+                                                       max_interval=max_interval))
+
+    def wait(self, jobs: Iterable[JobReference], timeout: Optional[float] = None) -> List[JobResult]:
+        """
+        Wait for several jobs at once.
+
+        Args:
+            jobs: Job IDs, 202 Accepted responses or job resources
+            timeout: Maximum number of seconds to wait for every job (default: no limit)
+
+        Returns:
+            List of JobResult objects in input order
+        """
+        futures = [self.submit(job, timeout=timeout) for job in jobs]
+        return [future.result() for future in futures]
+
+    def close(self):
+        """
+        Stop the scheduler thread. Jobs still waited for are resolved as timed out.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _schedule(self, polled: _PolledJob, due: float):
+        """
+        Queue the next poll of a job (caller holds the condition).
+        """
+        if polled.deadline is not None:
+            due = min(due, polled.deadline)
+        heapq.heappush(self._queue, (due, next(self._counter), polled))
+
+    def _run(self):
+        """
+        Scheduler loop: poll the job due first, then reschedule or resolve it.
+        """
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        for _, _, polled in self._queue:
+                            self._resolve(polled, timed_out=True)
+                        self._queue.clear()
+                        return
+                    if not self._queue:
+                        if self._condition.wait(self.idle_timeout) or self._queue or self._closed:
+                            continue
+                        # Still nothing to poll: let the thread (and its references to the
+                        # waiter and the session) go, submit starts a new one
+                        self._thread = None
+                        return
+                    delay = self._queue[0][0] - time.monotonic()
+                    if delay <= 0:
+                        _, _, polled = heapq.heappop(self._queue)
+                        break
+                    self._condition.wait(delay)
+            try:
+                self._poll(polled)
+            except Exception as e:
+                # An unexpected error fails this job only; the thread keeps polling the others
+                self._fail(polled, e)
+
+    def _poll(self, polled: _PolledJob):
+        """
+        Poll one job and resolve its future or schedule its next poll.
+        """
+        retry_after = None
+        try:
+            response = self.jobs.get_job(polled.job_id)
+        except requests.RequestException:
+            response = None
+        polled.polls += 1
+
+        if response is not None and response.status_code < 300:
+            try:
+                polled.data = response_json(response).get('data') or {}
+            except ValueError:
+                polled.data = {}
+            if is_finished(polled.data):
+                self._resolve(polled)
+                return
+        elif response is not None and response.status_code not in RETRY_STATUS_CODES:
+            self._resolve(polled, error=error_detail(response))
+            return
+        elif response is not None:
+            retry_after = (response.headers or {}).get('Retry-After')
+
+        now = time.monotonic()
+        if polled.deadline is not None and now >= polled.deadline:
+            self._resolve(polled, timed_out=True)
+            return
+        polled.interval = min(polled.interval * BACKOFF_FACTOR, polled.max_interval)
+        delay = polled.interval * random.uniform(0.8, 1.2)
+        if retry_after is not None and str(retry_after).isdigit():
+            delay = max(delay, float(retry_after))
+        with self._condition:
+            self._schedule(polled, now + delay)
+
+    def _fail(self, polled: _PolledJob, exception: Exception):
+        """
+        Resolve the future of a job whose poll raised an unexpected exception.
+        """
+        if polled.future.done():
+            return
+        try:
+            self._resolve(polled, error=f"{type(exception).__name__}: {exception}")
+        except Exception:
+            polled.future.set_exception(exception)
+
+    def _resolve(self, polled: _PolledJob, error: Optional[str] = None, timed_out: bool = False):
+        """
+        Resolve the future of a job with its JobResult.
+        """
+        files = []
+        for url in ((polled.data or {}).get('links') or {}).get('downloads') or []:
+            filename = str(url).rstrip('/').rsplit('/', 1)[-1]
+            files.append(JobResultFile(self.jobs, polled.job_id, filename, url))
+        polled.future.set_result(JobResult(polled.job_id, polled.data, files, polled.polls, error, timed_out))
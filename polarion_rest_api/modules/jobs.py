@@ -2,9 +2,59 @@
 Jobs module for Polarion REST API.
 Handles all Jobs related endpoints.
 """
-from typing import Optional, Dict, Any
+import threading
+from typing import Optional, Dict, Any, Iterable, List
 import requests
-from .base import PolarionBase
+from .base import PolarionBase, JOB_WAITER_ATTRIBUTE
+from .downloads import (DownloadResult, ByteRange, save_ranged, range_header, DEFAULT_CHUNK_SIZE,
+                        DEFAULT_ALGORITHM, DEFAULT_RETRIES, DEFAULT_SEGMENT_WORKERS)
+from .job_waiter import (JobWaiter, JobResult, JobHandle, JobReference,
+                         DEFAULT_INITIAL_INTERVAL, DEFAULT_MAX_INTERVAL)
+
+
+# One JobWaiter per session: all modules of a PolarionRestApi share their session,
+# so every job they wait for is polled by the same scheduler thread. The waiter is
+# stored on the session itself so that it goes away with it, and is stopped by close()
+_shared_waiters_lock = threading.Lock()
+
+
+def shared_job_waiter(module: PolarionBase) -> JobWaiter:
+    """
+    Return the JobWaiter shared by all modules using the session of `module`.
+
+    Args:
+        module: Any API module
+
+    Returns:
+        JobWaiter polling with a Jobs module on the same session
+    """
+    with _shared_waiters_lock:
+        waiter = vars(module._session).get(JOB_WAITER_ATTRIBUTE)
+        if waiter is None:
+            jobs = module if isinstance(module, Jobs) else Jobs(
+                module.base_url, module._token, module.debug_request, module.debug_response,
+                session=module._session)
+            jobs._scheduler = module._scheduler
+            waiter = JobWaiter(jobs)
+            setattr(module._session, JOB_WAITER_ATTRIBUTE, waiter)
+        return waiter
+
+
+def start_job(module: PolarionBase, response: requests.Response,
+              timeout: Optional[float] = None) -> JobHandle:
+    """
+    Return the handle of the job started by an operation of `module`.
+
+    Args:
+        module: API module that sent the operation
+        response: Response of the operation (202 Accepted when a job was started)
+        timeout: Maximum number of seconds to poll the job (default: no limit)
+
+    Returns:
+        JobHandle polled by the shared JobWaiter (already done with an error if
+        the operation did not start a job)
+    """
+    return shared_job_waiter(module).handle(response, timeout=timeout)
 
 
 class Jobs(PolarionBase):
@@ -14,6 +64,7 @@ class Jobs(PolarionBase):
     
     Methods are organized by HTTP method type (same order as Swagger documentation):
     - GET methods: Retrieve jobs and download job result files
+    - Waiting methods: Poll jobs started by 202 Accepted operations until they finish
     """
     
     # ========== GET methods ==========
@@ -33,6 +84,74 @@ class Jobs(PolarionBase):
         """
         return self._get(f'jobs/{job_id}/actions/download/{filename}')
     
+    def stream_job_result_file_content(self,
+                                       job_id: str,
+                                       filename: str,
+                                       byte_range: Optional[ByteRange] = None) -> requests.Response:
+        """
+        Downloads the file content for a specified job as a stream.
+        
+        Same endpoint as get_job_result_file_content, but the body is not loaded
+        into memory: read it with response.iter_content() and close the response.
+        
+        Args:
+            job_id: The Job ID
+            filename: The Download File Name
+            byte_range: Optional inclusive (first, last) byte range, last None for the
+                        rest of the file. The server answers 206 Partial Content, or
+                        200 with the whole file if it does not support ranges
+            
+        Returns:
+            Streamed Response object containing the file content
+        """
+        return self._get_stream(f'jobs/{job_id}/actions/download/{filename}',
+                                headers=range_header(byte_range))
+    
+    def save_job_result_file_content(self,
+                                     job_id: str,
+                                     filename: str,
+                                     destination: str,
+                                     segment_size: Optional[int] = None,
+                                     max_workers: int = DEFAULT_SEGMENT_WORKERS,
+                                     retries: int = DEFAULT_RETRIES,
+                                     expected_checksum: Optional[str] = None,
+                                     chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                     algorithm: str = DEFAULT_ALGORITHM) -> DownloadResult:
+        """
+        Downloads the file content for a specified job to a path, resuming after failures.
+        
+        A connection failure does not restart the download: it continues with a Range
+        request from the last byte written, and a call after a failed one continues
+        from the '.part' file it left. With segment_size the file is fetched in ranges
+        of that size by max_workers parallel requests. Servers ignoring Range get a
+        single plain download. See downloads.save_ranged.
+        
+        Args:
+            job_id: The Job ID
+            filename: The Download File Name
+            destination: Path of the file to write
+            segment_size: Size in bytes of the ranges fetched in parallel (default: one stream)
+            max_workers: Number of ranges fetched at the same time (default: 4)
+            retries: Number of resumptions of a range without progress (default: 3)
+            expected_checksum: Hex digest the file must have
+            chunk_size: Number of bytes read per chunk (default: 1 MiB)
+            algorithm: hashlib algorithm of the checksum (default: 'sha256')
+            
+        Returns:
+            DownloadResult with the size and checksum of the file
+            
+        Raises:
+            ValueError: If the download is refused, keeps failing, or has the wrong size or checksum
+            
+        Example:
+            >>> result = api.jobs.save_job_result_file_content(
+            ...     "MyJobId", "export.xlsx", "/data/export.xlsx", segment_size=64 * 1024 * 1024)
+        """
+        return save_ranged(
+            lambda byte_range: self.stream_job_result_file_content(job_id, filename, byte_range=byte_range),
+            destination, chunk_size=chunk_size, algorithm=algorithm, segment_size=segment_size,
+            max_workers=max_workers, retries=retries, expected_checksum=expected_checksum)
+    
     def get_job(self,
                job_id: str,
                fields: Optional[Dict[str, str]] = None,
@@ -70,3 +189,85 @@ class Jobs(PolarionBase):
             params['include'] = include
             
         return self._get(f'jobs/{job_id}', params=params if params else None)
+    
+    # ========== Waiting methods ==========
+    
+    @property
+    def job_waiter(self) -> JobWaiter:
+        """
+        JobWaiter shared with the other modules of the client, polling every waited
+        job from one thread.
+        """
+        return shared_job_waiter(self)
+    
+    def wait_for_job(self,
+                     job: JobReference,
+                     timeout: Optional[float] = None,
+                     initial_interval: float = DEFAULT_INITIAL_INTERVAL,
+                     max_interval: float = DEFAULT_MAX_INTERVAL) -> JobResult:
+        """
+        Waits until a job finished.
+        
+        The job is polled with get_job using jittered exponential backoff: the first
+        poll happens after `initial_interval` seconds and the interval grows up to
+        `max_interval` seconds.
+        
+        Args:
+            job: The Job ID, or the 202 Accepted response of the operation that started
+                 the job (e.g. delete_project, post_create_project, post_move_project_action,
+                 post_merge_document_to_master, post_merge_document_from_master,
+                 post_branch_documents, import_x_unit_test_results,
+                 import_excel_test_results, get_export_excel_tests)
+            timeout: Maximum number of seconds to wait (default: no limit)
+            initial_interval: Delay in seconds before the first poll (default: 0.5)
+            max_interval: Maximum delay in seconds between two polls (default: 10.0)
+            
+        Returns:
+            JobResult with the final state and status of the job and handles of the
+            files it produced (JobResult.files, downloaded with JobResultFile.download())
+            
+        Raises:
+            ValueError: If no job ID can be found in the response
+            
+        Example:
+            >>> response = api.test_runs.get_export_excel_tests("MyProjectId", "MyTestRunId")
+            >>> result = api.jobs.wait_for_job(response, timeout=300)
+            >>> if result.ok:
+            ...     content = result.files[0].download().content
+        """
+        return self.job_waiter.submit(job, timeout=timeout, initial_interval=initial_interval,
+                                      max_interval=max_interval).result()
+    
+    def wait_for_jobs(self,
+                      jobs: Iterable[JobReference],
+                      timeout: Optional[float] = None,
+                      initial_interval: float = DEFAULT_INITIAL_INTERVAL,
+                      max_interval: float = DEFAULT_MAX_INTERVAL) -> List[JobResult]:
+        """
+        Waits until several jobs finished.
+        
+        All jobs are polled by the same scheduler thread, each with its own jittered
+        exponential backoff, so waiting on many jobs does not multiply the load.
+        
+        Args:
+            jobs: Job IDs or 202 Accepted responses of the operations that started them
+            timeout: Maximum number of seconds to wait for every job (default: no limit)
+            initial_interval: Delay in seconds before the first poll of a job (default: 0.5)
+            max_interval: Maximum delay in seconds between two polls of a job (default: 10.0)
+            
+        Returns:
+            List of JobResult objects in input order
+            
+        Raises:
+            ValueError: If no job ID can be found in one of the responses
+            
+        Example:
+            >>> responses = [api.test_runs.import_excel_test_results("MyProjectId", run, files)
+            ...              for run, files in imports]
+            >>> for result in api.jobs.wait_for_jobs(responses, timeout=900):
+            ...     print(result.job_id, result.status, result.message)
+        """
+        futures = [self.job_waiter.submit(job, timeout=timeout, initial_interval=initial_interval,
+                                          max_interval=max_interval)
+                   for job in jobs]
+        return [future.result() for future in futures]
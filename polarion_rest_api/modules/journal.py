@@ -0,0 +1,342 @@
+"""
+Write journal module for Polarion REST API.
+Records bulk writes with a client-side key and their outcome in a local SQLite
+database, so an interrupted bulk operation can be replayed without creating
+duplicates and without losing items.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List, Tuple
+import requests
+from .bulk import (BulkResult, BulkItemResult, Chunk, send_chunk, run_chunks, chunked, reject_invalid, not_sent,
+                   DEFAULT_CHUNK_SIZE, DEFAULT_MAX_WORKERS, SPLIT_STATUS_CODES, DEFAULT_BACKOFF,
+                   UNPROCESSED_STATUS_CODES)
+
+
+# Journal states of a write
+PENDING = 'pending'    # sent (or about to be sent), outcome unknown
+CREATED = 'created'    # confirmed by the server
+FAILED = 'failed'      # rejected by the server, nothing was written
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS writes (
+    operation TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    status TEXT NOT NULL,
+    resource_id TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (operation, scope, key)
+)
+"""
+
+
+def content_key(item: Any) -> str:
+    """
+    Compute a deterministic client key from the content of an item.
+
+    Args:
+        item: JSON serializable item
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON form of the item
+    """
+    canonical = json.dumps(item, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class JournalEntry:
+    """
+    State of one journaled write.
+
+    Attributes:
+        key: Client-side key of the write
+        status: One of 'pending', 'created' or 'failed'
+        resource_id: ID of the created resource, once known
+        error: Error detail of the last failed attempt
+        attempts: Number of times the write was sent
+    """
+
+    __slots__ = ('key', 'status', 'resource_id', 'error', 'attempts')
+
+    def __init__(self, key: str, status: str, resource_id: Optional[str] = None,
+                 error: Optional[str] = None, attempts: int = 0):
+        self.key = key
+        self.status = status
+        self.resource_id = resource_id
+        self.error = error
+        self.attempts = attempts
+
+    def __repr__(self) -> str:
+        return (f"JournalEntry(key={self.key!r}, status={self.status!r}, "
+                f"resource_id={self.resource_id!r}, attempts={self.attempts})")
+
+
+class WriteJournal:
+    """
+    Durable journal of bulk writes, backed by SQLite.
+
+    Every item of a journaled bulk write is identified by a client-side key and
+    scoped by operation (e.g. 'post_work_items') and scope (e.g. the project ID).
+    A write is marked 'pending' before it is sent and 'created' or 'failed' once the
+    server answered. Writes left 'pending' by a timeout or a crash have an unknown
+    outcome: before they are resent, the server is queried for the created entity.
+
+    Example:
+        >>> with WriteJournal('writes.db') as journal:
+        ...     result = api.work_items.bulk_post_work_items(
+        ...         "MyProjectId", items, journal=journal, key_attribute="importKey")
+        >>> # After a failure, running the same call again only sends the missing items
+    """
+
+    def __init__(self, path: str = ':memory:'):
+        """
+        Open (or create) the journal.
+
+        Args:
+            path: Path of the SQLite database file, or ':memory:' for a journal
+                  that only lives as long as the object (default)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            if path != ':memory:':
+                self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(_SCHEMA)
+
+    def get(self, operation: str, scope: str, key: str) -> Optional[JournalEntry]:
+        """
+        Return the journal entry of a write.
+
+        Args:
+            operation: Name of the bulk operation
+            scope: Scope of the write (e.g. the project ID)
+            key: Client-side key of the write
+
+        Returns:
+            JournalEntry, or None if the write was never journaled
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT key, status, resource_id, error, attempts FROM writes '
+                'WHERE operation = ? AND scope = ? AND key = ?', (operation, scope, key)
+            ).fetchone()
+        return JournalEntry(*row) if row else None
+
+    def mark_pending(self, operation: str, scope: str, keys: Iterable[str]):
+        """
+        Mark writes as sent with an unknown outcome and count the attempt.
+
+        Args:
+            operation: Name of the bulk operation
+            scope: Scope of the writes
+            keys: Client-side keys of the writes
+        """
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT INTO writes (operation, scope, key, status, attempts, updated_at) '
+                'VALUES (?, ?, ?, ?, 1, ?) '
+                'ON CONFLICT (operation, scope, key) DO UPDATE SET '
+                'status = excluded.status, error = NULL, attempts = attempts + 1, updated_at = excluded.updated_at',
+                [(operation, scope, key, PENDING, now) for key in keys]
+            )
+
+    def record(self, operation: str, scope: str, key: str, status: str,
+               resource_id: Optional[str] = None, error: Optional[str] = None):
+        """
+        Record the outcome of a write.
+
+        Args:
+            operation: Name of the bulk operation
+            scope: Scope of the write
+            key: Client-side key of the write
+            status: One of 'pending', 'created' or 'failed'
+            resource_id: ID of the created resource
+            error: Error detail of a failed write
+
+        Raises:
+            ValueError: If status is not a journal state
+        """
+        if status not in (PENDING, CREATED, FAILED):
+            raise ValueError(f"Invalid journal status {status!r}")
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT INTO writes (operation, scope, key, status, resource_id, error, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (operation, scope, key) DO UPDATE SET '
+                'status = excluded.status, resource_id = excluded.resource_id, '
+                'error = excluded.error, updated_at = excluded.updated_at',
+                (operation, scope, key, status, resource_id, error, time.time())
+            )
+
+    def entries(self, operation: str, scope: str, status: Optional[str] = None) -> List[JournalEntry]:
+        """
+        Return the journal entries of an operation.
+
+        Args:
+            operation: Name of the bulk operation
+            scope: Scope of the writes
+            status: Only return entries in this state
+
+        Returns:
+            List of JournalEntry objects
+        """
+        sql = 'SELECT key, status, resource_id, error, attempts FROM writes WHERE operation = ? AND scope = ?'
+        params: Tuple[Any, ...] = (operation, scope)
+        if status is not None:
+            sql += ' AND status = ?'
+            params += (status,)
+        with self._lock:
+            rows = self._connection.execute(sql + ' ORDER BY rowid', params).fetchall()
+        return [JournalEntry(*row) for row in rows]
+
+    def close(self):
+        """
+        Close the underlying database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _keyed(items: Iterable[Any], key_of: Callable[[Any], Optional[str]]) -> Iterator[Tuple[str, Any]]:
+    """
+    Pair items with their client key, deriving keys from the content when key_of
+    returns None. Identical items get distinct keys by occurrence number, so they
+    map to the same keys again when the same input is replayed.
+    """
+    seen: Dict[str, int] = {}
+    for item in items:
+        key = key_of(item)
+        if key is None:
+            digest = content_key(item)
+            occurrence = seen.get(digest, 0)
+            seen[digest] = occurrence + 1
+            key = digest if occurrence == 0 else f"{digest}-{occurrence}"
+        yield key, item
+
+
+def _outcome_unknown(item_result: BulkItemResult) -> bool:
+    """
+    True when a failed write may nevertheless have been applied by the server
+    (connection errors, timeouts and server side errors).
+    """
+    return item_result.status_code is None or item_result.status_code >= 500
+
+
+def run_journaled(journal: WriteJournal,
+                  operation: str,
+                  scope: str,
+                  request: Callable[[List[Any]], requests.Response],
+                  items: Iterable[Any],
+                  on_success: Callable[[Chunk, requests.Response], List[BulkItemResult]],
+                  key_of: Callable[[Any], Optional[str]] = lambda item: None,
+                  lookup: Optional[Callable[[str, Any], Optional[str]]] = None,
+                  stamp: Optional[Callable[[str, Any], Any]] = None,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  max_workers: int = DEFAULT_MAX_WORKERS,
+                  retries: int = 0,
+                  backoff: float = DEFAULT_BACKOFF,
+                  validate: Optional[Callable[[Any], List[str]]] = None) -> BulkResult:
+    """
+    Run a bulk create operation through a write journal.
+
+    Items already journaled as 'created' are skipped. Items journaled as 'pending'
+    (sent before, outcome unknown) are looked up on the server first and only resent
+    when `lookup` does not find them. Every other item is journaled as 'pending',
+    sent in chunks like run_bulk and journaled with its outcome. Failures with an
+    unknown outcome (connection errors, 5xx) stay 'pending', so the next run
+    reconciles them before resending.
+
+    Args:
+        journal: Journal recording the writes
+        operation: Name of the bulk operation (e.g. 'post_work_items')
+        scope: Scope of the writes (e.g. the project ID)
+        request: Callable sending a list of items and returning the response
+        items: Iterable of items (consumed lazily)
+        on_success: Callable translating a successful response into item results
+        key_of: Callable returning the client key of an item, or None to derive the
+                key from the item content
+        lookup: Callable returning the ID of the entity created for a key and item,
+                or None if it does not exist. Without lookup, pending items are resent.
+        stamp: Callable returning the item with its key written into it, so the created
+               entity can later be found by lookup
+        chunk_size: Maximum number of items per request
+        max_workers: Maximum number of requests in flight
+        retries: Number of retries per request of the failures the server cannot have
+                 applied (429, 503 and connect timeouts, see not_sent); other failures
+                 are left 'pending' for the journal lookup (default: 0)
+        backoff: Base delay in seconds between retries (default: 0.5)
+        validate: Optional callable returning the error messages of an item; invalid
+                  items are journaled as failed and not sent (see reject_invalid)
+
+    Returns:
+        BulkResult with one result per input item. Items skipped because they were
+        already created have status 'skipped' and the ID of the created resource.
+    """
+    result = BulkResult()
+    keys: Dict[int, str] = {}
+    keys_lock = threading.Lock()
+
+    def send(chunk: Chunk) -> List[BulkItemResult]:
+        with keys_lock:
+            chunk_keys = {index: keys.pop(index) for index, _ in chunk}
+        results = []
+        to_send = []
+        for index, item in chunk:
+            key = chunk_keys[index]
+            entry = journal.get(operation, scope, key)
+            if entry is not None and entry.status == CREATED:
+                results.append(BulkItemResult(index, 'skipped', id=entry.resource_id))
+                continue
+            if entry is not None and entry.status == PENDING and lookup is not None:
+                resource_id = lookup(key, item)
+                if resource_id is not None:
+                    journal.record(operation, scope, key, CREATED, resource_id=resource_id)
+                    results.append(BulkItemResult(index, 'skipped', id=resource_id))
+                    continue
+            to_send.append((index, item))
+
+        rejected, to_send = reject_invalid(to_send, validate)
+        for item_result in rejected:
+            journal.record(operation, scope, chunk_keys[item_result.index], FAILED, error=item_result.error)
+        results += rejected
+        if not to_send:
+            return results
+
+        journal.mark_pending(operation, scope, (chunk_keys[index] for index, _ in to_send))
+        # Creates are not idempotent: only retry what cannot have been applied and leave
+        # the rest pending, so the next run resolves it with lookup instead of duplicating
+        for item_result in send_chunk(request, to_send, on_success, result, SPLIT_STATUS_CODES,
+                                      retries=retries, backoff=backoff,
+                                      retry_status_codes=UNPROCESSED_STATUS_CODES, retry_error=not_sent):
+            key = chunk_keys[item_result.index]
+            if item_result.ok:
+                journal.record(operation, scope, key, CREATED, resource_id=item_result.id)
+            elif not _outcome_unknown(item_result):
+                journal.record(operation, scope, key, FAILED, error=item_result.error)
+            else:
+                journal.record(operation, scope, key, PENDING, error=item_result.error)
+            results.append(item_result)
+        return results
+
+    def chunks() -> Iterator[Chunk]:
+        for chunk in chunked(enumerate(_keyed(items, key_of)), chunk_size):
+            with keys_lock:
+                for index, (key, _) in chunk:
+                    keys[index] = key
+            yield [(index, stamp(key, item) if stamp is not None else item) for index, (key, item) in chunk]
+
+    return run_chunks(send, chunks(), max_workers, result)
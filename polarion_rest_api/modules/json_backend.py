@@ -0,0 +1,151 @@
+"""
+JSON backend module for Polarion REST API.
+Pluggable JSON serializer/deserializer used to encode request bodies and decode
+responses. orjson is used when it is installed (pip install orjson), the standard
+library json module otherwise (see json_benchmark.py for a comparison).
+"""
+import functools
+import json
+from typing import Optional, Dict, Any, Callable, Union
+
+import requests
+
+try:
+    import orjson
+except ImportError:  # Optional dependency: pip install orjson
+    orjson = None
+
+
+class JsonBackend:
+    """
+    JSON serializer/deserializer.
+
+    Attributes:
+        name: Name of the backend (e.g. 'json', 'orjson')
+        dumps: Function encoding an object to UTF-8 JSON bytes
+        loads: Function decoding JSON bytes or str
+    """
+
+    __slots__ = ('name', 'dumps', 'loads')
+
+    def __init__(self, name: str, dumps: Callable[[Any], bytes], loads: Callable[[Union[bytes, str]], Any]):
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        return f"JsonBackend(name={self.name!r})"
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    # Compact UTF-8 output, as orjson writes it
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, allow_nan=False).encode('utf-8')
+
+
+STDLIB = JsonBackend('json', _stdlib_dumps, json.loads)
+ORJSON = JsonBackend('orjson', functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS),
+                     orjson.loads) if orjson is not None else None
+
+BACKENDS: Dict[str, JsonBackend] = {backend.name: backend for backend in (STDLIB, ORJSON) if backend is not None}
+
+_backend: JsonBackend = ORJSON or STDLIB
+
+
+def get_backend() -> JsonBackend:
+    """
+    The JSON backend in use.
+    """
+    return _backend
+
+
+def set_backend(backend: Union[str, JsonBackend]) -> JsonBackend:
+    """
+    Select the JSON backend used by all clients.
+
+    Args:
+        backend: 'json', 'orjson', or a JsonBackend with custom dumps/loads functions
+
+    Returns:
+        The previous backend, so it can be restored
+
+    Raises:
+        ValueError: If a backend is named that is unknown or not installed
+    """
+    global _backend
+    if isinstance(backend, str):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown or not installed JSON backend {backend!r}, available: {sorted(BACKENDS)}")
+        backend = BACKENDS[backend]
+    previous, _backend = _backend, backend
+    return previous
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encode an object to UTF-8 JSON bytes with the selected backend.
+    """
+    return _backend.dumps(obj)
+
+
+def encode_body(body: Any) -> bytes:
+    """
+    Encode a request body, passing bodies already encoded (e.g. by
+    BodyBuilder.encoded_chunks) through unchanged.
+    """
+    if isinstance(body, (bytes, bytearray)):
+        return bytes(body)
+    return _backend.dumps(body)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode JSON bytes or str with the selected backend.
+    """
+    return _backend.loads(data)
+
+
+def response_json(response: Any) -> Any:
+    """
+    Decode the JSON body of a requests or httpx response with the selected backend.
+
+    Responses without a bytes body (e.g. test doubles) are decoded with their own
+    json() method.
+    """
+    content = getattr(response, 'content', None)
+    if isinstance(content, (bytes, bytearray)) and content:
+        return _backend.loads(content)
+    return response.json()
+
+
+class JsonResponse(requests.Response):
+    """
+    Response whose json() decodes with the selected JSON backend.
+    """
+
+    def json(self, **kwargs) -> Any:
+        if kwargs or not self.content:
+            return super().json(**kwargs)
+        return _backend.loads(self.content)
+
+
+class JsonSession(requests.Session):
+    """
+    Session encoding json= request bodies and decoding response.json() with the
+    selected JSON backend instead of the standard library json module. A json=
+    body given as bytes is sent as already encoded JSON.
+    """
+
+    def request(self, method: str, url: str, *args, json: Optional[Any] = None, **kwargs) -> requests.Response:
+        if json is not None and kwargs.get('data') is None and not kwargs.get('files') and not args:
+            kwargs['data'] = encode_body(json)
+            json = None
+            headers = kwargs.get('headers') or {}
+            if 'Content-Type' not in self.headers and not any(k.lower() == 'content-type' for k in headers):
+                kwargs['headers'] = dict(headers, **{'Content-Type': 'application/json'})
+        return super().request(method, url, *args, json=json, **kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        response = super().send(request, **kwargs)
+        if type(response) is requests.Response:
+            response.__class__ = JsonResponse
+        return response
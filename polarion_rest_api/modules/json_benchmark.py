@@ -0,0 +1,73 @@
+"""
+JSON benchmark module for Polarion REST API.
+Times encoding and decoding of a bulk-sized work item payload with every installed
+JSON backend (see json_backend.py):
+
+    python -m polarion_rest_api.modules.json_benchmark
+"""
+import sys
+import time
+from typing import Dict, Any
+from .json_backend import BACKENDS, ORJSON, STDLIB
+
+
+def benchmark(payload: Any, repeat: int = 20) -> Dict[str, Dict[str, float]]:
+    """
+    Time encoding and decoding a payload with every installed backend.
+
+    Args:
+        payload: JSON-compatible object (e.g. a bulk request body)
+        repeat: Number of encode/decode rounds
+
+    Returns:
+        Backend name -> {'dumps': seconds, 'loads': seconds} for all rounds
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    for name, backend in BACKENDS.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            encoded = backend.dumps(payload)
+        encoded_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(repeat):
+            backend.loads(encoded)
+        results[name] = {'dumps': encoded_time, 'loads': time.perf_counter() - start}
+    return results
+
+
+def sample_payload(count: int = 10000) -> Dict[str, Any]:
+    """
+    Work item list page of count items, shaped like a bulk export or bulk patch body.
+    """
+    return {'data': [{
+        'type': 'workitems', 'id': f'MyProjectId/WI-{i}', 'revision': '1234',
+        'attributes': {
+            'title': f'Requirement {i}', 'type': 'requirement', 'status': 'open', 'severity': 'major',
+            'priority': 90.0, 'created': '2026-01-01T00:00:00Z', 'updated': '2026-01-02T00:00:00Z',
+            'description': {'type': 'text/html', 'value': f'<p>Description of requirement {i} – ok</p>'},
+            'hyperlinks': [{'role': 'ref_ext', 'uri': f'https://example.com/{i}'}],
+        },
+        'relationships': {
+            'author': {'data': {'type': 'users', 'id': f'user{i % 50}'}},
+            'assignee': {'data': [{'type': 'users', 'id': f'user{(i + 1) % 50}'}]},
+        },
+    } for i in range(count)], 'meta': {'totalCount': count}}
+
+
+def main() -> int:
+    """
+    Print the benchmark of the installed backends.
+    """
+    payload = sample_payload()
+    results = benchmark(payload)
+    size = len(STDLIB.dumps(payload))
+    print(f"Payload: {len(payload['data'])} work items, {size / 1024 / 1024:.1f} MiB, 20 rounds")
+    for name, times in results.items():
+        print(f"{name:>8}: dumps {times['dumps']:.3f} s, loads {times['loads']:.3f} s")
+    if ORJSON is None:
+        print("orjson is not installed (pip install orjson)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
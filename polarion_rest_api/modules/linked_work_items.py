@@ -2,9 +2,15 @@
 Linked Work Items module for Polarion REST API.
 Handles all Linked Work Items related endpoints.
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List, Set, Tuple
 import requests
 from .base import PolarionBase
+from .bulk import (BulkResult, BulkItemResult, Chunk, send_chunk, run_chunks, reject_invalid, created_ids,
+                   DEFAULT_CHUNK_SIZE, DEFAULT_MAX_WORKERS)
+from .pagination import iter_resources
+
+# A link given as (source Work Item ID, role ID, target Work Item ID)
+LinkTriple = Tuple[str, str, str]
 
 
 class LinkedWorkItems(PolarionBase):
@@ -20,6 +26,7 @@ class LinkedWorkItems(PolarionBase):
     - GET methods: Retrieve linked work items
     - PATCH methods: Update linked work items
     - POST methods: Create linked work items
+    - Bulk methods: Concurrent import of links given as (source, role, target) triples
     """
     
     # ========== DELETE methods ==========   
@@ -236,3 +243,129 @@ class LinkedWorkItems(PolarionBase):
             f'projects/{project_id}/workitems/{work_item_id}/linkedworkitems',
             json=linked_items_data
         )
+    
+    # ========== Bulk methods ==========
+    
+    def bulk_post_linked_work_items(self,
+                                    project_id: str,
+                                    links: Iterable[LinkTriple],
+                                    chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                    max_workers: int = DEFAULT_MAX_WORKERS,
+                                    skip_existing: bool = True,
+                                    suspect: Optional[bool] = None) -> BulkResult:
+        """
+        Creates any number of Linked Work Items from (source, role, target) triples.
+        
+        The links are grouped by source Work Item, so every source needs one
+        post_linked_work_items call per `chunk_size` links. Links repeated in the input
+        are created once, and with `skip_existing` the outgoing links of every source
+        are fetched first (all pages) so links that already exist are not sent again.
+        Up to `max_workers` source Work Items are processed in parallel.
+        
+        Args:
+            project_id: The Project ID used for Work Item IDs without a project prefix
+            links: Iterable of (source, role, target) triples. Source and target are
+                   Work Item IDs, either 'MyProjectId/WI-1' or 'WI-1' (in project_id).
+            chunk_size: Maximum number of links per request (default: 100)
+            max_workers: Maximum number of source Work Items processed in parallel (default: 4)
+            skip_existing: Fetch the existing links of every source and skip them (default: True)
+            suspect: Optional value of the 'suspect' attribute of the created links
+            
+        Returns:
+            BulkResult with one result per input triple: 'created', 'skipped' for links
+            that already existed or were repeated in the input, or 'failed'. The ID of
+            every result is the link ID, e.g. 'MyProjectId/WI-1/relates_to/MyProjectId/WI-2'.
+            
+        Raises:
+            ValueError: If a triple does not have three elements
+            
+        Example:
+            >>> links = [("WI-1", "relates_to", "WI-2"), ("WI-1", "parent", "OtherProject/WI-9")]
+            >>> result = api.bulk_post_linked_work_items("MyProjectId", links, max_workers=8)
+            >>> result.outcomes
+            {'MyProjectId/WI-1/relates_to/MyProjectId/WI-2': 'created', ...}
+        """
+        def qualified(work_item_id: str) -> str:
+            return work_item_id if '/' in work_item_id else f"{project_id}/{work_item_id}"
+        
+        result = BulkResult()
+        by_source: Dict[str, Chunk] = {}
+        seen: Set[Tuple[str, str, str]] = set()
+        for index, link in enumerate(links):
+            if len(link) != 3:
+                raise ValueError(f"Link must be a (source, role, target) triple, got {link!r}")
+            source, role, target = qualified(link[0]), link[1], qualified(link[2])
+            if (source, role, target) in seen:
+                result.add(BulkItemResult(index, 'skipped', id=f"{source}/{role}/{target}"))
+                continue
+            seen.add((source, role, target))
+            by_source.setdefault(source, []).append((index, (role, target)))
+        
+        self._ensure_pool_size(max_workers)
+        validate = self._item_validator('POST', f"projects/{project_id}/workitems/_/linkedworkitems")
+        
+        def send(group: Chunk) -> List[BulkItemResult]:
+            source = group[0][1][0]
+            source_project, source_id = source.split('/', 1)
+            results = []
+            if skip_existing:
+                try:
+                    existing = self._existing_links(source_project, source_id)
+                except requests.RequestException as e:
+                    return [BulkItemResult(index, 'failed', id=f"{source}/{role}/{target}",
+                                           error=f"Fetching existing links failed: {e}")
+                            for index, (_, role, target) in group]
+                pending = []
+                for index, (_, role, target) in group:
+                    if (role, target) in existing:
+                        results.append(BulkItemResult(index, 'skipped', id=f"{source}/{role}/{target}"))
+                    else:
+                        pending.append((index, (role, target)))
+            else:
+                pending = [(index, (role, target)) for index, (_, role, target) in group]
+            
+            def request(items):
+                return self.post_linked_work_items(source_project, source_id, {'data': items})
+            
+            for start in range(0, len(pending), chunk_size):
+                part = dict(pending[start:start + chunk_size])
+                chunk = [(index, self._link_resource(role, target, suspect)) for index, (role, target) in part.items()]
+                rejected, chunk = reject_invalid(chunk, validate)
+                for item_result in rejected + (send_chunk(request, chunk, created_ids, result) if chunk else []):
+                    if item_result.id is None:
+                        role, target = part[item_result.index]
+                        item_result.id = f"{source}/{role}/{target}"
+                    results.append(item_result)
+            return results
+        
+        groups = ([(index, (source, role, target)) for index, (role, target) in group]
+                  for source, group in by_source.items())
+        return run_chunks(send, groups, max_workers, result)
+    
+    # ========== Helper methods ==========
+    
+    def _existing_links(self, project_id: str, work_item_id: str) -> Set[Tuple[str, str]]:
+        """
+        Return the (role, target Work Item ID) pairs of the outgoing links of a Work Item.
+        """
+        existing = set()
+        for resource in iter_resources(self.get_linked_work_items, project_id, work_item_id,
+                                       fields={'linkedworkitems': 'id'}):
+            parts = resource.get('id', '').split('/')
+            if len(parts) == 5:
+                existing.add((parts[2], f"{parts[3]}/{parts[4]}"))
+        return existing
+    
+    @staticmethod
+    def _link_resource(role: str, target: str, suspect: Optional[bool]) -> Dict[str, Any]:
+        """
+        Build the Linked Work Item resource of a link to a target Work Item.
+        """
+        attributes: Dict[str, Any] = {'role': role}
+        if suspect is not None:
+            attributes['suspect'] = suspect
+        return {
+            'type': 'linkedworkitems',
+            'attributes': attributes,
+            'relationships': {'workItem': {'data': {'type': 'workitems', 'id': target}}}
+        }
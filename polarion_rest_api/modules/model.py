@@ -0,0 +1,185 @@
+"""
+Model base module for Polarion REST API.
+Base class of the typed resource models generated from the OpenAPI specification
+(see models.py and model_generator.py). A model keeps the type, id and revision of
+its resource and the rest of the resource as compact JSON bytes, which are parsed
+the first time an attribute, a relationship, links or meta are accessed.
+"""
+from typing import Optional, Dict, Any, List, Type, Union
+import requests
+from .bulk import error_detail
+from .json_backend import dumps, loads, response_json
+
+
+# Resource type -> generated model class, filled when the model classes are defined
+MODEL_TYPES: Dict[str, Type['Model']] = {}
+
+
+class Attribute:
+    """
+    Model field reading one attribute of the resource, None when it is not set.
+
+    Attributes:
+        name: Attribute name in the JSON:API resource (e.g. 'dueDate')
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance: Optional['Model'], owner: type) -> Any:
+        if instance is None:
+            return self
+        return instance.attributes.get(self.name)
+
+    def __repr__(self) -> str:
+        return f"Attribute({self.name!r})"
+
+
+class Model:
+    """
+    Typed JSON:API resource with lazily decoded attributes.
+
+    Only the type, id and revision are decoded up front. The attributes,
+    relationships, links and meta are kept as compact JSON bytes until the first
+    access, so a list of models takes a fraction of the memory of the decoded
+    dictionaries. Generated subclasses (see models.py) add one field per attribute
+    of the resource type, e.g. work_item.title or work_item.due_date.
+
+    Attributes:
+        type: Resource type (e.g. 'workitems')
+        id: Resource ID (e.g. 'MyProjectId/MyWorkItemId')
+        revision: Revision of the resource, None if the response has none
+    """
+
+    __slots__ = ('type', 'id', 'revision', '_source', '_resource')
+
+    # Set by the generated subclasses
+    resource_type: Optional[str] = None
+    attribute_names: tuple = ()
+    relationship_names: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.resource_type is not None:
+            MODEL_TYPES[cls.resource_type] = cls
+
+    def __init__(self, resource: Dict[str, Any]):
+        """
+        Create a model of a decoded JSON:API resource object.
+
+        Args:
+            resource: Resource object ({'type': ..., 'id': ..., 'attributes': ..., ...})
+        """
+        resource_type = resource.get('type')
+        # Share the class string instead of keeping one copy per resource
+        self.type = self.resource_type if resource_type == self.resource_type else resource_type
+        self.id = resource.get('id')
+        self.revision = resource.get('revision')
+        rest = {key: value for key, value in resource.items() if key not in ('type', 'id', 'revision')}
+        self._source: Optional[bytes] = dumps(rest) if rest else None
+        self._resource: Optional[Dict[str, Any]] = None if rest else {}
+
+    def _load(self) -> Dict[str, Any]:
+        if self._resource is None:
+            self._resource = loads(self._source)
+            self._source = None
+        return self._resource
+
+    @property
+    def loaded(self) -> bool:
+        """True once the attributes were decoded"""
+        return self._resource is not None
+
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        return self._load().get('attributes') or {}
+
+    @property
+    def relationships(self) -> Dict[str, Any]:
+        """Raw relationship objects, by name"""
+        return self._load().get('relationships') or {}
+
+    @property
+    def links(self) -> Dict[str, Any]:
+        return self._load().get('links') or {}
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        return self._load().get('meta') or {}
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """
+        Value of an attribute by its JSON:API name, default when the resource does not have it.
+        """
+        return self.attributes.get(name, default)
+
+    def __getitem__(self, name: str) -> Any:
+        return self.attributes[name]
+
+    def related_ids(self, name: str) -> List[str]:
+        """
+        IDs of the resources of a relationship (e.g. 'author', 'linkedWorkItems').
+        """
+        data = (self.relationships.get(name) or {}).get('data')
+        if data is None:
+            return []
+        return [identifier.get('id') for identifier in (data if isinstance(data, list) else [data])]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        The resource object as returned by the API.
+        """
+        resource = {'type': self.type, 'id': self.id}
+        if self.revision is not None:
+            resource['revision'] = self.revision
+        resource.update(self._load() if self._resource is not None else loads(self._source))
+        return resource
+
+    def __eq__(self, other: Any) -> bool:
+        return (isinstance(other, Model) and other.type == self.type and other.id == self.id
+                and other.revision == self.revision)
+
+    def __hash__(self) -> int:
+        return hash((self.type, self.id, self.revision))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self.id!r}, revision={self.revision!r})"
+
+
+def model_class(resource_type: str) -> Type[Model]:
+    """
+    Generated model class of a resource type, Model for types the specification does not define.
+    """
+    from . import models  # noqa: F401 - defines and registers the generated classes
+    return MODEL_TYPES.get(resource_type, Model)
+
+
+def to_model(resource: Dict[str, Any]) -> Model:
+    """
+    Model of a decoded JSON:API resource object, of the class generated for its type.
+    """
+    return model_class(resource.get('type'))(resource)
+
+
+def decode_models(response: Union[requests.Response, Dict[str, Any]]) -> Union[Model, List[Model], None]:
+    """
+    Decode the primary data of a response into models.
+
+    Args:
+        response: Response of a module method, or its decoded body
+
+    Returns:
+        A list of models for list endpoints, a model for single resource endpoints,
+        None when the response has no data
+
+    Raises:
+        requests.HTTPError: If the response is an error response
+    """
+    if not isinstance(response, dict):
+        if response.status_code >= 300:
+            raise requests.HTTPError(error_detail(response), response=response)
+        response = response_json(response)
+    data = response.get('data')
+    if isinstance(data, list):
+        return [to_model(resource) for resource in data]
+    return to_model(data) if data else None
@@ -0,0 +1,248 @@
+"""
+Model generator module for Polarion REST API.
+Generates models.py, one typed Model subclass per resource type, from the resource
+schemas ('<type>SingleGetResponse' and '<type>ListGetResponse') of the OpenAPI
+specification. The output only depends on the specification, so models.py can be
+regenerated and checked in CI:
+
+    python -m polarion_rest_api.modules.model_generator data/openapi_official.json \\
+        -o polarion_rest_api/modules/models.py
+"""
+import argparse
+import json
+import keyword
+import re
+import sys
+from typing import Optional, Dict, Any, List
+
+
+SPEC_PATH = 'data/openapi_official.json'
+
+RESPONSE_SUFFIXES = ('SingleGetResponse', 'ListGetResponse')
+
+# Class names of the resource types; types missing here are named after their words
+CLASS_NAMES = {
+    'collections': 'Collection',
+    'document_attachments': 'DocumentAttachment',
+    'document_comments': 'DocumentComment',
+    'document_parts': 'DocumentPart',
+    'documents': 'Document',
+    'enumerations': 'Enumeration',
+    'externallylinkedworkitems': 'ExternallyLinkedWorkItem',
+    'featureselections': 'FeatureSelection',
+    'globalroles': 'GlobalRole',
+    'icons': 'Icon',
+    'jobs': 'Job',
+    'linkedoslcresources': 'LinkedOslcResource',
+    'linkedworkitems': 'LinkedWorkItem',
+    'page_attachments': 'PageAttachment',
+    'pages': 'Page',
+    'plans': 'Plan',
+    'projects': 'Project',
+    'projecttemplates': 'ProjectTemplate',
+    'revisions': 'Revision',
+    'testparameter_definitions': 'TestParameterDefinition',
+    'testparameters': 'TestParameter',
+    'testrecord_attachments': 'TestRecordAttachment',
+    'testrecords': 'TestRecord',
+    'testrun_attachments': 'TestRunAttachment',
+    'testrun_comments': 'TestRunComment',
+    'testruns': 'TestRun',
+    'teststep_results': 'TestStepResult',
+    'teststepresult_attachments': 'TestStepResultAttachment',
+    'teststeps': 'TestStep',
+    'usergroups': 'UserGroup',
+    'users': 'User',
+    'workitem_approvals': 'WorkItemApproval',
+    'workitem_attachments': 'WorkItemAttachment',
+    'workitem_comments': 'WorkItemComment',
+    'workitems': 'WorkItem',
+    'workrecords': 'WorkRecord',
+}
+
+# Names taken by Model; attributes with these names get a trailing underscore (type_, id_)
+RESERVED_NAMES = {'type', 'id', 'revision', 'loaded', 'attributes', 'relationships', 'links',
+                  'meta', 'get', 'related_ids', 'to_dict', 'resource_type', 'attribute_names',
+                  'relationship_names'}
+
+JSON_TYPES = {
+    'string': 'str',
+    'integer': 'int',
+    'number': 'float',
+    'boolean': 'bool',
+    'object': 'Dict[str, Any]',
+    'array': 'List[Any]',
+}
+
+
+class ResourceSchema:
+    """
+    Attributes and relationships of one resource type, merged from its response schemas.
+
+    Attributes:
+        resource_type: JSON:API type (e.g. 'workitems')
+        schemas: Names of the schemas the resource type was read from
+        attributes: Attribute name -> attribute schema, in specification order
+        relationships: Relationship names, in specification order
+    """
+
+    __slots__ = ('resource_type', 'schemas', 'attributes', 'relationships')
+
+    def __init__(self, resource_type: str):
+        self.resource_type = resource_type
+        self.schemas: List[str] = []
+        self.attributes: Dict[str, Dict[str, Any]] = {}
+        self.relationships: List[str] = []
+
+    @property
+    def class_name(self) -> str:
+        return CLASS_NAMES.get(self.resource_type) or ''.join(
+            word.capitalize() for word in self.resource_type.split('_'))
+
+
+def field_name(attribute: str) -> str:
+    """
+    Python name of an attribute: 'dueDate' -> 'due_date', 'workItemURI' -> 'work_item_uri'.
+    """
+    name = re.sub(r'(?<=[a-z0-9])(?=[A-Z])', '_', attribute).lower()
+    if name in RESERVED_NAMES or keyword.iskeyword(name):
+        name += '_'
+    return name
+
+
+def annotation(schema: Dict[str, Any]) -> str:
+    """
+    Type hint of an attribute schema.
+    """
+    return f"Optional[{JSON_TYPES.get(schema.get('type'), 'Any')}]"
+
+
+def comment(schema: Dict[str, Any]) -> str:
+    """
+    Format or allowed values of an attribute schema, '' when it has neither.
+    """
+    if schema.get('enum'):
+        return ', '.join(str(value) for value in schema['enum'])
+    return schema.get('format') or ''
+
+
+def resource_schemas(spec: Dict[str, Any]) -> List[ResourceSchema]:
+    """
+    Resource types defined by the response schemas of a specification, sorted by type.
+    """
+    resources: Dict[str, ResourceSchema] = {}
+    for name, schema in spec.get('components', {}).get('schemas', {}).items():
+        if not name.endswith(RESPONSE_SUFFIXES):
+            continue
+        data = schema.get('properties', {}).get('data', {})
+        properties = data.get('items', data).get('properties', {})
+        types = properties.get('type', {}).get('enum') or []
+        if len(types) != 1:
+            continue
+        resource = resources.setdefault(types[0], ResourceSchema(types[0]))
+        resource.schemas.append(name)
+        for attribute, attribute_schema in properties.get('attributes', {}).get('properties', {}).items():
+            resource.attributes.setdefault(attribute, attribute_schema)
+        for relationship in properties.get('relationships', {}).get('properties', {}):
+            if relationship not in resource.relationships:
+                resource.relationships.append(relationship)
+    return [resources[resource_type] for resource_type in sorted(resources)]
+
+
+def _tuple(name: str, values: List[str]) -> List[str]:
+    if not values:
+        return [f"    {name} = ()"]
+    return [f"    {name} = ("] + [f"        {value!r}," for value in values] + ['    )']
+
+
+def generate_class(resource: ResourceSchema) -> List[str]:
+    """
+    Source lines of the model class of a resource type.
+    """
+    lines = [
+        f"class {resource.class_name}(Model):",
+        '    """',
+        f"    '{resource.resource_type}' resource ({', '.join(sorted(resource.schemas))}).",
+        '    """',
+        '',
+        '    __slots__ = ()',
+        '',
+        f"    resource_type = {resource.resource_type!r}",
+    ]
+    lines += _tuple('attribute_names', list(resource.attributes))
+    lines += _tuple('relationship_names', resource.relationships)
+    if resource.attributes:
+        lines.append('')
+    for attribute, schema in resource.attributes.items():
+        line = f"    {field_name(attribute)}: {annotation(schema)} = Attribute({attribute!r})"
+        note = comment(schema)
+        lines.append(f"{line}  # {note}" if note else line)
+    return lines
+
+
+def generate_models(spec: Dict[str, Any], source: str = SPEC_PATH) -> str:
+    """
+    Generate the source of models.py from a specification.
+
+    Args:
+        spec: Decoded OpenAPI specification
+        source: Specification path named in the header of the module
+
+    Returns:
+        Module source; the same specification always gives the same source
+    """
+    resources = resource_schemas(spec)
+    version = spec.get('info', {}).get('version', '')
+    lines = [
+        '"""',
+        'Typed resource models for Polarion REST API.',
+        f"Generated from {source} (API {version}) by model_generator.py, do not edit.",
+        'Regenerate with:',
+        '',
+        f"    python -m polarion_rest_api.modules.model_generator {source} \\\\",
+        '        -o polarion_rest_api/modules/models.py',
+        '"""',
+        'from typing import Optional, Dict, Any, List',
+        'from .model import Model, Attribute',
+    ]
+    for resource in resources:
+        lines += ['', ''] + generate_class(resource)
+    lines += ['', '', 'MODELS = {']
+    lines += [f"    {resource.resource_type!r}: {resource.class_name}," for resource in resources]
+    lines += ['}', '']
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point: write (or --check) models.py for a specification file.
+    """
+    parser = argparse.ArgumentParser(description='Generate typed resource models from the OpenAPI specification.')
+    parser.add_argument('spec', nargs='?', default=SPEC_PATH, help=f'Specification file (default: {SPEC_PATH})')
+    parser.add_argument('-o', '--output', help='Output file (default: standard output)')
+    parser.add_argument('--check', action='store_true',
+                        help='Exit with status 1 if the output file is not up to date')
+    args = parser.parse_args(argv)
+
+    with open(args.spec, 'r', encoding='utf-8') as file:
+        source = generate_models(json.load(file), source=args.spec.replace('\\', '/'))
+    if args.output is None:
+        sys.stdout.write(source)
+        return 0
+    if args.check:
+        try:
+            with open(args.output, 'r', encoding='utf-8') as file:
+                current = file.read()
+        except FileNotFoundError:
+            current = None
+        if current != source:
+            print(f"{args.output} is not up to date with {args.spec}", file=sys.stderr)
+            return 1
+        return 0
+    with open(args.output, 'w', encoding='utf-8', newline='\n') as file:
+        file.write(source)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
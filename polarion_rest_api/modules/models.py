@@ -0,0 +1,1093 @@
+"""
+Typed resource models for Polarion REST API.
+Generated from data/openapi_official.json (API v1) by model_generator.py, do not edit.
+Regenerate with:
+
+    python -m polarion_rest_api.modules.model_generator data/openapi_official.json \\
+        -o polarion_rest_api/modules/models.py
+"""
+from typing import Optional, Dict, Any, List
+from .model import Model, Attribute
+
+
+class Collection(Model):
+    """
+    'collections' resource (collectionsListGetResponse, collectionsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'collections'
+    attribute_names = (
+        'closedOn',
+        'created',
+        'description',
+        'id',
+        'name',
+        'updated',
+    )
+    relationship_names = (
+        'author',
+        'documents',
+        'downstreamCollections',
+        'project',
+        'reusedFrom',
+        'richPages',
+        'upstreamCollections',
+    )
+
+    closed_on: Optional[str] = Attribute('closedOn')  # date-time
+    created: Optional[str] = Attribute('created')  # date-time
+    description: Optional[Dict[str, Any]] = Attribute('description')
+    id_: Optional[str] = Attribute('id')
+    name: Optional[str] = Attribute('name')
+    updated: Optional[str] = Attribute('updated')  # date-time
+
+
+class DocumentAttachment(Model):
+    """
+    'document_attachments' resource (document_attachmentsListGetResponse, document_attachmentsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'document_attachments'
+    attribute_names = (
+        'fileName',
+        'id',
+        'length',
+        'title',
+        'updated',
+    )
+    relationship_names = (
+        'author',
+        'project',
+    )
+
+    file_name: Optional[str] = Attribute('fileName')
+    id_: Optional[str] = Attribute('id')
+    length: Optional[int] = Attribute('length')  # int32
+    title: Optional[str] = Attribute('title')
+    updated: Optional[str] = Attribute('updated')  # date-time
+
+
+class DocumentComment(Model):
+    """
+    'document_comments' resource (document_commentsListGetResponse, document_commentsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'document_comments'
+    attribute_names = (
+        'created',
+        'id',
+        'resolved',
+        'text',
+    )
+    relationship_names = (
+        'author',
+        'childComments',
+        'parentComment',
+        'project',
+    )
+
+    created: Optional[str] = Attribute('created')  # date-time
+    id_: Optional[str] = Attribute('id')
+    resolved: Optional[bool] = Attribute('resolved')
+    text: Optional[Dict[str, Any]] = Attribute('text')
+
+
+class DocumentPart(Model):
+    """
+    'document_parts' resource (document_partsListGetResponse, document_partsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'document_parts'
+    attribute_names = (
+        'content',
+        'external',
+        'id',
+        'level',
+        'type',
+    )
+    relationship_names = (
+        'nextPart',
+        'previousPart',
+        'workItem',
+    )
+
+    content: Optional[str] = Attribute('content')
+    external: Optional[bool] = Attribute('external')
+    id_: Optional[str] = Attribute('id')
+    level: Optional[int] = Attribute('level')  # int32
+    type_: Optional[str] = Attribute('type')
+
+
+class Document(Model):
+    """
+    'documents' resource (documentsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'documents'
+    attribute_names = (
+        'autoSuspect',
+        'branchedWithInitializedFields',
+        'branchedWithQuery',
+        'created',
+        'derivedFields',
+        'derivedFromLinkRole',
+        'homePageContent',
+        'moduleFolder',
+        'moduleName',
+        'outlineNumbering',
+        'renderingLayouts',
+        'status',
+        'structureLinkRole',
+        'title',
+        'type',
+        'updated',
+        'usesOutlineNumbering',
+    )
+    relationship_names = (
+        'attachments',
+        'author',
+        'branchedFrom',
+        'comments',
+        'derivedFrom',
+        'project',
+        'updatedBy',
+        'variant',
+    )
+
+    auto_suspect: Optional[bool] = Attribute('autoSuspect')
+    branched_with_initialized_fields: Optional[List[Any]] = Attribute('branchedWithInitializedFields')
+    branched_with_query: Optional[str] = Attribute('branchedWithQuery')
+    created: Optional[str] = Attribute('created')  # date-time
+    derived_fields: Optional[List[Any]] = Attribute('derivedFields')
+    derived_from_link_role: Optional[str] = Attribute('derivedFromLinkRole')
+    home_page_content: Optional[Dict[str, Any]] = Attribute('homePageContent')
+    module_folder: Optional[str] = Attribute('moduleFolder')
+    module_name: Optional[str] = Attribute('moduleName')
+    outline_numbering: Optional[Dict[str, Any]] = Attribute('outlineNumbering')
+    rendering_layouts: Optional[List[Any]] = Attribute('renderingLayouts')
+    status: Optional[str] = Attribute('status')
+    structure_link_role: Optional[str] = Attribute('structureLinkRole')
+    title: Optional[str] = Attribute('title')
+    type_: Optional[str] = Attribute('type')
+    updated: Optional[str] = Attribute('updated')  # date-time
+    uses_outline_numbering: Optional[bool] = Attribute('usesOutlineNumbering')
+
+
+class Enumeration(Model):
+    """
+    'enumerations' resource (enumerationsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'enumerations'
+    attribute_names = (
+        'enumContext',
+        'enumName',
+        'options',
+        'targetType',
+    )
+    relationship_names = ()
+
+    enum_context: Optional[str] = Attribute('enumContext')
+    enum_name: Optional[str] = Attribute('enumName')
+    options: Optional[List[Any]] = Attribute('options')
+    target_type: Optional[str] = Attribute('targetType')
+
+
+class ExternallyLinkedWorkItem(Model):
+    """
+    'externallylinkedworkitems' resource (externallylinkedworkitemsListGetResponse, externallylinkedworkitemsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'externallylinkedworkitems'
+    attribute_names = (
+        'role',
+        'workItemURI',
+    )
+    relationship_names = ()
+
+    role: Optional[str] = Attribute('role')
+    work_item_uri: Optional[str] = Attribute('workItemURI')
+
+
+class FeatureSelection(Model):
+    """
+    'featureselections' resource (featureselectionsListGetResponse, featureselectionsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'featureselections'
+    attribute_names = (
+        'selectionType',
+    )
+    relationship_names = (
+        'workItem',
+    )
+
+    selection_type: Optional[str] = Attribute('selectionType')  # excluded, included, implicitly-included
+
+
+class GlobalRole(Model):
+    """
+    'globalroles' resource (globalrolesSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'globalroles'
+    attribute_names = ()
+    relationship_names = (
+        'users',
+    )
+
+
+class Icon(Model):
+    """
+    'icons' resource (iconsListGetResponse, iconsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'icons'
+    attribute_names = (
+        'iconUrl',
+        'id',
+        'path',
+    )
+    relationship_names = ()
+
+    icon_url: Optional[str] = Attribute('iconUrl')
+    id_: Optional[str] = Attribute('id')
+    path: Optional[str] = Attribute('path')
+
+
+class Job(Model):
+    """
+    'jobs' resource (jobsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'jobs'
+    attribute_names = (
+        'jobId',
+        'name',
+        'state',
+        'status',
+    )
+    relationship_names = (
+        'document',
+        'documents',
+        'project',
+    )
+
+    job_id: Optional[str] = Attribute('jobId')
+    name: Optional[str] = Attribute('name')
+    state: Optional[str] = Attribute('state')
+    status: Optional[Dict[str, Any]] = Attribute('status')
+
+
+class LinkedOslcResource(Model):
+    """
+    'linkedoslcresources' resource (linkedoslcresourcesListGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'linkedoslcresources'
+    attribute_names = (
+        'label',
+        'role',
+        'uri',
+    )
+    relationship_names = ()
+
+    label: Optional[str] = Attribute('label')
+    role: Optional[str] = Attribute('role')
+    uri: Optional[str] = Attribute('uri')
+
+
+class LinkedWorkItem(Model):
+    """
+    'linkedworkitems' resource (linkedworkitemsListGetResponse, linkedworkitemsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'linkedworkitems'
+    attribute_names = (
+        'revision',
+        'role',
+        'suspect',
+    )
+    relationship_names = (
+        'workItem',
+    )
+
+    revision_: Optional[str] = Attribute('revision')
+    role: Optional[str] = Attribute('role')
+    suspect: Optional[bool] = Attribute('suspect')
+
+
+class PageAttachment(Model):
+    """
+    'page_attachments' resource (page_attachmentsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'page_attachments'
+    attribute_names = (
+        'fileName',
+        'id',
+        'length',
+        'title',
+        'updated',
+    )
+    relationship_names = (
+        'author',
+        'project',
+    )
+
+    file_name: Optional[str] = Attribute('fileName')
+    id_: Optional[str] = Attribute('id')
+    length: Optional[int] = Attribute('length')  # int32
+    title: Optional[str] = Attribute('title')
+    updated: Optional[str] = Attribute('updated')  # date-time
+
+
+class Page(Model):
+    """
+    'pages' resource (pagesSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'pages'
+    attribute_names = (
+        'created',
+        'pageName',
+        'spaceId',
+        'title',
+        'updated',
+    )
+    relationship_names = (
+        'attachments',
+        'author',
+        'project',
+        'updatedBy',
+    )
+
+    created: Optional[str] = Attribute('created')  # date-time
+    page_name: Optional[str] = Attribute('pageName')
+    space_id: Optional[str] = Attribute('spaceId')
+    title: Optional[str] = Attribute('title')
+    updated: Optional[str] = Attribute('updated')  # date-time
+
+
+class Plan(Model):
+    """
+    'plans' resource (plansListGetResponse, plansSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'plans'
+    attribute_names = (
+        'allowedTypes',
+        'calculationType',
+        'capacity',
+        'color',
+        'created',
+        'defaultEstimate',
+        'description',
+        'dueDate',
+        'estimationField',
+        'finishedOn',
+        'homePageContent',
+        'id',
+        'isTemplate',
+        'name',
+        'previousTimeSpent',
+        'prioritizationField',
+        'sortOrder',
+        'startDate',
+        'startedOn',
+        'status',
+        'updated',
+        'useReportFromTemplate',
+    )
+    relationship_names = (
+        'author',
+        'parent',
+        'project',
+        'projectSpan',
+        'template',
+        'workItems',
+    )
+
+    allowed_types: Optional[List[Any]] = Attribute('allowedTypes')
+    calculation_type: Optional[str] = Attribute('calculationType')  # timeBased, customFieldBased
+    capacity: Optional[float] = Attribute('capacity')
+    color: Optional[str] = Attribute('color')
+    created: Optional[str] = Attribute('created')  # date-time
+    default_estimate: Optional[float] = Attribute('defaultEstimate')
+    description: Optional[Dict[str, Any]] = Attribute('description')
+    due_date: Optional[str] = Attribute('dueDate')  # date
+    estimation_field: Optional[str] = Attribute('estimationField')
+    finished_on: Optional[str] = Attribute('finishedOn')  # date-time
+    home_page_content: Optional[Dict[str, Any]] = Attribute('homePageContent')
+    id_: Optional[str] = Attribute('id')
+    is_template: Optional[bool] = Attribute('isTemplate')
+    name: Optional[str] = Attribute('name')
+    previous_time_spent: Optional[str] = Attribute('previousTimeSpent')
+    prioritization_field: Optional[str] = Attribute('prioritizationField')
+    sort_order: Optional[int] = Attribute('sortOrder')  # int32
+    start_date: Optional[str] = Attribute('startDate')  # date
+    started_on: Optional[str] = Attribute('startedOn')  # date-time
+    status: Optional[str] = Attribute('status')
+    updated: Optional[str] = Attribute('updated')  # date-time
+    use_report_from_template: Optional[bool] = Attribute('useReportFromTemplate')
+
+
+class Project(Model):
+    """
+    'projects' resource (projectsListGetResponse, projectsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'projects'
+    attribute_names = (
+        'active',
+        'color',
+        'description',
+        'finish',
+        'icon',
+        'id',
+        'lockWorkRecordsDate',
+        'name',
+        'start',
+        'trackerPrefix',
+    )
+    relationship_names = (
+        'lead',
+    )
+
+    active: Optional[bool] = Attribute('active')
+    color: Optional[str] = Attribute('color')
+    description: Optional[Dict[str, Any]] = Attribute('description')
+    finish: Optional[str] = Attribute('finish')  # date
+    icon: Optional[str] = Attribute('icon')
+    id_: Optional[str] = Attribute('id')
+    lock_work_records_date: Optional[str] = Attribute('lockWorkRecordsDate')  # date
+    name: Optional[str] = Attribute('name')
+    start: Optional[str] = Attribute('start')  # date
+    tracker_prefix: Optional[str] = Attribute('trackerPrefix')
+
+
+class ProjectTemplate(Model):
+    """
+    'projecttemplates' resource (projecttemplatesListGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'projecttemplates'
+    attribute_names = (
+        'customIcon',
+        'description',
+        'distributions',
+        'id',
+        'isDefault',
+        'name',
+        'parameters',
+    )
+    relationship_names = ()
+
+    custom_icon: Optional[str] = Attribute('customIcon')
+    description: Optional[str] = Attribute('description')
+    distributions: Optional[List[Any]] = Attribute('distributions')
+    id_: Optional[str] = Attribute('id')
+    is_default: Optional[bool] = Attribute('isDefault')
+    name: Optional[str] = Attribute('name')
+    parameters: Optional[Dict[str, Any]] = Attribute('parameters')
+
+
+class Revision(Model):
+    """
+    'revisions' resource (revisionsListGetResponse, revisionsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'revisions'
+    attribute_names = (
+        'created',
+        'id',
+        'internalCommit',
+        'message',
+        'repositoryName',
+    )
+    relationship_names = (
+        'author',
+    )
+
+    created: Optional[str] = Attribute('created')  # date-time
+    id_: Optional[str] = Attribute('id')
+    internal_commit: Optional[bool] = Attribute('internalCommit')
+    message: Optional[str] = Attribute('message')
+    repository_name: Optional[str] = Attribute('repositoryName')
+
+
+class TestParameterDefinition(Model):
+    """
+    'testparameter_definitions' resource (testparameter_definitionsListGetResponse, testparameter_definitionsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'testparameter_definitions'
+    attribute_names = (
+        'name',
+    )
+    relationship_names = ()
+
+    name: Optional[str] = Attribute('name')
+
+
+class TestParameter(Model):
+    """
+    'testparameters' resource (testparametersListGetResponse, testparametersSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'testparameters'
+    attribute_names = (
+        'name',
+        'value',
+    )
+    relationship_names = (
+        'definition',
+    )
+
+    name: Optional[str] = Attribute('name')
+    value: Optional[str] = Attribute('value')
+
+
+class TestRecordAttachment(Model):
+    """
+    'testrecord_attachments' resource (testrecord_attachmentsListGetResponse, testrecord_attachmentsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'testrecord_attachments'
+    attribute_names = (
+        'fileName',
+        'id',
+        'length',
+        'title',
+        'updated',
+    )
+    relationship_names = (
+        'author',
+        'project',
+    )
+
+    file_name: Optional[str] = Attribute('fileName')
+    id_: Optional[str] = Attribute('id')
+    length: Optional[int] = Attribute('length')  # int32
+    title: Optional[str] = Attribute('title')
+    updated: Optional[str] = Attribute('updated')  # date-time
+
+
+class TestRecord(Model):
+    """
+    'testrecords' resource (testrecordsListGetResponse, testrecordsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'testrecords'
+    attribute_names = (
+        'comment',
+        'duration',
+        'executed',
+        'iteration',
+        'result',
+        'testCaseRevision',
+    )
+    relationship_names = (
+        'defect',
+        'executedBy',
+        'testCase',
+    )
+
+    comment: Optional[Dict[str, Any]] = Attribute('comment')
+    duration: Optional[float] = Attribute('duration')
+    executed: Optional[str] = Attribute('executed')  # date-time
+    iteration: Optional[int] = Attribute('iteration')  # int32
+    result: Optional[str] = Attribute('result')
+    test_case_revision: Optional[str] = Attribute('testCaseRevision')
+
+
+class TestRunAttachment(Model):
+    """
+    'testrun_attachments' resource (testrun_attachmentsListGetResponse, testrun_attachmentsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'testrun_attachments'
+    attribute_names = (
+        'fileName',
+        'id',
+        'length',
+        'title',
+        'updated',
+    )
+    relationship_names = (
+        'author',
+        'project',
+    )
+
+    file_name: Optional[str] = Attribute('fileName')
+    id_: Optional[str] = Attribute('id')
+    length: Optional[int] = Attribute('length')  # int32
+    title: Optional[str] = Attribute('title')
+    updated: Optional[str] = Attribute('updated')  # date-time
+
+
+class TestRunComment(Model):
+    """
+    'testrun_comments' resource (testrun_commentsListGetResponse, testrun_commentsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'testrun_comments'
+    attribute_names = (
+        'created',
+        'id',
+        'resolved',
+        'text',
+        'title',
+    )
+    relationship_names = (
+        'author',
+        'childComments',
+        'parentComment',
+        'project',
+    )
+
+    created: Optional[str] = Attribute('created')  # date-time
+    id_: Optional[str] = Attribute('id')
+    resolved: Optional[bool] = Attribute('resolved')
+    text: Optional[Dict[str, Any]] = Attribute('text')
+    title: Optional[str] = Attribute('title')
+
+
+class TestRun(Model):
+    """
+    'testruns' resource (testrunsListGetResponse, testrunsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'testruns'
+    attribute_names = (
+        'created',
+        'finishedOn',
+        'groupId',
+        'homePageContent',
+        'id',
+        'idPrefix',
+        'isTemplate',
+        'keepInHistory',
+        'query',
+        'selectTestCasesBy',
+        'status',
+        'title',
+        'type',
+        'updated',
+        'useReportFromTemplate',
+    )
+    relationship_names = (
+        'author',
+        'document',
+        'project',
+        'projectSpan',
+        'summaryDefect',
+        'template',
+    )
+
+    created: Optional[str] = Attribute('created')  # date-time
+    finished_on: Optional[str] = Attribute('finishedOn')  # date-time
+    group_id: Optional[str] = Attribute('groupId')
+    home_page_content: Optional[Dict[str, Any]] = Attribute('homePageContent')
+    id_: Optional[str] = Attribute('id')
+    id_prefix: Optional[str] = Attribute('idPrefix')
+    is_template: Optional[bool] = Attribute('isTemplate')
+    keep_in_history: Optional[bool] = Attribute('keepInHistory')
+    query: Optional[str] = Attribute('query')
+    select_test_cases_by: Optional[str] = Attribute('selectTestCasesBy')  # manualSelection, staticQueryResult, dynamicQueryResult, staticLiveDoc, dynamicLiveDoc, automatedProcess
+    status: Optional[str] = Attribute('status')
+    title: Optional[str] = Attribute('title')
+    type_: Optional[str] = Attribute('type')
+    updated: Optional[str] = Attribute('updated')  # date-time
+    use_report_from_template: Optional[bool] = Attribute('useReportFromTemplate')
+
+
+class TestStepResult(Model):
+    """
+    'teststep_results' resource (teststep_resultsListGetResponse, teststep_resultsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'teststep_results'
+    attribute_names = (
+        'comment',
+        'result',
+    )
+    relationship_names = (
+        'testStep',
+    )
+
+    comment: Optional[Dict[str, Any]] = Attribute('comment')
+    result: Optional[str] = Attribute('result')
+
+
+class TestStepResultAttachment(Model):
+    """
+    'teststepresult_attachments' resource (teststepresult_attachmentsListGetResponse, teststepresult_attachmentsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'teststepresult_attachments'
+    attribute_names = (
+        'fileName',
+        'id',
+        'length',
+        'title',
+        'updated',
+    )
+    relationship_names = (
+        'author',
+        'project',
+    )
+
+    file_name: Optional[str] = Attribute('fileName')
+    id_: Optional[str] = Attribute('id')
+    length: Optional[int] = Attribute('length')  # int32
+    title: Optional[str] = Attribute('title')
+    updated: Optional[str] = Attribute('updated')  # date-time
+
+
+class TestStep(Model):
+    """
+    'teststeps' resource (teststepsListGetResponse, teststepsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'teststeps'
+    attribute_names = (
+        'index',
+        'keys',
+        'values',
+    )
+    relationship_names = ()
+
+    index: Optional[str] = Attribute('index')
+    keys: Optional[List[Any]] = Attribute('keys')
+    values: Optional[List[Any]] = Attribute('values')
+
+
+class UserGroup(Model):
+    """
+    'usergroups' resource (usergroupsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'usergroups'
+    attribute_names = (
+        'description',
+        'id',
+        'ldapSearchFilter',
+        'name',
+        'ssoSynchronizationAllowed',
+    )
+    relationship_names = (
+        'globalRoles',
+        'projectRoles',
+        'users',
+    )
+
+    description: Optional[Dict[str, Any]] = Attribute('description')
+    id_: Optional[str] = Attribute('id')
+    ldap_search_filter: Optional[str] = Attribute('ldapSearchFilter')
+    name: Optional[str] = Attribute('name')
+    sso_synchronization_allowed: Optional[bool] = Attribute('ssoSynchronizationAllowed')
+
+
+class User(Model):
+    """
+    'users' resource (usersListGetResponse, usersSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'users'
+    attribute_names = (
+        'avatarUrl',
+        'description',
+        'disabledNotifications',
+        'email',
+        'id',
+        'initials',
+        'name',
+    )
+    relationship_names = (
+        'globalRoles',
+        'projectRoles',
+        'userGroups',
+    )
+
+    avatar_url: Optional[str] = Attribute('avatarUrl')
+    description: Optional[Dict[str, Any]] = Attribute('description')
+    disabled_notifications: Optional[bool] = Attribute('disabledNotifications')
+    email: Optional[str] = Attribute('email')
+    id_: Optional[str] = Attribute('id')
+    initials: Optional[str] = Attribute('initials')
+    name: Optional[str] = Attribute('name')
+
+
+class WorkItemApproval(Model):
+    """
+    'workitem_approvals' resource (workitem_approvalsListGetResponse, workitem_approvalsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'workitem_approvals'
+    attribute_names = (
+        'status',
+    )
+    relationship_names = (
+        'user',
+    )
+
+    status: Optional[str] = Attribute('status')  # waiting, approved, disapproved
+
+
+class WorkItemAttachment(Model):
+    """
+    'workitem_attachments' resource (workitem_attachmentsListGetResponse, workitem_attachmentsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'workitem_attachments'
+    attribute_names = (
+        'fileName',
+        'id',
+        'length',
+        'title',
+        'updated',
+    )
+    relationship_names = (
+        'author',
+        'project',
+    )
+
+    file_name: Optional[str] = Attribute('fileName')
+    id_: Optional[str] = Attribute('id')
+    length: Optional[int] = Attribute('length')  # int32
+    title: Optional[str] = Attribute('title')
+    updated: Optional[str] = Attribute('updated')  # date-time
+
+
+class WorkItemComment(Model):
+    """
+    'workitem_comments' resource (workitem_commentsListGetResponse, workitem_commentsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'workitem_comments'
+    attribute_names = (
+        'created',
+        'id',
+        'resolved',
+        'text',
+        'title',
+    )
+    relationship_names = (
+        'author',
+        'childComments',
+        'parentComment',
+        'project',
+    )
+
+    created: Optional[str] = Attribute('created')  # date-time
+    id_: Optional[str] = Attribute('id')
+    resolved: Optional[bool] = Attribute('resolved')
+    text: Optional[Dict[str, Any]] = Attribute('text')
+    title: Optional[str] = Attribute('title')
+
+
+class WorkItem(Model):
+    """
+    'workitems' resource (workitemsListGetResponse, workitemsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'workitems'
+    attribute_names = (
+        'created',
+        'description',
+        'dueDate',
+        'hyperlinks',
+        'id',
+        'initialEstimate',
+        'outlineNumber',
+        'plannedEnd',
+        'plannedStart',
+        'priority',
+        'remainingEstimate',
+        'resolution',
+        'resolvedOn',
+        'severity',
+        'status',
+        'timeSpent',
+        'title',
+        'type',
+        'updated',
+    )
+    relationship_names = (
+        'approvals',
+        'assignee',
+        'attachments',
+        'author',
+        'backlinkedWorkItems',
+        'categories',
+        'comments',
+        'externallyLinkedWorkItems',
+        'linkedOslcResources',
+        'linkedRevisions',
+        'linkedWorkItems',
+        'module',
+        'plannedIn',
+        'project',
+        'testSteps',
+        'votes',
+        'watches',
+        'workRecords',
+    )
+
+    created: Optional[str] = Attribute('created')  # date-time
+    description: Optional[Dict[str, Any]] = Attribute('description')
+    due_date: Optional[str] = Attribute('dueDate')  # date
+    hyperlinks: Optional[List[Any]] = Attribute('hyperlinks')
+    id_: Optional[str] = Attribute('id')
+    initial_estimate: Optional[str] = Attribute('initialEstimate')
+    outline_number: Optional[str] = Attribute('outlineNumber')
+    planned_end: Optional[str] = Attribute('plannedEnd')  # date-time
+    planned_start: Optional[str] = Attribute('plannedStart')  # date-time
+    priority: Optional[str] = Attribute('priority')
+    remaining_estimate: Optional[str] = Attribute('remainingEstimate')
+    resolution: Optional[str] = Attribute('resolution')
+    resolved_on: Optional[str] = Attribute('resolvedOn')  # date-time
+    severity: Optional[str] = Attribute('severity')
+    status: Optional[str] = Attribute('status')
+    time_spent: Optional[str] = Attribute('timeSpent')
+    title: Optional[str] = Attribute('title')
+    type_: Optional[str] = Attribute('type')
+    updated: Optional[str] = Attribute('updated')  # date-time
+
+
+class WorkRecord(Model):
+    """
+    'workrecords' resource (workrecordsListGetResponse, workrecordsSingleGetResponse).
+    """
+
+    __slots__ = ()
+
+    resource_type = 'workrecords'
+    attribute_names = (
+        'comment',
+        'date',
+        'id',
+        'timeSpent',
+        'type',
+    )
+    relationship_names = (
+        'project',
+        'user',
+    )
+
+    comment: Optional[str] = Attribute('comment')
+    date: Optional[str] = Attribute('date')  # date
+    id_: Optional[str] = Attribute('id')
+    time_spent: Optional[str] = Attribute('timeSpent')
+    type_: Optional[str] = Attribute('type')
+
+
+MODELS = {
+    'collections': Collection,
+    'document_attachments': DocumentAttachment,
+    'document_comments': DocumentComment,
+    'document_parts': DocumentPart,
+    'documents': Document,
+    'enumerations': Enumeration,
+    'externallylinkedworkitems': ExternallyLinkedWorkItem,
+    'featureselections': FeatureSelection,
+    'globalroles': GlobalRole,
+    'icons': Icon,
+    'jobs': Job,
+    'linkedoslcresources': LinkedOslcResource,
+    'linkedworkitems': LinkedWorkItem,
+    'page_attachments': PageAttachment,
+    'pages': Page,
+    'plans': Plan,
+    'projects': Project,
+    'projecttemplates': ProjectTemplate,
+    'revisions': Revision,
+    'testparameter_definitions': TestParameterDefinition,
+    'testparameters': TestParameter,
+    'testrecord_attachments': TestRecordAttachment,
+    'testrecords': TestRecord,
+    'testrun_attachments': TestRunAttachment,
+    'testrun_comments': TestRunComment,
+    'testruns': TestRun,
+    'teststep_results': TestStepResult,
+    'teststepresult_attachments': TestStepResultAttachment,
+    'teststeps': TestStep,
+    'usergroups': UserGroup,
+    'users': User,
+    'workitem_approvals': WorkItemApproval,
+    'workitem_attachments': WorkItemAttachment,
+    'workitem_comments': WorkItemComment,
+    'workitems': WorkItem,
+    'workrecords': WorkRecord,
+}
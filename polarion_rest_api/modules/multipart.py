@@ -0,0 +1,332 @@
+"""
+Streaming multipart module for Polarion REST API.
+Encodes multipart/form-data bodies part by part, reading file contents from paths,
+file objects or iterators in fixed-size chunks, and uploads many files in a few
+requests.
+"""
+import json
+import mimetypes
+import os
+import uuid
+from typing import Optional, Union, List, Dict, Any, Tuple, Iterable, Iterator, Sequence, BinaryIO
+import requests
+from .downloads import DEFAULT_CHUNK_SIZE
+
+
+DEFAULT_MAX_FILES = 20
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+# Content of a file part: path, bytes, binary file object or iterator of bytes chunks
+Source = Union[str, os.PathLike, bytes, BinaryIO, Iterable[bytes]]
+
+# A file to upload: path or binary file object, or (filename, source[, content_type])
+FileSpec = Union[str, os.PathLike, BinaryIO, Tuple[str, Source], Tuple[str, Source, Optional[str]]]
+
+_CRLF = b'\r\n'
+
+
+def _quote(value: str) -> str:
+    """
+    Escape a name or filename for a Content-Disposition header (HTML5 form encoding).
+    """
+    return value.replace('\\', '\\\\').replace('"', '%22').replace('\r', '%0D').replace('\n', '%0A')
+
+
+class UploadFile:
+    """
+    A file part of a multipart body.
+
+    The content is only opened (for paths) and read while the body is sent.
+
+    Attributes:
+        filename: Name sent in the Content-Disposition of the part
+        source: Path, bytes, binary file object or iterator of bytes chunks
+        content_type: Content-Type of the part
+        size: Number of bytes of the content, None for iterators
+    """
+
+    __slots__ = ('filename', 'source', 'content_type', 'size')
+
+    def __init__(self, filename: str, source: Source, content_type: Optional[str] = None):
+        self.filename = filename
+        self.source = source
+        self.content_type = (content_type or mimetypes.guess_type(filename)[0]
+                             or 'application/octet-stream')
+        self.size = self._size(source)
+
+    @classmethod
+    def from_spec(cls, spec: FileSpec) -> 'UploadFile':
+        """
+        Build an UploadFile from a path, a named file object or a (filename, source[, content_type]) tuple.
+
+        Raises:
+            ValueError: If no filename can be derived from the specification
+        """
+        if isinstance(spec, UploadFile):
+            return spec
+        if isinstance(spec, tuple):
+            return cls(*spec)
+        if isinstance(spec, (str, os.PathLike)):
+            return cls(os.path.basename(os.fspath(spec)), spec)
+        name = getattr(spec, 'name', None)
+        if not isinstance(name, str):
+            raise ValueError(f"Cannot derive a filename from {spec!r}, pass (filename, source) instead")
+        return cls(os.path.basename(name), spec)
+
+    @staticmethod
+    def _size(source: Source) -> Optional[int]:
+        """
+        Size of the remaining content of a source, None when it is not known up front.
+        """
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return len(source)
+        if isinstance(source, (str, os.PathLike)):
+            return os.path.getsize(source)
+        if hasattr(source, 'read'):
+            if hasattr(source, 'seek') and hasattr(source, 'tell'):
+                position = source.tell()
+                end = source.seek(0, os.SEEK_END)
+                source.seek(position)
+                return end - position
+            return None
+        if hasattr(source, '__iter__'):
+            return None
+        raise ValueError(f"Unsupported file content {type(source).__name__}")
+
+    def chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Yield the content in chunks of at most chunk_size bytes.
+
+        Paths are opened for the duration of the iteration; file objects passed by the
+        caller are read from their current position and left open.
+        """
+        source = self.source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            view = memoryview(source)
+            for start in range(0, len(view), chunk_size):
+                yield bytes(view[start:start + chunk_size])
+        elif isinstance(source, (str, os.PathLike)):
+            with open(source, 'rb') as file:
+                yield from iter(lambda: file.read(chunk_size), b'')
+        elif hasattr(source, 'read'):
+            yield from iter(lambda: source.read(chunk_size), b'')
+        else:
+            for chunk in source:
+                if chunk:
+                    yield bytes(chunk)
+
+    def __repr__(self) -> str:
+        return f"UploadFile({self.filename!r}, size={self.size}, content_type={self.content_type!r})"
+
+
+class MultipartEncoder:
+    """
+    Streaming multipart/form-data body.
+
+    Passed as the data of a request, the body is read part by part while it is sent,
+    so memory use is bounded by chunk_size whatever the size of the files. When the
+    sizes of all files are known the request carries a Content-Length, otherwise it
+    is sent with chunked transfer encoding. A body can be sent only once.
+
+    Args:
+        fields: Form fields as a dict or a list of (name, value) pairs. Dict and list
+               values are sent as JSON (e.g. the JSON:API 'resource' field)
+        files: File parts as a list of (name, file) pairs, where file is a path, a named
+               binary file object, a (filename, source[, content_type]) tuple or an UploadFile
+        boundary: Multipart boundary (default: random)
+        chunk_size: Number of bytes read from the files per chunk (default: 1 MiB)
+
+    Example:
+        >>> encoder = MultipartEncoder({'resource': resource}, [('files', '/logs/build.log')])
+        >>> session.post(url, data=encoder, headers={'Content-Type': encoder.content_type})
+    """
+
+    def __init__(self,
+                 fields: Optional[Union[Dict[str, Any], Sequence[Tuple[str, Any]]]] = None,
+                 files: Optional[Sequence[Tuple[str, FileSpec]]] = None,
+                 boundary: Optional[str] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.boundary = boundary or uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        if isinstance(fields, dict):
+            fields = list(fields.items())
+        self._parts: List[Tuple[bytes, Union[bytes, UploadFile]]] = []
+        for name, value in fields or []:
+            if isinstance(value, (dict, list)):
+                value = json.dumps(value)
+            if isinstance(value, str):
+                value = value.encode('utf-8')
+            self._parts.append((self._part_header(name), value))
+        for name, spec in files or []:
+            upload = UploadFile.from_spec(spec)
+            self._parts.append((self._part_header(name, upload), upload))
+        self._closing = b'--' + self.boundary.encode('ascii') + b'--' + _CRLF
+        self._chunks: Optional[Iterator[bytes]] = None
+        self._buffer = bytearray()
+
+    def _part_header(self, name: str, upload: Optional[UploadFile] = None) -> bytes:
+        """
+        Boundary and headers preceding the content of a part.
+        """
+        disposition = f'form-data; name="{_quote(name)}"'
+        lines = [f'--{self.boundary}']
+        if upload is None:
+            lines.append(f'Content-Disposition: {disposition}')
+        else:
+            lines.append(f'Content-Disposition: {disposition}; filename="{_quote(upload.filename)}"')
+            lines.append(f'Content-Type: {upload.content_type}')
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('utf-8')
+
+    @property
+    def content_type(self) -> str:
+        """Content-Type header value of the body, including the boundary"""
+        return f'multipart/form-data; boundary={self.boundary}'
+
+    @property
+    def files(self) -> List[UploadFile]:
+        """File parts of the body"""
+        return [body for _, body in self._parts if isinstance(body, UploadFile)]
+
+    @property
+    def len(self) -> Optional[int]:
+        """
+        Total size of the body in bytes, None when a file is read from an iterator.
+
+        Read by requests to set the Content-Length header.
+        """
+        total = len(self._closing)
+        for header, body in self._parts:
+            size = len(body) if isinstance(body, bytes) else body.size
+            if size is None:
+                return None
+            total += len(header) + size + len(_CRLF)
+        return total
+
+    def _iter_body(self) -> Iterator[bytes]:
+        for header, body in self._parts:
+            yield header
+            if isinstance(body, bytes):
+                yield body
+            else:
+                sent = 0
+                for chunk in body.chunks(self.chunk_size):
+                    sent += len(chunk)
+                    yield chunk
+                if body.size is not None and sent != body.size:
+                    raise ValueError(f"File {body.filename!r} changed while uploading: "
+                                     f"sent {sent} of {body.size} bytes")
+            yield _CRLF
+        yield self._closing
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(lambda: self.read(self.chunk_size), b'')
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read up to size bytes of the body (all remaining bytes if size is negative).
+        """
+        if self._chunks is None:
+            self._chunks = self._iter_body()
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def __repr__(self) -> str:
+        return f"MultipartEncoder(boundary={self.boundary!r}, files={self.files}, len={self.len})"
+
+
+def batch_files(files: Iterable[FileSpec], max_files: int = DEFAULT_MAX_FILES,
+                max_bytes: int = DEFAULT_MAX_BYTES) -> List[List[UploadFile]]:
+    """
+    Group files into batches of at most max_files files and max_bytes bytes.
+
+    A file larger than max_bytes, or whose size is unknown, gets a batch of its own.
+    The order of the files is kept.
+
+    Args:
+        files: Files to upload (paths, named file objects or (filename, source[, content_type]))
+        max_files: Maximum number of files per batch
+        max_bytes: Maximum total size of the files of a batch
+
+    Returns:
+        List of batches of UploadFile
+    """
+    if max_files < 1:
+        raise ValueError("max_files must be at least 1")
+    batches: List[List[UploadFile]] = []
+    batch: List[UploadFile] = []
+    batch_bytes = 0
+    for spec in files:
+        upload = UploadFile.from_spec(spec)
+        size = upload.size if upload.size is not None else max_bytes
+        if batch and (len(batch) >= max_files or batch_bytes + size > max_bytes):
+            batches.append(batch)
+            batch, batch_bytes = [], 0
+        batch.append(upload)
+        batch_bytes += size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def upload_files(module, endpoint: str, resource_type: str, files: Iterable[FileSpec],
+                 titles: Optional[Sequence[Optional[str]]] = None,
+                 file_attributes: bool = True,
+                 max_files: int = DEFAULT_MAX_FILES,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[requests.Response]:
+    """
+    Upload files to a Polarion multipart endpoint taking a 'resource' part and 'files' parts.
+
+    The files are sent in batches, several per request, each as a streamed multipart
+    body. The 'resource' part lists one resource per file, matched by order. Uploading
+    stops at the first failed request.
+
+    Args:
+        module: PolarionBase module sending the requests
+        endpoint: Endpoint of the collection (e.g. 'projects/P/workitems/WI-1/attachments')
+        resource_type: JSON:API type of the created resources (e.g. 'workitem_attachments')
+        files: Files to upload (paths, named file objects or (filename, source[, content_type]))
+        titles: Optional titles matched with the files by order
+        file_attributes: Send the fileName (and title) attributes of each resource
+        max_files: Maximum number of files per request
+        max_bytes: Maximum total size of the files of a request
+        chunk_size: Number of bytes read from the files per chunk
+
+    Returns:
+        List of Response objects, one per request
+
+    Raises:
+        ValueError: If titles and files do not have the same length
+    """
+    batches = batch_files(files, max_files=max_files, max_bytes=max_bytes)
+    if titles is not None:
+        titles = list(titles)
+        if len(titles) != sum(len(batch) for batch in batches):
+            raise ValueError("titles must have one entry per file")
+    responses = []
+    index = 0
+    for batch in batches:
+        resources = []
+        for upload in batch:
+            resource: Dict[str, Any] = {'type': resource_type}
+            if file_attributes:
+                resource['attributes'] = {'fileName': upload.filename}
+                if titles is not None and titles[index] is not None:
+                    resource['attributes']['title'] = titles[index]
+            resources.append(resource)
+            index += 1
+        encoder = MultipartEncoder({'resource': {'data': resources}},
+                                   [('files', upload) for upload in batch], chunk_size=chunk_size)
+        response = module._post(endpoint, data=encoder, headers={'Content-Type': encoder.content_type})
+        responses.append(response)
+        if response.status_code >= 300:
+            break
+    return responses
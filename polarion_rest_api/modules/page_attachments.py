@@ -2,9 +2,11 @@
 Page Attachments module for Polarion REST API.
 Handles all Page Attachments related endpoints.
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Iterable, Sequence
 import requests
 from .base import PolarionBase
+from .downloads import DownloadResult, Destination, save_stream, DEFAULT_CHUNK_SIZE, DEFAULT_ALGORITHM
+from .multipart import FileSpec, upload_files, DEFAULT_MAX_FILES, DEFAULT_MAX_BYTES
 
 
 class PageAttachments(PolarionBase):
@@ -15,6 +17,7 @@ class PageAttachments(PolarionBase):
     Methods are organized by HTTP method type (same order as Swagger documentation):
     - GET methods: Retrieve page attachments and download content
     - POST methods: Create page attachments
+    - Upload methods: Stream files from disk, several per request
     """
     
     # ========== GET methods ==========
@@ -98,6 +101,46 @@ class PageAttachments(PolarionBase):
             params=params if params else None
         )
     
+    def save_page_attachment_content(self,
+                                     project_id: str,
+                                     space_id: str,
+                                     page_name: str,
+                                     attachment_id: str,
+                                     destination: Destination,
+                                     revision: Optional[str] = None,
+                                     chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                     algorithm: str = DEFAULT_ALGORITHM) -> DownloadResult:
+        """
+        Downloads the file content for a specified Page Attachment to a path or file object.
+        
+        Streaming variant of get_page_attachment_content: the content is written in chunks of
+        chunk_size bytes and hashed on the fly, so memory use does not depend on the
+        file size.
+        
+        Args:
+            project_id: The Project ID
+            space_id: The Space ID (Use '_default' for the default Space)
+            page_name: The Page name
+            attachment_id: The Attachment ID
+            destination: Path of the file to write, or binary file object
+            revision: The revision ID
+            chunk_size: Number of bytes read per chunk (default: 1 MiB)
+            algorithm: hashlib algorithm of the checksum (default: 'sha256')
+            
+        Returns:
+            DownloadResult with the size and checksum of the content
+            
+        Raises:
+            ValueError: If the download failed or was incomplete
+        """
+        params = {}
+        if revision:
+            params['revision'] = revision
+        
+        response = self._get_stream(f'projects/{project_id}/spaces/{space_id}/pages/{page_name}/attachments/{attachment_id}/content',
+                                    params=params if params else None)
+        return save_stream(response, destination, chunk_size=chunk_size, algorithm=algorithm)
+    
     # ========== POST methods ==========
     
     def post_page_attachments(self,
@@ -125,3 +168,43 @@ class PageAttachments(PolarionBase):
             data=data,
             files=files
         )
+    
+    # ========== Upload methods ==========
+    
+    def upload_page_attachments(self,
+                                project_id: str,
+                                space_id: str,
+                                page_name: str,
+                                files: Iterable[FileSpec],
+                                titles: Optional[Sequence[Optional[str]]] = None,
+                                max_files: int = DEFAULT_MAX_FILES,
+                                max_bytes: int = DEFAULT_MAX_BYTES,
+                                chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[requests.Response]:
+        """
+        Uploads files as Page Attachments, streaming them from disk.
+        
+        Several files are sent per request (up to max_files and max_bytes) in a streamed
+        multipart/form-data body, so memory use does not depend on the file sizes.
+        
+        Args:
+            project_id: The Project ID
+            space_id: The Space ID
+            page_name: The Page name
+            files: Paths, named binary file objects or (filename, source[, content_type]) tuples,
+                   where source is a path, bytes, a file object or an iterator of bytes
+            titles: Optional attachment titles matched with the files by order
+            max_files: Maximum number of files per request (default: 20)
+            max_bytes: Maximum total size of the files of a request (default: 1 GiB)
+            chunk_size: Number of bytes read from the files per chunk (default: 1 MiB)
+        
+        Returns:
+            List of Response objects (201 Created), one per request. Uploading stops
+            at the first failed request.
+        
+        Example:
+            responses = api.page_attachments.upload_page_attachments(
+                "MyProject", "_default", "Home", ["/img/diagram.png"])
+        """
+        return upload_files(self, f'projects/{project_id}/spaces/{space_id}/pages/{page_name}/attachments',
+                            'page_attachments', files, titles=titles, max_files=max_files,
+                            max_bytes=max_bytes, chunk_size=chunk_size)
@@ -0,0 +1,82 @@
+"""
+Pagination helper module for Polarion REST API.
+Iterates over all pages of the list endpoints (methods accepting page_size and page_number).
+"""
+from typing import Dict, Any, Callable, Iterator
+import requests
+from .bulk import error_detail
+from .json_backend import response_json
+
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def iter_pages(list_method: Callable[..., requests.Response],
+               *args: Any,
+               page_size: int = DEFAULT_PAGE_SIZE,
+               **kwargs: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the decoded pages of a list endpoint.
+
+    Pages are requested one at a time, starting from page 1, until a page is
+    shorter than `page_size` or meta.totalCount resources have been returned.
+
+    Args:
+        list_method: Bound list method accepting page_size and page_number,
+                     e.g. api.work_items.get_work_items
+        *args: Positional arguments of list_method (e.g. project_id)
+        page_size: Number of resources per page (default: 100)
+        **kwargs: Other keyword arguments of list_method (e.g. query, include)
+
+    Returns:
+        Iterator over the decoded JSON pages
+
+    Raises:
+        requests.HTTPError: If a page request fails
+
+    Example:
+        >>> for page in iter_pages(api.work_items.get_work_items, "MyProjectId", query="type:task"):
+        ...     print(len(page['data']))
+    """
+    page_number = 1
+    returned = 0
+    while True:
+        response = list_method(*args, page_size=page_size, page_number=page_number, **kwargs)
+        if response.status_code >= 300:
+            raise requests.HTTPError(error_detail(response), response=response)
+        page = response_json(response)
+        data = page.get('data') or []
+        yield page
+        returned += len(data)
+        total = (page.get('meta') or {}).get('totalCount')
+        if len(data) < page_size or (total is not None and returned >= total):
+            return
+        page_number += 1
+
+
+def iter_resources(list_method: Callable[..., requests.Response],
+                   *args: Any,
+                   page_size: int = DEFAULT_PAGE_SIZE,
+                   **kwargs: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the resources of all pages of a list endpoint.
+
+    Args:
+        list_method: Bound list method accepting page_size and page_number
+        *args: Positional arguments of list_method (e.g. project_id)
+        page_size: Number of resources per page (default: 100)
+        **kwargs: Other keyword arguments of list_method
+
+    Returns:
+        Iterator over the resources ('data' items) of every page
+
+    Raises:
+        requests.HTTPError: If a page request fails
+
+    Example:
+        >>> for record in iter_resources(api.test_records.get_test_records, "MyProjectId", "MyTestRunId"):
+        ...     print(record['id'])
+    """
+    for page in iter_pages(list_method, *args, page_size=page_size, **kwargs):
+        for resource in page.get('data') or []:
+            yield resource
@@ -0,0 +1,464 @@
+"""
+Project mirror module for Polarion REST API.
+Mirrors the work items, links, documents, plans, test runs and test records of a
+project into a local indexed SQLite database. After a full load, every sync only
+requests the entities updated since the last sync (their 'updated' watermark), so
+read-heavy reporting runs against the local database.
+"""
+import datetime
+import sqlite3
+import threading
+import time
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List, Set, Tuple
+from .columnar import column_getter
+from .fanout import FanOut, DEFAULT_MAX_WORKERS
+from .json_backend import dumps, loads, response_json
+from .pagination import iter_pages, iter_resources, DEFAULT_PAGE_SIZE
+
+
+# Entity tables: table -> indexed columns (column name, column path as in columnar.column_getter).
+# Every table also has id (primary key), project_id and resource (the JSON:API resource).
+TABLES = {
+    'work_items': (('type', 'type'), ('title', 'title'), ('status', 'status'), ('updated', 'updated'),
+                   ('document', 'relationships.module')),
+    'links': (('source', None), ('role', 'role'), ('target', 'relationships.workItem')),
+    'documents': (('title', 'title'), ('type', 'type'), ('status', 'status'), ('updated', 'updated')),
+    'plans': (('name', 'name'), ('status', 'status'), ('updated', 'updated')),
+    'test_runs': (('title', 'title'), ('type', 'type'), ('status', 'status'), ('updated', 'updated')),
+    'test_records': (('test_run', None), ('test_case', 'relationships.testCase'), ('result', 'result'),
+                     ('executed', 'executed')),
+}
+
+# Indexes created per table, besides the primary key and project_id
+INDEXES = {
+    'work_items': (('type', 'status'), ('updated',), ('document',)),
+    'links': (('source',), ('target',), ('role',)),
+    'documents': (('updated',),),
+    'plans': (('updated',),),
+    'test_runs': (('status',), ('updated',)),
+    'test_records': (('test_run',), ('test_case',), ('result',)),
+}
+
+# Entities synced by 'updated' watermark: entity -> (module attribute, list method)
+WATERMARKED = {
+    'work_items': ('work_items', 'get_work_items'),
+    'plans': ('plans', 'get_plans'),
+    'test_runs': ('test_runs', 'get_test_runs'),
+}
+
+# Lucene query of the entities updated since a day (YYYYMMDD). Days are used because
+# Polarion date queries have day precision in the server time zone; the watermark
+# day is started one day early and entities are stored idempotently.
+UPDATED_QUERY = 'updated:[{since} TO 99991231]'
+WATERMARK_OVERLAP = datetime.timedelta(days=1)
+
+_STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sync_state (
+    project_id TEXT NOT NULL,
+    entity TEXT NOT NULL,
+    watermark TEXT,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (project_id, entity)
+)
+"""
+
+
+def _schema() -> List[str]:
+    statements = [_STATE_SCHEMA]
+    for table, columns in TABLES.items():
+        names = ''.join(f"    {name} TEXT,\n" for name, _ in columns)
+        statements.append(f"CREATE TABLE IF NOT EXISTS {table} (\n"
+                          f"    id TEXT PRIMARY KEY,\n    project_id TEXT NOT NULL,\n{names}"
+                          f"    resource TEXT NOT NULL\n)")
+        for index_columns in (('project_id',),) + INDEXES[table]:
+            statements.append(f"CREATE INDEX IF NOT EXISTS {table}_{'_'.join(index_columns)} "
+                              f"ON {table} ({', '.join(index_columns)})")
+    return statements
+
+
+def updated_since(watermark: str) -> str:
+    """
+    Query of the entities updated since a watermark ('updated' timestamp of the last sync).
+
+    Example:
+        >>> updated_since('2026-03-02T08:15:00.000Z')
+        'updated:[20260301 TO 99991231]'
+    """
+    day = datetime.date.fromisoformat(watermark[:10]) - WATERMARK_OVERLAP
+    return UPDATED_QUERY.format(since=day.strftime('%Y%m%d'))
+
+
+def _and(query: Optional[str], condition: Optional[str]) -> Optional[str]:
+    if not query or not condition:
+        return query or condition
+    return f"({query}) AND {condition}"
+
+
+class SyncResult:
+    """
+    Outcome of a sync.
+
+    Attributes:
+        full: True for a full load, False for an incremental sync
+        stored: Entity table -> number of resources stored (inserted or replaced)
+        deleted: Entity table -> number of rows deleted (full loads and replaced links/records)
+        failed: (entity table, owner ID, exception) of the links, documents and test
+                records that could not be fetched. The watermark of their owners is
+                kept, so they are fetched again by the next sync.
+        watermarks: Entity table -> watermark saved by the sync ('work_items', 'plans', 'test_runs')
+        elapsed: Duration of the sync in seconds
+    """
+
+    def __init__(self, full: bool):
+        self.full = full
+        self.stored: Dict[str, int] = {table: 0 for table in TABLES}
+        self.deleted: Dict[str, int] = {table: 0 for table in TABLES}
+        self.failed: List[Tuple[str, str, BaseException]] = []
+        self.watermarks: Dict[str, Optional[str]] = {}
+        self.elapsed = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """
+        True when every entity was fetched.
+        """
+        return not self.failed
+
+    def __repr__(self) -> str:
+        stored = ', '.join(f"{table}={count}" for table, count in self.stored.items())
+        return f"SyncResult(full={self.full}, {stored}, failed={len(self.failed)})"
+
+
+class ProjectMirror:
+    """
+    Local mirror of a project in an indexed SQLite database.
+
+    Every entity table has the columns id, project_id, a few indexed columns (see
+    TABLES) and resource, the JSON:API resource as returned by the server, so
+    reports can filter on the indexed columns and read any other field with
+    SQLite's JSON functions (e.g. json_extract(resource, '$.attributes.severity')).
+
+    The first sync of a project loads everything; later syncs request the work
+    items, plans and test runs updated since the last synced 'updated' timestamp,
+    then the links of the updated work items and the test records of the updated
+    test runs. Documents cannot be listed through the REST API: the documents of
+    the synced work items and the documents given to sync() are fetched. Deleted
+    entities are only detected by a full sync (sync(full=True)).
+
+    Example:
+        >>> with ProjectMirror(api, "reporting.db") as mirror:
+        ...     mirror.sync("MyProjectId")
+        ...     rows = mirror.query("SELECT status, count(*) FROM work_items "
+        ...                         "WHERE project_id = ? GROUP BY status", ("MyProjectId",))
+    """
+
+    def __init__(self, api: Any, path: str = ':memory:',
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 page_size: int = DEFAULT_PAGE_SIZE):
+        """
+        Open (or create) the mirror database.
+
+        Args:
+            api: PolarionRestApi (or any object exposing its modules as attributes)
+            path: Path of the SQLite database file, or ':memory:' (default)
+            max_workers: Maximum number of link, document and test record requests in parallel (default: 8)
+            page_size: Number of resources per page of the list requests (default: 100)
+        """
+        self.api = api
+        self.path = path
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._getters = {table: [(name, column_getter(column) if column else None) for name, column in columns]
+                         for table, columns in TABLES.items()}
+        with self._connection:
+            if path != ':memory:':
+                self._connection.execute('PRAGMA journal_mode=WAL')
+            for statement in _schema():
+                self._connection.execute(statement)
+
+    # ========== Sync ==========
+
+    def sync(self, project_id: str,
+             full: bool = False,
+             documents: Iterable[Tuple[str, str]] = (),
+             query: Optional[str] = None,
+             on_progress: Optional[Callable[[SyncResult], None]] = None) -> SyncResult:
+        """
+        Sync a project into the mirror.
+
+        Args:
+            project_id: The Project ID
+            full: Reload everything and delete the rows of entities that no longer
+                  exist (default: False, a full load is done anyway on the first sync)
+            documents: (space_id, document_name) of documents to sync besides the
+                       documents of the synced work items
+            query: Optional Lucene query restricting the mirrored work items (e.g. 'type:requirement')
+            on_progress: Optional callable invoked with the SyncResult after every page and entity
+
+        Returns:
+            SyncResult with the number of stored and deleted rows per table
+
+        Raises:
+            requests.HTTPError: If a list request fails; the watermarks of the entities
+                                not completely synced are kept
+        """
+        started = time.monotonic()
+        result = SyncResult(full)
+        ensure_pool_size = getattr(self.api, '_ensure_pool_size', None)
+        if ensure_pool_size is not None:
+            ensure_pool_size(self.max_workers)
+
+        def progress():
+            if on_progress is not None:
+                on_progress(result)
+
+        changed_work_items, document_ids = self._sync_watermarked(project_id, 'work_items', full, query,
+                                                                  result, progress)
+        self._sync_links(project_id, changed_work_items, result)
+        progress()
+        for space_id, document_name in documents:
+            document_ids.add(f"{project_id}/{space_id}/{document_name}")
+        self._sync_documents(project_id, sorted(document_ids), result)
+        progress()
+        self._sync_watermarked(project_id, 'plans', full, None, result, progress)
+        changed_test_runs, _ = self._sync_watermarked(project_id, 'test_runs', full, None, result, progress)
+        self._sync_test_records(project_id, changed_test_runs, result)
+        progress()
+        self._commit_watermarks(project_id, result)
+        result.elapsed = time.monotonic() - started
+        return result
+
+    def _sync_watermarked(self, project_id: str, table: str, full: bool, query: Optional[str],
+                          result: SyncResult, progress: Callable[[], None]) -> Tuple[List[str], Set[str]]:
+        """
+        Store the entities of a watermarked table updated since its watermark (all of
+        them on a full load, deleting the rows of the entities no longer returned).
+
+        Entities returned again because of the watermark overlap whose 'updated'
+        timestamp did not change are skipped, so their links or test records are not
+        fetched again.
+
+        Returns:
+            (IDs of the stored entities, IDs of the documents they are in)
+        """
+        module_name, list_method = WATERMARKED[table]
+        watermark = None if full else self.watermark(project_id, table)
+        method = getattr(getattr(self.api, module_name), list_method)
+        list_query = _and(query, updated_since(watermark) if watermark else None)
+        kwargs = {'query': list_query} if list_query else {}
+
+        seen: Set[str] = set()
+        stored: List[str] = []
+        document_ids: Set[str] = set()
+        newest = watermark
+        for page in iter_pages(method, project_id, page_size=self.page_size, **kwargs):
+            resources = page.get('data') or []
+            if not full:
+                known = self._updated(table, [resource['id'] for resource in resources])
+                resources = [resource for resource in resources
+                             if (resource.get('attributes') or {}).get('updated') is None
+                             or known.get(resource['id']) != resource['attributes']['updated']]
+            seen.update(resource['id'] for resource in page.get('data') or [])
+            self._store(table, project_id, resources)
+            for resource in resources:
+                stored.append(resource['id'])
+                updated = (resource.get('attributes') or {}).get('updated')
+                if updated and (newest is None or updated > newest):
+                    newest = updated
+                if table == 'work_items':
+                    module = ((resource.get('relationships') or {}).get('module') or {}).get('data')
+                    if module and module.get('id'):
+                        document_ids.add(module['id'])
+            result.stored[table] += len(resources)
+            progress()
+
+        if watermark is None:
+            result.deleted[table] += self._delete_missing(table, project_id, seen, query)
+        result.watermarks[table] = newest
+        return stored, document_ids
+
+    def _sync_links(self, project_id: str, work_item_ids: List[str], result: SyncResult):
+        """
+        Replace the outgoing links of the synced work items.
+        """
+        def list_links(work_item_id: str) -> List[Dict[str, Any]]:
+            return list(iter_resources(self.api.linked_work_items.get_linked_work_items,
+                                       project_id, work_item_id.split('/', 1)[-1], page_size=self.page_size))
+
+        self._replace_children('links', 'source', project_id, work_item_ids, list_links, result,
+                               owner_table='work_items')
+
+    def _sync_test_records(self, project_id: str, test_run_ids: List[str], result: SyncResult):
+        """
+        Replace the test records of the synced test runs.
+        """
+        def list_records(test_run_id: str) -> List[Dict[str, Any]]:
+            return list(iter_resources(self.api.test_records.get_test_records,
+                                       project_id, test_run_id.split('/', 1)[-1], page_size=self.page_size))
+
+        self._replace_children('test_records', 'test_run', project_id, test_run_ids, list_records, result,
+                               owner_table='test_runs')
+
+    def _replace_children(self, table: str, owner_column: str, project_id: str, owner_ids: List[str],
+                          list_children: Callable[[str], List[Dict[str, Any]]], result: SyncResult,
+                          owner_table: str):
+        """
+        Fetch the children of every owner concurrently and replace their rows.
+        """
+        for call in FanOut(list_children, owner_ids, max_workers=self.max_workers, ordered=False):
+            owner_id = call.args
+            if call.error is not None:
+                result.failed.append((table, owner_id, call.error))
+                # Owners with missing children are synced again next time
+                result.watermarks.pop(owner_table, None)
+                with self._lock, self._connection:
+                    self._connection.execute(f"UPDATE {owner_table} SET updated = NULL WHERE id = ?", (owner_id,))
+                continue
+            with self._lock, self._connection:
+                deleted = self._connection.execute(f"DELETE FROM {table} WHERE {owner_column} = ?", (owner_id,))
+                result.deleted[table] += deleted.rowcount
+                self._insert(table, project_id, call.value, {owner_column: owner_id})
+            result.stored[table] += len(call.value)
+
+    def _sync_documents(self, project_id: str, document_ids: List[str], result: SyncResult):
+        """
+        Fetch and store documents by ID ('MyProjectId/MySpaceId/MyDocument').
+        """
+        def get_document(document_id: str) -> Dict[str, Any]:
+            document_project, space_id, document_name = document_id.split('/', 2)
+            response = self.api.documents.get_document(document_project, space_id, document_name)
+            if response.status_code >= 300:
+                raise ValueError(f"Fetching document {document_id} failed (status {response.status_code})")
+            return response_json(response)['data']
+
+        for call in FanOut(get_document, document_ids, max_workers=self.max_workers, ordered=False):
+            if call.error is not None:
+                result.failed.append(('documents', call.args, call.error))
+                continue
+            self._store('documents', project_id, [call.value])
+            result.stored['documents'] += 1
+
+    # ========== Storage ==========
+
+    def _row(self, table: str, project_id: str, resource: Dict[str, Any],
+             extra: Optional[Dict[str, Any]] = None) -> Tuple[Any, ...]:
+        values = []
+        for name, getter in self._getters[table]:
+            value = extra[name] if extra and name in extra else (getter(resource) if getter else None)
+            values.append(value if value is None or isinstance(value, (str, int, float)) else str(value))
+        return (resource['id'], project_id, *values, dumps(resource).decode('utf-8'))
+
+    def _insert(self, table: str, project_id: str, resources: List[Dict[str, Any]],
+                extra: Optional[Dict[str, Any]] = None):
+        names = ['id', 'project_id'] + [name for name, _ in TABLES[table]] + ['resource']
+        self._connection.executemany(
+            f"INSERT OR REPLACE INTO {table} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})",
+            [self._row(table, project_id, resource, extra) for resource in resources]
+        )
+
+    def _updated(self, table: str, ids: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Stored 'updated' timestamps of the entities with the given IDs that are in the mirror.
+        """
+        if not ids:
+            return {}
+        with self._lock:
+            return dict(self._connection.execute(
+                f"SELECT id, updated FROM {table} WHERE id IN ({', '.join('?' * len(ids))})", ids))
+
+    def _store(self, table: str, project_id: str, resources: List[Dict[str, Any]]):
+        """
+        Insert or replace resources, in one transaction.
+        """
+        with self._lock, self._connection:
+            self._insert(table, project_id, resources)
+
+    def _delete_missing(self, table: str, project_id: str, ids: Set[str], query: Optional[str]) -> int:
+        """
+        Delete the rows of a project not returned by a full load. With a query, only
+        part of the entities was requested and nothing is deleted.
+        """
+        if query:
+            return 0
+        with self._lock, self._connection:
+            existing = [row[0] for row in self._connection.execute(
+                f"SELECT id FROM {table} WHERE project_id = ?", (project_id,))]
+            missing = [(resource_id,) for resource_id in existing if resource_id not in ids]
+            self._connection.executemany(f"DELETE FROM {table} WHERE id = ?", missing)
+            if table == 'work_items':
+                self._connection.executemany("DELETE FROM links WHERE source = ?", missing)
+            elif table == 'test_runs':
+                self._connection.executemany("DELETE FROM test_records WHERE test_run = ?", missing)
+        return len(missing)
+
+    def _commit_watermarks(self, project_id: str, result: SyncResult):
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO sync_state (project_id, entity, watermark, synced_at) VALUES (?, ?, ?, ?)',
+                [(project_id, table, watermark, now)
+                 for table, watermark in result.watermarks.items()]
+            )
+
+    # ========== Reading ==========
+
+    def watermark(self, project_id: str, entity: str) -> Optional[str]:
+        """
+        Newest 'updated' timestamp synced for an entity table ('work_items', 'plans'
+        or 'test_runs'), None before the first sync.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT watermark FROM sync_state WHERE project_id = ? AND entity = ?', (project_id, entity)
+            ).fetchone()
+        return row[0] if row else None
+
+    def query(self, sql: str, params: Iterable[Any] = ()) -> List[Tuple[Any, ...]]:
+        """
+        Run a read query on the mirror and return its rows.
+
+        Example:
+            >>> mirror.query("SELECT target, count(*) FROM links WHERE role = ? GROUP BY target", ("verifies",))
+        """
+        with self._lock:
+            return self._connection.execute(sql, tuple(params)).fetchall()
+
+    def resources(self, table: str, where: str = '', params: Iterable[Any] = ()) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the stored JSON:API resources of a table.
+
+        Args:
+            table: Entity table (see TABLES)
+            where: Optional SQL condition on the table columns, e.g. 'status = ?'
+            params: Parameters of the condition
+
+        Raises:
+            ValueError: If the table is unknown
+        """
+        if table not in TABLES:
+            raise ValueError(f"Unknown table {table!r}, expected one of {list(TABLES)}")
+        rows = self.query(f"SELECT resource FROM {table}" + (f" WHERE {where}" if where else ''), params)
+        for (resource,) in rows:
+            yield loads(resource)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        The SQLite connection, e.g. for pandas.read_sql. Not to be used while a sync runs.
+        """
+        return self._connection
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
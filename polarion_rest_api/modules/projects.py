@@ -5,6 +5,8 @@ Handles all Projects related endpoints.
 from typing import Optional, Dict, Any
 import requests
 from .base import PolarionBase
+from .job_waiter import JobHandle
+from .jobs import start_job
 
 
 class Projects(PolarionBase):
@@ -17,6 +19,7 @@ class Projects(PolarionBase):
     - GET methods: Retrieve projects and test parameter definitions
     - PATCH methods: Update projects
     - POST methods: Create projects and perform actions
+    - Job methods: Start the asynchronous (202 Accepted) operations and return a JobHandle right away
     """
     
     # ========== DELETE methods ==========
@@ -473,3 +476,60 @@ class Projects(PolarionBase):
             Response object
         """
         return self._post(f'projects/{project_id}/actions/unmarkProject')
+
+    
+    # ========== Job methods ==========
+    
+    def submit_delete_project(self, project_id: str, timeout: Optional[float] = None) -> JobHandle:
+        """
+        Starts delete_project and returns a handle of its job right away.
+        
+        Args:
+            project_id: The Project ID
+            timeout: Maximum number of seconds to poll the job (default: no limit)
+            
+        Returns:
+            JobHandle with done(), result(timeout) and add_done_callback(fn)
+        """
+        return start_job(self, self.delete_project(project_id), timeout=timeout)
+    
+    def submit_create_project(self, timeout: Optional[float] = None, **kwargs) -> JobHandle:
+        """
+        Starts post_create_project and returns a handle of its job right away.
+        
+        Args:
+            timeout: Maximum number of seconds to poll the job (default: no limit)
+            **kwargs: Create project parameters (see post_create_project)
+            
+        Returns:
+            JobHandle with done(), result(timeout) and add_done_callback(fn)
+            
+        Raises:
+            ValueError: If any required parameter is missing
+            
+        Example:
+            >>> handle = api.projects.submit_create_project(projectId='MY_PROJECT', trackerPrefix='MYP',
+            ...                                             location='default/MY_PROJECT', templateId='agile')
+            >>> handle.add_done_callback(lambda h: print(h.job_id, h.result().status))
+        """
+        return start_job(self, self.post_create_project(**kwargs), timeout=timeout)
+    
+    def submit_move_project_action(self,
+                                   project_id: str,
+                                   timeout: Optional[float] = None,
+                                   **kwargs) -> JobHandle:
+        """
+        Starts post_move_project_action and returns a handle of its job right away.
+        
+        Args:
+            project_id: The Project ID
+            timeout: Maximum number of seconds to poll the job (default: no limit)
+            **kwargs: Move project parameters (see post_move_project_action)
+            
+        Returns:
+            JobHandle with done(), result(timeout) and add_done_callback(fn)
+            
+        Raises:
+            ValueError: If the required parameter is missing
+        """
+        return start_job(self, self.post_move_project_action(project_id, **kwargs), timeout=timeout)
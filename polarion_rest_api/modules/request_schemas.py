@@ -0,0 +1,2820 @@
+"""
+Request body schemas of the Polarion REST API, used by validation.py.
+Generated from data/openapi_official.json (API v1) by schema_generator.py, do not edit.
+Regenerate with:
+
+    python -m polarion_rest_api.modules.schema_generator data/openapi_official.json \\
+        -o polarion_rest_api/modules/request_schemas.py
+"""
+
+# (METHOD, path template, schema name) of the operations with a JSON request body
+REQUEST_BODIES = (
+    ('POST', 'all/documents/actions/branch', 'branchDocumentsRequestBody'),
+    ('DELETE', 'all/workitems', 'workitemsListDeleteRequest'),
+    ('PATCH', 'all/workitems', 'workitemsListPatchRequest'),
+    ('POST', 'enumerations', 'enumerationsListPostRequest'),
+    ('PATCH', 'enumerations/{enumContext}/{enumName}/{targetType}', 'enumerationsSinglePatchRequest'),
+    ('POST', 'projects/actions/createProject', 'createProjectRequestBody'),
+    ('POST', 'projects/actions/markProject', 'createProjectRequestBody'),
+    ('PATCH', 'projects/{projectId}', 'projectsSinglePatchRequest'),
+    ('POST', 'projects/{projectId}/actions/moveProject', 'moveProjectRequestBody'),
+    ('DELETE', 'projects/{projectId}/collections', 'collectionsListDeleteRequest'),
+    ('POST', 'projects/{projectId}/collections', 'collectionsListPostRequest'),
+    ('PATCH', 'projects/{projectId}/collections/{collectionId}', 'collectionsSinglePatchRequest'),
+    ('DELETE', 'projects/{projectId}/collections/{collectionId}/relationships/{relationshipId}', 'relationshipsListDeleteRequest'),
+    ('PATCH', 'projects/{projectId}/collections/{collectionId}/relationships/{relationshipId}', 'RelationshipsRequestWithRevisionBody'),
+    ('POST', 'projects/{projectId}/collections/{collectionId}/relationships/{relationshipId}', 'RelationshipsRequestWithRevisionBody'),
+    ('POST', 'projects/{projectId}/enumerations', 'enumerationsListPostRequest'),
+    ('PATCH', 'projects/{projectId}/enumerations/{enumContext}/{enumName}/{targetType}', 'enumerationsSinglePatchRequest'),
+    ('DELETE', 'projects/{projectId}/plans', 'plansListDeleteRequest'),
+    ('POST', 'projects/{projectId}/plans', 'plansListPostRequest'),
+    ('PATCH', 'projects/{projectId}/plans/{planId}', 'plansSinglePatchRequest'),
+    ('DELETE', 'projects/{projectId}/plans/{planId}/relationships/{relationshipId}', 'relationshipsListDeleteRequest'),
+    ('PATCH', 'projects/{projectId}/plans/{planId}/relationships/{relationshipId}', 'RelationshipsRequestBody'),
+    ('POST', 'projects/{projectId}/plans/{planId}/relationships/{relationshipId}', 'RelationshipsRequestBody'),
+    ('POST', 'projects/{projectId}/spaces/{spaceId}/documents', 'documentsListPostRequest'),
+    ('PATCH', 'projects/{projectId}/spaces/{spaceId}/documents/{documentName}', 'documentsSinglePatchRequest'),
+    ('POST', 'projects/{projectId}/spaces/{spaceId}/documents/{documentName}/actions/branch', 'branchDocumentRequestBody'),
+    ('POST', 'projects/{projectId}/spaces/{spaceId}/documents/{documentName}/actions/copy', 'copyDocumentRequestBody'),
+    ('POST', 'projects/{projectId}/spaces/{spaceId}/documents/{documentName}/actions/mergeFromMaster', 'mergeDocumentRequestBody'),
+    ('POST', 'projects/{projectId}/spaces/{spaceId}/documents/{documentName}/actions/mergeToMaster', 'mergeDocumentRequestBody'),
+    ('POST', 'projects/{projectId}/spaces/{spaceId}/documents/{documentName}/comments', 'document_commentsListPostRequest'),
+    ('PATCH', 'projects/{projectId}/spaces/{spaceId}/documents/{documentName}/comments/{commentId}', 'document_commentsSinglePatchRequest'),
+    ('POST', 'projects/{projectId}/spaces/{spaceId}/documents/{documentName}/parts', 'document_partsListPostRequest'),
+    ('PATCH', 'projects/{projectId}/spaces/{spaceId}/pages/{pageName}', 'pagesSinglePatchRequest'),
+    ('DELETE', 'projects/{projectId}/testparameterdefinitions', 'testparameter_definitionsListDeleteRequest'),
+    ('POST', 'projects/{projectId}/testparameterdefinitions', 'testparameter_definitionsListPostRequest'),
+    ('DELETE', 'projects/{projectId}/testruns', 'testrunsListDeleteRequest'),
+    ('PATCH', 'projects/{projectId}/testruns', 'testrunsListPatchRequest'),
+    ('POST', 'projects/{projectId}/testruns', 'testrunsListPostRequest'),
+    ('PATCH', 'projects/{projectId}/testruns/{testRunId}', 'testrunsSinglePatchRequest'),
+    ('DELETE', 'projects/{projectId}/testruns/{testRunId}/attachments', 'testrun_attachmentsListDeleteRequest'),
+    ('PATCH', 'projects/{projectId}/testruns/{testRunId}/comments', 'testrun_commentsListPatchRequest'),
+    ('POST', 'projects/{projectId}/testruns/{testRunId}/comments', 'testrun_commentsListPostRequest'),
+    ('PATCH', 'projects/{projectId}/testruns/{testRunId}/comments/{commentId}', 'testrun_commentsSinglePatchRequest'),
+    ('POST', 'projects/{projectId}/testruns/{testRunId}/testparameterdefinitions', 'testparameter_definitionsListPostRequest'),
+    ('DELETE', 'projects/{projectId}/testruns/{testRunId}/testparameters', 'testparametersListDeleteRequest'),
+    ('POST', 'projects/{projectId}/testruns/{testRunId}/testparameters', 'testparametersListPostRequest'),
+    ('PATCH', 'projects/{projectId}/testruns/{testRunId}/testrecords', 'testrecordsListPatchRequest'),
+    ('POST', 'projects/{projectId}/testruns/{testRunId}/testrecords', 'testrecordsListPostRequest'),
+    ('PATCH', 'projects/{projectId}/testruns/{testRunId}/testrecords/{testCaseProjectId}/{testCaseId}/{iteration}', 'testrecordsSinglePatchRequest'),
+    ('DELETE', 'projects/{projectId}/testruns/{testRunId}/testrecords/{testCaseProjectId}/{testCaseId}/{iteration}/attachments', 'testrecord_attachmentsListDeleteRequest'),
+    ('POST', 'projects/{projectId}/testruns/{testRunId}/testrecords/{testCaseProjectId}/{testCaseId}/{iteration}/testparameters', 'testparametersListPostRequest'),
+    ('PATCH', 'projects/{projectId}/testruns/{testRunId}/testrecords/{testCaseProjectId}/{testCaseId}/{iteration}/teststepresults', 'teststep_resultsListPatchRequest'),
+    ('POST', 'projects/{projectId}/testruns/{testRunId}/testrecords/{testCaseProjectId}/{testCaseId}/{iteration}/teststepresults', 'teststep_resultsListPostRequest'),
+    ('PATCH', 'projects/{projectId}/testruns/{testRunId}/testrecords/{testCaseProjectId}/{testCaseId}/{iteration}/teststepresults/{testStepIndex}', 'teststep_resultsSinglePatchRequest'),
+    ('DELETE', 'projects/{projectId}/testruns/{testRunId}/testrecords/{testCaseProjectId}/{testCaseId}/{iteration}/teststepresults/{testStepIndex}/attachments', 'teststepresult_attachmentsListDeleteRequest'),
+    ('DELETE', 'projects/{projectId}/workitems', 'workitemsListDeleteRequest'),
+    ('PATCH', 'projects/{projectId}/workitems', 'workitemsListPatchRequest'),
+    ('POST', 'projects/{projectId}/workitems', 'workitemsListPostRequest'),
+    ('PATCH', 'projects/{projectId}/workitems/{workItemId}', 'workitemsSinglePatchRequest'),
+    ('POST', 'projects/{projectId}/workitems/{workItemId}/actions/moveToDocument', 'moveWorkItemToDocumentRequestBody'),
+    ('DELETE', 'projects/{projectId}/workitems/{workItemId}/approvals', 'workitem_approvalsListDeleteRequest'),
+    ('PATCH', 'projects/{projectId}/workitems/{workItemId}/approvals', 'workitem_approvalsListPatchRequest'),
+    ('POST', 'projects/{projectId}/workitems/{workItemId}/approvals', 'workitem_approvalsListPostRequest'),
+    ('PATCH', 'projects/{projectId}/workitems/{workItemId}/approvals/{userId}', 'workitem_approvalsSinglePatchRequest'),
+    ('POST', 'projects/{projectId}/workitems/{workItemId}/comments', 'workitem_commentsListPostRequest'),
+    ('PATCH', 'projects/{projectId}/workitems/{workItemId}/comments/{commentId}', 'workitem_commentsSinglePatchRequest'),
+    ('DELETE', 'projects/{projectId}/workitems/{workItemId}/externallylinkedworkitems', 'externallylinkedworkitemsListDeleteRequest'),
+    ('POST', 'projects/{projectId}/workitems/{workItemId}/externallylinkedworkitems', 'externallylinkedworkitemsListPostRequest'),
+    ('DELETE', 'projects/{projectId}/workitems/{workItemId}/linkedoslcresources', 'linkedoslcresourcesListDeleteRequest'),
+    ('POST', 'projects/{projectId}/workitems/{workItemId}/linkedoslcresources', 'linkedoslcresourcesListPostRequest'),
+    ('DELETE', 'projects/{projectId}/workitems/{workItemId}/linkedworkitems', 'linkedworkitemsListDeleteRequest'),
+    ('POST', 'projects/{projectId}/workitems/{workItemId}/linkedworkitems', 'linkedworkitemsListPostRequest'),
+    ('PATCH', 'projects/{projectId}/workitems/{workItemId}/linkedworkitems/{roleId}/{targetProjectId}/{linkedWorkItemId}', 'linkedworkitemsSinglePatchRequest'),
+    ('DELETE', 'projects/{projectId}/workitems/{workItemId}/relationships/{relationshipId}', 'relationshipsListDeleteRequest'),
+    ('PATCH', 'projects/{projectId}/workitems/{workItemId}/relationships/{relationshipId}', 'RelationshipsRequestBody'),
+    ('POST', 'projects/{projectId}/workitems/{workItemId}/relationships/{relationshipId}', 'RelationshipsRequestBody'),
+    ('DELETE', 'projects/{projectId}/workitems/{workItemId}/teststeps', 'teststepsListDeleteRequest'),
+    ('PATCH', 'projects/{projectId}/workitems/{workItemId}/teststeps', 'teststepsListPatchRequest'),
+    ('POST', 'projects/{projectId}/workitems/{workItemId}/teststeps', 'teststepsListPostRequest'),
+    ('PATCH', 'projects/{projectId}/workitems/{workItemId}/teststeps/{testStepIndex}', 'teststepsSinglePatchRequest'),
+    ('DELETE', 'projects/{projectId}/workitems/{workItemId}/workrecords', 'workrecordsListDeleteRequest'),
+    ('POST', 'projects/{projectId}/workitems/{workItemId}/workrecords', 'workrecordsListPostRequest'),
+    ('POST', 'users', 'usersListPostRequest'),
+    ('PATCH', 'users/{userId}', 'usersSinglePatchRequest'),
+    ('POST', 'users/{userId}/actions/setLicense', 'setLicenseRequestBody'),
+)
+
+# Schema name -> schema reduced to the validated keywords
+SCHEMAS = {
+    'RelationshipDataBody': {
+        'type': 'object',
+        'properties': {
+            'type': {
+                'type': 'string',
+                'enum': [
+                    'collections',
+                    'categories',
+                    'documents',
+                    'document_attachments',
+                    'document_comments',
+                    'document_parts',
+                    'enumerations',
+                    'globalroles',
+                    'icons',
+                    'jobs',
+                    'linkedworkitems',
+                    'externallylinkedworkitems',
+                    'linkedoslcresources',
+                    'pages',
+                    'page_attachments',
+                    'plans',
+                    'projectroles',
+                    'projectgroups',
+                    'projects',
+                    'projecttemplates',
+                    'spaces',
+                    'testparameters',
+                    'testparameter_definitions',
+                    'testrecords',
+                    'teststep_results',
+                    'testruns',
+                    'testrun_attachments',
+                    'teststepresult_attachments',
+                    'testrun_comments',
+                    'usergroups',
+                    'users',
+                    'workitems',
+                    'workitem_attachments',
+                    'workitem_approvals',
+                    'workitem_comments',
+                    'featureselections',
+                    'teststeps',
+                    'workrecords',
+                    'revisions',
+                    'testrecord_attachments',
+                ],
+            },
+            'id': {'type': 'string'},
+        },
+    },
+    'RelationshipDataListRequest': {'type': 'object', 'properties': {'data': {'type': 'array', 'items': {'$ref': 'RelationshipDataBody'}}}},
+    'RelationshipDataSingleRequest': {'type': 'object', 'properties': {'data': {'$ref': 'RelationshipDataBody'}}},
+    'RelationshipsRequestBody': {
+        'type': 'object',
+        'oneOf': [{'$ref': 'RelationshipDataSingleRequest'}, {'$ref': 'RelationshipDataListRequest'}],
+    },
+    'RelationshipsRequestWithRevisionBody': {
+        'type': 'object',
+        'oneOf': [{'$ref': 'RelationshipDataSingleRequest'}, {'$ref': 'RelationshipDataListRequest'}],
+    },
+    'branchDocumentRequestBody': {
+        'type': 'object',
+        'properties': {
+            'targetProjectId': {'type': 'string'},
+            'targetSpaceId': {'type': 'string'},
+            'targetDocumentName': {'type': 'string'},
+            'copyWorkflowStatusAndSignatures': {'type': 'boolean'},
+            'query': {'type': 'string'},
+        },
+    },
+    'branchDocumentsRequestBody': {
+        'type': 'object',
+        'required': ['documentConfigurations'],
+        'properties': {
+            'documentConfigurations': {
+                'type': 'array',
+                'minItems': 1,
+                'items': {
+                    'type': 'object',
+                    'required': ['sourceDocument'],
+                    'properties': {
+                        'sourceDocument': {'type': 'string'},
+                        'sourceRevision': {'type': 'string'},
+                        'targetProjectId': {'type': 'string'},
+                        'targetSpaceId': {'type': 'string'},
+                        'targetDocumentName': {'type': 'string'},
+                        'copyWorkflowStatusAndSignatures': {'type': 'boolean'},
+                        'query': {'type': 'string'},
+                        'targetDocumentTitle': {'type': 'string'},
+                        'updateTitleHeading': {'type': 'boolean'},
+                        'overwriteWorkItems': {'type': 'boolean'},
+                        'initializedFields': {'type': 'array', 'items': {'type': 'string'}},
+                    },
+                },
+            },
+        },
+    },
+    'collectionsListDeleteRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {'type': {'type': 'string', 'enum': ['collections']}, 'id': {'type': 'string'}},
+                },
+            },
+        },
+    },
+    'collectionsListPostRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['collections']},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {
+                                'description': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                        'value': {'type': 'string'},
+                                    },
+                                },
+                                'id': {'type': 'string'},
+                                'name': {'type': 'string'},
+                            },
+                        },
+                        'relationships': {
+                            'type': 'object',
+                            'properties': {
+                                'documents': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'array',
+                                            'items': {
+                                                'type': 'object',
+                                                'properties': {
+                                                    'type': {'type': 'string', 'enum': ['documents']},
+                                                    'id': {'type': 'string'},
+                                                    'revision': {'type': 'string'},
+                                                },
+                                            },
+                                        },
+                                    },
+                                },
+                                'richPages': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'array',
+                                            'items': {
+                                                'type': 'object',
+                                                'properties': {
+                                                    'type': {'type': 'string', 'enum': ['pages']},
+                                                    'id': {'type': 'string'},
+                                                },
+                                            },
+                                        },
+                                    },
+                                },
+                                'upstreamCollections': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'array',
+                                            'items': {
+                                                'type': 'object',
+                                                'properties': {
+                                                    'type': {'type': 'string', 'enum': ['collections']},
+                                                    'id': {'type': 'string'},
+                                                    'revision': {'type': 'string'},
+                                                },
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'collectionsSinglePatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'object',
+                'properties': {
+                    'type': {'type': 'string', 'enum': ['collections']},
+                    'id': {'type': 'string'},
+                    'attributes': {
+                        'type': 'object',
+                        'properties': {
+                            'description': {
+                                'type': 'object',
+                                'properties': {
+                                    'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                    'value': {'type': 'string'},
+                                },
+                            },
+                            'name': {'type': 'string'},
+                        },
+                    },
+                    'relationships': {
+                        'type': 'object',
+                        'properties': {
+                            'documents': {
+                                'type': 'object',
+                                'properties': {
+                                    'data': {
+                                        'type': 'array',
+                                        'items': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['documents']},
+                                                'id': {'type': 'string'},
+                                                'revision': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                            'richPages': {
+                                'type': 'object',
+                                'properties': {
+                                    'data': {
+                                        'type': 'array',
+                                        'items': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['pages']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                            'upstreamCollections': {
+                                'type': 'object',
+                                'properties': {
+                                    'data': {
+                                        'type': 'array',
+                                        'items': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['collections']},
+                                                'id': {'type': 'string'},
+                                                'revision': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'copyDocumentRequestBody': {
+        'type': 'object',
+        'properties': {
+            'targetProjectId': {'type': 'string'},
+            'targetSpaceId': {'type': 'string'},
+            'targetDocumentName': {'type': 'string'},
+            'removeOutgoingLinks': {'type': 'boolean'},
+            'linkOriginalItemsWithRole': {'type': 'string'},
+        },
+    },
+    'createProjectRequestBody': {
+        'type': 'object',
+        'properties': {
+            'projectId': {'type': 'string', 'nullable': False},
+            'trackerPrefix': {'type': 'string', 'nullable': False},
+            'location': {'type': 'string', 'nullable': False},
+            'templateId': {'type': 'string', 'nullable': True},
+            'params': {'type': 'object', 'nullable': True},
+        },
+    },
+    'document_commentsListPostRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['document_comments']},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {
+                                'resolved': {'type': 'boolean'},
+                                'text': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                        'value': {'type': 'string'},
+                                    },
+                                },
+                            },
+                        },
+                        'relationships': {
+                            'type': 'object',
+                            'properties': {
+                                'author': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['users']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                                'parentComment': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['document_comments']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'document_commentsSinglePatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'object',
+                'properties': {
+                    'type': {'type': 'string', 'enum': ['document_comments']},
+                    'id': {'type': 'string'},
+                    'attributes': {'type': 'object', 'properties': {'resolved': {'type': 'boolean'}}},
+                },
+            },
+        },
+    },
+    'document_partsListPostRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['document_parts']},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {'level': {'type': 'integer', 'format': 'int32'}, 'type': {'type': 'string'}},
+                        },
+                        'relationships': {
+                            'type': 'object',
+                            'properties': {
+                                'nextPart': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['document_parts']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                                'previousPart': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['document_parts']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                                'workItem': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['workitems']},
+                                                'id': {'type': 'string'},
+                                                'revision': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'documentsListPostRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['documents']},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {
+                                'autoSuspect': {'type': 'boolean'},
+                                'homePageContent': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                        'value': {'type': 'string'},
+                                    },
+                                },
+                                'moduleName': {'type': 'string'},
+                                'outlineNumbering': {'type': 'object', 'properties': {'prefix': {'type': 'string'}}},
+                                'renderingLayouts': {
+                                    'type': 'array',
+                                    'items': {
+                                        'type': 'object',
+                                        'properties': {
+                                            'type': {'type': 'string'},
+                                            'label': {'type': 'string'},
+                                            'layouter': {'type': 'string'},
+                                            'properties': {
+                                                'type': 'array',
+                                                'items': {
+                                                    'type': 'object',
+                                                    'properties': {'key': {'type': 'string'}, 'value': {'type': 'string'}},
+                                                },
+                                            },
+                                        },
+                                    },
+                                },
+                                'status': {'type': 'string'},
+                                'structureLinkRole': {'type': 'string'},
+                                'title': {'type': 'string'},
+                                'type': {'type': 'string'},
+                                'usesOutlineNumbering': {'type': 'boolean'},
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'documentsSinglePatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'object',
+                'properties': {
+                    'type': {'type': 'string', 'enum': ['documents']},
+                    'id': {'type': 'string'},
+                    'attributes': {
+                        'type': 'object',
+                        'properties': {
+                            'autoSuspect': {'type': 'boolean'},
+                            'homePageContent': {
+                                'type': 'object',
+                                'properties': {
+                                    'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                    'value': {'type': 'string'},
+                                },
+                            },
+                            'outlineNumbering': {'type': 'object', 'properties': {'prefix': {'type': 'string'}}},
+                            'renderingLayouts': {
+                                'type': 'array',
+                                'items': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'type': {'type': 'string'},
+                                        'label': {'type': 'string'},
+                                        'layouter': {'type': 'string'},
+                                        'properties': {
+                                            'type': 'array',
+                                            'items': {
+                                                'type': 'object',
+                                                'properties': {'key': {'type': 'string'}, 'value': {'type': 'string'}},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                            'status': {'type': 'string'},
+                            'title': {'type': 'string'},
+                            'type': {'type': 'string'},
+                            'usesOutlineNumbering': {'type': 'boolean'},
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'enumerationsListPostRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['enumerations']},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {
+                                'enumContext': {'type': 'string'},
+                                'enumName': {'type': 'string'},
+                                'options': {
+                                    'type': 'array',
+                                    'items': {
+                                        'type': 'object',
+                                        'properties': {
+                                            'id': {'type': 'string'},
+                                            'name': {'type': 'string'},
+                                            'color': {'type': 'string'},
+                                            'description': {'type': 'string'},
+                                            'hidden': {'type': 'boolean'},
+                                            'default': {'type': 'boolean'},
+                                            'parent': {'type': 'boolean'},
+                                            'oppositeName': {'type': 'string'},
+                                            'columnWidth': {'type': 'string'},
+                                            'iconURL': {'type': 'string'},
+                                            'createDefect': {'type': 'boolean'},
+                                            'templateWorkItem': {'type': 'string'},
+                                            'minValue': {'type': 'number'},
+                                            'requiresSignatureForTestCaseExecution': {'type': 'boolean'},
+                                            'terminal': {'type': 'boolean'},
+                                            'limited': {'type': 'boolean'},
+                                        },
+                                    },
+                                },
+                                'targetType': {'type': 'string'},
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'enumerationsSinglePatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'object',
+                'properties': {
+                    'type': {'type': 'string', 'enum': ['enumerations']},
+                    'id': {'type': 'string'},
+                    'attributes': {
+                        'type': 'object',
+                        'properties': {
+                            'options': {
+                                'type': 'array',
+                                'items': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'id': {'type': 'string'},
+                                        'name': {'type': 'string'},
+                                        'color': {'type': 'string'},
+                                        'description': {'type': 'string'},
+                                        'hidden': {'type': 'boolean'},
+                                        'default': {'type': 'boolean'},
+                                        'parent': {'type': 'boolean'},
+                                        'oppositeName': {'type': 'string'},
+                                        'columnWidth': {'type': 'string'},
+                                        'iconURL': {'type': 'string'},
+                                        'createDefect': {'type': 'boolean'},
+                                        'templateWorkItem': {'type': 'string'},
+                                        'minValue': {'type': 'number'},
+                                        'requiresSignatureForTestCaseExecution': {'type': 'boolean'},
+                                        'terminal': {'type': 'boolean'},
+                                        'limited': {'type': 'boolean'},
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'externallylinkedworkitemsListDeleteRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['externallylinkedworkitems']},
+                        'id': {'type': 'string'},
+                    },
+                },
+            },
+        },
+    },
+    'externallylinkedworkitemsListPostRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['externallylinkedworkitems']},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {'role': {'type': 'string'}, 'workItemURI': {'type': 'string'}},
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'linkedoslcresourcesListDeleteRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {'type': {'type': 'string', 'enum': ['linkedoslcresources']}, 'id': {'type': 'string'}},
+                },
+            },
+        },
+    },
+    'linkedoslcresourcesListPostRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['linkedoslcresources']},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {
+                                'label': {'type': 'string'},
+                                'role': {'type': 'string'},
+                                'uri': {'type': 'string'},
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'linkedworkitemsListDeleteRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {'type': {'type': 'string', 'enum': ['linkedworkitems']}, 'id': {'type': 'string'}},
+                },
+            },
+        },
+    },
+    'linkedworkitemsListPostRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['linkedworkitems']},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {
+                                'revision': {'type': 'string'},
+                                'role': {'type': 'string'},
+                                'suspect': {'type': 'boolean'},
+                            },
+                        },
+                        'relationships': {
+                            'type': 'object',
+                            'properties': {
+                                'workItem': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['workitems']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'linkedworkitemsSinglePatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'object',
+                'properties': {
+                    'type': {'type': 'string', 'enum': ['linkedworkitems']},
+                    'id': {'type': 'string'},
+                    'attributes': {
+                        'type': 'object',
+                        'properties': {'revision': {'type': 'string'}, 'suspect': {'type': 'boolean'}},
+                    },
+                },
+            },
+        },
+    },
+    'mergeDocumentRequestBody': {
+        'type': 'object',
+        'properties': {'createBaseline': {'type': 'boolean'}, 'userFilter': {'type': 'string'}},
+    },
+    'moveProjectRequestBody': {'type': 'object', 'properties': {'location': {'type': 'string', 'nullable': False}}},
+    'moveWorkItemToDocumentRequestBody': {
+        'type': 'object',
+        'properties': {
+            'targetDocument': {'type': 'string'},
+            'previousPart': {'type': 'string'},
+            'nextPart': {'type': 'string'},
+        },
+    },
+    'pagesSinglePatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'object',
+                'properties': {
+                    'type': {'type': 'string', 'enum': ['pages']},
+                    'id': {'type': 'string'},
+                    'attributes': {'type': 'object', 'properties': {'title': {'type': 'string'}}},
+                },
+            },
+        },
+    },
+    'plansListDeleteRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {'type': {'type': 'string', 'enum': ['plans']}, 'id': {'type': 'string'}},
+                },
+            },
+        },
+    },
+    'plansListPostRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['plans']},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {
+                                'allowedTypes': {'type': 'array', 'items': {'type': 'string'}},
+                                'calculationType': {'type': 'string', 'enum': ['timeBased', 'customFieldBased']},
+                                'capacity': {'type': 'number'},
+                                'color': {'type': 'string'},
+                                'defaultEstimate': {'type': 'number'},
+                                'description': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'type': {'type': 'string', 'enum': ['text/plain']},
+                                        'value': {'type': 'string'},
+                                    },
+                                },
+                                'dueDate': {'type': 'string', 'format': 'date'},
+                                'estimationField': {'type': 'string'},
+                                'finishedOn': {'type': 'string', 'format': 'date-time'},
+                                'homePageContent': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                        'value': {'type': 'string'},
+                                    },
+                                },
+                                'id': {'type': 'string'},
+                                'isTemplate': {'type': 'boolean'},
+                                'name': {'type': 'string'},
+                                'previousTimeSpent': {'type': 'string'},
+                                'prioritizationField': {'type': 'string'},
+                                'sortOrder': {'type': 'integer', 'format': 'int32'},
+                                'startDate': {'type': 'string', 'format': 'date'},
+                                'startedOn': {'type': 'string', 'format': 'date-time'},
+                                'status': {'type': 'string'},
+                                'useReportFromTemplate': {'type': 'boolean'},
+                            },
+                        },
+                        'relationships': {
+                            'type': 'object',
+                            'properties': {
+                                'parent': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['plans']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                                'projectSpan': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'array',
+                                            'items': {
+                                                'type': 'object',
+                                                'properties': {
+                                                    'type': {'type': 'string', 'enum': ['projects']},
+                                                    'id': {'type': 'string'},
+                                                },
+                                            },
+                                        },
+                                    },
+                                },
+                                'template': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['plans']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                                'workItems': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'array',
+                                            'items': {
+                                                'type': 'object',
+                                                'properties': {
+                                                    'type': {'type': 'string', 'enum': ['workitems']},
+                                                    'id': {'type': 'string'},
+                                                },
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'plansSinglePatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'object',
+                'properties': {
+                    'type': {'type': 'string', 'enum': ['plans']},
+                    'id': {'type': 'string'},
+                    'attributes': {
+                        'type': 'object',
+                        'properties': {
+                            'allowedTypes': {'type': 'array', 'items': {'type': 'string'}},
+                            'calculationType': {'type': 'string', 'enum': ['timeBased', 'customFieldBased']},
+                            'capacity': {'type': 'number'},
+                            'color': {'type': 'string'},
+                            'defaultEstimate': {'type': 'number'},
+                            'description': {
+                                'type': 'object',
+                                'properties': {
+                                    'type': {'type': 'string', 'enum': ['text/plain']},
+                                    'value': {'type': 'string'},
+                                },
+                            },
+                            'dueDate': {'type': 'string', 'format': 'date'},
+                            'estimationField': {'type': 'string'},
+                            'finishedOn': {'type': 'string', 'format': 'date-time'},
+                            'homePageContent': {
+                                'type': 'object',
+                                'properties': {
+                                    'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                    'value': {'type': 'string'},
+                                },
+                            },
+                            'isTemplate': {'type': 'boolean'},
+                            'name': {'type': 'string'},
+                            'previousTimeSpent': {'type': 'string'},
+                            'prioritizationField': {'type': 'string'},
+                            'sortOrder': {'type': 'integer', 'format': 'int32'},
+                            'startDate': {'type': 'string', 'format': 'date'},
+                            'startedOn': {'type': 'string', 'format': 'date-time'},
+                            'status': {'type': 'string'},
+                            'useReportFromTemplate': {'type': 'boolean'},
+                        },
+                    },
+                    'relationships': {
+                        'type': 'object',
+                        'properties': {
+                            'parent': {
+                                'type': 'object',
+                                'properties': {
+                                    'data': {
+                                        'type': 'object',
+                                        'properties': {
+                                            'type': {'type': 'string', 'enum': ['plans']},
+                                            'id': {'type': 'string'},
+                                        },
+                                    },
+                                },
+                            },
+                            'projectSpan': {
+                                'type': 'object',
+                                'properties': {
+                                    'data': {
+                                        'type': 'array',
+                                        'items': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['projects']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                            'workItems': {
+                                'type': 'object',
+                                'properties': {
+                                    'data': {
+                                        'type': 'array',
+                                        'items': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['workitems']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'projectsSinglePatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'object',
+                'properties': {
+                    'type': {'type': 'string', 'enum': ['projects']},
+                    'id': {'type': 'string'},
+                    'attributes': {
+                        'type': 'object',
+                        'properties': {
+                            'active': {'type': 'boolean'},
+                            'color': {'type': 'string'},
+                            'description': {
+                                'type': 'object',
+                                'properties': {
+                                    'type': {'type': 'string', 'enum': ['text/plain']},
+                                    'value': {'type': 'string'},
+                                },
+                            },
+                            'finish': {'type': 'string', 'format': 'date'},
+                            'icon': {'type': 'string'},
+                            'lockWorkRecordsDate': {'type': 'string', 'format': 'date'},
+                            'name': {'type': 'string'},
+                            'start': {'type': 'string', 'format': 'date'},
+                            'trackerPrefix': {'type': 'string'},
+                        },
+                    },
+                    'relationships': {
+                        'type': 'object',
+                        'properties': {
+                            'lead': {
+                                'type': 'object',
+                                'properties': {
+                                    'data': {
+                                        'type': 'object',
+                                        'properties': {
+                                            'type': {'type': 'string', 'enum': ['users']},
+                                            'id': {'type': 'string'},
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'relationshipsListDeleteRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {
+                            'type': 'string',
+                            'enum': [
+                                'collections',
+                                'categories',
+                                'documents',
+                                'document_attachments',
+                                'document_comments',
+                                'document_parts',
+                                'enumerations',
+                                'globalroles',
+                                'icons',
+                                'jobs',
+                                'linkedworkitems',
+                                'externallylinkedworkitems',
+                                'linkedoslcresources',
+                                'pages',
+                                'page_attachments',
+                                'plans',
+                                'projectroles',
+                                'projectgroups',
+                                'projects',
+                                'projecttemplates',
+                                'spaces',
+                                'testparameters',
+                                'testparameter_definitions',
+                                'testrecords',
+                                'teststep_results',
+                                'testruns',
+                                'testrun_attachments',
+                                'teststepresult_attachments',
+                                'testrun_comments',
+                                'usergroups',
+                                'users',
+                                'workitems',
+                                'workitem_attachments',
+                                'workitem_approvals',
+                                'workitem_comments',
+                                'featureselections',
+                                'teststeps',
+                                'workrecords',
+                                'revisions',
+                                'testrecord_attachments',
+                            ],
+                        },
+                        'id': {'type': 'string'},
+                    },
+                },
+            },
+        },
+    },
+    'setLicenseRequestBody': {
+        'type': 'object',
+        'properties': {
+            'license': {
+                'type': 'string',
+                'enum': [
+                    'REVIEWER',
+                    'XReviewer',
+                    'XBase',
+                    'XEssentials',
+                    'XPro',
+                    'XStandard',
+                    'XEnterprise',
+                    'XAdvanced',
+                    'XExtended',
+                    'XPremium',
+                    'XAutomotive',
+                    'PRO',
+                    'REQUIREMENTS',
+                    'QA',
+                    'ALM',
+                ],
+            },
+            'group': {'type': 'string'},
+            'concurrent': {'type': 'boolean'},
+        },
+    },
+    'testparameter_definitionsListDeleteRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['testparameter_definitions']},
+                        'id': {'type': 'string'},
+                    },
+                },
+            },
+        },
+    },
+    'testparameter_definitionsListPostRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['testparameter_definitions']},
+                        'attributes': {'type': 'object', 'properties': {'name': {'type': 'string'}}},
+                    },
+                },
+            },
+        },
+    },
+    'testparametersListDeleteRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {'type': {'type': 'string', 'enum': ['testparameters']}, 'id': {'type': 'string'}},
+                },
+            },
+        },
+    },
+    'testparametersListPostRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['testparameters']},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {'name': {'type': 'string'}, 'value': {'type': 'string'}},
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'testrecord_attachmentsListDeleteRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {'type': {'type': 'string', 'enum': ['testrecord_attachments']}, 'id': {'type': 'string'}},
+                },
+            },
+        },
+    },
+    'testrecordsListPatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['testrecords']},
+                        'id': {'type': 'string'},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {
+                                'comment': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                        'value': {'type': 'string'},
+                                    },
+                                },
+                                'duration': {'type': 'number'},
+                                'executed': {'type': 'string', 'format': 'date-time'},
+                                'result': {'type': 'string'},
+                                'testCaseRevision': {'type': 'string'},
+                            },
+                        },
+                        'relationships': {
+                            'type': 'object',
+                            'properties': {
+                                'defect': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['workitems']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                                'executedBy': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['users']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'testrecordsListPostRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['testrecords']},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {
+                                'comment': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                        'value': {'type': 'string'},
+                                    },
+                                },
+                                'duration': {'type': 'number'},
+                                'executed': {'type': 'string', 'format': 'date-time'},
+                                'result': {'type': 'string'},
+                                'testCaseRevision': {'type': 'string'},
+                            },
+                        },
+                        'relationships': {
+                            'type': 'object',
+                            'properties': {
+                                'defect': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['workitems']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                                'executedBy': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['users']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                                'testCase': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['workitems']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'testrecordsSinglePatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'object',
+                'properties': {
+                    'type': {'type': 'string', 'enum': ['testrecords']},
+                    'id': {'type': 'string'},
+                    'attributes': {
+                        'type': 'object',
+                        'properties': {
+                            'comment': {
+                                'type': 'object',
+                                'properties': {
+                                    'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                    'value': {'type': 'string'},
+                                },
+                            },
+                            'duration': {'type': 'number'},
+                            'executed': {'type': 'string', 'format': 'date-time'},
+                            'result': {'type': 'string'},
+                            'testCaseRevision': {'type': 'string'},
+                        },
+                    },
+                    'relationships': {
+                        'type': 'object',
+                        'properties': {
+                            'defect': {
+                                'type': 'object',
+                                'properties': {
+                                    'data': {
+                                        'type': 'object',
+                                        'properties': {
+                                            'type': {'type': 'string', 'enum': ['workitems']},
+                                            'id': {'type': 'string'},
+                                        },
+                                    },
+                                },
+                            },
+                            'executedBy': {
+                                'type': 'object',
+                                'properties': {
+                                    'data': {
+                                        'type': 'object',
+                                        'properties': {
+                                            'type': {'type': 'string', 'enum': ['users']},
+                                            'id': {'type': 'string'},
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'testrun_attachmentsListDeleteRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {'type': {'type': 'string', 'enum': ['testrun_attachments']}, 'id': {'type': 'string'}},
+                },
+            },
+        },
+    },
+    'testrun_commentsListPatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['testrun_comments']},
+                        'id': {'type': 'string'},
+                        'attributes': {'type': 'object', 'properties': {'resolved': {'type': 'boolean'}}},
+                    },
+                },
+            },
+        },
+    },
+    'testrun_commentsListPostRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['testrun_comments']},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {
+                                'resolved': {'type': 'boolean'},
+                                'text': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                        'value': {'type': 'string'},
+                                    },
+                                },
+                                'title': {'type': 'string'},
+                            },
+                        },
+                        'relationships': {
+                            'type': 'object',
+                            'properties': {
+                                'author': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['users']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                                'parentComment': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['testrun_comments']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'testrun_commentsSinglePatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'object',
+                'properties': {
+                    'type': {'type': 'string', 'enum': ['testrun_comments']},
+                    'id': {'type': 'string'},
+                    'attributes': {'type': 'object', 'properties': {'resolved': {'type': 'boolean'}}},
+                },
+            },
+        },
+    },
+    'testrunsListDeleteRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {'type': {'type': 'string', 'enum': ['testruns']}, 'id': {'type': 'string'}},
+                },
+            },
+        },
+    },
+    'testrunsListPatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['testruns']},
+                        'id': {'type': 'string'},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {
+                                'finishedOn': {'type': 'string', 'format': 'date-time'},
+                                'groupId': {'type': 'string'},
+                                'homePageContent': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                        'value': {'type': 'string'},
+                                    },
+                                },
+                                'idPrefix': {'type': 'string'},
+                                'keepInHistory': {'type': 'boolean'},
+                                'query': {'type': 'string'},
+                                'selectTestCasesBy': {
+                                    'type': 'string',
+                                    'enum': [
+                                        'manualSelection',
+                                        'staticQueryResult',
+                                        'dynamicQueryResult',
+                                        'staticLiveDoc',
+                                        'dynamicLiveDoc',
+                                        'automatedProcess',
+                                    ],
+                                },
+                                'status': {'type': 'string'},
+                                'title': {'type': 'string'},
+                                'type': {'type': 'string'},
+                                'useReportFromTemplate': {'type': 'boolean'},
+                            },
+                        },
+                        'relationships': {
+                            'type': 'object',
+                            'properties': {
+                                'document': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['documents']},
+                                                'id': {'type': 'string'},
+                                                'revision': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                                'projectSpan': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'array',
+                                            'items': {
+                                                'type': 'object',
+                                                'properties': {
+                                                    'type': {'type': 'string', 'enum': ['projects']},
+                                                    'id': {'type': 'string'},
+                                                },
+                                            },
+                                        },
+                                    },
+                                },
+                                'summaryDefect': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['workitems']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'testrunsListPostRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['testruns']},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {
+                                'finishedOn': {'type': 'string', 'format': 'date-time'},
+                                'groupId': {'type': 'string'},
+                                'homePageContent': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                        'value': {'type': 'string'},
+                                    },
+                                },
+                                'id': {'type': 'string'},
+                                'idPrefix': {'type': 'string'},
+                                'isTemplate': {'type': 'boolean'},
+                                'keepInHistory': {'type': 'boolean'},
+                                'query': {'type': 'string'},
+                                'selectTestCasesBy': {
+                                    'type': 'string',
+                                    'enum': [
+                                        'manualSelection',
+                                        'staticQueryResult',
+                                        'dynamicQueryResult',
+                                        'staticLiveDoc',
+                                        'dynamicLiveDoc',
+                                        'automatedProcess',
+                                    ],
+                                },
+                                'status': {'type': 'string'},
+                                'title': {'type': 'string'},
+                                'type': {'type': 'string'},
+                                'useReportFromTemplate': {'type': 'boolean'},
+                            },
+                        },
+                        'relationships': {
+                            'type': 'object',
+                            'properties': {
+                                'document': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['documents']},
+                                                'id': {'type': 'string'},
+                                                'revision': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                                'projectSpan': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'array',
+                                            'items': {
+                                                'type': 'object',
+                                                'properties': {
+                                                    'type': {'type': 'string', 'enum': ['projects']},
+                                                    'id': {'type': 'string'},
+                                                },
+                                            },
+                                        },
+                                    },
+                                },
+                                'summaryDefect': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['workitems']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                                'template': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['testruns']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'testrunsSinglePatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'object',
+                'properties': {
+                    'type': {'type': 'string', 'enum': ['testruns']},
+                    'id': {'type': 'string'},
+                    'attributes': {
+                        'type': 'object',
+                        'properties': {
+                            'finishedOn': {'type': 'string', 'format': 'date-time'},
+                            'groupId': {'type': 'string'},
+                            'homePageContent': {
+                                'type': 'object',
+                                'properties': {
+                                    'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                    'value': {'type': 'string'},
+                                },
+                            },
+                            'idPrefix': {'type': 'string'},
+                            'keepInHistory': {'type': 'boolean'},
+                            'query': {'type': 'string'},
+                            'selectTestCasesBy': {
+                                'type': 'string',
+                                'enum': [
+                                    'manualSelection',
+                                    'staticQueryResult',
+                                    'dynamicQueryResult',
+                                    'staticLiveDoc',
+                                    'dynamicLiveDoc',
+                                    'automatedProcess',
+                                ],
+                            },
+                            'status': {'type': 'string'},
+                            'title': {'type': 'string'},
+                            'type': {'type': 'string'},
+                            'useReportFromTemplate': {'type': 'boolean'},
+                        },
+                    },
+                    'relationships': {
+                        'type': 'object',
+                        'properties': {
+                            'document': {
+                                'type': 'object',
+                                'properties': {
+                                    'data': {
+                                        'type': 'object',
+                                        'properties': {
+                                            'type': {'type': 'string', 'enum': ['documents']},
+                                            'id': {'type': 'string'},
+                                            'revision': {'type': 'string'},
+                                        },
+                                    },
+                                },
+                            },
+                            'projectSpan': {
+                                'type': 'object',
+                                'properties': {
+                                    'data': {
+                                        'type': 'array',
+                                        'items': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['projects']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                            'summaryDefect': {
+                                'type': 'object',
+                                'properties': {
+                                    'data': {
+                                        'type': 'object',
+                                        'properties': {
+                                            'type': {'type': 'string', 'enum': ['workitems']},
+                                            'id': {'type': 'string'},
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'teststep_resultsListPatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['teststep_results']},
+                        'id': {'type': 'string'},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {
+                                'comment': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                        'value': {'type': 'string'},
+                                    },
+                                },
+                                'result': {'type': 'string'},
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'teststep_resultsListPostRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['teststep_results']},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {
+                                'comment': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                        'value': {'type': 'string'},
+                                    },
+                                },
+                                'result': {'type': 'string'},
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'teststep_resultsSinglePatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'object',
+                'properties': {
+                    'type': {'type': 'string', 'enum': ['teststep_results']},
+                    'id': {'type': 'string'},
+                    'attributes': {
+                        'type': 'object',
+                        'properties': {
+                            'comment': {
+                                'type': 'object',
+                                'properties': {
+                                    'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                    'value': {'type': 'string'},
+                                },
+                            },
+                            'result': {'type': 'string'},
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'teststepresult_attachmentsListDeleteRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['teststepresult_attachments']},
+                        'id': {'type': 'string'},
+                    },
+                },
+            },
+        },
+    },
+    'teststepsListDeleteRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {'type': {'type': 'string', 'enum': ['teststeps']}, 'id': {'type': 'string'}},
+                },
+            },
+        },
+    },
+    'teststepsListPatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['teststeps']},
+                        'id': {'type': 'string'},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {
+                                'keys': {'type': 'array', 'items': {'type': 'string'}},
+                                'values': {
+                                    'type': 'array',
+                                    'items': {
+                                        'type': 'object',
+                                        'properties': {
+                                            'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                            'value': {'type': 'string'},
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'teststepsListPostRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['teststeps']},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {
+                                'keys': {'type': 'array', 'items': {'type': 'string'}},
+                                'values': {
+                                    'type': 'array',
+                                    'items': {
+                                        'type': 'object',
+                                        'properties': {
+                                            'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                            'value': {'type': 'string'},
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'teststepsSinglePatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'object',
+                'properties': {
+                    'type': {'type': 'string', 'enum': ['teststeps']},
+                    'id': {'type': 'string'},
+                    'attributes': {
+                        'type': 'object',
+                        'properties': {
+                            'keys': {'type': 'array', 'items': {'type': 'string'}},
+                            'values': {
+                                'type': 'array',
+                                'items': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                        'value': {'type': 'string'},
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'usersListPostRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['users']},
+                        'attributes': {
+                            'type': 'object',
+                            'required': ['id'],
+                            'properties': {
+                                'description': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'type': {'type': 'string', 'enum': ['text/plain']},
+                                        'value': {'type': 'string'},
+                                    },
+                                },
+                                'disabledNotifications': {'type': 'boolean'},
+                                'email': {'type': 'string'},
+                                'id': {'type': 'string'},
+                                'initials': {'type': 'string'},
+                                'name': {'type': 'string'},
+                            },
+                        },
+                        'relationships': {
+                            'type': 'object',
+                            'properties': {
+                                'globalRoles': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'array',
+                                            'items': {
+                                                'type': 'object',
+                                                'properties': {
+                                                    'type': {'type': 'string', 'enum': ['globalroles']},
+                                                    'id': {'type': 'string'},
+                                                },
+                                            },
+                                        },
+                                    },
+                                },
+                                'projectRoles': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'array',
+                                            'items': {
+                                                'type': 'object',
+                                                'properties': {
+                                                    'type': {'type': 'string', 'enum': ['projectroles']},
+                                                    'id': {'type': 'string'},
+                                                },
+                                            },
+                                        },
+                                    },
+                                },
+                                'userGroups': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'array',
+                                            'items': {
+                                                'type': 'object',
+                                                'properties': {
+                                                    'type': {'type': 'string', 'enum': ['usergroups']},
+                                                    'id': {'type': 'string'},
+                                                },
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'usersSinglePatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'object',
+                'properties': {
+                    'type': {'type': 'string', 'enum': ['users']},
+                    'id': {'type': 'string'},
+                    'attributes': {
+                        'type': 'object',
+                        'properties': {
+                            'description': {
+                                'type': 'object',
+                                'properties': {
+                                    'type': {'type': 'string', 'enum': ['text/plain']},
+                                    'value': {'type': 'string'},
+                                },
+                            },
+                            'disabledNotifications': {'type': 'boolean'},
+                            'email': {'type': 'string'},
+                            'initials': {'type': 'string'},
+                            'name': {'type': 'string'},
+                        },
+                    },
+                    'relationships': {
+                        'type': 'object',
+                        'properties': {
+                            'globalRoles': {
+                                'type': 'object',
+                                'properties': {
+                                    'data': {
+                                        'type': 'array',
+                                        'items': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['globalroles']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                            'projectRoles': {
+                                'type': 'object',
+                                'properties': {
+                                    'data': {
+                                        'type': 'array',
+                                        'items': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['projectroles']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                            'userGroups': {
+                                'type': 'object',
+                                'properties': {
+                                    'data': {
+                                        'type': 'array',
+                                        'items': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['usergroups']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'workitem_approvalsListDeleteRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {'type': {'type': 'string', 'enum': ['workitem_approvals']}, 'id': {'type': 'string'}},
+                },
+            },
+        },
+    },
+    'workitem_approvalsListPatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['workitem_approvals']},
+                        'id': {'type': 'string'},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {'status': {'type': 'string', 'enum': ['waiting', 'approved', 'disapproved']}},
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'workitem_approvalsListPostRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['workitem_approvals']},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {'status': {'type': 'string', 'enum': ['waiting', 'approved', 'disapproved']}},
+                        },
+                        'relationships': {
+                            'type': 'object',
+                            'properties': {
+                                'user': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['users']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'workitem_approvalsSinglePatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'object',
+                'properties': {
+                    'type': {'type': 'string', 'enum': ['workitem_approvals']},
+                    'id': {'type': 'string'},
+                    'attributes': {
+                        'type': 'object',
+                        'properties': {'status': {'type': 'string', 'enum': ['waiting', 'approved', 'disapproved']}},
+                    },
+                },
+            },
+        },
+    },
+    'workitem_commentsListPostRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['workitem_comments']},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {
+                                'resolved': {'type': 'boolean'},
+                                'text': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                        'value': {'type': 'string'},
+                                    },
+                                },
+                                'title': {'type': 'string'},
+                            },
+                        },
+                        'relationships': {
+                            'type': 'object',
+                            'properties': {
+                                'author': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['users']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                                'parentComment': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['workitem_comments']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'workitem_commentsSinglePatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'object',
+                'properties': {
+                    'type': {'type': 'string', 'enum': ['workitem_comments']},
+                    'id': {'type': 'string'},
+                    'attributes': {'type': 'object', 'properties': {'resolved': {'type': 'boolean'}}},
+                },
+            },
+        },
+    },
+    'workitemsListDeleteRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {'type': {'type': 'string', 'enum': ['workitems']}, 'id': {'type': 'string'}},
+                },
+            },
+        },
+    },
+    'workitemsListPatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['workitems']},
+                        'id': {'type': 'string'},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {
+                                'description': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                        'value': {'type': 'string'},
+                                    },
+                                },
+                                'dueDate': {'type': 'string', 'format': 'date'},
+                                'hyperlinks': {
+                                    'type': 'array',
+                                    'items': {
+                                        'type': 'object',
+                                        'properties': {
+                                            'title': {'type': 'string'},
+                                            'role': {'type': 'string'},
+                                            'uri': {'type': 'string'},
+                                        },
+                                    },
+                                },
+                                'initialEstimate': {'type': 'string'},
+                                'priority': {'type': 'string'},
+                                'remainingEstimate': {'type': 'string'},
+                                'resolution': {'type': 'string'},
+                                'resolvedOn': {'type': 'string', 'format': 'date-time'},
+                                'severity': {'type': 'string'},
+                                'status': {'type': 'string'},
+                                'timeSpent': {'type': 'string'},
+                                'title': {'type': 'string'},
+                            },
+                        },
+                        'relationships': {
+                            'type': 'object',
+                            'properties': {
+                                'assignee': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'array',
+                                            'items': {
+                                                'type': 'object',
+                                                'properties': {
+                                                    'type': {'type': 'string', 'enum': ['users']},
+                                                    'id': {'type': 'string'},
+                                                },
+                                            },
+                                        },
+                                    },
+                                },
+                                'categories': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'array',
+                                            'items': {
+                                                'type': 'object',
+                                                'properties': {
+                                                    'type': {'type': 'string', 'enum': ['categories']},
+                                                    'id': {'type': 'string'},
+                                                },
+                                            },
+                                        },
+                                    },
+                                },
+                                'linkedRevisions': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'array',
+                                            'items': {
+                                                'type': 'object',
+                                                'properties': {
+                                                    'type': {'type': 'string', 'enum': ['revisions']},
+                                                    'id': {'type': 'string'},
+                                                },
+                                            },
+                                        },
+                                    },
+                                },
+                                'votes': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'array',
+                                            'items': {
+                                                'type': 'object',
+                                                'properties': {
+                                                    'type': {'type': 'string', 'enum': ['users']},
+                                                    'id': {'type': 'string'},
+                                                },
+                                            },
+                                        },
+                                    },
+                                },
+                                'watches': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'array',
+                                            'items': {
+                                                'type': 'object',
+                                                'properties': {
+                                                    'type': {'type': 'string', 'enum': ['users']},
+                                                    'id': {'type': 'string'},
+                                                },
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'workitemsListPostRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['workitems']},
+                        'attributes': {
+                            'type': 'object',
+                            'required': ['type'],
+                            'properties': {
+                                'description': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                        'value': {'type': 'string'},
+                                    },
+                                },
+                                'dueDate': {'type': 'string', 'format': 'date'},
+                                'hyperlinks': {
+                                    'type': 'array',
+                                    'items': {
+                                        'type': 'object',
+                                        'properties': {
+                                            'title': {'type': 'string'},
+                                            'role': {'type': 'string'},
+                                            'uri': {'type': 'string'},
+                                        },
+                                    },
+                                },
+                                'initialEstimate': {'type': 'string'},
+                                'priority': {'type': 'string'},
+                                'remainingEstimate': {'type': 'string'},
+                                'resolution': {'type': 'string'},
+                                'resolvedOn': {'type': 'string', 'format': 'date-time'},
+                                'severity': {'type': 'string'},
+                                'status': {'type': 'string'},
+                                'timeSpent': {'type': 'string'},
+                                'title': {'type': 'string'},
+                                'type': {'type': 'string'},
+                            },
+                        },
+                        'relationships': {
+                            'type': 'object',
+                            'properties': {
+                                'assignee': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'array',
+                                            'items': {
+                                                'type': 'object',
+                                                'properties': {
+                                                    'type': {'type': 'string', 'enum': ['users']},
+                                                    'id': {'type': 'string'},
+                                                },
+                                            },
+                                        },
+                                    },
+                                },
+                                'author': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['users']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                                'categories': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'array',
+                                            'items': {
+                                                'type': 'object',
+                                                'properties': {
+                                                    'type': {'type': 'string', 'enum': ['categories']},
+                                                    'id': {'type': 'string'},
+                                                },
+                                            },
+                                        },
+                                    },
+                                },
+                                'linkedRevisions': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'array',
+                                            'items': {
+                                                'type': 'object',
+                                                'properties': {
+                                                    'type': {'type': 'string', 'enum': ['revisions']},
+                                                    'id': {'type': 'string'},
+                                                },
+                                            },
+                                        },
+                                    },
+                                },
+                                'module': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['documents']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'workitemsSinglePatchRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'object',
+                'properties': {
+                    'type': {'type': 'string', 'enum': ['workitems']},
+                    'id': {'type': 'string'},
+                    'attributes': {
+                        'type': 'object',
+                        'properties': {
+                            'description': {
+                                'type': 'object',
+                                'properties': {
+                                    'type': {'type': 'string', 'enum': ['text/html', 'text/plain']},
+                                    'value': {'type': 'string'},
+                                },
+                            },
+                            'dueDate': {'type': 'string', 'format': 'date'},
+                            'hyperlinks': {
+                                'type': 'array',
+                                'items': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'title': {'type': 'string'},
+                                        'role': {'type': 'string'},
+                                        'uri': {'type': 'string'},
+                                    },
+                                },
+                            },
+                            'initialEstimate': {'type': 'string'},
+                            'priority': {'type': 'string'},
+                            'remainingEstimate': {'type': 'string'},
+                            'resolution': {'type': 'string'},
+                            'resolvedOn': {'type': 'string', 'format': 'date-time'},
+                            'severity': {'type': 'string'},
+                            'status': {'type': 'string'},
+                            'timeSpent': {'type': 'string'},
+                            'title': {'type': 'string'},
+                        },
+                    },
+                    'relationships': {
+                        'type': 'object',
+                        'properties': {
+                            'assignee': {
+                                'type': 'object',
+                                'properties': {
+                                    'data': {
+                                        'type': 'array',
+                                        'items': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['users']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                            'categories': {
+                                'type': 'object',
+                                'properties': {
+                                    'data': {
+                                        'type': 'array',
+                                        'items': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['categories']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                            'linkedRevisions': {
+                                'type': 'object',
+                                'properties': {
+                                    'data': {
+                                        'type': 'array',
+                                        'items': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['revisions']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                            'votes': {
+                                'type': 'object',
+                                'properties': {
+                                    'data': {
+                                        'type': 'array',
+                                        'items': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['users']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                            'watches': {
+                                'type': 'object',
+                                'properties': {
+                                    'data': {
+                                        'type': 'array',
+                                        'items': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['users']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    'workrecordsListDeleteRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {'type': {'type': 'string', 'enum': ['workrecords']}, 'id': {'type': 'string'}},
+                },
+            },
+        },
+    },
+    'workrecordsListPostRequest': {
+        'type': 'object',
+        'properties': {
+            'data': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'type': {'type': 'string', 'enum': ['workrecords']},
+                        'attributes': {
+                            'type': 'object',
+                            'properties': {
+                                'comment': {'type': 'string'},
+                                'date': {'type': 'string', 'format': 'date'},
+                                'timeSpent': {'type': 'string'},
+                                'type': {'type': 'string'},
+                            },
+                        },
+                        'relationships': {
+                            'type': 'object',
+                            'properties': {
+                                'user': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'data': {
+                                            'type': 'object',
+                                            'properties': {
+                                                'type': {'type': 'string', 'enum': ['users']},
+                                                'id': {'type': 'string'},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
@@ -0,0 +1,238 @@
+"""
+Request scheduler module for Polarion REST API.
+Admits the requests of a client by priority class, with a concurrency cap per
+class and in total, so interactive calls overtake queued batch traffic.
+"""
+import contextlib
+import contextvars
+import threading
+import time
+from collections import deque
+from typing import Optional, Dict, Any, Callable, Iterator
+
+
+INTERACTIVE = 'interactive'
+BATCH = 'batch'
+DEFAULT_MAX_CONCURRENT = 10
+
+# Priority class of the requests sent from the current context (None: the scheduler default)
+_request_class: 'contextvars.ContextVar[Optional[str]]' = contextvars.ContextVar('polarion_request_class', default=None)
+
+
+def run_in_context(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Bind a callable to a copy of the current context.
+
+    Worker threads start with an empty context; submitting the bound callable
+    keeps the priority class chosen by the caller for the requests it sends.
+
+    Args:
+        fn: Callable run later in another thread
+
+    Returns:
+        Callable running fn in the copied context
+    """
+    context = contextvars.copy_context()
+    return lambda *args, **kwargs: context.run(fn, *args, **kwargs)
+
+
+class ClassStats:
+    """
+    Snapshot of the counters of one priority class.
+
+    Attributes:
+        name: Class name
+        limit: Maximum number of requests of the class running at a time
+        active: Requests running
+        queued: Requests waiting for a slot
+        admitted: Requests admitted so far
+        total_wait: Seconds spent waiting by all admitted requests
+        max_wait: Longest wait of an admitted request in seconds
+    """
+
+    __slots__ = ('name', 'limit', 'active', 'queued', 'admitted', 'total_wait', 'max_wait')
+
+    def __init__(self, name: str, limit: int, active: int = 0, queued: int = 0,
+                 admitted: int = 0, total_wait: float = 0.0, max_wait: float = 0.0):
+        self.name = name
+        self.limit = limit
+        self.active = active
+        self.queued = queued
+        self.admitted = admitted
+        self.total_wait = total_wait
+        self.max_wait = max_wait
+
+    @property
+    def mean_wait(self) -> float:
+        """
+        Average wait in seconds of the admitted requests.
+        """
+        return self.total_wait / self.admitted if self.admitted else 0.0
+
+    def __repr__(self) -> str:
+        return (f"ClassStats(name={self.name!r}, active={self.active}/{self.limit}, queued={self.queued}, "
+                f"admitted={self.admitted}, mean_wait={self.mean_wait:.3f})")
+
+
+class _Waiter:
+    """
+    Request waiting for a slot.
+    """
+
+    __slots__ = ('granted',)
+
+    def __init__(self):
+        self.granted = False
+
+
+class RequestScheduler:
+    """
+    Priority scheduler for the requests of a client.
+
+    Classes are given in priority order, each with its own concurrency cap, and
+    all of them share `max_concurrent` slots. A freed slot always goes to the
+    oldest request of the highest-priority class below its cap, so a long export
+    running as 'batch' delays interactive lookups by at most one request instead
+    of its whole queue. With the defaults, batch traffic never holds more than
+    half of the slots.
+
+    Requests pick their class from the context they are sent in (see priority()),
+    the others use `default_class`.
+
+    Example:
+        >>> api = PolarionRestApi(token=token, scheduler=RequestScheduler(max_concurrent=8))
+        >>> with api.priority(BATCH):
+        ...     result = api.work_items.bulk_post_work_items("MyProjectId", items)
+        >>> api.scheduler.stats()[BATCH].queued
+    """
+
+    def __init__(self, max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+                 limits: Optional[Dict[str, int]] = None,
+                 default_class: str = INTERACTIVE):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_concurrent: Maximum number of requests running at a time (default: 10)
+            limits: Maximum number of running requests per class, highest priority first
+                    (default: interactive up to max_concurrent, batch up to half of it)
+            default_class: Class of the requests sent outside of priority() (default: 'interactive')
+
+        Raises:
+            ValueError: If a limit is lower than 1 or default_class is not a class
+        """
+        if limits is None:
+            limits = {INTERACTIVE: max_concurrent, BATCH: max(1, max_concurrent // 2)}
+        if max_concurrent < 1 or any(limit < 1 for limit in limits.values()):
+            raise ValueError(f"Concurrency limits must be at least 1, got {max_concurrent} and {limits}")
+        if default_class not in limits:
+            raise ValueError(f"Unknown default class {default_class!r}, expected one of {list(limits)}")
+        self.max_concurrent = max_concurrent
+        self.default_class = default_class
+        self._classes = {name: ClassStats(name, limit) for name, limit in limits.items()}
+        self._queues: Dict[str, deque] = {name: deque() for name in limits}
+        self._active = 0
+        self._condition = threading.Condition()
+
+    @contextlib.contextmanager
+    def priority(self, name: str) -> Iterator[None]:
+        """
+        Send the requests of the block with priority class `name`.
+
+        Applies to the current thread or task and to the worker threads started by
+        the bulk, fan-out and unit of work helpers from inside the block.
+
+        Raises:
+            ValueError: If the class is unknown
+        """
+        if name not in self._classes:
+            raise ValueError(f"Unknown priority class {name!r}, expected one of {list(self._classes)}")
+        token = _request_class.set(name)
+        try:
+            yield
+        finally:
+            _request_class.reset(token)
+
+    def current_class(self) -> str:
+        """
+        Return the priority class of the requests sent from the current context.
+        """
+        name = _request_class.get()
+        return name if name in self._classes else self.default_class
+
+    def acquire(self, name: Optional[str] = None) -> float:
+        """
+        Wait for a slot of a priority class.
+
+        Args:
+            name: Priority class (default: the class of the current context)
+
+        Returns:
+            Seconds spent waiting
+        """
+        name = name or self.current_class()
+        stats = self._classes[name]
+        started = time.monotonic()
+        with self._condition:
+            waiter = _Waiter()
+            self._queues[name].append(waiter)
+            stats.queued += 1
+            self._dispatch()
+            while not waiter.granted:
+                self._condition.wait()
+            waited = time.monotonic() - started
+            stats.admitted += 1
+            stats.total_wait += waited
+            stats.max_wait = max(stats.max_wait, waited)
+        return waited
+
+    def release(self, name: Optional[str] = None):
+        """
+        Free a slot taken with acquire().
+
+        Args:
+            name: Priority class the slot was acquired for (default: the class of the current context)
+        """
+        name = name or self.current_class()
+        with self._condition:
+            self._classes[name].active -= 1
+            self._active -= 1
+            self._dispatch()
+
+    @contextlib.contextmanager
+    def slot(self, name: Optional[str] = None) -> Iterator[None]:
+        """
+        Hold a slot of a priority class for the duration of the block.
+        """
+        name = name or self.current_class()
+        self.acquire(name)
+        try:
+            yield
+        finally:
+            self.release(name)
+
+    def stats(self) -> Dict[str, ClassStats]:
+        """
+        Return a snapshot of the counters of every class, in priority order.
+        """
+        with self._condition:
+            return {
+                name: ClassStats(s.name, s.limit, s.active, s.queued, s.admitted, s.total_wait, s.max_wait)
+                for name, s in self._classes.items()
+            }
+
+    def _dispatch(self):
+        """
+        Grant free slots to waiting requests by priority (caller holds the condition).
+        """
+        granted = False
+        for name, stats in self._classes.items():
+            queue = self._queues[name]
+            while queue and self._active < self.max_concurrent and stats.active < stats.limit:
+                queue.popleft().granted = True
+                stats.queued -= 1
+                stats.active += 1
+                self._active += 1
+                granted = True
+        if granted:
+            self._condition.notify_all()
@@ -0,0 +1,176 @@
+"""
+Request schema generator module for Polarion REST API.
+Generates request_schemas.py from the OpenAPI specification: the JSON request body
+schemas of all operations, reduced to the keywords checked by validation.py, and
+the (method, path template) of the operations using them. The output only
+depends on the specification, so request_schemas.py can be regenerated and
+checked in CI:
+
+    python -m polarion_rest_api.modules.schema_generator data/openapi_official.json \\
+        -o polarion_rest_api/modules/request_schemas.py
+"""
+import argparse
+import json
+import sys
+from typing import Optional, Dict, Any, List, Tuple
+from .model_generator import SPEC_PATH
+
+
+REF_PREFIX = '#/components/schemas/'
+
+# Keywords kept in the generated schemas; descriptions, examples etc. are dropped
+KEYWORDS = ('$ref', 'type', 'format', 'enum', 'nullable', 'required', 'minItems', 'maxItems',
+            'properties', 'items', 'oneOf', 'anyOf', 'allOf')
+
+HTTP_METHODS = ('post', 'patch', 'delete', 'put')
+
+LINE_LENGTH = 110
+
+
+def reduce_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Schema with only the validated keywords, recursively.
+    """
+    reduced: Dict[str, Any] = {}
+    for keyword in KEYWORDS:
+        if keyword not in schema:
+            continue
+        value = schema[keyword]
+        if keyword == '$ref':
+            value = value[len(REF_PREFIX):] if value.startswith(REF_PREFIX) else value
+        elif keyword == 'properties':
+            value = {name: reduce_schema(property_schema) for name, property_schema in value.items()}
+        elif keyword == 'items':
+            value = reduce_schema(value)
+        elif keyword in ('oneOf', 'anyOf', 'allOf'):
+            value = [reduce_schema(alternative) for alternative in value]
+        reduced[keyword] = value
+    return reduced
+
+
+def _references(schema: Any) -> List[str]:
+    if isinstance(schema, dict):
+        found = [schema['$ref']] if '$ref' in schema else []
+        for value in schema.values():
+            found += _references(value)
+        return found
+    if isinstance(schema, list):
+        return [name for value in schema for name in _references(value)]
+    return []
+
+
+def request_bodies(spec: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+    """
+    (METHOD, path template, schema name) of the operations with a JSON request body,
+    sorted by path and method. Path templates have no leading slash, like the
+    endpoints passed to PolarionBase._post.
+    """
+    bodies = []
+    for path, operations in spec.get('paths', {}).items():
+        for method, operation in operations.items():
+            if method not in HTTP_METHODS or not isinstance(operation, dict):
+                continue
+            content = (operation.get('requestBody') or {}).get('content', {})
+            reference = content.get('application/json', {}).get('schema', {}).get('$ref', '')
+            if reference.startswith(REF_PREFIX):
+                bodies.append((method.upper(), path.lstrip('/'), reference[len(REF_PREFIX):]))
+    return sorted(bodies, key=lambda body: (body[1], body[0]))
+
+
+def request_schemas(spec: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Reduced schemas of the request bodies and of the schemas they reference, sorted by name.
+    """
+    schemas = spec.get('components', {}).get('schemas', {})
+    reduced: Dict[str, Dict[str, Any]] = {}
+    pending = [name for _, _, name in request_bodies(spec)]
+    while pending:
+        name = pending.pop()
+        if name in reduced or name not in schemas:
+            continue
+        reduced[name] = reduce_schema(schemas[name])
+        pending += _references(reduced[name])
+    return {name: reduced[name] for name in sorted(reduced)}
+
+
+def literal(value: Any, indent: str = '') -> str:
+    """
+    Python literal of a JSON value, on one line when it fits, otherwise one entry per line.
+    """
+    inline = repr(value)
+    if len(indent) + len(inline) <= LINE_LENGTH or not isinstance(value, (dict, list)) or not value:
+        return inline
+    inner = indent + '    '
+    if isinstance(value, dict):
+        entries = [f"{inner}{key!r}: {literal(item, inner)}," for key, item in value.items()]
+        return '{\n' + '\n'.join(entries) + f"\n{indent}}}"
+    entries = [f"{inner}{literal(item, inner)}," for item in value]
+    return '[\n' + '\n'.join(entries) + f"\n{indent}]"
+
+
+def generate_request_schemas(spec: Dict[str, Any], source: str = SPEC_PATH) -> str:
+    """
+    Generate the source of request_schemas.py from a specification.
+
+    Args:
+        spec: Decoded OpenAPI specification
+        source: Specification path named in the header of the module
+
+    Returns:
+        Module source; the same specification always gives the same source
+    """
+    version = spec.get('info', {}).get('version', '')
+    lines = [
+        '"""',
+        'Request body schemas of the Polarion REST API, used by validation.py.',
+        f"Generated from {source} (API {version}) by schema_generator.py, do not edit.",
+        'Regenerate with:',
+        '',
+        f"    python -m polarion_rest_api.modules.schema_generator {source} \\\\",
+        '        -o polarion_rest_api/modules/request_schemas.py',
+        '"""',
+        '',
+        '# (METHOD, path template, schema name) of the operations with a JSON request body',
+        'REQUEST_BODIES = (',
+    ]
+    lines += [f"    {body!r}," for body in request_bodies(spec)]
+    lines += [')', '', '# Schema name -> schema reduced to the validated keywords', 'SCHEMAS = {']
+    for name, schema in request_schemas(spec).items():
+        lines.append(f"    {name!r}: {literal(schema, '    ')},")
+    lines += ['}', '']
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point: write (or --check) request_schemas.py for a specification file.
+    """
+    parser = argparse.ArgumentParser(description='Generate the request body schemas from the OpenAPI specification.')
+    parser.add_argument('spec', nargs='?', default=SPEC_PATH, help=f'Specification file (default: {SPEC_PATH})')
+    parser.add_argument('-o', '--output', help='Output file (default: standard output)')
+    parser.add_argument('--check', action='store_true',
+                        help='Exit with status 1 if the output file is not up to date')
+    args = parser.parse_args(argv)
+
+    with open(args.spec, 'r', encoding='utf-8') as file:
+        source = generate_request_schemas(json.load(file), source=args.spec.replace('\\', '/'))
+    if args.output is None:
+        sys.stdout.write(source)
+        return 0
+    if args.check:
+        try:
+            with open(args.output, 'r', encoding='utf-8') as file:
+                current = file.read()
+        except FileNotFoundError:
+            current = None
+        if current != source:
+            print(f"{args.output} is not up to date with {args.spec}", file=sys.stderr)
+            return 1
+        return 0
+    with open(args.output, 'w', encoding='utf-8', newline='\n') as file:
+        file.write(source)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,9 +2,12 @@
 Test Records module for Polarion REST API.
 Handles all Test Records related endpoints.
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List
 import requests
 from .base import PolarionBase
+from .bulk import (BulkResult, Chunk, run_chunks, send_chunk, reject_invalid, created_ids, updated_ids,
+                   DEFAULT_CHUNK_SIZE, DEFAULT_MAX_WORKERS)
+from .pagination import iter_resources
 
 
 class TestRecords(PolarionBase):
@@ -18,6 +21,7 @@ class TestRecords(PolarionBase):
     - GET methods: Retrieve test records and test parameters
     - PATCH methods: Update test records
     - POST methods: Create test records and test parameters
+    - Bulk methods: Streaming ingestion of test results
     """
     
     # ========== DELETE methods ==========
@@ -413,3 +417,151 @@ class TestRecords(PolarionBase):
         """
         endpoint = f"projects/{project_id}/testruns/{test_run_id}/testrecords/{test_case_project_id}/{test_case_id}/{iteration}/testparameters"
         return self._post(endpoint, json=test_parameters_data)
+    
+    # ========== Bulk methods ==========
+    
+    def ingest_test_records(
+        self,
+        project_id: str,
+        test_run_id: str,
+        test_records: Iterable[Dict[str, Any]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        upsert: bool = False,
+        on_progress: Optional[Callable[[BulkResult], None]] = None,
+        keep_results: bool = False
+    ) -> BulkResult:
+        """
+        Streams any number of Test Records into a Test Run.
+        
+        Test records are pulled from the iterable (typically a generator producing
+        results while the test suite is parsed) and sent in chunks of `chunk_size`
+        with post_test_records, up to `max_workers` requests in parallel. The iterable
+        is only advanced when a worker is about to become free, so memory use stays
+        flat regardless of the number of records.
+        
+        Records carrying an 'id' are updated through patch_test_records instead of
+        being created. With `upsert=True` the existing records of the Test Run are
+        fetched first and records whose Test Case already has a record in the run
+        update that record (the highest iteration) instead of creating a new iteration.
+        
+        Args:
+            project_id: The Project ID
+            test_run_id: The Test Run ID
+            test_records: Iterable of Test Record resources, e.g.
+                          {"type": "testrecords", "attributes": {"result": "passed"},
+                           "relationships": {"testCase": {"data": {"type": "workitems", "id": "MyProjectId/MyTestcaseId"}}}}
+            chunk_size: Maximum number of Test Records per request (default: 100)
+            max_workers: Maximum number of requests sent in parallel (default: 4)
+            upsert: Update records of Test Cases that already have a record in the run
+            on_progress: Optional callable invoked with the BulkResult after every chunk;
+                         its processed, failed_count, requests_sent, elapsed and
+                         items_per_second counters are live
+            keep_results: Keep results of successful records too (by default only
+                          failures are kept, to keep memory flat)
+            
+        Returns:
+            BulkResult with the counters of the ingestion and the failed records
+            
+        Raises:
+            ValueError: If chunk_size is lower than 1
+            requests.HTTPError: If the existing records cannot be fetched for an upsert
+            
+        Example:
+            >>> def results():
+            ...     for case in parse_junit("report.xml"):
+            ...         yield {"attributes": {"result": case.result, "duration": case.time},
+            ...                "relationships": {"testCase": {"data": {"type": "workitems", "id": case.work_item}}}}
+            >>> stats = api.ingest_test_records("MyProjectId", "MyTestRunId", results(),
+            ...                                 on_progress=lambda r: print(r.processed, r.items_per_second))
+        """
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be at least 1, got {chunk_size}")
+        self._ensure_pool_size(max_workers)
+        existing = self._existing_test_record_ids(project_id, test_run_id) if upsert else {}
+        result = BulkResult(keep_succeeded=keep_results)
+        endpoint = f"projects/{project_id}/testruns/{test_run_id}/testrecords"
+        validators = {False: self._item_validator('POST', endpoint), True: self._item_validator('PATCH', endpoint)}
+        
+        def request(items: List[Dict[str, Any]]) -> requests.Response:
+            body = {'data': items}
+            if 'id' in items[0]:
+                return self.patch_test_records(project_id, test_run_id, body)
+            return self.post_test_records(project_id, test_run_id, body)
+        
+        def send(chunk: Chunk):
+            is_update = 'id' in chunk[0][1]
+            on_success = updated_ids if is_update else created_ids
+            rejected, chunk = reject_invalid(chunk, validators[is_update])
+            if not chunk:
+                return rejected
+            return rejected + send_chunk(request, chunk, on_success, result)
+        
+        def chunks() -> Iterator[Chunk]:
+            # Creates and updates go to different endpoints, so they are buffered separately
+            buffers = {False: [], True: []}
+            for index, record in enumerate(test_records):
+                record = self._prepare_ingested_record(record, existing)
+                buffer = buffers['id' in record]
+                buffer.append((index, record))
+                if len(buffer) >= chunk_size:
+                    yield list(buffer)
+                    buffer.clear()
+            for buffer in buffers.values():
+                if buffer:
+                    yield buffer
+        
+        return run_chunks(send, chunks(), max_workers, result, on_progress)
+    
+    # ========== Helper methods ==========
+    
+    def _existing_test_record_ids(self, project_id: str, test_run_id: str) -> Dict[str, str]:
+        """
+        Map the Test Case IDs of a Test Run to their latest Test Record ID.
+        
+        Args:
+            project_id: The Project ID
+            test_run_id: The Test Run ID
+            
+        Returns:
+            Dictionary {"TestcaseProjectId/TestcaseId": "ProjectId/TestRunId/TestcaseProjectId/TestcaseId/Iteration"}
+        """
+        latest: Dict[str, str] = {}
+        for record in iter_resources(self.get_test_records, project_id, test_run_id):
+            # Test Record ID: ProjectId/TestRunId/TestcaseProjectId/TestcaseId/Iteration
+            parts = record.get('id', '').split('/')
+            if len(parts) != 5:
+                continue
+            test_case = f"{parts[2]}/{parts[3]}"
+            current = latest.get(test_case)
+            if current is None or int(parts[4]) > int(current.rsplit('/', 1)[1]):
+                latest[test_case] = record['id']
+        return latest
+    
+    @staticmethod
+    def _prepare_ingested_record(record: Dict[str, Any], existing: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Add the JSON:API type and, for upserts, the ID of the existing Test Record.
+        The caller's dictionary is never modified.
+        
+        Args:
+            record: Test Record resource
+            existing: Map of Test Case IDs to existing Test Record IDs
+            
+        Returns:
+            Test Record resource ready to be sent
+        """
+        if 'type' not in record:
+            record = {'type': 'testrecords', **record}
+        if existing and 'id' not in record:
+            test_case = ((record.get('relationships') or {}).get('testCase') or {}).get('data') or {}
+            record_id = existing.get(test_case.get('id'))
+            if record_id is not None:
+                # The testCase relationship cannot be patched, the other relationships can
+                relationships = {name: value for name, value in record['relationships'].items()
+                                 if name != 'testCase'}
+                record = {key: value for key, value in record.items() if key != 'relationships'}
+                if relationships:
+                    record['relationships'] = relationships
+                record['id'] = record_id
+        return record
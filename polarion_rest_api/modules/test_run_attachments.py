@@ -2,9 +2,11 @@
 Test Run Attachments module for Polarion REST API.
 Handles all Test Run Attachments related endpoints.
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Iterable, Sequence
 import requests
 from .base import PolarionBase
+from .downloads import DownloadResult, Destination, save_stream, DEFAULT_CHUNK_SIZE, DEFAULT_ALGORITHM
+from .multipart import FileSpec, upload_files, DEFAULT_MAX_FILES, DEFAULT_MAX_BYTES
 
 
 class TestRunAttachments(PolarionBase):
@@ -18,6 +20,7 @@ class TestRunAttachments(PolarionBase):
     - GET methods: Retrieve test run attachments and their content
     - PATCH methods: Update test run attachments
     - POST methods: Create test run attachments
+    - Upload methods: Stream files from disk, several per request
     
     Note: POST and PATCH methods use multipart/form-data for file uploads.
     """
@@ -143,6 +146,46 @@ class TestRunAttachments(PolarionBase):
             
         return self._get(endpoint, params=params if params else None)
     
+    def save_test_run_attachment_content(
+        self,
+        project_id: str,
+        test_run_id: str,
+        attachment_id: str,
+        destination: Destination,
+        revision: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        algorithm: str = DEFAULT_ALGORITHM
+    ) -> DownloadResult:
+        """
+        Downloads the file content for a specified Test Run Attachment to a path or file object.
+        
+        Streaming variant of get_test_run_attachment_content: the content is written in chunks of
+        chunk_size bytes and hashed on the fly, so memory use does not depend on the
+        file size.
+        
+        Args:
+            project_id: The Project ID
+            test_run_id: The Test Run ID
+            attachment_id: The Attachment ID
+            destination: Path of the file to write, or binary file object
+            revision: The revision ID
+            chunk_size: Number of bytes read per chunk (default: 1 MiB)
+            algorithm: hashlib algorithm of the checksum (default: 'sha256')
+            
+        Returns:
+            DownloadResult with the size and checksum of the content
+            
+        Raises:
+            ValueError: If the download failed or was incomplete
+        """
+        params = {}
+        if revision:
+            params['revision'] = revision
+        
+        response = self._get_stream(f"projects/{project_id}/testruns/{test_run_id}/attachments/{attachment_id}/content",
+                                    params=params if params else None)
+        return save_stream(response, destination, chunk_size=chunk_size, algorithm=algorithm)
+    
     def get_test_run_attachments(
         self,
         project_id: str,
@@ -250,3 +293,41 @@ class TestRunAttachments(PolarionBase):
         """
         endpoint = f"projects/{project_id}/testruns/{test_run_id}/attachments"
         return self._post(endpoint, files=files, data=data)
+    
+    # ========== Upload methods ==========
+    
+    def upload_test_run_attachments(self,
+                                    project_id: str,
+                                    test_run_id: str,
+                                    files: Iterable[FileSpec],
+                                    titles: Optional[Sequence[Optional[str]]] = None,
+                                    max_files: int = DEFAULT_MAX_FILES,
+                                    max_bytes: int = DEFAULT_MAX_BYTES,
+                                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[requests.Response]:
+        """
+        Uploads files as Test Run Attachments, streaming them from disk.
+        
+        Several files are sent per request (up to max_files and max_bytes) in a streamed
+        multipart/form-data body, so memory use does not depend on the file sizes.
+        
+        Args:
+            project_id: The Project ID
+            test_run_id: The Test Run ID
+            files: Paths, named binary file objects or (filename, source[, content_type]) tuples,
+                   where source is a path, bytes, a file object or an iterator of bytes
+            titles: Optional attachment titles matched with the files by order
+            max_files: Maximum number of files per request (default: 20)
+            max_bytes: Maximum total size of the files of a request (default: 1 GiB)
+            chunk_size: Number of bytes read from the files per chunk (default: 1 MiB)
+        
+        Returns:
+            List of Response objects (201 Created), one per request. Uploading stops
+            at the first failed request.
+        
+        Example:
+            responses = api.test_run_attachments.upload_test_run_attachments(
+                "MyProject", "RUN-1", ["/logs/build.log", "/videos/run.mp4"])
+        """
+        return upload_files(self, f"projects/{project_id}/testruns/{test_run_id}/attachments",
+                            'testrun_attachments', files, titles=titles, max_files=max_files,
+                            max_bytes=max_bytes, chunk_size=chunk_size)
@@ -2,9 +2,16 @@
 Test Runs module for Polarion REST API.
 Handles all Test Runs related endpoints.
 """
-from typing import Optional, Dict, Any
+import os
+from typing import Optional, Dict, Any, Iterable, Union, BinaryIO
 import requests
 from .base import PolarionBase
+from .bulk import BulkResult, run_bulk, created_ids, DEFAULT_CHUNK_SIZE, DEFAULT_MAX_WORKERS
+from .journal import WriteJournal, run_journaled
+from .job_waiter import JobHandle
+from .jobs import start_job
+from .xunit import XUnitImportResult, import_xunit, DEFAULT_MAX_WORKERS as DEFAULT_SHARD_WORKERS
+from .validation import validate_request
 
 
 class TestRuns(PolarionBase):
@@ -18,6 +25,8 @@ class TestRuns(PolarionBase):
     - GET methods: Retrieve test runs, test parameters, and workflow actions
     - PATCH methods: Update test runs
     - POST methods: Create test runs, import/export results, manage test parameters
+    - Bulk methods: Chunked, parallel variants of the list endpoints
+    - Job methods: Start the asynchronous (202 Accepted) operations and return a JobHandle right away
     """
     
     # ========== DELETE methods ==========
@@ -551,22 +560,24 @@ class TestRuns(PolarionBase):
         self, 
         project_id: str, 
         test_run_id: str, 
-        xunit_file_data: bytes
+        xunit_file_data: Union[bytes, BinaryIO, str, os.PathLike]
     ) -> requests.Response:
         """
         Imports XUnit test results.
         
+        Paths and file objects are streamed from disk while the request is sent,
+        so the report is never loaded into memory.
+        
         Args:
             project_id: The Project ID
             test_run_id: The Test Run ID
-            xunit_file_data: XUnit File data (binary)
+            xunit_file_data: XUnit File data (binary), path of the XUnit file, or binary file object
             
         Returns:
             Response object (202 Accepted)
         """
         endpoint = f"/projects/{project_id}/testruns/{test_run_id}/actions/importXUnitTestResults"
-        headers = {'Content-Type': 'application/octet-stream'}
-        return self._post(endpoint, data=xunit_file_data, headers=headers)
+        return self._post_file(endpoint, xunit_file_data, headers={'Content-Type': 'application/octet-stream'})
     
     def import_excel_test_results(
         self, 
@@ -630,6 +641,196 @@ class TestRuns(PolarionBase):
         endpoint = f"/projects/{project_id}/testruns/{test_run_id}/testparameters"
         return self._post(endpoint, json=test_parameters_data)
     
+    # ========== Job methods ==========
+    
+    def submit_export_excel_tests(
+        self,
+        project_id: str,
+        test_run_id: str,
+        query: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        template: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> JobHandle:
+        """
+        Starts get_export_excel_tests and returns a handle of its job right away.
+        
+        Args:
+            project_id: The Project ID
+            test_run_id: The Test Run ID
+            query: The query string
+            sort_by: The property to sort the test results
+            template: The export template string
+            timeout: Maximum number of seconds to poll the job (default: no limit)
+            
+        Returns:
+            JobHandle with done(), result(timeout) and add_done_callback(fn); the
+            exported workbook is streamed to disk with handle.save_result_file(path)
+            
+        Example:
+            >>> handle = api.test_runs.submit_export_excel_tests("MyProjectId", "MyTestRunId")
+            >>> handle.save_result_file("MyTestRunId.xlsx", timeout=600)
+        """
+        return start_job(self, self.get_export_excel_tests(project_id, test_run_id, query, sort_by, template),
+                         timeout=timeout)
+    
+    def submit_import_x_unit_test_results(
+        self,
+        project_id: str,
+        test_run_id: str,
+        xunit_file_data: Union[bytes, BinaryIO, str, os.PathLike],
+        timeout: Optional[float] = None
+    ) -> JobHandle:
+        """
+        Starts import_x_unit_test_results and returns a handle of its job right away.
+        
+        Args:
+            project_id: The Project ID
+            test_run_id: The Test Run ID
+            xunit_file_data: XUnit File data (binary), path of the XUnit file, or binary file object
+            timeout: Maximum number of seconds to poll the job (default: no limit)
+            
+        Returns:
+            JobHandle with done(), result(timeout) and add_done_callback(fn)
+        """
+        return start_job(self, self.import_x_unit_test_results(project_id, test_run_id, xunit_file_data),
+                         timeout=timeout)
+    
+    def submit_import_excel_test_results(
+        self,
+        project_id: str,
+        test_run_id: str,
+        files: Dict[str, Any],
+        data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> JobHandle:
+        """
+        Starts import_excel_test_results and returns a handle of its job right away.
+        
+        Args:
+            project_id: The Project ID
+            test_run_id: The Test Run ID
+            files: Dictionary containing file(s) to upload (multipart/form-data)
+            data: Optional metadata dictionary
+            timeout: Maximum number of seconds to poll the job (default: no limit)
+            
+        Returns:
+            JobHandle with done(), result(timeout) and add_done_callback(fn)
+        """
+        return start_job(self, self.import_excel_test_results(project_id, test_run_id, files, data),
+                         timeout=timeout)
+    
+    # ========== Bulk methods ==========
+    
+    def bulk_post_test_runs(
+        self,
+        project_id: str,
+        test_runs: Iterable[Dict[str, Any]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        journal: Optional[WriteJournal] = None
+    ) -> BulkResult:
+        """
+        Creates any number of Test Runs in a project.
+        
+        The Test Runs are sent with post_test_runs in chunks of `chunk_size`, up to
+        `max_workers` requests in parallel. With a journal, every Test Run is recorded
+        under its ID (attributes.id) or, without one, a hash of its content. Replaying
+        the same call after a timeout or crash skips the Test Runs already created and
+        checks with get_test_run whether Test Runs with an unknown outcome exist before
+        resending them.
+        
+        Args:
+            project_id: The Project ID
+            test_runs: Iterable of Test Run resources, e.g.
+                       {"type": "testruns", "attributes": {"id": "Run-1", "title": "Nightly"}}.
+                       The 'type' key defaults to "testruns" when missing.
+            chunk_size: Maximum number of Test Runs per request (default: 100)
+            max_workers: Maximum number of requests sent in parallel (default: 4)
+            journal: Optional WriteJournal recording every write and its outcome
+            
+        Returns:
+            BulkResult with one result per input item. Items found in the journal as
+            already created have status 'skipped'.
+            
+        Example:
+            >>> journal = WriteJournal('test_runs.db')
+            >>> runs = [{"attributes": {"id": f"Run-{n}", "title": f"Run {n}"}} for n in range(500)]
+            >>> result = api.bulk_post_test_runs("MyProjectId", runs, journal=journal)
+        """
+        self._ensure_pool_size(max_workers)
+        
+        def request(items):
+            return self.post_test_runs(project_id, {'data': items})
+        
+        items = (item if 'type' in item else {'type': 'testruns', **item} for item in test_runs)
+        validate = self._item_validator('POST', f"projects/{project_id}/testruns")
+        if journal is None:
+            return run_bulk(request, items, created_ids, chunk_size=chunk_size, max_workers=max_workers,
+                            validate=validate)
+        
+        def key_of(item):
+            return item.get('attributes', {}).get('id')
+        
+        def lookup(key, item):
+            test_run_id = key_of(item)
+            if test_run_id is None:
+                return None
+            response = self.get_test_run(project_id, test_run_id, fields={'testruns': 'id'})
+            return f"{project_id}/{test_run_id}" if response.status_code == 200 else None
+        
+        return run_journaled(journal, 'post_test_runs', project_id, request, items, created_ids,
+                             key_of=key_of, lookup=lookup, chunk_size=chunk_size, max_workers=max_workers,
+                             validate=validate)
+    
+    def ingest_x_unit_test_results(
+        self,
+        project_id: str,
+        test_run_id: str,
+        path: Union[str, os.PathLike],
+        shard_size: Optional[int] = None,
+        max_workers: int = DEFAULT_SHARD_WORKERS,
+        test_run_attributes: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        shard_directory: Optional[Union[str, os.PathLike]] = None
+    ) -> XUnitImportResult:
+        """
+        Imports an XUnit report from disk and waits for the import, optionally in parallel shards.
+        
+        Without shard_size the file is streamed into test_run_id. With shard_size it
+        is split into shards of whole test suites of about that many bytes, parsed
+        incrementally so memory use does not depend on the report size. Each shard
+        is imported into its own Test Run '<test_run_id>-0000', '<test_run_id>-0001',
+        ... created with test_run_attributes, up to max_workers uploads in parallel,
+        and all import jobs are then waited for together.
+        
+        Args:
+            project_id: The Project ID
+            test_run_id: The Test Run ID, or prefix of the shard Test Run IDs
+            path: Path of the XUnit report
+            shard_size: Target size of a shard in bytes (default: no sharding)
+            max_workers: Maximum number of shards uploaded in parallel (default: 4)
+            test_run_attributes: Attributes of the created shard Test Runs (e.g. {"title": ..., "type": ...})
+            timeout: Maximum number of seconds to wait for the import jobs (default: no limit)
+            shard_directory: Directory keeping the shard files (default: a temporary directory)
+            
+        Returns:
+            XUnitImportResult with ok, failed, test_run_ids and one ShardImport per Test Run
+            
+        Raises:
+            ValueError: If the report is not valid XML
+            
+        Example:
+            >>> result = api.test_runs.ingest_x_unit_test_results(
+            ...     "MyProjectId", "Nightly-42", "reports/junit.xml", shard_size=50 * 1024 * 1024,
+            ...     test_run_attributes={"title": "Nightly 42"})
+            >>> for failure in result.failed:
+            ...     print(failure.test_run_id, failure.error)
+        """
+        return import_xunit(self, project_id, test_run_id, path, shard_size=shard_size,
+                            max_workers=max_workers, test_run_attributes=test_run_attributes,
+                            timeout=timeout, shard_directory=shard_directory)
+    
     # ========== Helper methods ==========
     
     def _delete_with_body(self, endpoint: str, **kwargs) -> requests.Response:
@@ -643,5 +844,7 @@ class TestRuns(PolarionBase):
         Returns:
             Response object
         """
+        if isinstance(kwargs.get('json'), dict) and self.validate_requests:
+            validate_request('DELETE', endpoint, kwargs['json'])
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        return self._session.request('DELETE', url, **kwargs)
+        return self._send(self._session.request, 'DELETE', url, **kwargs)
@@ -2,9 +2,11 @@
 Test Step Result Attachments module for Polarion REST API.
 Handles all Test Step Result Attachments related endpoints.
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Iterable, Sequence
 import requests
 from .base import PolarionBase
+from .downloads import DownloadResult, Destination, save_stream, DEFAULT_CHUNK_SIZE, DEFAULT_ALGORITHM
+from .multipart import FileSpec, upload_files, DEFAULT_MAX_FILES, DEFAULT_MAX_BYTES
 
 
 class TestStepResultAttachments(PolarionBase):
@@ -20,6 +22,7 @@ class TestStepResultAttachments(PolarionBase):
     - GET methods: Retrieve test step result attachments and content
     - PATCH methods: Update test step result attachments
     - POST methods: Create test step result attachments
+    - Upload methods: Stream files from disk, several per request
     """
     
     # ========== DELETE methods ==========
@@ -173,6 +176,52 @@ class TestStepResultAttachments(PolarionBase):
             params=params if params else None
         )
     
+    def save_test_step_result_attachment_content(self,
+                                                 project_id: str,
+                                                 test_run_id: str,
+                                                 test_case_project_id: str,
+                                                 test_case_id: str,
+                                                 iteration: str,
+                                                 test_step_index: str,
+                                                 attachment_id: str,
+                                                 destination: Destination,
+                                                 revision: Optional[str] = None,
+                                                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                                 algorithm: str = DEFAULT_ALGORITHM) -> DownloadResult:
+        """
+        Downloads the file content for a specified Test Step Result Attachment to a path or file object.
+        
+        Streaming variant of get_test_step_result_attachment_content: the content is written in chunks of
+        chunk_size bytes and hashed on the fly, so memory use does not depend on the
+        file size.
+        
+        Args:
+            project_id: The Project ID
+            test_run_id: The Test Run ID
+            test_case_project_id: The Testcase Project ID
+            test_case_id: The Testcase ID
+            iteration: The Iteration Number
+            test_step_index: The Test Step index
+            attachment_id: The Attachment ID
+            destination: Path of the file to write, or binary file object
+            revision: The revision ID
+            chunk_size: Number of bytes read per chunk (default: 1 MiB)
+            algorithm: hashlib algorithm of the checksum (default: 'sha256')
+            
+        Returns:
+            DownloadResult with the size and checksum of the content
+            
+        Raises:
+            ValueError: If the download failed or was incomplete
+        """
+        params = {}
+        if revision:
+            params['revision'] = revision
+        
+        response = self._get_stream(f'projects/{project_id}/testruns/{test_run_id}/testrecords/{test_case_project_id}/{test_case_id}/{iteration}/teststepresults/{test_step_index}/attachments/{attachment_id}/content',
+                                    params=params if params else None)
+        return save_stream(response, destination, chunk_size=chunk_size, algorithm=algorithm)
+    
     def get_test_step_result_attachments(self,
                                         project_id: str,
                                         test_run_id: str,
@@ -308,3 +357,49 @@ class TestStepResultAttachments(PolarionBase):
             files=files,
             data=data
         )
+    
+    # ========== Upload methods ==========
+    
+    def upload_test_step_result_attachments(self,
+                                            project_id: str,
+                                            test_run_id: str,
+                                            test_case_project_id: str,
+                                            test_case_id: str,
+                                            iteration: str,
+                                            test_step_index: str,
+                                            files: Iterable[FileSpec],
+                                            titles: Optional[Sequence[Optional[str]]] = None,
+                                            max_files: int = DEFAULT_MAX_FILES,
+                                            max_bytes: int = DEFAULT_MAX_BYTES,
+                                            chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[requests.Response]:
+        """
+        Uploads files as Test Step Result Attachments, streaming them from disk.
+        
+        Several files are sent per request (up to max_files and max_bytes) in a streamed
+        multipart/form-data body, so memory use does not depend on the file sizes.
+        
+        Args:
+            project_id: The Project ID
+            test_run_id: The Test Run ID
+            test_case_project_id: The Testcase Project ID
+            test_case_id: The Testcase ID
+            iteration: The Iteration Number
+            test_step_index: The Test Step index
+            files: Paths, named binary file objects or (filename, source[, content_type]) tuples,
+                   where source is a path, bytes, a file object or an iterator of bytes
+            titles: Optional attachment titles matched with the files by order
+            max_files: Maximum number of files per request (default: 20)
+            max_bytes: Maximum total size of the files of a request (default: 1 GiB)
+            chunk_size: Number of bytes read from the files per chunk (default: 1 MiB)
+        
+        Returns:
+            List of Response objects (201 Created), one per request. Uploading stops
+            at the first failed request.
+        
+        Example:
+            responses = api.test_step_result_attachments.upload_test_step_result_attachments(
+                "MyProject", "RUN-1", "MyProject", "TC-1", "0", "1", ["/shots/step1.png"])
+        """
+        return upload_files(self, f'projects/{project_id}/testruns/{test_run_id}/testrecords/{test_case_project_id}/{test_case_id}/{iteration}/teststepresults/{test_step_index}/attachments',
+                            'teststepresult_attachments', files, titles=titles, max_files=max_files,
+                            max_bytes=max_bytes, chunk_size=chunk_size)
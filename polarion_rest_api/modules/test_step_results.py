@@ -2,9 +2,16 @@
 Test Step Results module for Polarion REST API.
 Handles all Test Step Results related endpoints.
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Mapping, Sequence, Tuple, Union
 import requests
 from .base import PolarionBase
+from .bulk import (BulkResult, Chunk, run_chunks, send_chunk, reject_invalid, not_sent, created_ids, updated_ids,
+                   DEFAULT_MAX_WORKERS, DEFAULT_BACKOFF, RETRY_STATUS_CODES, UNPROCESSED_STATUS_CODES)
+
+# Test Record reference: "TestcaseProjectId/TestcaseId/Iteration", a full Test Record ID
+# "ProjectId/TestRunId/TestcaseProjectId/TestcaseId/Iteration" or a
+# (test_case_project_id, test_case_id, iteration) tuple
+TestRecordKey = Union[str, Tuple[str, str, Union[str, int]]]
 
 
 class TestStepResults(PolarionBase):
@@ -19,6 +26,7 @@ class TestStepResults(PolarionBase):
     - GET methods: Retrieve test step results
     - PATCH methods: Update test step results
     - POST methods: Create test step results
+    - Bulk methods: Concurrent upload of test step results of many test records
     """
     
     # ========== GET methods ==========
@@ -222,3 +230,128 @@ class TestStepResults(PolarionBase):
             f'projects/{project_id}/testruns/{test_run_id}/testrecords/{test_case_project_id}/{test_case_id}/{iteration}/teststepresults',
             json=test_step_results_data
         )
+    
+    # ========== Bulk methods ==========
+    
+    def bulk_post_test_step_results(self,
+                                    project_id: str,
+                                    test_run_id: str,
+                                    step_results: Union[Mapping[TestRecordKey, Sequence[Dict[str, Any]]],
+                                                        Iterable[Tuple[TestRecordKey, Sequence[Dict[str, Any]]]]],
+                                    max_workers: int = DEFAULT_MAX_WORKERS,
+                                    retries: int = 3,
+                                    backoff: float = DEFAULT_BACKOFF) -> BulkResult:
+        """
+        Uploads the Test Step Results of many Test Records concurrently.
+        
+        The Test Step Results of every Test Record are sent in one post_test_step_results
+        call, up to `max_workers` calls in parallel. Step results carrying an 'id'
+        (ProjectId/TestRunId/TestcaseProjectId/TestcaseId/Iteration/TestStepIndex) are
+        updates of existing results and are batched into one patch_test_step_results
+        call per Test Record instead. Failed requests are retried with jittered
+        exponential backoff: updates after connection errors and transient statuses
+        (429, 502, 503, 504), creates only when the server cannot have created the
+        results yet (429, 503, or a connection error before the request was sent),
+        so a retry never duplicates step results.
+        
+        Args:
+            project_id: The Project ID
+            test_run_id: The Test Run ID
+            step_results: Mapping (or iterable of pairs) of Test Record to its list of
+                          Test Step Result resources, e.g.
+                          {("MyProjectId", "MyTestcaseId", 0): [{"type": "teststep_results", "attributes": {"result": "passed"}}]}.
+                          A Test Record is given as a (test_case_project_id, test_case_id, iteration)
+                          tuple, as "TestcaseProjectId/TestcaseId/Iteration" or as a full Test Record ID.
+            max_workers: Maximum number of requests sent in parallel (default: 4)
+            retries: Number of retries of transient failures per request (default: 3)
+            backoff: Base delay in seconds between retries (default: 0.5)
+            
+        Returns:
+            BulkResult with one result per Test Step Result, indexed in input order
+            (Test Records in iteration order, then step results in list order)
+            
+        Raises:
+            ValueError: If a Test Record reference cannot be parsed
+            
+        Example:
+            >>> results = {
+            ...     ("MyProjectId", "TC-1", 0): [{"attributes": {"result": "passed"}}, {"attributes": {"result": "failed"}}],
+            ...     "MyProjectId/TC-2/0": [{"attributes": {"result": "passed"}}],
+            ... }
+            >>> report = api.bulk_post_test_step_results("MyProjectId", "MyTestRunId", results, max_workers=8)
+        """
+        self._ensure_pool_size(max_workers)
+        result = BulkResult()
+        pairs = step_results.items() if isinstance(step_results, Mapping) else step_results
+        # Test Record of every chunk, keyed by the input index of its first item
+        chunk_records: Dict[int, Tuple[str, str, str]] = {}
+        # Validators of created and updated step results (the endpoint template only has placeholders)
+        endpoint = f"projects/{project_id}/testruns/{test_run_id}/testrecords/_/_/0/teststepresults"
+        validators = {False: self._item_validator('POST', endpoint), True: self._item_validator('PATCH', endpoint)}
+        
+        def send(chunk: Chunk) -> List:
+            test_case_project_id, test_case_id, iteration = chunk_records.pop(chunk[0][0])
+            is_update = 'id' in chunk[0][1]
+            
+            def request(items):
+                body = {'data': items}
+                if is_update:
+                    return self.patch_test_step_results(project_id, test_run_id, test_case_project_id,
+                                                        test_case_id, iteration, body)
+                return self.post_test_step_results(project_id, test_run_id, test_case_project_id,
+                                                   test_case_id, iteration, body)
+            
+            on_success = updated_ids if is_update else created_ids
+            rejected, chunk = reject_invalid(chunk, validators[is_update])
+            if not chunk:
+                return rejected
+            if is_update:
+                retry_status_codes, retry_error = RETRY_STATUS_CODES, None
+            else:
+                retry_status_codes, retry_error = UNPROCESSED_STATUS_CODES, not_sent
+            return rejected + send_chunk(request, chunk, on_success, result, split_status_codes=(),
+                                         retries=retries, backoff=backoff,
+                                         retry_status_codes=retry_status_codes, retry_error=retry_error)
+        
+        def chunks() -> Iterator[Chunk]:
+            index = 0
+            for key, record_results in pairs:
+                record = self._parse_test_record_key(key)
+                creates, updates = [], []
+                for step_result in record_results:
+                    if 'type' not in step_result:
+                        step_result = {'type': 'teststep_results', **step_result}
+                    (updates if 'id' in step_result else creates).append((index, step_result))
+                    index += 1
+                for chunk in (creates, updates):
+                    if chunk:
+                        chunk_records[chunk[0][0]] = record
+                        yield chunk
+        
+        return run_chunks(send, chunks(), max_workers, result)
+    
+    # ========== Helper methods ==========
+    
+    @staticmethod
+    def _parse_test_record_key(key: TestRecordKey) -> Tuple[str, str, str]:
+        """
+        Parse a Test Record reference into its Test Case project, Test Case and iteration.
+        
+        Args:
+            key: Tuple, "TestcaseProjectId/TestcaseId/Iteration" or full Test Record ID
+            
+        Returns:
+            Tuple (test_case_project_id, test_case_id, iteration)
+            
+        Raises:
+            ValueError: If the reference cannot be parsed
+        """
+        parts = list(key) if isinstance(key, (tuple, list)) else str(key).split('/')
+        if len(parts) == 5:
+            parts = parts[2:]
+        if len(parts) != 3:
+            raise ValueError(
+                f"Invalid Test Record reference {key!r}. Expected (test_case_project_id, test_case_id, iteration), "
+                f"'TestcaseProjectId/TestcaseId/Iteration' or 'ProjectId/TestRunId/TestcaseProjectId/TestcaseId/Iteration'"
+            )
+        return str(parts[0]), str(parts[1]), str(parts[2])
@@ -0,0 +1,409 @@
+"""
+Unit of work module for Polarion REST API.
+Buffers small mutations and flushes them as list requests (write-behind).
+"""
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Optional, Dict, Any, List, Tuple
+from .bulk import (BulkItemResult, BulkResult, send_chunk, reject_invalid, created_ids, updated_ids,
+                   DEFAULT_CHUNK_SIZE, DEFAULT_MAX_WORKERS)
+from .scheduler import run_in_context
+
+
+# Operations that can be queued: operation name -> (module attribute, list method,
+# flush phase, JSON:API type, success handler, coalesce updates of the same resource).
+# Phases are flushed in order, so work items and test records are created before
+# they are updated, and updated before links and comments are added to them.
+OPERATIONS = {
+    'post_work_items': ('work_items', 'post_work_items', 0, 'workitems', created_ids, False),
+    'patch_work_items': ('work_items', 'patch_work_items', 1, 'workitems', updated_ids, True),
+    'post_test_records': ('test_records', 'post_test_records', 0, 'testrecords', created_ids, False),
+    'patch_test_records': ('test_records', 'patch_test_records', 1, 'testrecords', updated_ids, True),
+    'post_linked_work_items': ('linked_work_items', 'post_linked_work_items', 2, 'linkedworkitems',
+                               created_ids, False),
+    'post_comments': ('work_item_comments', 'post_comments', 2, 'workitem_comments', created_ids, False),
+    'post_test_run_comments': ('test_run_comments', 'post_test_run_comments', 2, 'testrun_comments',
+                               created_ids, False),
+}
+
+# Endpoint of the list method of every operation, formatted with its positional arguments
+# to find the request schema the queued items are validated against
+ENDPOINTS = {
+    'post_work_items': 'projects/{}/workitems',
+    'patch_work_items': 'projects/{}/workitems',
+    'patch_test_records': 'projects/{}/testruns/{}/testrecords',
+    'post_linked_work_items': 'projects/{}/workitems/{}/linkedworkitems',
+    'post_comments': 'projects/{}/workitems/{}/comments',
+    'post_test_run_comments': 'projects/{}/testruns/{}/comments',
+    'post_test_records': 'projects/{}/testruns/{}/testrecords',
+}
+
+
+class _Entry:
+    """
+    Queued resource with the futures waiting for its result.
+    """
+
+    __slots__ = ('item', 'futures')
+
+    def __init__(self, item: Dict[str, Any], future: Future):
+        self.item = item
+        self.futures = [future]
+
+
+class UnitOfWork:
+    """
+    Write-behind buffer that batches mutations into list requests.
+
+    Mutations are queued per endpoint and return a Future right away. Queued
+    mutations are flushed as list requests (post_work_items, patch_work_items,
+    post_linked_work_items, post_comments, ...) when an endpoint buffer reaches
+    `max_batch_size` items or when the oldest queued mutation is `max_delay`
+    seconds old. Updates of the same resource queued before a flush are merged
+    into one payload.
+
+    Every flush sends the buffers phase by phase: work items are created first,
+    then updates are sent, then links, comments and test records. Positional
+    arguments such as work_item_id may be the Future returned by post_work_item,
+    so links and comments can be queued for work items that are not created yet.
+
+    Futures resolve to a BulkItemResult (check `.ok`, `.id` and `.error`).
+
+    Example:
+        >>> with api.unit_of_work(max_batch_size=100, max_delay=2.0) as uow:
+        ...     created = uow.post_work_item("MyProjectId", {"attributes": {"type": "task", "title": "New"}})
+        ...     uow.patch_work_item("MyProjectId", "WI-1", attributes={"status": "done"})
+        ...     uow.post_comment("MyProjectId", created, {"attributes": {"text": {"type": "text/plain", "value": "Hi"}}})
+        >>> created.result().id
+        'MyProjectId/WI-2'
+    """
+
+    def __init__(self, api: Any,
+                 max_batch_size: int = DEFAULT_CHUNK_SIZE,
+                 max_delay: float = 1.0,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 max_pending: Optional[int] = None):
+        """
+        Initialize the unit of work and start its background flusher.
+
+        Args:
+            api: PolarionRestApi instance (anything exposing the API modules as attributes)
+            max_batch_size: Items per list request; a buffer reaching it triggers a flush (default: 100)
+            max_delay: Maximum age in seconds of a queued mutation before it is flushed (default: 1.0)
+            max_workers: Maximum number of list requests sent in parallel (default: 4)
+            max_pending: Maximum number of queued mutations; queueing blocks while it is
+                         reached (default: 10 * max_batch_size). Mutations chained on
+                         created Work Items are queued without waiting.
+
+        Raises:
+            ValueError: If max_batch_size or max_workers is lower than 1
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self._api = api
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.max_workers = max_workers
+        self.max_pending = max_pending if max_pending is not None else 10 * max_batch_size
+        self.flushes = 0
+        self.requests_sent = 0
+
+        # (operation, args) -> {resource key: _Entry}
+        self._buffers: Dict[Tuple[str, Tuple[Any, ...]], Dict[Any, _Entry]] = {}
+        self._pending = 0
+        self._oldest: Optional[float] = None
+        self._closed = False
+        self._stopping = False
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._flush_requested = False
+        # Set on threads queueing dependent mutations from a completion callback
+        self._chaining = threading.local()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._flusher = threading.Thread(target=self._run_flusher, name='polarion-unit-of-work', daemon=True)
+        self._flusher.start()
+
+    # ========== Queueing methods ==========
+
+    def add(self, operation: str, *args: Any, item: Dict[str, Any]) -> Future:
+        """
+        Queue a mutation for a list endpoint.
+
+        Args:
+            operation: Name of the list method, one of OPERATIONS
+                       (e.g. 'post_work_items', 'patch_work_items', 'post_comments')
+            *args: Positional arguments of the list method before the body
+                   (e.g. project_id, work_item_id). Futures returned by an earlier
+                   post_work_items operation are replaced by the created Work Item ID.
+            item: Resource to add to the list body ('type' defaults to the endpoint type)
+
+        Returns:
+            Future resolving to the BulkItemResult of the mutation
+
+        Raises:
+            ValueError: If the operation is unknown, or an update has no 'id'
+            RuntimeError: If the unit of work is closed
+        """
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unknown operation {operation!r}. Expected one of: {', '.join(sorted(OPERATIONS))}")
+        _, _, _, resource_type, _, coalesce = OPERATIONS[operation]
+        if 'type' not in item:
+            item = {'type': resource_type, **item}
+        if coalesce and 'id' not in item:
+            raise ValueError(f"{operation} items must contain an 'id' key")
+
+        future: Future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Unit of work is closed")
+            # Chained mutations are queued while a flush is running, which waiting would block
+            while self._pending >= self.max_pending and not getattr(self._chaining, 'active', False):
+                self._flush_requested = True
+                self._condition.notify_all()
+                self._condition.wait()
+                if self._closed:
+                    raise RuntimeError("Unit of work is closed")
+            buffer = self._buffers.setdefault((operation, args), {})
+            entry = buffer.get(item['id']) if coalesce else None
+            if entry is None:
+                buffer[item['id'] if coalesce else len(buffer)] = _Entry(item, future)
+                self._pending += 1
+            else:
+                entry.item = self._merge(entry.item, item)
+                entry.futures.append(future)
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            if len(buffer) >= self.max_batch_size:
+                self._flush_requested = True
+            self._condition.notify_all()
+        return future
+
+    def post_work_item(self, project_id: str, work_item: Dict[str, Any]) -> Future:
+        """
+        Queue the creation of a Work Item.
+
+        Args:
+            project_id: The Project ID
+            work_item: The Work Item resource
+
+        Returns:
+            Future resolving to the BulkItemResult (its id is the created Work Item ID)
+        """
+        return self.add('post_work_items', project_id, item=work_item)
+
+    def patch_work_item(self, project_id: str, work_item_id: Any,
+                        attributes: Optional[Dict[str, Any]] = None,
+                        relationships: Optional[Dict[str, Any]] = None) -> Future:
+        """
+        Queue an update of a Work Item. Updates of the same Work Item are merged.
+
+        Args:
+            project_id: The Project ID
+            work_item_id: The Work Item ID (short ID, or a Future of post_work_item)
+            attributes: Attributes to update
+            relationships: Relationships to update
+
+        Returns:
+            Future resolving to the BulkItemResult
+        """
+        if isinstance(work_item_id, Future):
+            # The full ID is only known once the Work Item is created
+            return self._after(work_item_id, lambda wid: self.patch_work_item(project_id, wid, attributes,
+                                                                              relationships))
+        item: Dict[str, Any] = {'id': f"{project_id}/{work_item_id}"}
+        if attributes:
+            item['attributes'] = attributes
+        if relationships:
+            item['relationships'] = relationships
+        return self.add('patch_work_items', project_id, item=item)
+
+    def post_linked_work_item(self, project_id: str, work_item_id: Any, link: Dict[str, Any]) -> Future:
+        """
+        Queue the creation of a Linked Work Item.
+
+        Args:
+            project_id: The Project ID
+            work_item_id: The source Work Item ID (short ID, or a Future of post_work_item)
+            link: The Linked Work Item resource
+
+        Returns:
+            Future resolving to the BulkItemResult
+        """
+        return self.add('post_linked_work_items', project_id, work_item_id, item=link)
+
+    def post_comment(self, project_id: str, work_item_id: Any, comment: Dict[str, Any]) -> Future:
+        """
+        Queue the creation of a Work Item Comment.
+
+        Args:
+            project_id: The Project ID
+            work_item_id: The Work Item ID (short ID, or a Future of post_work_item)
+            comment: The Comment resource
+
+        Returns:
+            Future resolving to the BulkItemResult
+        """
+        return self.add('post_comments', project_id, work_item_id, item=comment)
+
+    # ========== Flushing methods ==========
+
+    def flush(self):
+        """
+        Send every queued mutation now and wait until all of them are resolved.
+        """
+        with self._flush_lock:
+            with self._condition:
+                buffers = self._buffers
+                self._buffers = {}
+                self._pending = 0
+                self._oldest = None
+                self._flush_requested = False
+                self._condition.notify_all()
+            if buffers:
+                self._send(buffers)
+
+    def close(self):
+        """
+        Flush the queued mutations and stop the background flusher.
+        """
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        self._flusher.join()
+        # Mutations chained on created Work Items are queued while flushing
+        self.flush()
+        while self._buffers:
+            self.flush()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._executor.shutdown()
+
+    def __enter__(self):
+        """
+        Context manager entry.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Context manager exit - flushes the queued mutations and stops the flusher.
+        """
+        self.close()
+
+    # ========== Helper methods ==========
+
+    def _run_flusher(self):
+        """
+        Background loop flushing when a size or time threshold is reached.
+        """
+        while True:
+            with self._condition:
+                while not self._stopping and not self._flush_requested and not self._expired():
+                    timeout = None
+                    if self._oldest is not None:
+                        timeout = max(0.0, self._oldest + self.max_delay - time.monotonic())
+                    self._condition.wait(timeout)
+                if self._stopping:
+                    return
+            self.flush()
+
+    def _expired(self) -> bool:
+        """
+        True when the oldest queued mutation reached max_delay.
+        """
+        return self._oldest is not None and time.monotonic() - self._oldest >= self.max_delay
+
+    def _after(self, dependency: Future, queue) -> Future:
+        """
+        Queue an operation once the Work Item of `dependency` is created.
+        """
+        future: Future = Future()
+
+        def chain(done: Future):
+            created = done.result()
+            if not created.ok:
+                future.set_result(BulkItemResult(0, 'failed', error=f"Dependency failed: {created.error}"))
+                return
+            self._chaining.active = True
+            try:
+                queued = queue(created.id.split('/')[-1])
+            except Exception as e:
+                future.set_result(BulkItemResult(0, 'failed', error=str(e)))
+                return
+            finally:
+                self._chaining.active = False
+            queued.add_done_callback(lambda queued_done: future.set_result(queued_done.result()))
+
+        dependency.add_done_callback(chain)
+        return future
+
+    @staticmethod
+    def _merge(current: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Merge an update into a queued update of the same resource.
+        """
+        merged = dict(current)
+        for key in ('attributes', 'relationships'):
+            if update.get(key):
+                merged[key] = {**current.get(key, {}), **update[key]}
+        return merged
+
+    @staticmethod
+    def _resolve(arg: Any) -> Any:
+        """
+        Replace a Future of a created Work Item by its short Work Item ID.
+
+        Raises:
+            RuntimeError: If the Work Item could not be created
+        """
+        if not isinstance(arg, Future):
+            return arg
+        created = arg.result()
+        if not created.ok:
+            raise RuntimeError(f"Dependency failed: {created.error}")
+        return created.id.split('/')[-1]
+
+    def _send(self, buffers: Dict[Tuple[str, Tuple[Any, ...]], Dict[Any, _Entry]]):
+        """
+        Send the buffers phase by phase and resolve their futures.
+        """
+        phases: Dict[int, List[Tuple[str, Tuple[Any, ...], List[_Entry]]]] = {}
+        for (operation, args), entries in buffers.items():
+            phases.setdefault(OPERATIONS[operation][2], []).append((operation, args, list(entries.values())))
+
+        self.flushes += 1
+        for phase in sorted(phases):
+            futures = []
+            for operation, args, entries in phases[phase]:
+                for start in range(0, len(entries), self.max_batch_size):
+                    batch = entries[start:start + self.max_batch_size]
+                    futures.append(self._executor.submit(run_in_context(self._send_batch), operation, args, batch))
+            wait(futures)
+
+    def _send_batch(self, operation: str, args: Tuple[Any, ...], entries: List[_Entry]):
+        """
+        Send one list request and resolve the futures of its entries. With request
+        validation enabled, invalid entries fail on their own and are not sent.
+        """
+        module_name, method_name, _, _, on_success, _ = OPERATIONS[operation]
+        result = BulkResult()
+        try:
+            resolved = tuple(self._resolve(arg) for arg in args)
+            module = getattr(self._api, module_name)
+            method = getattr(module, method_name)
+            validate = module._item_validator(method_name.split('_', 1)[0].upper(),
+                                              ENDPOINTS[operation].format(*resolved))
+            results, chunk = reject_invalid(list(enumerate(entry.item for entry in entries)), validate)
+            if chunk:
+                results += send_chunk(lambda items: method(*resolved, {'data': items}), chunk, on_success, result)
+        except Exception as e:
+            results = [BulkItemResult(index, 'failed', error=str(e)) for index in range(len(entries))]
+        with self._condition:
+            self.requests_sent += result.requests_sent
+        for item_result in results:
+            for future in entries[item_result.index].futures:
+                future.set_result(item_result)
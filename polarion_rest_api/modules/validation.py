@@ -0,0 +1,293 @@
+"""
+Request validation module for Polarion REST API.
+Validates JSON request bodies against the request schemas of the OpenAPI
+specification (request_schemas.py) before they are sent. Every schema is compiled
+once into nested checker functions and cached, so bulk methods can validate each
+item on its own and report invalid items without sending them.
+"""
+import functools
+import re
+from typing import Optional, Dict, Any, Callable, List, Tuple
+from .request_schemas import REQUEST_BODIES, SCHEMAS
+
+
+# A checker appends (path, message) for every error of a value at a path
+Errors = List[Tuple[str, str]]
+Checker = Callable[[Any, str, Errors], None]
+
+JSON_TYPES = {
+    'object': dict,
+    'array': list,
+    'string': str,
+    'integer': int,
+    'number': (int, float),
+    'boolean': bool,
+}
+
+FORMATS = {
+    'date': re.compile(r'\d{4}-\d{2}-\d{2}$'),
+    'date-time': re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?$'),
+}
+
+# Number of errors shown in the message of a ValidationError
+MESSAGE_ERRORS = 5
+
+
+class ValidationError(ValueError):
+    """
+    Raised when a request body does not match its request schema.
+
+    Attributes:
+        errors: (path, message) of every error, e.g. ('data[3].attributes.title', 'expected string, got int')
+    """
+
+    def __init__(self, errors: Errors, schema: Optional[str] = None):
+        self.errors = errors
+        self.schema = schema
+        shown = '; '.join(format_error(path, message) for path, message in errors[:MESSAGE_ERRORS])
+        more = f" (and {len(errors) - MESSAGE_ERRORS} more)" if len(errors) > MESSAGE_ERRORS else ''
+        super().__init__(f"Invalid request body{f' ({schema})' if schema else ''}: {shown}{more}")
+
+
+def format_error(path: str, message: str) -> str:
+    return f"{path}: {message}" if path else message
+
+
+def _join(path: str, name: str) -> str:
+    return f"{path}.{name}" if path else name
+
+
+def _type_name(value: Any) -> str:
+    return 'null' if value is None else type(value).__name__
+
+
+def compile_schema(schema: Dict[str, Any]) -> Checker:
+    """
+    Compile a request schema into a checker function.
+
+    Supported keywords: type, nullable, enum, format (date, date-time), required,
+    properties, items, minItems, maxItems, oneOf/anyOf (any alternative), allOf
+    and $ref to other request schemas. Properties that are not in the schema (e.g.
+    custom fields) are accepted.
+
+    Args:
+        schema: Schema as found in request_schemas.SCHEMAS
+
+    Returns:
+        Function check(value, path, errors) appending the errors of value to errors
+    """
+    checks: List[Checker] = []
+
+    if '$ref' in schema:
+        name = schema['$ref']
+        # Resolved on first use, so recursive schemas compile
+        checks.append(lambda value, path, errors: schema_checker(name)(value, path, errors))
+
+    for keyword in ('oneOf', 'anyOf'):
+        if keyword in schema:
+            alternatives = [compile_schema(alternative) for alternative in schema[keyword]]
+
+            def any_of(value, path, errors, alternatives=alternatives):
+                for alternative in alternatives:
+                    found: Errors = []
+                    alternative(value, path, found)
+                    if not found:
+                        return
+                errors.append((path, 'does not match any of the allowed schemas'))
+            checks.append(any_of)
+    checks += [compile_schema(part) for part in schema.get('allOf', [])]
+
+    expected = JSON_TYPES.get(schema.get('type'))
+    if expected is not None:
+        type_name = schema['type']
+        nullable = schema.get('nullable', False)
+        numeric = type_name in ('integer', 'number')
+
+        def check_type(value, path, errors):
+            if value is None and nullable:
+                return True
+            if not isinstance(value, expected) or (numeric and isinstance(value, bool)):
+                errors.append((path, f"expected {type_name}, got {_type_name(value)}"))
+                return True
+            return False
+    else:
+        def check_type(value, path, errors):
+            return value is None
+
+    enum = frozenset(schema['enum']) if 'enum' in schema else None
+    pattern = FORMATS.get(schema.get('format'))
+    required = tuple(schema.get('required', ()))
+    properties = [(name, compile_schema(property_schema))
+                  for name, property_schema in schema.get('properties', {}).items()]
+    items = compile_schema(schema['items']) if 'items' in schema else None
+    min_items = schema.get('minItems')
+    max_items = schema.get('maxItems')
+
+    def check(value, path, errors):
+        for sub_check in checks:
+            sub_check(value, path, errors)
+        if check_type(value, path, errors):
+            return
+        if enum is not None and value not in enum:
+            errors.append((path, f"{value!r} is not one of {sorted(enum)}"))
+        if pattern is not None and isinstance(value, str) and not pattern.match(value):
+            errors.append((path, f"{value!r} is not a valid {schema['format']}"))
+        if isinstance(value, dict):
+            for name in required:
+                if name not in value:
+                    errors.append((path, f"missing required property '{name}'"))
+            for name, property_check in properties:
+                if name in value:
+                    property_check(value[name], _join(path, name), errors)
+        elif isinstance(value, list):
+            if min_items is not None and len(value) < min_items:
+                errors.append((path, f"expected at least {min_items} items, got {len(value)}"))
+            if max_items is not None and len(value) > max_items:
+                errors.append((path, f"expected at most {max_items} items, got {len(value)}"))
+            if items is not None:
+                for index, item in enumerate(value):
+                    items(item, f"{path}[{index}]", errors)
+
+    return check
+
+
+@functools.lru_cache(maxsize=None)
+def schema_checker(name: str) -> Checker:
+    """
+    Compiled checker of a request schema, compiled on first use and cached.
+
+    Raises:
+        KeyError: If the schema is unknown
+    """
+    return compile_schema(SCHEMAS[name])
+
+
+class RequestValidator:
+    """
+    Validator of the request bodies of one schema.
+
+    Attributes:
+        schema: Name of the request schema (e.g. 'workitemsListPostRequest')
+    """
+
+    __slots__ = ('schema', '_check', '_item_check')
+
+    def __init__(self, schema: str):
+        self.schema = schema
+        self._check = schema_checker(schema)
+        data = SCHEMAS[schema].get('properties', {}).get('data', {})
+        self._item_check = compile_schema(data['items']) if data.get('type') == 'array' and 'items' in data else None
+
+    def errors(self, body: Any) -> Errors:
+        """
+        (path, message) of every error of a request body, empty when it is valid.
+        """
+        errors: Errors = []
+        self._check(body, '', errors)
+        return errors
+
+    def validate(self, body: Any):
+        """
+        Raises:
+            ValidationError: If the request body is invalid
+        """
+        errors = self.errors(body)
+        if errors:
+            raise ValidationError(errors, self.schema)
+
+    @property
+    def validates_items(self) -> bool:
+        """True for list request bodies ({'data': [...]}), whose items can be validated one by one"""
+        return self._item_check is not None
+
+    def item_errors(self, item: Any) -> Errors:
+        """
+        Errors of one item of the 'data' array of a list request body, with paths relative to the item.
+        """
+        errors: Errors = []
+        if self._item_check is not None:
+            self._item_check(item, '', errors)
+        return errors
+
+    def __repr__(self) -> str:
+        return f"RequestValidator(schema={self.schema!r})"
+
+
+def _template_pattern(template: str) -> 're.Pattern':
+    parts = re.split(r'(\{[^}]+\})', template)
+    return re.compile(''.join('[^/]+' if part.startswith('{') else re.escape(part) for part in parts) + '$')
+
+
+@functools.lru_cache(maxsize=1)
+def _routes() -> Dict[str, List[Tuple['re.Pattern', str]]]:
+    routes: Dict[str, List[Tuple[int, 're.Pattern', str]]] = {}
+    for method, template, schema in REQUEST_BODIES:
+        literal_length = len(re.sub(r'\{[^}]+\}', '', template))
+        routes.setdefault(method, []).append((literal_length, _template_pattern(template), schema))
+    # Templates with more literal text win, e.g. '.../actions/branch' over '.../{documentName}'
+    return {method: [(pattern, schema) for _, pattern, schema in sorted(entries, key=lambda entry: -entry[0])]
+            for method, entries in routes.items()}
+
+
+@functools.lru_cache(maxsize=1024)
+def request_validator(method: str, endpoint: str) -> Optional[RequestValidator]:
+    """
+    Validator of the request bodies of an endpoint, cached per (method, endpoint).
+
+    Args:
+        method: HTTP method ('POST', 'PATCH', 'DELETE')
+        endpoint: Endpoint as passed to PolarionBase._post (e.g. 'projects/MyProjectId/workitems')
+
+    Returns:
+        RequestValidator, None for endpoints without a JSON request schema
+    """
+    path = endpoint.split('?', 1)[0].strip('/')
+    for pattern, schema in _routes().get(method.upper(), []):
+        if pattern.match(path):
+            return _validator(schema)
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _validator(schema: str) -> RequestValidator:
+    return RequestValidator(schema)
+
+
+def validate_request(method: str, endpoint: str, body: Any):
+    """
+    Validate the JSON body of a request to an endpoint.
+
+    Raises:
+        ValidationError: If the body does not match the request schema of the endpoint
+    """
+    validator = request_validator(method, endpoint)
+    if validator is not None:
+        validator.validate(body)
+
+
+def delete_item_errors(item: Any) -> List[str]:
+    """
+    Error messages of one resource of a DELETE list request body, checked against the
+    delete schema of its JSON:API type (e.g. 'workitemsListDeleteRequest'). Resources
+    of types without a delete schema are not checked.
+    """
+    schema = f"{item.get('type')}ListDeleteRequest" if isinstance(item, dict) else None
+    if schema not in SCHEMAS:
+        return []
+    return [format_error(path, message) for path, message in _validator(schema).item_errors(item)]
+
+
+def item_validator(method: str, endpoint: str) -> Optional[Callable[[Any], List[str]]]:
+    """
+    Function returning the error messages of one item of a list request body, for bulk methods.
+
+    Returns:
+        None for endpoints without a list request schema
+    """
+    validator = request_validator(method, endpoint)
+    if validator is None or not validator.validates_items:
+        return None
+
+    def validate(item: Any) -> List[str]:
+        return [format_error(path, message) for path, message in validator.item_errors(item)]
+    return validate
@@ -2,9 +2,11 @@
 Work Item Attachments module for Polarion REST API.
 Handles all Work Item Attachments related endpoints.
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Iterable, Sequence
 import requests
 from .base import PolarionBase
+from .downloads import DownloadResult, Destination, save_stream, DEFAULT_CHUNK_SIZE, DEFAULT_ALGORITHM
+from .multipart import FileSpec, upload_files, DEFAULT_MAX_FILES, DEFAULT_MAX_BYTES
 
 
 class WorkItemAttachments(PolarionBase):
@@ -17,6 +19,7 @@ class WorkItemAttachments(PolarionBase):
     - GET methods: Retrieve attachments and related data
     - PATCH methods: Update attachments
     - POST methods: Create attachments
+    - Upload methods: Stream files from disk, several per request
     """
     
     # ========== DELETE methods ==========
@@ -161,6 +164,44 @@ class WorkItemAttachments(PolarionBase):
         return self._get(f'projects/{project_id}/workitems/{work_item_id}/attachments/{attachment_id}/content', 
                         params=params)
     
+    def save_work_item_attachment_content(self,
+                                          project_id: str,
+                                          work_item_id: str,
+                                          attachment_id: str,
+                                          destination: Destination,
+                                          revision: Optional[str] = None,
+                                          chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                          algorithm: str = DEFAULT_ALGORITHM) -> DownloadResult:
+        """
+        Downloads the file content for a specified Work Item Attachment to a path or file object.
+        
+        Streaming variant of get_work_item_attachment_content: the content is written in chunks of
+        chunk_size bytes and hashed on the fly, so memory use does not depend on the
+        file size.
+        
+        Args:
+            project_id: The Project ID
+            work_item_id: The Work Item ID
+            attachment_id: The Attachment ID
+            destination: Path of the file to write, or binary file object
+            revision: The revision ID
+            chunk_size: Number of bytes read per chunk (default: 1 MiB)
+            algorithm: hashlib algorithm of the checksum (default: 'sha256')
+            
+        Returns:
+            DownloadResult with the size and checksum of the content
+            
+        Raises:
+            ValueError: If the download failed or was incomplete
+        """
+        params = {}
+        if revision:
+            params['revision'] = revision
+        
+        response = self._get_stream(f'projects/{project_id}/workitems/{work_item_id}/attachments/{attachment_id}/content',
+                                    params=params if params else None)
+        return save_stream(response, destination, chunk_size=chunk_size, algorithm=algorithm)
+    
     # ========== PATCH methods ==========
     
     def patch_work_item_attachment(self,
@@ -207,3 +248,41 @@ class WorkItemAttachments(PolarionBase):
         """
         return self._post(f'projects/{project_id}/workitems/{work_item_id}/attachments', 
                          json=attachments_data)
+    
+    # ========== Upload methods ==========
+    
+    def upload_work_item_attachments(self,
+                                     project_id: str,
+                                     work_item_id: str,
+                                     files: Iterable[FileSpec],
+                                     titles: Optional[Sequence[Optional[str]]] = None,
+                                     max_files: int = DEFAULT_MAX_FILES,
+                                     max_bytes: int = DEFAULT_MAX_BYTES,
+                                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[requests.Response]:
+        """
+        Uploads files as Work Item Attachments, streaming them from disk.
+        
+        Several files are sent per request (up to max_files and max_bytes) in a streamed
+        multipart/form-data body, so memory use does not depend on the file sizes.
+        
+        Args:
+            project_id: The Project ID
+            work_item_id: The Work Item ID
+            files: Paths, named binary file objects or (filename, source[, content_type]) tuples,
+                   where source is a path, bytes, a file object or an iterator of bytes
+            titles: Optional attachment titles matched with the files by order
+            max_files: Maximum number of files per request (default: 20)
+            max_bytes: Maximum total size of the files of a request (default: 1 GiB)
+            chunk_size: Number of bytes read from the files per chunk (default: 1 MiB)
+        
+        Returns:
+            List of Response objects (201 Created), one per request. Uploading stops
+            at the first failed request.
+        
+        Example:
+            responses = api.work_item_attachments.upload_work_item_attachments(
+                "MyProject", "WI-1", ["/logs/build.log", "/videos/run.mp4"])
+        """
+        return upload_files(self, f'projects/{project_id}/workitems/{work_item_id}/attachments',
+                            'workitem_attachments', files, titles=titles, max_files=max_files,
+                            max_bytes=max_bytes, chunk_size=chunk_size)
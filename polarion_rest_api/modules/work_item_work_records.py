@@ -5,6 +5,7 @@ Handles all Work Item Work Records related endpoints.
 from typing import Optional, Dict, Any
 import requests
 from .base import PolarionBase
+from .validation import validate_request
 
 
 class WorkItemWorkRecords(PolarionBase):
@@ -198,5 +199,7 @@ class WorkItemWorkRecords(PolarionBase):
         Returns:
             Response object
         """
+        if isinstance(kwargs.get('json'), dict) and self.validate_requests:
+            validate_request('DELETE', endpoint, kwargs['json'])
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        return self._session.request('DELETE', url, **kwargs)
+        return self._send(self._session.request, 'DELETE', url, **kwargs)
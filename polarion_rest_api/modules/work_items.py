@@ -2,9 +2,14 @@
 Work Items module for Polarion REST API.
 Handles all Work Items related endpoints.
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable
 import requests
 from .base import PolarionBase
+from .bulk import (BulkResult, BulkItemResult, UpdateCollector, run_bulk, created_ids, updated_ids,
+                   DEFAULT_CHUNK_SIZE, DEFAULT_MAX_WORKERS)
+from .journal import WriteJournal, run_journaled
+from .json_backend import response_json
+from .validation import validate_request
 
 
 class WorkItems(PolarionBase):
@@ -17,6 +22,7 @@ class WorkItems(PolarionBase):
     - GET methods: Retrieve work items and related data
     - PATCH methods: Update work items
     - POST methods: Create work items and perform actions
+    - Bulk methods: Chunked, parallel variants of the list endpoints
     """
     
     # ========== DELETE methods ==========
@@ -719,6 +725,164 @@ class WorkItems(PolarionBase):
             json=request_body
         )
     
+    # ========== Bulk methods ==========
+    
+    def bulk_post_work_items(self,
+                             project_id: str,
+                             work_items: Iterable[Dict[str, Any]],
+                             chunk_size: int = DEFAULT_CHUNK_SIZE,
+                             max_workers: int = DEFAULT_MAX_WORKERS,
+                             journal: Optional[WriteJournal] = None,
+                             key_attribute: Optional[str] = None) -> BulkResult:
+        """
+        Creates any number of Work Items in a project.
+        
+        The work items are split into chunks of `chunk_size` which are sent with
+        post_work_items, up to `max_workers` requests in parallel. The iterable is
+        consumed lazily, so generators of hundreds of thousands of items can be used
+        without holding them all in memory.
+        
+        A chunk rejected by the server (400, 413, 422) is split in halves and re-sent,
+        so invalid work items are reported individually instead of failing the whole chunk.
+        With request validation enabled (PolarionRestApi.set_request_validation), work items
+        not matching the request schema fail locally with their errors and are never sent.
+        
+        With a journal, every Work Item is recorded with a client-side key, so the same
+        call can be replayed after a timeout or crash: items already created are skipped
+        and items with an unknown outcome are searched for before being resent. The key is
+        the value of `key_attribute` (a custom field that can be queried), or a hash of the
+        item content which is then written into `key_attribute`. Without `key_attribute`
+        items with an unknown outcome cannot be searched for and are resent.
+        
+        Args:
+            project_id: The Project ID
+            work_items: Iterable of Work Item resources, e.g.
+                        {"type": "workitems", "attributes": {"type": "task", "title": "Title"}}.
+                        The 'type' key defaults to "workitems" when missing.
+            chunk_size: Maximum number of Work Items per request (default: 100)
+            max_workers: Maximum number of requests sent in parallel (default: 4)
+            journal: Optional WriteJournal recording every write and its outcome
+            key_attribute: Attribute holding the client-side key of every Work Item,
+                           used to find created Work Items when a journal is replayed
+            
+        Returns:
+            BulkResult with one result per input item. BulkResult.ids lists the created
+            Work Item IDs in input order (None for failed items), BulkResult.failed
+            contains the failed items with their input index and error detail.
+            Items found in the journal as already created have status 'skipped'.
+            
+        Example:
+            >>> items = ({"attributes": {"type": "requirement", "title": t}} for t in titles)
+            >>> result = api.bulk_post_work_items("MyProjectId", items, chunk_size=50)
+            >>> created = result.ids
+            >>> for failure in result.failed:
+            ...     print(failure.index, failure.error)
+        """
+        self._ensure_pool_size(max_workers)
+        
+        def request(items):
+            return self.post_work_items(project_id, {'data': items})
+        
+        items = (item if 'type' in item else {'type': 'workitems', **item} for item in work_items)
+        validate = self._item_validator('POST', f"projects/{project_id}/workitems")
+        if journal is None:
+            return run_bulk(request, items, created_ids, chunk_size=chunk_size, max_workers=max_workers,
+                            validate=validate)
+        
+        if key_attribute is None:
+            return run_journaled(journal, 'post_work_items', project_id, request, items, created_ids,
+                                 chunk_size=chunk_size, max_workers=max_workers, validate=validate)
+        
+        def key_of(item):
+            return item.get('attributes', {}).get(key_attribute)
+        
+        def stamp(key, item):
+            if key_of(item) == key:
+                return item
+            return {**item, 'attributes': {**item.get('attributes', {}), key_attribute: key}}
+        
+        def lookup(key, item):
+            response = self.get_work_items(project_id, page_size=1, query=f'{key_attribute}:"{key}"',
+                                           fields={'workitems': 'id'})
+            if response.status_code >= 300:
+                return None
+            data = response_json(response).get('data') or []
+            return data[0].get('id') if data else None
+        
+        return run_journaled(journal, 'post_work_items', project_id, request, items, created_ids,
+                             key_of=key_of, lookup=lookup, stamp=stamp,
+                             chunk_size=chunk_size, max_workers=max_workers, validate=validate)
+    
+    def bulk_patch_work_items(self,
+                              project_id: str,
+                              updates: Iterable[Dict[str, Any]],
+                              chunk_size: int = DEFAULT_CHUNK_SIZE,
+                              max_workers: int = DEFAULT_MAX_WORKERS,
+                              workflow_action: Optional[str] = None,
+                              change_type_to: Optional[str] = None,
+                              dry_run: bool = False) -> BulkResult:
+        """
+        Updates any number of Work Items in a project, coalescing updates of the same item.
+        
+        All updates of one Work Item are merged into a single payload (attributes merged
+        key by key, relationships replaced per name, later updates winning). The merged
+        payloads are sent with patch_work_items in chunks of `chunk_size`, up to
+        `max_workers` requests in parallel.
+        
+        Args:
+            project_id: The Project ID
+            updates: Iterable of Work Item resources with 'id' and 'attributes' and/or
+                     'relationships', or an UpdateCollector filled by the caller
+            chunk_size: Maximum number of Work Items per request (default: 100)
+            max_workers: Maximum number of requests sent in parallel (default: 4)
+            workflow_action: The Workflow Action applied to every request
+            change_type_to: The Type the Workitems to change to, applied to every request
+            dry_run: Only coalesce and plan the requests, without sending anything
+            
+        Returns:
+            BulkResult with one result per updated Work Item, in order of first update.
+            BulkResult.requests_saved is the number of requests saved compared to one
+            patch_work_item call per update. In dry-run mode all items have status 'skipped'
+            and BulkResult.requests_sent stays 0.
+            
+        Raises:
+            ValueError: If an update has no 'id'
+            
+        Example:
+            >>> updates = UpdateCollector('workitems')
+            >>> updates.add('MyProjectId/WI-1', attributes={'status': 'done'})
+            >>> updates.add('MyProjectId/WI-1', relationships={'assignee': {'data': [{'type': 'users', 'id': 'jdoe'}]}})
+            >>> result = api.bulk_patch_work_items('MyProjectId', updates, dry_run=True)
+            >>> result.requests_saved
+            1
+        """
+        if isinstance(updates, UpdateCollector):
+            collector = updates
+        else:
+            collector = UpdateCollector('workitems')
+            for update in updates:
+                collector.add_resource(update)
+        
+        planned_requests = -(-len(collector) // chunk_size) if chunk_size > 0 else 0
+        if dry_run:
+            result = BulkResult()
+            for index, resource in enumerate(collector):
+                result.add(BulkItemResult(index, 'skipped', id=resource['id']))
+            result.requests_saved = collector.received - planned_requests
+            return result
+        
+        self._ensure_pool_size(max_workers)
+        
+        def request(items):
+            return self.patch_work_items(project_id, {'data': items},
+                                         workflow_action=workflow_action,
+                                         change_type_to=change_type_to)
+        
+        result = run_bulk(request, collector, updated_ids, chunk_size=chunk_size, max_workers=max_workers,
+                          validate=self._item_validator('PATCH', f"projects/{project_id}/workitems"))
+        result.requests_saved = collector.received - result.requests_sent
+        return result
+    
     # ========== Helper methods ==========
     
     def _validate_delete_body(self, body_data: Dict[str, Any], param_name: str) -> None:
@@ -792,5 +956,7 @@ class WorkItems(PolarionBase):
         Returns:
             Response object
         """
+        if isinstance(kwargs.get('json'), dict) and self.validate_requests:
+            validate_request('DELETE', endpoint, kwargs['json'])
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        return self._session.request('DELETE', url, **kwargs)
+        return self._send(self._session.request, 'DELETE', url, **kwargs)
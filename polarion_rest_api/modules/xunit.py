@@ -0,0 +1,282 @@
+"""
+xUnit import helper module for Polarion REST API.
+Splits large xUnit (JUnit XML) reports into shards of whole test suites without
+loading them into memory, and imports the shards into per-shard Test Runs in
+parallel, waiting for all import jobs together.
+"""
+import os
+import tempfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Iterator, Tuple, Union
+from .bulk import error_detail
+from .job_waiter import JobResult
+from .scheduler import run_in_context
+
+
+DEFAULT_SHARD_SIZE = 64 * 1024 * 1024
+DEFAULT_MAX_WORKERS = 4
+
+PathLike = Union[str, os.PathLike]
+
+
+def _local_name(tag: str) -> str:
+    """
+    Tag without its namespace, e.g. 'testsuite' for '{http://example.com/junit}testsuite'.
+    """
+    return tag.rsplit('}', 1)[-1]
+
+
+def _serialize_suite(element: ET.Element) -> bytes:
+    """
+    Serialize a <testsuite> element with the namespaces of its tags removed.
+    """
+    element.tail = None
+    for child in element.iter():
+        child.tag = _local_name(child.tag)
+    return ET.tostring(element, encoding='unicode').encode('utf-8')
+
+
+def iter_suites(path: PathLike) -> Iterator[Tuple[Dict[str, str], bytes]]:
+    """
+    Yield the top-level test suites of an xUnit report one by one.
+
+    The report is parsed incrementally and every suite is released once it was
+    yielded, so memory use is bounded by the largest suite, not by the report.
+    Elements are matched by local name, so namespaced reports are read as well;
+    the yielded suites have no namespace.
+
+    Args:
+        path: Path of the xUnit report (<testsuites> root, or a single <testsuite>)
+
+    Yields:
+        (attributes of the root element, serialized <testsuite> element)
+    """
+    root = None
+    depth = 0
+    for event, element in ET.iterparse(os.fspath(path), events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = element
+            depth += 1
+            continue
+        depth -= 1
+        if element is root and _local_name(element.tag) == 'testsuite':
+            # Single-suite report
+            yield {}, _serialize_suite(element)
+        elif depth == 1 and _local_name(element.tag) == 'testsuite':
+            yield dict(root.attrib), _serialize_suite(element)
+            root.remove(element)
+
+
+class XUnitShard:
+    """
+    Part of an xUnit report holding whole test suites.
+
+    Attributes:
+        index: Position of the shard in the report
+        path: Path of the shard file
+        suites: Number of test suites in the shard
+        size: Size of the shard file in bytes
+    """
+
+    __slots__ = ('index', 'path', 'suites', 'size')
+
+    def __init__(self, index: int, path: str, suites: int, size: int):
+        self.index = index
+        self.path = path
+        self.suites = suites
+        self.size = size
+
+    def __repr__(self) -> str:
+        return f"XUnitShard(index={self.index}, path={self.path!r}, suites={self.suites}, size={self.size})"
+
+
+def shard_xunit(path: PathLike, directory: PathLike,
+                shard_size: int = DEFAULT_SHARD_SIZE) -> List[XUnitShard]:
+    """
+    Split an xUnit report into files of whole test suites of about shard_size bytes.
+
+    Suites are never split, so a suite larger than shard_size gets a shard of its
+    own. Each shard is a <testsuites> document keeping the name of the report.
+
+    Args:
+        path: Path of the xUnit report
+        directory: Directory the shard files are written to
+        shard_size: Target size of a shard file in bytes (default: 64 MiB)
+
+    Returns:
+        List of XUnitShard in report order
+
+    Raises:
+        ValueError: If shard_size is lower than 1, the report is not valid XML or it
+                    has no test suites
+    """
+    if shard_size < 1:
+        raise ValueError(f"Shard size must be at least 1, got {shard_size}")
+    stem = os.path.splitext(os.path.basename(os.fspath(path)))[0]
+    shards: List[XUnitShard] = []
+    file = None
+
+    def close_shard():
+        file.write(b'</testsuites>\n')
+        file.close()
+        shard = shards[-1]
+        shard.size = os.path.getsize(shard.path)
+
+    try:
+        for root_attributes, suite in iter_suites(path):
+            if file is not None and file.tell() + len(suite) > shard_size and shards[-1].suites:
+                close_shard()
+                file = None
+            if file is None:
+                shard_path = os.path.join(os.fspath(directory), f"{stem}-{len(shards):04d}.xml")
+                file = open(shard_path, 'wb')
+                root = ET.Element('testsuites', {k: v for k, v in root_attributes.items() if k == 'name'})
+                opening = ET.tostring(root, encoding='unicode').replace(' />', '>')
+                file.write(b'<?xml version="1.0" encoding="UTF-8"?>\n' + opening.encode('utf-8') + b'\n')
+                shards.append(XUnitShard(len(shards), shard_path, 0, 0))
+            file.write(suite + b'\n')
+            shards[-1].suites += 1
+        if file is not None:
+            close_shard()
+            file = None
+    except ET.ParseError as error:
+        raise ValueError(f"Invalid xUnit report {os.fspath(path)}: {error}") from error
+    finally:
+        if file is not None:
+            file.close()
+    if not shards:
+        raise ValueError(f"Invalid xUnit report {os.fspath(path)}: no <testsuite> elements found")
+    return shards
+
+
+class ShardImport:
+    """
+    Outcome of the import of one shard.
+
+    Attributes:
+        test_run_id: ID of the Test Run the shard was imported into
+        shard: The imported XUnitShard, None when the report was imported whole
+        job: JobResult of the import job, None if the job could not be started
+        error: Error message if the Test Run could not be created or the import failed
+    """
+
+    __slots__ = ('test_run_id', 'shard', 'job', 'error')
+
+    def __init__(self, test_run_id: str, shard: Optional[XUnitShard] = None,
+                 job: Optional[JobResult] = None, error: Optional[str] = None):
+        self.test_run_id = test_run_id
+        self.shard = shard
+        self.job = job
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """True when the import job finished with status 'OK'"""
+        return self.error is None and self.job is not None and self.job.ok
+
+    def __repr__(self) -> str:
+        return f"ShardImport(test_run_id={self.test_run_id!r}, ok={self.ok}, error={self.error!r})"
+
+
+class XUnitImportResult:
+    """
+    Outcome of an xUnit import, one ShardImport per imported Test Run.
+    """
+
+    __slots__ = ('imports',)
+
+    def __init__(self, imports: List[ShardImport]):
+        self.imports = imports
+
+    @property
+    def ok(self) -> bool:
+        """True when every shard was imported"""
+        return all(shard_import.ok for shard_import in self.imports)
+
+    @property
+    def failed(self) -> List[ShardImport]:
+        """Imports that did not succeed"""
+        return [shard_import for shard_import in self.imports if not shard_import.ok]
+
+    @property
+    def test_run_ids(self) -> List[str]:
+        """IDs of the Test Runs the report was imported into"""
+        return [shard_import.test_run_id for shard_import in self.imports]
+
+    def __repr__(self) -> str:
+        return f"XUnitImportResult(imports={len(self.imports)}, failed={len(self.failed)})"
+
+
+def shard_test_run_id(test_run_id: str, shard: XUnitShard) -> str:
+    """
+    ID of the Test Run a shard is imported into, e.g. 'Nightly-0003'.
+    """
+    return f"{test_run_id}-{shard.index:04d}"
+
+
+def import_xunit(test_runs: Any, project_id: str, test_run_id: str, path: PathLike,
+                 shard_size: Optional[int] = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 test_run_attributes: Optional[Dict[str, Any]] = None,
+                 timeout: Optional[float] = None,
+                 shard_directory: Optional[PathLike] = None) -> XUnitImportResult:
+    """
+    Import an xUnit report streamed from disk, optionally sharded into per-shard Test Runs.
+
+    Without shard_size the report is imported whole into test_run_id. With
+    shard_size it is split into shards of whole suites (see shard_xunit); every
+    shard gets its own Test Run (see shard_test_run_id), created with
+    test_run_attributes, and the shards are imported by max_workers threads. The
+    import jobs are then waited for together by the shared job waiter.
+
+    Args:
+        test_runs: TestRuns module sending the requests
+        project_id: The Project ID
+        test_run_id: Test Run ID, or prefix of the shard Test Run IDs
+        path: Path of the xUnit report
+        shard_size: Target size of a shard in bytes (default: no sharding)
+        max_workers: Number of shards uploaded in parallel (default: 4)
+        test_run_attributes: Attributes of the created shard Test Runs (e.g. title, type)
+        timeout: Maximum number of seconds to wait for the import jobs (default: no limit)
+        shard_directory: Directory keeping the shard files (default: temporary, removed)
+
+    Returns:
+        XUnitImportResult with one ShardImport per Test Run
+    """
+    if shard_size is None:
+        handle = test_runs.submit_import_x_unit_test_results(project_id, test_run_id, path, timeout=timeout)
+        job = handle.result()
+        return XUnitImportResult([ShardImport(test_run_id, job=job, error=job.error)])
+
+    with tempfile.TemporaryDirectory(prefix='xunit-shards-') as temporary:
+        directory = shard_directory if shard_directory is not None else temporary
+        shards = shard_xunit(path, directory, shard_size)
+        imports = [ShardImport(shard_test_run_id(test_run_id, shard), shard) for shard in shards]
+        test_runs._ensure_pool_size(max_workers)
+
+        def start(shard_import: ShardImport):
+            attributes = dict(test_run_attributes or {}, id=shard_import.test_run_id)
+            try:
+                response = test_runs.post_test_runs(project_id, {'data': [{'type': 'testruns',
+                                                                           'attributes': attributes}]})
+                if response.status_code >= 300:
+                    shard_import.error = f"Test Run not created: {error_detail(response)}"
+                    return None
+                return test_runs.submit_import_x_unit_test_results(
+                    project_id, shard_import.test_run_id, shard_import.shard.path, timeout=timeout)
+            except Exception as error:
+                shard_import.error = f"{type(error).__name__}: {error}"
+                return None
+
+        # Shards are uploaded in parallel; their jobs are polled together by the shared waiter
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(run_in_context(start), shard_import) for shard_import in imports]
+            handles = [future.result() for future in futures]
+
+        for shard_import, handle in zip(imports, handles):
+            if handle is not None:
+                shard_import.job = handle.result()
+                shard_import.error = shard_import.job.error
+    return XUnitImportResult(imports)
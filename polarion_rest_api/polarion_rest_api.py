@@ -2,11 +2,19 @@
 Main Polarion REST API class.
 This class provides access to all Polarion REST API modules.
 """
-from typing import Optional
+import contextlib
+from typing import Optional, Any, Callable, Iterable, Iterator, Sequence
 
 try:
     # Try relative import (when used as package)
-    from .modules.base import PolarionBase
+    from .modules.base import PolarionBase, JOB_WAITER_ATTRIBUTE
+    from .modules.unit_of_work import UnitOfWork
+    from .modules.fanout import FanOut, DEFAULT_MAX_WORKERS
+    from .modules.scheduler import RequestScheduler
+    from .modules.attachment_mirror import AttachmentMirror, MirrorResult
+    from .modules.project_mirror import ProjectMirror, SyncResult
+    from .modules.columnar import ColumnarResult, collect_columns
+    from .modules.pagination import DEFAULT_PAGE_SIZE
 except ImportError:
     # Fall back to absolute import (when used as standalone script)
     import os
@@ -15,7 +23,14 @@ except ImportError:
     modules_dir = os.path.join(current_dir, 'modules')
     if modules_dir not in sys.path:
         sys.path.insert(0, modules_dir)
-    from modules.base import PolarionBase
+    from modules.base import PolarionBase, JOB_WAITER_ATTRIBUTE
+    from modules.unit_of_work import UnitOfWork
+    from modules.fanout import FanOut, DEFAULT_MAX_WORKERS
+    from modules.scheduler import RequestScheduler
+    from modules.attachment_mirror import AttachmentMirror, MirrorResult
+    from modules.project_mirror import ProjectMirror, SyncResult
+    from modules.columnar import ColumnarResult, collect_columns
+    from modules.pagination import DEFAULT_PAGE_SIZE
 
 
 class PolarionRestApi(PolarionBase):
@@ -63,7 +78,9 @@ class PolarionRestApi(PolarionBase):
     def __init__(self, base_url: str = "https://testdrive.polarion.com/polarion/rest/v1",
                  token: Optional[str] = None,
                  debug_request: bool = False,
-                 debug_response: bool = False):
+                 debug_response: bool = False,
+                 scheduler: Optional[RequestScheduler] = None,
+                 validate_requests: bool = False):
         """
         Initialize Polarion API client.
         
@@ -72,6 +89,11 @@ class PolarionRestApi(PolarionBase):
             token: Bearer token for authentication (can be set later using set_token())
             debug_request: Enable debug mode to print request details (default: False)
             debug_response: Enable debug mode to print response details (default: False)
+            scheduler: Optional RequestScheduler admitting the requests of all modules by
+                       priority class (can be set later using set_scheduler())
+            validate_requests: Validate JSON request bodies against the request schemas of the
+                               OpenAPI specification before sending (can be changed later
+                               using set_request_validation())
             
         Example:
             api = PolarionRestApi(token="your_bearer_token", debug_request=True)
@@ -144,216 +166,451 @@ class PolarionRestApi(PolarionBase):
         """
         super().__init__(base_url, token, debug_request, debug_response)
         self._load_modules()
+        self.set_scheduler(scheduler)
+        self.set_request_validation(validate_requests)
     
     def _load_modules(self):
         """
         Dynamically load all module classes from the modules directory.
         This method will automatically discover and initialize all module classes.
+        All modules share the session (and connection pool) of this client.
         """
         try:
             from .modules.work_items import WorkItems
-            self.work_items = WorkItems(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.work_items = WorkItems(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.work_item_comments import WorkItemComments
-            self.work_item_comments = WorkItemComments(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.work_item_comments = WorkItemComments(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.work_item_attachments import WorkItemAttachments
-            self.work_item_attachments = WorkItemAttachments(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.work_item_attachments = WorkItemAttachments(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.work_item_approvals import WorkItemApprovals
-            self.work_item_approvals = WorkItemApprovals(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.work_item_approvals = WorkItemApprovals(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.work_item_work_records import WorkItemWorkRecords
-            self.work_item_work_records = WorkItemWorkRecords(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.work_item_work_records = WorkItemWorkRecords(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.users import Users
-            self.users = Users(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.users = Users(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.user_groups import UserGroups
-            self.user_groups = UserGroups(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.user_groups = UserGroups(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.test_steps import TestSteps
-            self.test_steps = TestSteps(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.test_steps = TestSteps(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.test_step_results import TestStepResults
-            self.test_step_results = TestStepResults(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.test_step_results = TestStepResults(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.test_step_result_attachments import TestStepResultAttachments
-            self.test_step_result_attachments = TestStepResultAttachments(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.test_step_result_attachments = TestStepResultAttachments(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.test_runs import TestRuns
-            self.test_runs = TestRuns(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.test_runs = TestRuns(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.test_run_comments import TestRunComments
-            self.test_run_comments = TestRunComments(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.test_run_comments = TestRunComments(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.test_run_attachments import TestRunAttachments
-            self.test_run_attachments = TestRunAttachments(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.test_run_attachments = TestRunAttachments(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.test_records import TestRecords
-            self.test_records = TestRecords(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.test_records = TestRecords(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.test_record_attachments import TestRecordAttachments
-            self.test_record_attachments = TestRecordAttachments(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.test_record_attachments = TestRecordAttachments(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.roles import Roles
-            self.roles = Roles(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.roles = Roles(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.revisions import Revisions
-            self.revisions = Revisions(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.revisions = Revisions(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.projects import Projects
-            self.projects = Projects(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.projects = Projects(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.project_templates import ProjectTemplates
-            self.project_templates = ProjectTemplates(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.project_templates = ProjectTemplates(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.plans import Plans
-            self.plans = Plans(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.plans = Plans(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.pages import Pages
-            self.pages = Pages(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.pages = Pages(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.page_attachments import PageAttachments
-            self.page_attachments = PageAttachments(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.page_attachments = PageAttachments(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.linked_work_items import LinkedWorkItems
-            self.linked_work_items = LinkedWorkItems(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.linked_work_items = LinkedWorkItems(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.linked_oslc_resources import LinkedOslcResources
-            self.linked_oslc_resources = LinkedOslcResources(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.linked_oslc_resources = LinkedOslcResources(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.jobs import Jobs
-            self.jobs = Jobs(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.jobs = Jobs(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.icons import Icons
-            self.icons = Icons(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.icons = Icons(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.externally_linked_work_items import ExternallyLinkedWorkItems
-            self.externally_linked_work_items = ExternallyLinkedWorkItems(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.externally_linked_work_items = ExternallyLinkedWorkItems(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.feature_selections import FeatureSelections
-            self.feature_selections = FeatureSelections(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.feature_selections = FeatureSelections(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.enumerations import Enumerations
-            self.enumerations = Enumerations(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.enumerations = Enumerations(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.documents import Documents
-            self.documents = Documents(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.documents = Documents(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.document_parts import DocumentParts
-            self.document_parts = DocumentParts(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.document_parts = DocumentParts(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.document_comments import DocumentComments
-            self.document_comments = DocumentComments(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.document_comments = DocumentComments(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.document_attachments import DocumentAttachments
-            self.document_attachments = DocumentAttachments(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.document_attachments = DocumentAttachments(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
         
         try:
             from .modules.collections import Collections
-            self.collections = Collections(self.base_url, self._token, self.debug_request, self.debug_response)
+            self.collections = Collections(self.base_url, self._token, self.debug_request, self.debug_response, session=self._session)
         except ImportError:
             pass
     
+    @property
+    def scheduler(self) -> Optional[RequestScheduler]:
+        """
+        RequestScheduler of this client, None when requests are sent unscheduled.
+        """
+        return self._scheduler
+    
+    def set_scheduler(self, scheduler: Optional[RequestScheduler]):
+        """
+        Set or remove the request scheduler of this client and all its modules.
+        
+        Args:
+            scheduler: RequestScheduler to use, or None to send requests unscheduled
+        """
+        self._scheduler = scheduler
+        for module in vars(self).values():
+            if isinstance(module, PolarionBase):
+                module._scheduler = scheduler
+        # The job waiter of the session polls with its own Jobs module
+        waiter = vars(self._session).get(JOB_WAITER_ATTRIBUTE)
+        if waiter is not None:
+            waiter.jobs._scheduler = scheduler
+    
+    def set_request_validation(self, enabled: bool):
+        """
+        Enable or disable client-side validation of request bodies for this client and all its modules.
+        
+        When enabled, JSON bodies of POST, PATCH and DELETE requests are checked against the
+        request schema of their endpoint (request_schemas.py) and a ValidationError listing
+        every error path is raised before anything is sent. Bulk methods check every item on
+        its own: invalid items fail with their errors and the valid ones are sent.
+        
+        Args:
+            enabled: True to validate request bodies, False to send them unchecked
+            
+        Example:
+            api.set_request_validation(True)
+            result = api.work_items.bulk_post_work_items("project_id", items)
+            for failure in result.failed:
+                print(failure.index, failure.error)  # e.g. 'Invalid item: attributes.title: expected string, got int'
+        """
+        self.validate_requests = enabled
+        for module in vars(self).values():
+            if isinstance(module, PolarionBase):
+                module.validate_requests = enabled
+    
+    @contextlib.contextmanager
+    def priority(self, name: str) -> Iterator[None]:
+        """
+        Send the requests made inside the block with priority class `name`.
+        
+        Also applies to the worker threads of bulk methods, map() and unit_of_work()
+        started inside the block. Without a scheduler the block has no effect.
+        
+        Args:
+            name: Priority class of the scheduler (e.g. 'interactive' or 'batch')
+            
+        Raises:
+            ValueError: If the class is unknown to the scheduler
+            
+        Example:
+            api = PolarionRestApi(token="your_bearer_token", scheduler=RequestScheduler(max_concurrent=8))
+            with api.priority("batch"):
+                result = api.work_items.bulk_post_work_items("project_id", items)
+            print(api.scheduler.stats()["batch"].mean_wait)
+        """
+        if self._scheduler is None:
+            yield
+            return
+        with self._scheduler.priority(name):
+            yield
+    
+    def unit_of_work(self, max_batch_size: int = 100, max_delay: float = 1.0,
+                     max_workers: int = 4, max_pending: Optional[int] = None) -> UnitOfWork:
+        """
+        Create a write-behind unit of work batching mutations into list requests.
+        
+        Queued mutations (post_work_item, patch_work_item, post_linked_work_item,
+        post_comment, ...) return a Future right away and are flushed as list requests
+        when a buffer reaches max_batch_size items or after max_delay seconds.
+        
+        Args:
+            max_batch_size: Items per list request (default: 100)
+            max_delay: Maximum age in seconds of a queued mutation before it is flushed (default: 1.0)
+            max_workers: Maximum number of list requests sent in parallel (default: 4)
+            max_pending: Maximum number of queued mutations before queueing blocks
+                         (default: 10 * max_batch_size)
+            
+        Returns:
+            UnitOfWork instance (use it as a context manager to flush on exit)
+            
+        Example:
+            with api.unit_of_work(max_delay=2.0) as uow:
+                future = uow.patch_work_item("project_id", "WI-1", attributes={"status": "done"})
+            print(future.result().ok)
+        """
+        return UnitOfWork(self, max_batch_size=max_batch_size, max_delay=max_delay,
+                          max_workers=max_workers, max_pending=max_pending)
+    
+    def map(self, method: Callable[..., Any], arg_iterable: Iterable[Any],
+            max_workers: int = DEFAULT_MAX_WORKERS, ordered: bool = True,
+            on_progress: Optional[Callable[[FanOut], None]] = None) -> FanOut:
+        """
+        Call a module method for every element of an iterable, concurrently.
+        
+        The calls run on up to max_workers threads over the shared connection pool of
+        this client. Iterating the returned FanOut yields one CallResult per call, in
+        input order or as the calls complete. Exceptions are captured per call
+        (CallResult.error), FanOut.cancel() stops starting new calls.
+        
+        Args:
+            method: Module method, e.g. api.work_items.get_work_item
+            arg_iterable: Arguments of the calls (tuple: positional, dict: keyword,
+                          other: single positional argument), consumed lazily
+            max_workers: Maximum number of calls running in parallel (default: 8)
+            ordered: Yield results in input order (default) or as they complete
+            on_progress: Optional callable invoked with the FanOut after every completed call
+            
+        Returns:
+            FanOut to iterate (or FanOut.results() for a list)
+            
+        Example:
+            calls = api.map(api.work_items.get_work_item,
+                            (("project_id", work_item_id) for work_item_id in work_item_ids),
+                            max_workers=16,
+                            on_progress=lambda fan_out: print(fan_out.completed))
+            for call in calls:
+                if call.ok:
+                    print(call.value.json()["data"]["id"])
+                else:
+                    print(call.args, call.error or call.value.status_code)
+        """
+        self._ensure_pool_size(max_workers)
+        owner = getattr(method, '__self__', None)
+        if owner is not self and hasattr(owner, '_ensure_pool_size'):
+            owner._ensure_pool_size(max_workers)
+        return FanOut(method, arg_iterable, max_workers=max_workers, ordered=ordered, on_progress=on_progress)
+    
+    def mirror_attachments(self, project_id: str, root: str,
+                           documents: Iterable[Any] = (),
+                           pages: Iterable[Any] = (),
+                           max_workers: int = DEFAULT_MAX_WORKERS) -> MirrorResult:
+        """
+        Mirror every attachment of a project into a local content-addressed store.
+        
+        Attachments of work items, test runs, test records and test step results are
+        discovered through the list endpoints, documents and pages are given as
+        (space_id, name) pairs. Contents are stored once per hash and attachments that
+        did not change since the last run are skipped, so nightly runs only download
+        what is new; an interrupted run resumes where it stopped.
+        
+        Args:
+            project_id: The Project ID
+            root: Directory of the store (see AttachmentMirror)
+            documents: (space_id, document_name) of the documents to mirror
+            pages: (space_id, page_name) of the pages to mirror
+            max_workers: Maximum number of requests in parallel (default: 8)
+            
+        Returns:
+            MirrorResult with the outcome counters and failures
+            
+        Example:
+            result = api.mirror_attachments("project_id", "/backup/polarion",
+                                            documents=[("_default", "Specification")])
+            print(result.downloaded, result.unchanged, result.failed)
+        """
+        with AttachmentMirror(self, root, max_workers=max_workers) as mirror:
+            return mirror.run(project_id, documents=documents, pages=pages)
+    
+    def sync_project(self, project_id: str, path: str,
+                     full: bool = False,
+                     documents: Iterable[Any] = (),
+                     max_workers: int = DEFAULT_MAX_WORKERS) -> SyncResult:
+        """
+        Mirror a project into a local indexed SQLite database, incrementally.
+        
+        The first sync loads the work items, links, documents, plans, test runs and test
+        records of the project; later syncs only request the entities updated since the
+        previous sync. Reports then query the database instead of the API (see ProjectMirror).
+        
+        Args:
+            project_id: The Project ID
+            path: Path of the SQLite database file (created if missing)
+            full: Reload everything and delete the rows of deleted entities (default: False)
+            documents: (space_id, document_name) of documents to sync besides the
+                       documents of the synced work items
+            max_workers: Maximum number of requests in parallel (default: 8)
+            
+        Returns:
+            SyncResult with the number of stored and deleted rows per table
+            
+        Example:
+            result = api.sync_project("project_id", "reporting.db")
+            print(result.stored["work_items"], result.watermarks["work_items"])
+        """
+        with ProjectMirror(self, path, max_workers=max_workers) as mirror:
+            return mirror.sync(project_id, full=full, documents=documents)
+    
+    def collect_columns(self, list_method: Callable[..., Any], *args: Any,
+                        columns: Sequence[str],
+                        resource_type: Optional[str] = None,
+                        page_size: int = DEFAULT_PAGE_SIZE,
+                        **kwargs: Any) -> ColumnarResult:
+        """
+        Collect columns of all resources of a list endpoint into per-column lists.
+        
+        Pages are added to the columns as they arrive, without a dictionary per
+        resource, and the result exports to pandas, Arrow or Parquet when those
+        libraries are installed.
+        
+        Args:
+            list_method: List method, e.g. api.work_items.get_work_items
+            *args: Positional arguments of list_method (e.g. project_id)
+            columns: 'id', 'type', 'revision', attribute names or dotted paths
+                     ('description.value') and relationships ('relationships.author')
+            resource_type: Resource type of the endpoint (e.g. 'workitems'); requests
+                           only the fields of the columns
+            page_size: Number of resources per page (default: 100)
+            **kwargs: Other keyword arguments of list_method (e.g. query)
+            
+        Returns:
+            ColumnarResult (column(name), to_pandas(), to_arrow(), to_parquet(path))
+            
+        Example:
+            table = api.collect_columns(api.test_records.get_test_records, "project_id", "run_id",
+                                        columns=["id", "result", "executed", "relationships.testCase"],
+                                        resource_type="testrecords")
+            table.to_parquet("records.parquet")
+        """
+        return collect_columns(list_method, *args, columns=columns, resource_type=resource_type,
+                               page_size=page_size, **kwargs)
+    
     def __enter__(self):
         """
         Context manager entry.
@@ -27,6 +27,16 @@ setup(
             'pytest>=6.0.0',
             'pytest-cov>=2.12.0',
         ],
+        'async': [
+            'httpx>=0.23.0',
+        ],
+        'fast': [
+            'orjson>=3.0.0',
+        ],
+        'columnar': [
+            'pandas>=1.1.0',
+            'pyarrow>=5.0.0',
+        ],
     },
     classifiers=[
         'Development Status :: 3 - Alpha',
@@ -34,6 +34,8 @@ from modules.project_templates import ProjectTemplates
 from modules.revisions import Revisions
 from modules.test_record_attachments import TestRecordAttachments
 from modules.test_records import TestRecords
+from modules.test_step_results import TestStepResults
+from modules.test_runs import TestRuns
 
 
 # ============================================================================
@@ -196,6 +198,18 @@ def mock_test_records_api():
     return _create_mock_api(TestRecords)
 
 
+@pytest.fixture
+def mock_test_step_results_api():
+    """Create TestStepResults instance with mocked session for unit tests"""
+    return _create_mock_api(TestStepResults)
+
+
+@pytest.fixture
+def mock_test_runs_api():
+    """Create TestRuns instance with mocked session for unit tests"""
+    return _create_mock_api(TestRuns)
+
+
 @pytest.fixture
 def mock_response():
     """Create a mock response object for unit tests"""
@@ -0,0 +1,203 @@
+"""
+Pytest tests for AsyncPolarionRestApi.
+
+Tests that the asynchronous modules mirror the synchronous ones, share one
+client and keep the default fields handling.
+Uses an httpx mock transport to avoid making real API calls.
+
+Run with:
+    pytest test_async_polarion_rest_api.py -v
+"""
+import asyncio
+import json
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from async_polarion_rest_api import AsyncPolarionRestApi, MODULES
+from modules.validation import ValidationError
+
+
+def _api(handler, **kwargs):
+    """Create an API object sending requests to a mock transport"""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncPolarionRestApi(base_url="https://test.polarion.com/polarion/rest/v1",
+                                token="test_token", client=client, **kwargs)
+
+
+class TestAsyncPolarionRestApiMocked:
+    """Unit tests for AsyncPolarionRestApi using a mock transport"""
+
+    def test_async_api_mirrors_modules(self):
+        """Test that every module and endpoint method is available and shares the client"""
+        api = _api(lambda request: httpx.Response(200))
+
+        for name, module_class in MODULES.items():
+            module = getattr(api, name)
+            assert isinstance(module, module_class)
+            assert module._session is api._session
+            for method in dir(module_class):
+                if method.startswith(('get_', 'post_', 'patch_', 'delete_')):
+                    assert callable(getattr(module, method))
+        asyncio.run(api.close())
+        print("\n✓ Mock: All modules mirrored")
+
+    def test_async_get_applies_default_fields(self):
+        """Test that GET requests keep the default fields handling"""
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(200, json={"data": [{"type": "workitems", "id": "MyProjectId/WI-1"}]})
+
+        async def run():
+            async with _api(handler) as api:
+                return await api.work_items.get_work_items("MyProjectId", page_size=5,
+                                                           fields={"workitems": "title"})
+
+        response = asyncio.run(run())
+
+        assert response.status_code == 200
+        assert response.json()["data"][0]["id"] == "MyProjectId/WI-1"
+        request = requests_seen[0]
+        assert request.url.path == "/polarion/rest/v1/projects/MyProjectId/workitems"
+        assert request.url.params["fields[workitems]"] == "title"
+        assert request.url.params["fields[documents]"] == "@all"
+        assert request.url.params["page[size]"] == "5"
+        assert request.headers["Authorization"] == "Bearer test_token"
+        print("\n✓ Mock: Default fields applied")
+
+    def test_async_concurrent_requests(self):
+        """Test that many requests can be in flight at once without threads"""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"data": {"id": request.url.path.rsplit('/', 1)[1]}})
+
+        async def run():
+            async with _api(handler) as api:
+                return await asyncio.gather(*(
+                    api.work_items.get_work_item("MyProjectId", f"WI-{i}") for i in range(200)
+                ))
+
+        responses = asyncio.run(run())
+
+        assert [response.json()["data"]["id"] for response in responses] == [f"WI-{i}" for i in range(200)]
+        assert peak > 50
+        print("\n✓ Mock: Concurrent requests")
+
+    def test_async_bodies(self):
+        """Test that JSON and delete bodies are sent"""
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(201 if request.method == "POST" else 204)
+
+        async def run():
+            async with _api(handler) as api:
+                await api.test_runs.post_test_runs("MyProjectId", {"data": [{"type": "testruns"}]})
+                await api.work_items.delete_work_items("MyProjectId", {
+                    "data": [{"type": "workitems", "id": "MyProjectId/WI-1"}]
+                })
+
+        asyncio.run(run())
+
+        post, delete = requests_seen
+        assert json.loads(post.content) == {"data": [{"type": "testruns"}]}
+        assert post.headers["Content-Type"] == "application/json"
+        assert delete.method == "DELETE"
+        assert json.loads(delete.content)["data"][0]["id"] == "MyProjectId/WI-1"
+        print("\n✓ Mock: Request bodies sent")
+
+    def test_async_bulk_helpers_not_available(self):
+        """Test that thread based bulk helpers raise NotImplementedError"""
+        api = _api(lambda request: httpx.Response(200))
+
+        with pytest.raises(NotImplementedError):
+            api.work_items.bulk_post_work_items("MyProjectId", [])
+        asyncio.run(api.close())
+        print("\n✓ Mock: Bulk helpers rejected")
+
+    def test_async_job_waiting_not_available(self):
+        """Test that the thread based job waiting helpers raise NotImplementedError"""
+        api = _api(lambda request: httpx.Response(200))
+
+        for call in (lambda: api.jobs.wait_for_job("J1", timeout=3), lambda: api.jobs.wait_for_jobs(["J1"]),
+                     lambda: api.jobs.job_waiter):
+            with pytest.raises(NotImplementedError):
+                call()
+        asyncio.run(api.close())
+        print("\n✓ Mock: Job waiting helpers rejected")
+
+    def test_async_request_validation(self):
+        """Test that invalid bodies raise before being sent when validation is enabled"""
+        requests_seen = []
+
+        async def run():
+            async with _api(lambda request: requests_seen.append(request) or httpx.Response(201),
+                            validate_requests=True) as api:
+                with pytest.raises(ValidationError):
+                    await api.work_items.post_work_items("MyProjectId", {
+                        "data": [{"type": "workitems", "attributes": {"title": 3}}]
+                    })
+                await api.work_items.post_work_items("MyProjectId", {
+                    "data": [{"type": "workitems", "attributes": {"type": "task", "title": "Valid"}}]
+                })
+
+        asyncio.run(run())
+
+        assert len(requests_seen) == 1
+        print("\n✓ Mock: Request bodies validated")
+
+    @pytest.mark.parametrize("source", ["path", "file", "bytes"])
+    def test_async_import_x_unit_test_results(self, source, tmp_path):
+        """Test that an xUnit report given as a path, a file object or bytes is sent whole"""
+        report = tmp_path / "junit.xml"
+        report.write_bytes(b'<testsuites><testsuite name="a"><testcase name="t"/></testsuite></testsuites>' * 1000)
+        requests_seen = []
+
+        async def handler(request):
+            requests_seen.append((request, await request.aread()))
+            return httpx.Response(202, json={"data": {"type": "jobs", "id": "Job-1"}})
+
+        async def run():
+            async with _api(handler) as api:
+                if source == "file":
+                    with open(report, "rb") as file:
+                        return await api.test_runs.import_x_unit_test_results("MyProjectId", "MyTestRunId", file)
+                data = report if source == "path" else report.read_bytes()
+                return await api.test_runs.import_x_unit_test_results("MyProjectId", "MyTestRunId", data)
+
+        response = asyncio.run(run())
+
+        assert response.status_code == 202
+        request, content = requests_seen[0]
+        assert content == report.read_bytes()
+        assert request.url.path.endswith("/testruns/MyTestRunId/actions/importXUnitTestResults")
+        assert request.headers["Content-Type"] == "application/octet-stream"
+        assert request.headers["Content-Length"] == str(len(content))
+        print(f"\n✓ Mock: xUnit report sent from {source}")
+
+    def test_async_close_keeps_user_client_open(self):
+        """Test that close() and async with only close the client created by the API"""
+        async def run():
+            api = _api(lambda request: httpx.Response(200))
+            async with api:
+                pass
+            await api.close()
+            user_client_closed = api._session.is_closed
+            await api._session.aclose()
+            owned = AsyncPolarionRestApi(token="test_token")
+            async with owned:
+                pass
+            return user_client_closed, owned._session.is_closed
+
+        assert asyncio.run(run()) == (False, True)
+        print("\n✓ Mock: User supplied client left open")
@@ -0,0 +1,159 @@
+"""
+Pytest tests for the attachment mirror.
+
+Tests discovery through the attachment modules, content-addressed storage with
+deduplication, skipping unchanged attachments and resuming after failures.
+Uses mocks to avoid hitting real API.
+
+Run with:
+    pytest test_attachment_mirror.py -v
+"""
+import hashlib
+import importlib
+import threading
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from modules.attachment_mirror import AttachmentMirror
+
+# Client attribute -> (module, class) of the modules used by the mirror
+MIRROR_MODULES = {
+    'work_items': ('work_items', 'WorkItems'),
+    'work_item_attachments': ('work_item_attachments', 'WorkItemAttachments'),
+    'document_attachments': ('document_attachments', 'DocumentAttachments'),
+    'pages': ('pages', 'Pages'),
+    'page_attachments': ('page_attachments', 'PageAttachments'),
+    'test_runs': ('test_runs', 'TestRuns'),
+    'test_run_attachments': ('test_run_attachments', 'TestRunAttachments'),
+    'test_records': ('test_records', 'TestRecords'),
+    'test_record_attachments': ('test_record_attachments', 'TestRecordAttachments'),
+    'test_step_results': ('test_step_results', 'TestStepResults'),
+    'test_step_result_attachments': ('test_step_result_attachments', 'TestStepResultAttachments'),
+}
+
+
+def _attachment(resource_id, updated="2024-01-01T00:00:00Z"):
+    """Build an attachment resource"""
+    attachment_id = resource_id.rsplit('/', 1)[1]
+    return {"type": "attachments", "id": resource_id,
+            "attributes": {"id": attachment_id, "fileName": f"{attachment_id}.log", "updated": updated}}
+
+
+class _Server:
+    """Fake Polarion answering list and content requests"""
+
+    def __init__(self):
+        self.updated = "2024-01-01T00:00:00Z"
+        self.contents = {"A1": b"same log", "A2": b"same log", "D1": b"spec", "G1": b"page",
+                         "R1": b"run log", "S1": b"step screenshot"}
+        self.failing = set()
+        self.downloads = []
+        self.lock = threading.Lock()
+
+    def get(self, url, params=None, **kwargs):
+        path = url.split('/rest/v1/', 1)[1]
+        response = Mock(status_code=200, headers={})
+        if kwargs.get('stream'):
+            attachment_id = path.split('/')[-2]
+            with self.lock:
+                self.downloads.append(attachment_id)
+            if attachment_id in self.failing:
+                response.status_code = 503
+                response.json.return_value = {"errors": [{"status": "503", "detail": "Unavailable"}]}
+                return response
+            response.iter_content.side_effect = lambda chunk_size: iter([self.contents[attachment_id]])
+            return response
+        lists = {
+            "projects/P/workitems": [{"id": "P/WI-1"}, {"id": "P/WI-2"}],
+            "projects/P/workitems/WI-1/attachments": [_attachment("P/WI-1/A1", self.updated)],
+            "projects/P/workitems/WI-2/attachments": [_attachment("P/WI-2/A2")],
+            "projects/P/spaces/_default/documents/Spec/attachments": [_attachment("P/_default/Spec/D1")],
+            "projects/P/testruns": [{"id": "P/RUN-1"}],
+            "projects/P/testruns/RUN-1/attachments": [_attachment("P/RUN-1/R1")],
+            "projects/P/testruns/RUN-1/testrecords": [{"id": "P/RUN-1/P/TC-1/0"}],
+            "projects/P/testruns/RUN-1/testrecords/P/TC-1/0/attachments": [],
+            "projects/P/testruns/RUN-1/testrecords/P/TC-1/0/teststepresults": [{"id": "P/RUN-1/P/TC-1/0/1"}],
+            "projects/P/testruns/RUN-1/testrecords/P/TC-1/0/teststepresults/1/attachments":
+                [_attachment("P/RUN-1/P/TC-1/0/1/S1")],
+        }
+        if path == "projects/P/spaces/_default/pages/Home":
+            response.json.return_value = {"data": {"type": "pages", "id": "P/_default/Home"},
+                                          "included": [dict(_attachment("P/_default/Home/G1"),
+                                                            type="page_attachments")]}
+            return response
+        response.json.return_value = {"data": lists[path], "meta": {"totalCount": len(lists[path])}}
+        return response
+
+
+@pytest.fixture
+def mirror_api():
+    """Modules of one client sharing a session answered by a fake server"""
+    server = _Server()
+    session = Mock()
+    session.headers = {}
+    session.get.side_effect = server.get
+    api = SimpleNamespace()
+    for name, (module, class_name) in MIRROR_MODULES.items():
+        module_class = getattr(importlib.import_module(f"modules.{module}"), class_name)
+        setattr(api, name, module_class("https://test.polarion.com/polarion/rest/v1", "test_token", session=session))
+    return api, server
+
+
+class TestAttachmentMirror:
+    """Unit tests for AttachmentMirror using mocks"""
+
+    def test_mirror_deduplicates_and_skips_unchanged(self, mirror_api, tmp_path):
+        """Test that contents are stored once and unchanged attachments are not downloaded again"""
+        api, server = mirror_api
+
+        with AttachmentMirror(api, tmp_path, max_workers=4) as mirror:
+            result = mirror.run("P", documents=[("_default", "Spec")], pages=[("_default", "Home")])
+
+            assert result.ok, result.failed
+            assert (result.downloaded, result.deduplicated, result.unchanged) == (5, 1, 0)
+            assert sorted(server.downloads) == ["A1", "A2", "D1", "G1", "R1", "S1"]
+            checksum = hashlib.sha256(b"same log").hexdigest()
+            assert open(mirror.object_path(checksum), 'rb').read() == b"same log"
+            entries = mirror.manifest.entries("P")
+            assert ("teststepresult", "RUN-1/P/TC-1/0/1", "S1", "S1.log",
+                    hashlib.sha256(b"step screenshot").hexdigest(), 15) in entries
+            assert len([p for p in (tmp_path / "objects").rglob("*") if p.is_file()]) == 5
+
+            server.downloads.clear()
+            server.updated = "2024-02-01T00:00:00Z"
+            server.contents["A1"] = b"new log"
+            result = mirror.run("P", documents=[("_default", "Spec")], pages=[("_default", "Home")])
+
+        assert (result.downloaded, result.deduplicated, result.unchanged) == (1, 0, 5)
+        assert server.downloads == ["A1"]
+        print("\n✓ Mock: Deduplicated mirror, unchanged attachments skipped")
+
+    def test_mirror_resumes_after_failures(self, mirror_api, tmp_path):
+        """Test that failed downloads are reported and fetched by the next run only"""
+        api, server = mirror_api
+        server.failing = {"R1"}
+
+        with AttachmentMirror(api, tmp_path, max_workers=2) as mirror:
+            result = mirror.run("P", kinds=["workitem", "testrun"])
+
+            assert not result.ok
+            assert [(f.kind, f.owner, f.attachment_id) for f in result.failed] == [("testrun", ("RUN-1",), "R1")]
+            assert "Unavailable" in str(result.failed[0].error)
+            assert list((tmp_path / "tmp").iterdir()) == []
+
+            server.failing = set()
+            server.downloads.clear()
+            result = mirror.run("P", kinds=["workitem", "testrun"])
+
+        assert result.ok and result.downloaded == 1 and result.unchanged == 2
+        assert server.downloads == ["R1"]
+        print("\n✓ Mock: Mirror resumed after failures")
+
+    def test_mirror_unknown_kind(self, mirror_api, tmp_path):
+        """Test that an unknown kind raises ValueError"""
+        api, _ = mirror_api
+        with AttachmentMirror(api, tmp_path) as mirror:
+            with pytest.raises(ValueError):
+                mirror.run("P", kinds=["wiki"])
+        print("\n✓ Mock: Unknown kind rejected")
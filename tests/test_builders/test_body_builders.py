@@ -0,0 +1,156 @@
+"""
+Pytest tests for the typed request body builders.
+
+Tests the wire form of the built resources against the request schemas, that
+bodies and chunks share the built resources, encoded chunks sent through a real
+session, and builders used as the items of bulk methods.
+Uses mocks and a fake transport adapter to avoid hitting real API.
+
+Run with:
+    pytest test_body_builders.py -v
+"""
+import datetime
+import json
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from unittest.mock import Mock
+
+import modules.builders as builders
+from modules.json_backend import JsonSession
+from modules.validation import request_validator
+from modules.work_items import WorkItems
+
+
+class _Adapter(BaseAdapter):
+    """Transport answering every request with 201 and keeping the requests"""
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = requests.Response()
+        response.status_code = 201
+        response._content = b'{"data": []}'
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+class TestBodyBuilders:
+    """Unit tests for the request body builders"""
+
+    def test_work_items_wire_form(self):
+        """Test the Work Item resources built from typed arguments"""
+        builder = builders.WorkItemsBuilder()
+
+        builder.add('requirement', 'Login', description='<p>Users can log in</p>', status='open',
+                    due_date=datetime.date(2026, 1, 31), assignees=['jdoe'], author='asmith', customer='ACME')
+        builder.add(id='MyProjectId/WI-1', severity='major')
+
+        assert builder.body == {'data': [
+            {'type': 'workitems',
+             'attributes': {'customer': 'ACME', 'type': 'requirement', 'title': 'Login',
+                            'description': {'type': 'text/html', 'value': '<p>Users can log in</p>'},
+                            'status': 'open', 'dueDate': '2026-01-31'},
+             'relationships': {'assignee': {'data': [{'type': 'users', 'id': 'jdoe'}]},
+                               'author': {'data': {'type': 'users', 'id': 'asmith'}}}},
+            {'type': 'workitems', 'id': 'MyProjectId/WI-1', 'attributes': {'severity': 'major'}},
+        ]}
+        print("\n✓ Mock: Work Item resources built")
+
+    def test_shared_relationships_not_mutated(self):
+        """Test that a relationships dictionary shared by several add() calls is not changed"""
+        builder = builders.WorkItemsBuilder()
+        relationships = {'project': builders.to_one('projects', 'P')}
+
+        first = builder.add('task', 'A', assignees=['x'], relationships=relationships)
+        second = builder.add('task', 'B', assignees=['y'], relationships=relationships)
+
+        assert relationships == {'project': builders.to_one('projects', 'P')}
+        assert first['relationships']['assignee'] == builders.to_many('users', ['x'])
+        assert second['relationships']['assignee'] == builders.to_many('users', ['y'])
+        assert first['relationships']['project'] is relationships['project']
+        print("\n✓ Mock: Shared relationships not mutated")
+
+    @pytest.mark.parametrize("method, endpoint, build", [
+        ('POST', 'projects/P/workitems',
+         lambda: builders.WorkItemsBuilder().add('task', 'Title', priority='90.0', categories=['ui'])),
+        ('POST', 'projects/P/testruns/R/testrecords',
+         lambda: builders.TestRecordsBuilder().add('P/TC-1', 'passed', duration=1.5, comment='ok',
+                                                   executed=datetime.datetime(2026, 1, 1, 12, 0),
+                                                   executed_by='jdoe', defect='P/WI-9')),
+        ('POST', 'projects/P/testruns/R/testrecords/P/TC-1/0/teststepresults',
+         lambda: builders.TestStepResultsBuilder().add('failed', comment='Timeout')),
+        ('POST', 'projects/P/workitems/WI-1/linkedworkitems',
+         lambda: builders.LinkedWorkItemsBuilder().add('relates_to', 'P/WI-2', suspect=True)),
+        ('POST', 'projects/P/workitems/WI-1/approvals',
+         lambda: builders.WorkItemApprovalsBuilder().add('jdoe')),
+        ('PATCH', 'projects/P/workitems/WI-1/approvals',
+         lambda: builders.WorkItemApprovalsBuilder().add(status='approved', id='P/WI-1/jdoe')),
+    ])
+    def test_resources_match_request_schemas(self, method, endpoint, build):
+        """Test that the built resources are valid items of their request schema"""
+        resource = build()
+
+        assert request_validator(method, endpoint).item_errors(resource) == []
+        print(f"\n✓ Mock: {resource['type']} resource matches the request schema")
+
+    def test_body_and_chunks_share_resources(self):
+        """Test that the body and its chunks are not copies of the built resources"""
+        builder = builders.LinkedWorkItemsBuilder()
+        added = [builder.add('relates_to', f'P/WI-{n}') for n in range(5)]
+
+        chunks = list(builder.chunks(2))
+
+        assert [len(chunk['data']) for chunk in chunks] == [2, 2, 1]
+        assert all(a is b for a, b in zip(added, [item for chunk in chunks for item in chunk['data']]))
+        assert builder.body['data'][0] is added[0]
+        assert list(builder) == added and len(builder) == 5
+        with pytest.raises(ValueError):
+            next(builder.chunks(0))
+        builder.clear()
+        assert len(builder) == 0 and added[0]['attributes']['role'] == 'relates_to'
+        print("\n✓ Mock: Body and chunks share resources")
+
+    def test_encoded_chunks_sent_as_is(self):
+        """Test that encoded chunks are sent without being encoded again"""
+        api = WorkItems("https://example.com/polarion/rest/v1", token="token", session=JsonSession())
+        adapter = _Adapter()
+        api._session.mount("https://", adapter)
+        builder = builders.WorkItemsBuilder()
+        for n in range(5):
+            builder.add('task', f'Task {n}')
+
+        for body in builder.encoded_chunks(3):
+            api.post_work_items("MyProjectId", body)
+
+        assert [json.loads(request.body) for request in adapter.requests] == list(builder.chunks(3))
+        assert adapter.requests[0].headers['Content-Type'] == 'application/json'
+        print("\n✓ Mock: Encoded chunks sent as is")
+
+    def test_builder_as_bulk_items(self, mock_work_items_api, test_params):
+        """Test that a builder can be passed as the items of a bulk method"""
+        def post(url, json=None, **kwargs):
+            response = Mock(status_code=201)
+            response.json.return_value = {
+                "data": [{"type": "workitems", "id": f"TEST_PROJECT/WI-{n}"} for n in range(len(json['data']))]
+            }
+            return response
+        mock_work_items_api._session.post.side_effect = post
+        builder = builders.WorkItemsBuilder()
+        for n in range(4):
+            builder.add('task', f'Task {n}')
+
+        result = mock_work_items_api.bulk_post_work_items(test_params['project_id'], builder, chunk_size=2,
+                                                          max_workers=1)
+
+        assert result.ok and len(result.succeeded) == 4
+        sent = [item for call in mock_work_items_api._session.post.call_args_list for item in call[1]['json']['data']]
+        assert all(a is b for a, b in zip(sent, builder))
+        print("\n✓ Mock: Builder used as bulk items")
@@ -0,0 +1,127 @@
+"""
+Pytest tests for bulk_delete helper.
+
+Tests the bulk_delete function from the bulk module against
+DELETE-with-body list endpoints.
+Uses mocks to avoid making real API calls.
+
+Run with:
+    pytest test_bulk_delete.py -v
+"""
+import pytest
+from unittest.mock import Mock
+
+from modules.bulk import bulk_delete
+
+
+def _delete_side_effect(missing_ids=()):
+    """Session.request side effect returning 404 when a missing resource is in the body"""
+    def side_effect(method, url, json=None, **kwargs):
+        mock_response = Mock()
+        ids = [item['id'] for item in json['data']]
+        if any(resource_id in missing_ids for resource_id in ids):
+            mock_response.status_code = 404
+            mock_response.json.return_value = {
+                "errors": [{"status": "404", "title": "Not Found", "detail": "Resource not found"}]
+            }
+        else:
+            mock_response.status_code = 204
+        return mock_response
+    return side_effect
+
+
+class TestBulkDeleteMocked:
+    """Unit tests for bulk_delete helper using mocks"""
+
+    def test_bulk_delete_work_items_in_chunks(self, mock_work_items_api, test_params):
+        """Test that work items are deleted in chunks with the given leading arguments"""
+        mock_work_items_api._session.request.side_effect = _delete_side_effect()
+        ids = [f"{test_params['project_id']}/WI-{i}" for i in range(25)]
+
+        result = bulk_delete(
+            mock_work_items_api.delete_work_items,
+            test_params['project_id'],
+            resources=ids,
+            resource_type="workitems",
+            chunk_size=10,
+            max_workers=2
+        )
+
+        assert result.ok
+        assert result.requests_sent == 3
+        assert result.outcomes == {resource_id: 'deleted' for resource_id in ids}
+        call_args = mock_work_items_api._session.request.call_args
+        assert call_args[0][0] == 'DELETE'
+        assert call_args[0][1].endswith(f"projects/{test_params['project_id']}/workitems")
+        print("\n✓ Mock: Work items deleted in chunks")
+
+    def test_bulk_delete_treats_404_as_already_deleted(self, mock_collections_api, test_params):
+        """Test that missing resources are isolated and reported as not found"""
+        mock_collections_api._session.request.side_effect = _delete_side_effect(
+            missing_ids={f"{test_params['project_id']}/C-2"}
+        )
+        resources = [{"type": "collections", "id": f"{test_params['project_id']}/C-{i}"} for i in range(4)]
+
+        result = bulk_delete(
+            mock_collections_api.delete_collections,
+            test_params['project_id'],
+            resources=resources
+        )
+
+        assert result.ok
+        assert result.outcomes == {
+            f"{test_params['project_id']}/C-0": 'deleted',
+            f"{test_params['project_id']}/C-1": 'deleted',
+            f"{test_params['project_id']}/C-2": 'not_found',
+            f"{test_params['project_id']}/C-3": 'deleted',
+        }
+        print("\n✓ Mock: 404 treated as already deleted")
+
+    def test_bulk_delete_reports_failures(self, mock_work_items_api, test_params):
+        """Test that other errors are reported per resource"""
+        mock_response = Mock()
+        mock_response.status_code = 403
+        mock_response.json.return_value = {
+            "errors": [{"status": "403", "title": "Forbidden", "detail": "Not allowed"}]
+        }
+        mock_work_items_api._session.request.return_value = mock_response
+
+        result = bulk_delete(
+            mock_work_items_api.delete_work_items,
+            test_params['project_id'],
+            resources=[f"{test_params['project_id']}/WI-1"],
+            resource_type="workitems"
+        )
+
+        assert not result.ok
+        assert result.failed[0].id == f"{test_params['project_id']}/WI-1"
+        assert result.failed[0].error == "Not allowed"
+        print("\n✓ Mock: Delete failure reported per resource")
+
+    def test_bulk_delete_unwrapped_list(self, mock_projects_api, test_params, mock_response):
+        """Test deleting through a method that takes the bare list"""
+        mock_response.status_code = 204
+        mock_projects_api._session.delete.return_value = mock_response
+        resources = [{"type": "testparameter_definitions", "id": f"{test_params['project_id']}/P-{i}"}
+                     for i in range(3)]
+
+        result = bulk_delete(
+            mock_projects_api.delete_project_test_parameter_definitions,
+            test_params['project_id'],
+            resources=resources,
+            wrap_data=False
+        )
+
+        assert result.ok
+        assert len(result) == 3
+        print("\n✓ Mock: Bare list body handled correctly")
+
+    def test_bulk_delete_plain_ids_require_type(self, mock_work_items_api, test_params):
+        """Test that plain IDs without resource_type raise ValueError"""
+        with pytest.raises(ValueError):
+            bulk_delete(
+                mock_work_items_api.delete_work_items,
+                test_params['project_id'],
+                resources=["TEST_PROJECT/WI-1"]
+            )
+        print("\n✓ Mock: Plain IDs without type rejected")
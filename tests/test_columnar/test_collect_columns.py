@@ -0,0 +1,131 @@
+"""
+Pytest tests for the columnar collection of list endpoints.
+
+Tests paginating into per-column lists, column paths, sparse fieldsets, memory use
+compared with row dictionaries and the optional pandas/Arrow/Parquet export.
+Uses mocks to avoid hitting real API.
+
+Run with:
+    pytest test_collect_columns.py -v
+"""
+import sys
+import tracemalloc
+import pytest
+from unittest.mock import Mock
+
+from modules.columnar import ColumnarResult, collect_columns, sparse_fields
+
+COLUMNS = ["id", "title", "status", "description.value", "relationships.author", "relationships.assignee"]
+
+
+def _work_item(number):
+    return {
+        "type": "workitems", "id": f"MyProjectId/WI-{number}",
+        "attributes": {"title": f"Requirement {number}", "status": ["open", "done"][number % 2],
+                       "severity": "major", "description": {"type": "text/plain", "value": f"Text {number}"}},
+        "relationships": {
+            "author": {"data": {"type": "users", "id": f"user{number % 10}"}},
+            "assignee": {"data": [{"type": "users", "id": "user1"}]} if number % 3 else {"data": []},
+        },
+    }
+
+
+def _pages(total, page_size=100):
+    """Side effect answering get_work_items pages out of total work items"""
+    def get(url, params=None, **kwargs):
+        page_number = params["page[number]"]
+        start = (page_number - 1) * page_size
+        response = Mock(status_code=200)
+        response.json.return_value = {"data": [_work_item(i) for i in range(start, min(start + page_size, total))],
+                                      "meta": {"totalCount": total}}
+        return response
+    return get
+
+
+class TestCollectColumns:
+    """Unit tests for collect_columns using mocks"""
+
+    def test_collect_all_pages(self, mock_work_items_api):
+        """Test that every page is collected into the columns"""
+        mock_work_items_api._session.get.side_effect = _pages(250)
+
+        table = collect_columns(mock_work_items_api.get_work_items, "MyProjectId", columns=COLUMNS,
+                                resource_type="workitems", query="type:requirement")
+
+        assert len(table) == 250 and mock_work_items_api._session.get.call_count == 3
+        assert table.column("id")[249] == "MyProjectId/WI-249"
+        assert table["status"][:3] == ["open", "done", "open"]
+        assert table["status"][0] is table["status"][2]
+        assert table["description.value"][5] == "Text 5"
+        assert table["relationships.author"][12] == "user2"
+        assert table["relationships.assignee"][:2] == [[], ["user1"]]
+        assert next(table.rows()) == ("MyProjectId/WI-0", "Requirement 0", "open", "Text 0", "user0", [])
+        params = mock_work_items_api._session.get.call_args[1]["params"]
+        assert params["fields[workitems]"] == "title,status,description,author,assignee"
+        assert params["query"] == "type:requirement"
+        print("\n✓ Mock: Pages collected into columns")
+
+    def test_missing_values_and_invalid_columns(self):
+        """Test that missing fields give None and invalid column lists raise ValueError"""
+        table = ColumnarResult(["id", "title", "links.self", "meta.x", "description.value", "relationships.project"])
+        table.append({"type": "workitems", "id": "P/WI-1", "attributes": {"description": "not an object"}})
+
+        assert list(table.rows()) == [("P/WI-1", None, None, None, None, None)]
+        with pytest.raises(KeyError):
+            table.column("status")
+        with pytest.raises(ValueError):
+            ColumnarResult(["id", "id"])
+        with pytest.raises(ValueError):
+            ColumnarResult([])
+        assert sparse_fields("testrecords", ["id", "links.self"]) == {"testrecords": "@basic"}
+        print("\n✓ Mock: Missing values and invalid columns handled")
+
+    def test_memory_fraction_of_row_dicts(self):
+        """Test that columns take a fraction of the memory of row dictionaries"""
+        columns = ["id", "title", "status", "severity", "relationships.author"]
+        resources = [_work_item(i) for i in range(20000)]
+
+        tracemalloc.start()
+        rows = [{"id": r["id"], "title": r["attributes"]["title"], "status": r["attributes"]["status"],
+                 "severity": r["attributes"]["severity"], "author": r["relationships"]["author"]["data"]["id"]}
+                for r in resources]
+        rows_size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del rows
+
+        tracemalloc.start()
+        table = ColumnarResult(columns)
+        table.extend(resources)
+        table_size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        assert len(table) == 20000
+        assert table_size * 3 < rows_size
+        print(f"\n✓ Mock: 20000 rows take {table_size} bytes as columns, {rows_size} as dicts")
+
+    def test_export_requires_libraries(self, monkeypatch):
+        """Test that exporting without pandas or pyarrow raises ImportError"""
+        table = ColumnarResult(["id"])
+        monkeypatch.setitem(sys.modules, "pandas", None)
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+        with pytest.raises(ImportError, match="pandas"):
+            table.to_pandas()
+        with pytest.raises(ImportError, match="pyarrow"):
+            table.to_arrow()
+        print("\n✓ Mock: Missing export libraries reported")
+
+    def test_export_pandas_arrow_parquet(self, tmp_path):
+        """Test the DataFrame, Arrow and Parquet exports"""
+        pandas = pytest.importorskip("pandas")
+        pyarrow = pytest.importorskip("pyarrow")
+        import pyarrow.parquet
+        table = ColumnarResult(["id", "status"])
+        table.extend(_work_item(i) for i in range(4))
+
+        frame = table.to_pandas()
+        assert isinstance(frame, pandas.DataFrame) and list(frame["status"]) == ["open", "done", "open", "done"]
+        assert table.to_arrow().num_rows == 4
+        table.to_parquet(tmp_path / "items.parquet")
+        assert pyarrow.parquet.read_table(tmp_path / "items.parquet").column("id").to_pylist()[3] == "MyProjectId/WI-3"
+        print("\n✓ Mock: Exported to pandas, Arrow and Parquet")
@@ -0,0 +1,109 @@
+"""
+Pytest tests for the JSON:API compound document index.
+
+Tests resolving to-one and to-many relationships through the (type, id) index,
+resources missing from 'included', single resources and error responses.
+Uses mocks to avoid hitting real API.
+
+Run with:
+    pytest test_compound_document.py -v
+"""
+import pytest
+import requests
+from unittest.mock import Mock
+
+from modules.compound import CompoundDocument
+
+
+def _work_item(number, author, linked=()):
+    return {
+        "type": "workitems", "id": f"MyProjectId/WI-{number}",
+        "attributes": {"title": f"Item {number}"},
+        "relationships": {
+            "author": {"data": {"type": "users", "id": author}},
+            "assignee": {"data": [{"type": "users", "id": user} for user in linked]},
+            "project": {"data": None},
+        },
+    }
+
+
+def _page(count=1000, users=50):
+    """Build a work item list page including its authors"""
+    return {
+        "data": [_work_item(i, f"user{i % users}", linked=[f"user{(i + 1) % users}", "ghost"])
+                 for i in range(count)],
+        "included": [{"type": "users", "id": f"user{i}", "attributes": {"name": f"User {i}"}}
+                     for i in range(users)],
+        "meta": {"totalCount": count},
+    }
+
+
+def _response(body, status_code=200):
+    response = Mock(status_code=status_code)
+    response.json.return_value = body
+    return response
+
+
+class TestCompoundDocument:
+    """Unit tests for CompoundDocument using mocks"""
+
+    def test_decode_list_response(self, mock_work_items_api):
+        """Test that relationships of a page resolve to the included resources"""
+        mock_work_items_api._session.get.return_value = _response(_page())
+
+        document = mock_work_items_api.decode(
+            mock_work_items_api.get_work_items("MyProjectId", include="author,assignee"))
+
+        work_items = document.resources()
+        assert len(work_items) == 1000 and document.meta == {"totalCount": 1000}
+        first = work_items[0]
+        assert first["title"] == "Item 0" and first.get("missing", "-") == "-"
+        author = first.related("author")
+        assert author.loaded and author["name"] == "User 0"
+        assert author is work_items[50].related("author")
+        assignees = first.related("assignee")
+        assert [(user.id, user.loaded) for user in assignees] == [("user1", True), ("ghost", False)]
+        assert assignees[1].attributes == {}
+        assert first.related("project") is None and first.related("unknown") is None
+        assert first.related_ids("assignee") == ["user1", "ghost"]
+        assert len(document.resources("users")) == 50
+        assert document.get("users", "user7")["name"] == "User 7"
+        assert document.get("users", "ghost") is None
+        assert ("workitems", "MyProjectId/WI-3") in document
+        print("\n✓ Mock: Relationships resolved through the index")
+
+    def test_relationships_resolved_lazily(self):
+        """Test that relationships are resolved on first access and then cached"""
+        body = _page(count=3)
+        document = CompoundDocument(body)
+        work_item = document.data[0]
+
+        assert work_item._related == {}
+        author = work_item.related("author")
+        body["included"][0]["attributes"]["name"] = "Renamed"
+        assert work_item.related("author") is author
+        assert work_item._related.keys() == {"author"}
+        print("\n✓ Mock: Relationships resolved lazily")
+
+    def test_single_resource_and_included_duplicates(self):
+        """Test single-resource documents and primary data winning over included copies"""
+        body = {
+            "data": _work_item(1, "user0", linked=["user0"]),
+            "included": [{"type": "users", "id": "user0", "attributes": {"name": "User 0"}},
+                         {"type": "workitems", "id": "MyProjectId/WI-1", "attributes": {}}],
+        }
+        document = CompoundDocument(body)
+
+        assert document.data["title"] == "Item 1"
+        assert document.data.related("author") is document.data.related("assignee")[0]
+        assert document.get("workitems", "MyProjectId/WI-1") is document.data
+        assert len(document) == 2 and len(document.included) == 2
+        print("\n✓ Mock: Single resource decoded")
+
+    def test_error_response(self):
+        """Test that decoding an error response raises HTTPError"""
+        response = _response({"errors": [{"status": "404", "detail": "Work Item not found"}]}, 404)
+
+        with pytest.raises(requests.HTTPError, match="Work Item not found"):
+            CompoundDocument.from_response(response)
+        print("\n✓ Mock: Error response rejected")
@@ -0,0 +1,103 @@
+"""
+Pytest tests for the streaming attachment downloads.
+
+Tests save_*_attachment_content methods writing to paths and file objects in
+chunks, checksums, incomplete downloads and failed requests.
+Uses mocks to avoid hitting real API.
+
+Run with:
+    pytest test_save_attachment_content.py -v
+"""
+import hashlib
+import io
+import pytest
+from unittest.mock import Mock
+
+from modules.downloads import save_stream
+
+
+def _stream_response(chunks, status_code=200, headers=None):
+    """Build a streamed response yielding chunks"""
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.headers = headers if headers is not None else {"Content-Type": "text/plain"}
+    mock_response.iter_content.side_effect = lambda chunk_size: iter(chunks)
+    return mock_response
+
+
+class _RecordingFile(io.BytesIO):
+    """BytesIO remembering the size of the largest write"""
+    largest_write = 0
+
+    def write(self, data):
+        self.largest_write = max(self.largest_write, len(data))
+        return super().write(data)
+
+
+class TestSaveAttachmentContent:
+    """Unit tests for the streaming attachment downloads using mocks"""
+
+    def test_save_document_attachment_to_path(self, mock_document_attachments_api, tmp_path):
+        """Test that the content is streamed to a file with its checksum"""
+        chunks = [b"line %d\n" % i for i in range(1000)]
+        response = _stream_response(chunks)
+        mock_document_attachments_api._session.get.return_value = response
+        target = tmp_path / "build.log"
+
+        result = mock_document_attachments_api.save_document_attachment_content(
+            "MyProjectId", "_default", "MyDoc", "MyAttachmentId", target, revision="1234", chunk_size=4096)
+
+        content = b"".join(chunks)
+        assert target.read_bytes() == content
+        assert result.size == len(content)
+        assert result.checksum == hashlib.sha256(content).hexdigest()
+        assert result.path == str(target) and result.content_type == "text/plain"
+        assert not (tmp_path / "build.log.part").exists()
+        response.iter_content.assert_called_once_with(chunk_size=4096)
+        response.close.assert_called_once()
+
+        call_args = mock_document_attachments_api._session.get.call_args
+        assert call_args[0][0].endswith("documents/MyDoc/attachments/MyAttachmentId/content")
+        assert call_args[1] == {"params": {"revision": "1234"}, "stream": True}
+        print("\n✓ Mock: Attachment streamed to disk")
+
+    def test_save_to_file_object_in_chunks(self, mock_test_record_attachments_api):
+        """Test that memory use is bounded by the chunk size"""
+        chunks = [b"x" * 1024] * 512
+        mock_test_record_attachments_api._session.get.return_value = _stream_response(chunks)
+        target = _RecordingFile()
+
+        result = mock_test_record_attachments_api.save_test_record_attachment_content(
+            "MyProjectId", "MyTestRunId", "MyProjectId", "MyTestCaseId", "0", "MyAttachmentId", target,
+            chunk_size=1024, algorithm="md5")
+
+        assert result.path is None and result.size == 512 * 1024
+        assert result.algorithm == "md5"
+        assert result.checksum == hashlib.md5(b"x" * 512 * 1024).hexdigest()
+        assert target.largest_write == 1024
+        print("\n✓ Mock: File object written chunk by chunk")
+
+    def test_incomplete_download_removes_partial_file(self, mock_page_attachments_api, tmp_path):
+        """Test that a truncated body raises and leaves no file behind"""
+        mock_page_attachments_api._session.get.return_value = _stream_response(
+            [b"abc"], headers={"Content-Length": "10"})
+        target = tmp_path / "page.bin"
+
+        with pytest.raises(ValueError, match="3 of 10"):
+            mock_page_attachments_api.save_page_attachment_content(
+                "MyProjectId", "_default", "MyPage", "MyAttachmentId", target)
+
+        assert list(tmp_path.iterdir()) == []
+        print("\n✓ Mock: Incomplete download rejected")
+
+    def test_failed_request(self, tmp_path):
+        """Test that an error response raises ValueError without creating a file"""
+        response = _stream_response([], status_code=404)
+        response.json.return_value = {"errors": [{"status": "404", "detail": "Attachment not found"}]}
+
+        with pytest.raises(ValueError, match="Attachment not found"):
+            save_stream(response, tmp_path / "missing.bin")
+
+        assert list(tmp_path.iterdir()) == []
+        response.close.assert_called_once()
+        print("\n✓ Mock: Failed download reported")
@@ -0,0 +1,145 @@
+"""
+Pytest tests for the fan-out helper.
+
+Tests FanOut ordering, error capture, cancellation and progress reporting.
+Uses mocks to avoid making real API calls.
+
+Run with:
+    pytest test_fanout.py -v
+"""
+import threading
+import time
+import pytest
+import requests
+from unittest.mock import Mock
+
+from modules.fanout import FanOut, CallResult
+from modules.json_backend import JsonSession
+import modules.test_runs as test_runs_module
+from modules.work_items import WorkItems
+
+
+def _get_side_effect(url, params=None, **kwargs):
+    """Session.get side effect answering with the requested work item"""
+    work_item_id = url.rsplit('/', 1)[1]
+    if work_item_id == "WI-3":
+        raise requests.ConnectionError("Connection reset")
+    mock_response = Mock()
+    mock_response.status_code = 404 if work_item_id == "WI-5" else 200
+    mock_response.json.return_value = {"data": {"id": f"MyProjectId/{work_item_id}"}}
+    return mock_response
+
+
+class TestFanOutMocked:
+    """Unit tests for FanOut using mocks"""
+
+    def test_fan_out_ordered_with_error_capture(self, mock_work_items_api):
+        """Test that results come in input order with failures captured per call"""
+        mock_work_items_api._session.get.side_effect = _get_side_effect
+        progress = []
+
+        fan_out = FanOut(mock_work_items_api.get_work_item,
+                         (("MyProjectId", f"WI-{i}") for i in range(10)),
+                         max_workers=4,
+                         on_progress=lambda f: progress.append(f.completed))
+        calls = fan_out.results()
+
+        assert [call.index for call in calls] == list(range(10))
+        assert [call.args[1] for call in calls] == [f"WI-{i}" for i in range(10)]
+        assert isinstance(calls[3].error, requests.ConnectionError)
+        assert not calls[5].ok and calls[5].value.status_code == 404
+        assert calls[0].ok and calls[0].value.json()["data"]["id"] == "MyProjectId/WI-0"
+        assert fan_out.completed == 10 and fan_out.failed == 2
+        assert progress == list(range(1, 11))
+        print("\n✓ Mock: Ordered results with captured errors")
+
+    def test_fan_out_as_completed(self):
+        """Test that unordered results are yielded as calls complete"""
+        def slow_first(index):
+            time.sleep(0.2 if index == 0 else 0)
+            return index
+
+        calls = list(FanOut(slow_first, range(4), max_workers=4, ordered=False))
+
+        assert calls[-1].index == 0
+        assert sorted(call.value for call in calls) == [0, 1, 2, 3]
+        print("\n✓ Mock: Results yielded as completed")
+
+    def test_fan_out_ordered_bounds_buffered_results(self):
+        """Test that a slow first call stops new calls once the window is full of buffered results"""
+        release = threading.Event()
+        started = []
+
+        def slow_first(index):
+            started.append(index)
+            if index == 0:
+                release.wait(5)
+            return index
+
+        def release_head():
+            time.sleep(0.2)
+            started_while_blocked.extend(started)
+            release.set()
+
+        started_while_blocked = []
+        thread = threading.Thread(target=release_head)
+        thread.start()
+        calls = FanOut(slow_first, range(100), max_workers=2).results()
+        thread.join()
+
+        assert sorted(started_while_blocked) == [0, 1, 2, 3]
+        assert [call.value for call in calls] == list(range(100))
+        print("\n✓ Mock: Buffered results bounded by the window")
+
+    def test_fan_out_keyword_arguments(self):
+        """Test that dict arguments are passed as keyword arguments"""
+        calls = FanOut(lambda a, b=0: a + b, [{"a": 1, "b": 2}, (3, 4), 5]).results()
+
+        assert [call.value for call in calls] == [3, 7, 5]
+        print("\n✓ Mock: Keyword arguments passed")
+
+    def test_fan_out_cancel(self):
+        """Test that cancel stops starting new calls"""
+        started = []
+        lock = threading.Lock()
+
+        def call(index):
+            with lock:
+                started.append(index)
+            time.sleep(0.01)
+            return index
+
+        fan_out = FanOut(call, range(1000), max_workers=2)
+        calls = []
+        for result in fan_out:
+            calls.append(result)
+            if len(calls) == 3:
+                fan_out.cancel()
+
+        assert fan_out.cancelled
+        assert len(started) < 20
+        assert all(isinstance(result, CallResult) for result in calls)
+        with pytest.raises(RuntimeError):
+            list(fan_out)
+        print("\n✓ Mock: Cancel stopped new calls")
+
+    def test_shared_pool_only_grows(self):
+        """Test that modules sharing a session grow its connection pool and never shrink it"""
+        session = JsonSession()
+        work_items = WorkItems("https://example.com/polarion/rest/v1", "token", session=session)
+        test_runs = test_runs_module.TestRuns("https://example.com/polarion/rest/v1", "token", session=session)
+        default = session.get_adapter("https://")
+
+        work_items._ensure_pool_size(32)
+        grown = session.get_adapter("https://")
+        test_runs._ensure_pool_size(16)
+
+        assert grown is not default and grown._pool_maxsize == 32
+        assert session.get_adapter("https://") is grown and session.get_adapter("http://") is grown
+        print("\n✓ Mock: Shared pool only grows")
+
+    def test_fan_out_invalid_max_workers(self):
+        """Test that an invalid max_workers raises ValueError"""
+        with pytest.raises(ValueError):
+            FanOut(print, [], max_workers=0)
+        print("\n✓ Mock: Invalid max_workers rejected")
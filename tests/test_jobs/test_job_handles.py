@@ -0,0 +1,180 @@
+"""
+Pytest tests for the submit_* job methods of Documents, Projects and TestRuns.
+
+Tests JobHandle completion, callbacks, failed operations, the shared scheduler
+and streaming of result files.
+Uses mocks to avoid hitting real API.
+
+Run with:
+    pytest test_job_handles.py -v
+"""
+import gc
+import io
+import threading
+import weakref
+import pytest
+from concurrent.futures import TimeoutError
+from unittest.mock import Mock
+
+from modules.jobs import Jobs, shared_job_waiter
+
+
+def _accepted(job_id):
+    """Build the 202 Accepted response of an operation starting a job"""
+    mock_response = Mock()
+    mock_response.status_code = 202
+    mock_response.json.return_value = {"data": {"type": "jobs", "id": job_id}}
+    return mock_response
+
+
+def _job_response(job_id, state, status="UNKNOWN", downloads=None):
+    """Build a job GET response"""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_response.json.return_value = {
+        "data": {
+            "type": "jobs",
+            "id": job_id,
+            "attributes": {"jobId": job_id, "state": state, "status": {"type": status, "message": "done"}},
+            "links": {"downloads": downloads or []}
+        }
+    }
+    return mock_response
+
+
+def _file_response(chunks):
+    """Build a streamed file download response"""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.iter_content.return_value = iter(chunks)
+    return mock_response
+
+
+class TestJobHandles:
+    """Unit tests for the job handles using mocks"""
+
+    def test_submit_export_excel_tests_streams_result_file(self, mock_test_runs_api, tmp_path):
+        """Test that the handle resolves and streams the exported file to disk"""
+        release = threading.Event()
+
+        def get(url, params=None, **kwargs):
+            if url.endswith("actions/exportTestsToExcel"):
+                return _accepted("ExportJob")
+            if kwargs.get("stream"):
+                return _file_response([b"PK", b"", b"xlsx"])
+            release.wait(1)
+            return _job_response("ExportJob", "FINISHED", "OK",
+                                 downloads=["https://test.polarion.com/polarion/download/MyTestRunId.xlsx"])
+
+        mock_test_runs_api._session.get.side_effect = get
+        shared_job_waiter(mock_test_runs_api).initial_interval = 0.001
+        called = []
+
+        handle = mock_test_runs_api.submit_export_excel_tests("MyProjectId", "MyTestRunId")
+        handle.add_done_callback(called.append)
+
+        assert handle.job_id == "ExportJob"
+        assert handle.response.status_code == 202
+        assert not handle.done()
+        with pytest.raises(TimeoutError):
+            handle.result(timeout=0.01)
+
+        release.set()
+        target = tmp_path / "export.xlsx"
+        saved = handle.save_result_file(target, timeout=5)
+
+        assert handle.done() and handle.result().ok
+        assert called == [handle]
+        assert saved.filename == "MyTestRunId.xlsx"
+        assert target.read_bytes() == b"PKxlsx"
+        assert not (tmp_path / "export.xlsx.part").exists()
+        url = mock_test_runs_api._session.get.call_args[0][0]
+        assert url.endswith("jobs/ExportJob/actions/download/MyTestRunId.xlsx")
+        print("\n✓ Mock: Export job handle streamed the result file")
+
+    def test_submit_methods_share_one_scheduler(self, mock_documents_api):
+        """Test that the handles of one client are polled by a single scheduler"""
+        polls = {}
+        threads = set()
+        mock_documents_api._session.post.side_effect = [_accepted(f"Job-{i}") for i in range(3)]
+
+        def get(url, params=None, **kwargs):
+            threads.add(threading.get_ident())
+            job_id = url.rsplit('/', 1)[1]
+            polls[job_id] = polls.get(job_id, 0) + 1
+            return _job_response(job_id, "FINISHED" if polls[job_id] > 1 else "RUNNING", "OK")
+
+        mock_documents_api._session.get.side_effect = get
+        waiter = shared_job_waiter(mock_documents_api)
+        waiter.initial_interval = waiter.max_interval = 0.001
+
+        handles = [
+            mock_documents_api.submit_merge_document_to_master("MyProjectId", "_default", "MyDoc"),
+            mock_documents_api.submit_merge_document_from_master("MyProjectId", "_default", "MyDoc"),
+            mock_documents_api.submit_branch_documents({"documentConfigurations": []}),
+        ]
+
+        assert [handle.result(timeout=5).job_id for handle in handles] == ["Job-0", "Job-1", "Job-2"]
+        assert all(handle.result().ok for handle in handles)
+        assert len(threads) == 1
+        assert waiter.jobs._session is mock_documents_api._session
+        print("\n✓ Mock: Handles polled by the shared scheduler")
+
+    def test_submit_failed_operation(self, mock_projects_api):
+        """Test that an operation not starting a job returns a done handle with the error"""
+        forbidden = Mock(status_code=403, text="")
+        forbidden.json.return_value = {"errors": [{"status": "403", "detail": "Forbidden"}]}
+        mock_projects_api._session.delete.return_value = forbidden
+        called = []
+
+        handle = mock_projects_api.submit_delete_project("MyProjectId")
+        handle.add_done_callback(called.append)
+
+        assert handle.done() and handle.job_id is None
+        assert not handle.result().ok
+        assert "Forbidden" in handle.result().error
+        assert called == [handle]
+        with pytest.raises(ValueError):
+            handle.save_result_file(io.BytesIO())
+        print("\n✓ Mock: Failed operation returned a done handle")
+
+    def test_submit_create_project_validates_parameters(self, mock_projects_api):
+        """Test that the submit variant keeps the parameter validation"""
+        with pytest.raises(ValueError):
+            mock_projects_api.submit_create_project(projectId="MY_PROJECT")
+        mock_projects_api._session.post.assert_not_called()
+        print("\n✓ Mock: Missing parameters rejected")
+
+    def test_shared_waiter_released_with_session(self):
+        """Test that an idle waiter stops its thread and goes away with the session"""
+        jobs = Jobs("https://test.polarion.com/polarion/rest/v1", "test_token")
+        jobs._session.get = Mock(return_value=_job_response("Job-1", "FINISHED", "OK"))
+        waiter = shared_job_waiter(jobs)
+        waiter.initial_interval = waiter.idle_timeout = 0.001
+
+        assert waiter.submit("Job-1").result(timeout=5).ok
+        thread = waiter._thread
+        thread.join(5)
+        session = weakref.ref(jobs._session)
+        del jobs, waiter
+        gc.collect()
+
+        assert not thread.is_alive()
+        assert session() is None
+        print("\n✓ Mock: Idle waiter released with the session")
+
+    def test_close_stops_shared_waiter(self, mock_test_runs_api):
+        """Test that closing a module stops the waiter of its session and resolves pending jobs"""
+        mock_test_runs_api._session.get.return_value = _job_response("Job-1", "RUNNING")
+        waiter = shared_job_waiter(mock_test_runs_api)
+        waiter.initial_interval = waiter.max_interval = 0.001
+        future = waiter.submit("Job-1")
+
+        mock_test_runs_api.close()
+
+        assert future.result(timeout=5).timed_out
+        assert not waiter._thread.is_alive()
+        assert shared_job_waiter(mock_test_runs_api) is not waiter
+        mock_test_runs_api._session.close.assert_called_once()
+        print("\n✓ Mock: Closing the module stopped the job waiter")
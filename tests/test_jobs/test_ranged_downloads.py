@@ -0,0 +1,204 @@
+"""
+Pytest tests for the resumable ranged downloads of job result files.
+
+Tests resuming after connection resets, resuming a '.part' file left by an earlier
+call, parallel ranged segments, servers ignoring Range and checksum verification.
+Uses mocks to avoid hitting real API.
+
+Run with:
+    pytest test_ranged_downloads.py -v
+"""
+import hashlib
+import re
+import threading
+import pytest
+import requests
+from unittest.mock import Mock
+
+from modules.job_waiter import JobResultFile
+
+CONTENT = bytes(range(256)) * 40
+
+
+class _RangeServer:
+    """Fake download endpoint honouring (or ignoring) Range headers"""
+
+    def __init__(self, content=CONTENT, honour_range=True, resets=0, reset_after=1000, etag=None):
+        self.content = content
+        self.etag = etag
+        self.if_ranges = []
+        self.honour_range = honour_range
+        self.resets = resets
+        self.reset_after = reset_after
+        self.ranges = []
+        self.lock = threading.Lock()
+
+    def get(self, url, params=None, headers=None, stream=False):
+        assert stream and url.endswith("jobs/MyJobId/actions/download/export.xlsx")
+        header = (headers or {}).get("Range")
+        if_range = (headers or {}).get("If-Range")
+        with self.lock:
+            self.ranges.append(header)
+            self.if_ranges.append(if_range)
+            reset = self.resets > 0
+            self.resets -= reset
+        response = Mock(headers={"Content-Type": "application/vnd.ms-excel"})
+        if self.etag:
+            response.headers["ETag"] = self.etag
+        body = self.content
+        if header and self.honour_range and (if_range is None or if_range == self.etag):
+            first, last = re.match(r"bytes=(\d+)-(\d*)", header).groups()
+            first, last = int(first), int(last) if last else len(self.content) - 1
+            if first >= len(self.content):
+                response.status_code = 416
+                response.headers["Content-Range"] = f"bytes */{len(self.content)}"
+                return response
+            body = self.content[first:last + 1]
+            response.status_code = 206
+            response.headers["Content-Range"] = f"bytes {first}-{first + len(body) - 1}/{len(self.content)}"
+        else:
+            response.status_code = 200
+        response.headers["Content-Length"] = str(len(body))
+
+        def iter_content(chunk_size):
+            for start in range(0, len(body), 100):
+                if reset and start >= self.reset_after:
+                    raise requests.exceptions.ChunkedEncodingError("Connection reset by peer")
+                yield body[start:start + 100]
+        response.iter_content.side_effect = iter_content
+        return response
+
+
+@pytest.fixture
+def range_server(mock_jobs_api, monkeypatch):
+    """Jobs module answered by a fake range server, without retry delays"""
+    monkeypatch.setattr("modules.downloads.time.sleep", lambda seconds: None)
+    server = _RangeServer()
+    mock_jobs_api._session.get.side_effect = server.get
+    return mock_jobs_api, server
+
+
+class TestRangedDownloads:
+    """Unit tests for the resumable ranged downloads using mocks"""
+
+    def test_resume_after_connection_reset(self, range_server, tmp_path):
+        """Test that a reset connection continues from the last byte received"""
+        jobs, server = range_server
+        server.resets = 2
+        target = tmp_path / "export.xlsx"
+
+        result = jobs.save_job_result_file_content("MyJobId", "export.xlsx", target)
+
+        assert target.read_bytes() == CONTENT
+        assert result.size == len(CONTENT)
+        assert result.checksum == hashlib.sha256(CONTENT).hexdigest()
+        assert result.content_type == "application/vnd.ms-excel"
+        assert server.ranges == [None, "bytes=1000-", "bytes=2000-"]
+        assert not (tmp_path / "export.xlsx.part").exists()
+        print("\n✓ Mock: Download resumed after connection resets")
+
+    def test_resume_part_file_of_failed_call(self, range_server, tmp_path):
+        """Test that a failed download keeps its part file and the next call continues it"""
+        jobs, server = range_server
+        server.resets = 1
+        target = tmp_path / "export.xlsx"
+
+        with pytest.raises(ValueError, match="interrupted at byte 1000"):
+            jobs.save_job_result_file_content("MyJobId", "export.xlsx", target, retries=0)
+        assert (tmp_path / "export.xlsx.part").stat().st_size == 1000
+
+        result = jobs.save_job_result_file_content(
+            "MyJobId", "export.xlsx", target, expected_checksum=hashlib.sha256(CONTENT).hexdigest())
+
+        assert target.read_bytes() == CONTENT and result.size == len(CONTENT)
+        assert server.ranges == [None, "bytes=1000-"]
+        print("\n✓ Mock: Part file resumed by the next call")
+
+    def test_parallel_segments(self, range_server, tmp_path):
+        """Test that the file is fetched in ranged segments by several workers"""
+        jobs, server = range_server
+        server.resets = 1
+        server.reset_after = 500
+        target = tmp_path / "export.xlsx"
+
+        result = jobs.save_job_result_file_content("MyJobId", "export.xlsx", target,
+                                                   segment_size=3000, max_workers=3)
+
+        assert target.read_bytes() == CONTENT
+        assert result.checksum == hashlib.sha256(CONTENT).hexdigest()
+        assert server.ranges[:2] == ["bytes=0-2999", "bytes=500-2999"]
+        assert sorted(server.ranges[2:]) == ["bytes=3000-5999", "bytes=6000-8999", "bytes=9000-10239"]
+        print("\n✓ Mock: File fetched in parallel segments")
+
+    def test_segment_larger_than_file(self, range_server, tmp_path):
+        """Test that a first segment larger than the file ends at the size reported by the server"""
+        jobs, server = range_server
+        server.content = CONTENT[:1000]
+        target = tmp_path / "export.xlsx"
+
+        result = jobs.save_job_result_file_content("MyJobId", "export.xlsx", target, segment_size=4096)
+
+        assert target.read_bytes() == CONTENT[:1000] and result.size == 1000
+        assert server.ranges == ["bytes=0-4095"]
+        print("\n✓ Mock: Segment clamped to the file size")
+
+    def test_resume_changed_file_starts_over(self, range_server, tmp_path):
+        """Test that resumed ranges send If-Range and a file changed on the server is fetched again"""
+        jobs, server = range_server
+        server.etag = '"v1"'
+        server.resets = 1
+        target = tmp_path / "export.xlsx"
+
+        with pytest.raises(ValueError, match="interrupted at byte 1000"):
+            jobs.save_job_result_file_content("MyJobId", "export.xlsx", target, retries=0)
+        assert (tmp_path / "export.xlsx.part.validator").read_text() == '"v1"'
+
+        server.content, server.etag = CONTENT[::-1], '"v2"'
+        result = jobs.save_job_result_file_content("MyJobId", "export.xlsx", target)
+
+        assert target.read_bytes() == CONTENT[::-1] and result.size == len(CONTENT)
+        assert server.if_ranges == [None, '"v1"']
+        assert list(tmp_path.iterdir()) == [target]
+        print("\n✓ Mock: Changed file fetched again")
+
+    def test_server_ignoring_range(self, range_server, tmp_path):
+        """Test the fallback to a single download when the server ignores Range"""
+        jobs, server = range_server
+        server.honour_range = False
+        target = tmp_path / "export.xlsx"
+
+        result = jobs.save_job_result_file_content("MyJobId", "export.xlsx", target, segment_size=3000)
+
+        assert target.read_bytes() == CONTENT and result.size == len(CONTENT)
+        assert server.ranges == ["bytes=0-2999", None]
+
+        # A resumed request answered with the whole file starts over
+        server.ranges.clear()
+        server.resets = 1
+        result = jobs.save_job_result_file_content("MyJobId", "export.xlsx", target)
+
+        assert target.read_bytes() == CONTENT and result.size == len(CONTENT)
+        assert server.ranges == [None, "bytes=1000-"]
+        print("\n✓ Mock: Fallback when Range is ignored")
+
+    def test_checksum_mismatch(self, range_server, tmp_path):
+        """Test that a wrong checksum raises ValueError and leaves no file"""
+        jobs, _ = range_server
+
+        with pytest.raises(ValueError, match="Checksum mismatch"):
+            jobs.save_job_result_file_content("MyJobId", "export.xlsx", tmp_path / "export.xlsx",
+                                              expected_checksum="0" * 64)
+
+        assert list(tmp_path.iterdir()) == []
+        print("\n✓ Mock: Checksum verified")
+
+    def test_job_result_file_save_uses_ranges(self, range_server, tmp_path):
+        """Test that JobResultFile.save to a path goes through the resumable download"""
+        jobs, server = range_server
+        server.resets = 1
+
+        result = JobResultFile(jobs, "MyJobId", "export.xlsx").save(tmp_path / "export.xlsx")
+
+        assert result.size == len(CONTENT)
+        assert server.ranges == [None, "bytes=1000-"]
+        print("\n✓ Mock: Job result file saved with resume")
@@ -0,0 +1,129 @@
+"""
+Pytest tests for wait_for_job and wait_for_jobs methods in Jobs class.
+
+Tests polling with backoff, many jobs with a single scheduler, timeouts
+and result file handles.
+Uses mocks to avoid hitting real API.
+
+Run with:
+    pytest test_wait_for_jobs.py -v
+"""
+import threading
+import pytest
+from unittest.mock import Mock
+
+
+def _job_response(job_id, state, status="UNKNOWN", downloads=None, status_code=200):
+    """Build a job GET response"""
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.headers = {}
+    mock_response.json.return_value = {
+        "data": {
+            "type": "jobs",
+            "id": job_id,
+            "attributes": {"jobId": job_id, "state": state, "status": {"type": status, "message": "done"}},
+            "links": {"downloads": downloads or []}
+        }
+    }
+    return mock_response
+
+
+def _accepted(job_id):
+    """Build the 202 Accepted response of an operation starting a job"""
+    mock_response = Mock()
+    mock_response.status_code = 202
+    mock_response.json.return_value = {"data": {"type": "jobs", "id": job_id}}
+    return mock_response
+
+
+class TestWaitForJobs:
+    """Unit tests for the job waiting methods using mocks"""
+
+    def test_wait_for_job_polls_until_finished(self, mock_jobs_api):
+        """Test that a job is polled until it reports a final status"""
+        mock_jobs_api._session.get.side_effect = [
+            _job_response("MyJobId", "RUNNING"),
+            _job_response("MyJobId", "RUNNING"),
+            _job_response("MyJobId", "FINISHED", "OK",
+                          downloads=["https://test.polarion.com/polarion/download/export.xlsx"]),
+        ]
+
+        result = mock_jobs_api.wait_for_job(_accepted("MyJobId"), initial_interval=0.001, max_interval=0.002)
+
+        assert result.ok
+        assert result.polls == 3
+        assert result.state == "FINISHED"
+        assert [f.filename for f in result.files] == ["export.xlsx"]
+        assert mock_jobs_api._session.get.call_args[0][0].endswith("jobs/MyJobId")
+
+        mock_jobs_api._session.get.side_effect = None
+        mock_jobs_api._session.get.return_value = Mock(status_code=200, content=b"xlsx")
+        assert result.files[0].download().content == b"xlsx"
+        assert mock_jobs_api._session.get.call_args[0][0].endswith("jobs/MyJobId/actions/download/export.xlsx")
+        print("\n✓ Mock: Job polled until finished")
+
+    def test_wait_for_jobs_single_scheduler(self, mock_jobs_api):
+        """Test that many jobs are polled by one thread and returned in input order"""
+        polls = {}
+        threads = set()
+
+        def get(url, params=None, **kwargs):
+            threads.add(threading.get_ident())
+            job_id = url.rsplit('/', 1)[1]
+            polls[job_id] = polls.get(job_id, 0) + 1
+            if polls[job_id] < 3:
+                return _job_response(job_id, "RUNNING")
+            return _job_response(job_id, "FINISHED", "FAILED" if job_id == "Job-2" else "OK")
+
+        mock_jobs_api._session.get.side_effect = get
+
+        results = mock_jobs_api.wait_for_jobs([f"Job-{i}" for i in range(20)],
+                                              initial_interval=0.001, max_interval=0.002)
+
+        assert [result.job_id for result in results] == [f"Job-{i}" for i in range(20)]
+        assert [result.ok for result in results].count(False) == 1
+        assert results[2].status == "FAILED" and results[2].message == "done"
+        assert len(threads) == 1
+        assert all(count == 3 for count in polls.values())
+        print("\n✓ Mock: Jobs polled by a single scheduler")
+
+    def test_wait_for_job_timeout_and_errors(self, mock_jobs_api):
+        """Test that timeouts and polling errors resolve the job"""
+        mock_jobs_api._session.get.return_value = _job_response("MyJobId", "RUNNING")
+
+        result = mock_jobs_api.wait_for_job("MyJobId", timeout=0.05, initial_interval=0.01, max_interval=0.01)
+
+        assert result.timed_out and not result.ok
+        assert result.state == "RUNNING"
+
+        not_found = Mock(status_code=404, headers={}, text="")
+        not_found.json.return_value = {"errors": [{"status": "404", "detail": "Job not found"}]}
+        mock_jobs_api._session.get.return_value = not_found
+
+        result = mock_jobs_api.wait_for_job("Missing", initial_interval=0.001)
+
+        assert result.error == "Job not found"
+        print("\n✓ Mock: Timeouts and errors reported")
+
+    def test_wait_for_job_unexpected_error(self, mock_jobs_api):
+        """Test that an unexpected polling error fails the job and the scheduler keeps running"""
+        mock_jobs_api._session.get.side_effect = AttributeError("'NoneType' object has no attribute 'get'")
+
+        result = mock_jobs_api.wait_for_job("Broken", timeout=5, initial_interval=0.001)
+
+        assert not result.ok
+        assert result.error == "AttributeError: 'NoneType' object has no attribute 'get'"
+        mock_jobs_api._session.get.side_effect = None
+        mock_jobs_api._session.get.return_value = _job_response("MyJobId", "FINISHED", "OK")
+        assert mock_jobs_api.wait_for_job("MyJobId", timeout=5, initial_interval=0.001).ok
+        print("\n✓ Mock: Unexpected polling error reported")
+
+    def test_wait_for_job_failed_operation(self, mock_jobs_api):
+        """Test that a failed operation response raises ValueError"""
+        failed = Mock(status_code=403, text="")
+        failed.json.return_value = {"errors": [{"status": "403", "detail": "Forbidden"}]}
+
+        with pytest.raises(ValueError):
+            mock_jobs_api.wait_for_job(failed)
+        print("\n✓ Mock: Failed operation rejected")
@@ -0,0 +1,158 @@
+"""
+Pytest tests for the write journal.
+
+Tests WriteJournal together with the journaled bulk_post_work_items and
+bulk_post_test_runs methods.
+Uses mocks to avoid making real API calls.
+
+Run with:
+    pytest test_write_journal.py -v
+"""
+import pytest
+import requests
+from unittest.mock import Mock
+
+from modules.bulk import created_ids
+from modules.journal import WriteJournal, run_journaled, content_key, CREATED, FAILED, PENDING
+
+
+def _response(status_code, body=None):
+    """Build a response with the given status code and JSON body"""
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.headers = {}
+    mock_response.text = ""
+    mock_response.json.return_value = body or {}
+    return mock_response
+
+
+def _created(prefix):
+    """Session.post side effect creating one resource per item"""
+    counter = iter(range(1, 1000))
+
+    def post(url, json=None, **kwargs):
+        return _response(201, {"data": [{"id": f"{prefix}-{next(counter)}"} for _ in json['data']]})
+    return post
+
+
+@pytest.fixture
+def journal(tmp_path):
+    """Journal stored in a temporary SQLite file"""
+    with WriteJournal(str(tmp_path / "writes.db")) as write_journal:
+        yield write_journal
+
+
+class TestWriteJournalMocked:
+    """Unit tests for the write journal using mocks"""
+
+    def test_journal_records_outcomes(self, journal):
+        """Test that entries are stored and updated per key"""
+        journal.mark_pending('post_work_items', 'MyProjectId', ['a', 'b'])
+        journal.record('post_work_items', 'MyProjectId', 'a', CREATED, resource_id='MyProjectId/WI-1')
+        journal.mark_pending('post_work_items', 'MyProjectId', ['b'])
+
+        assert journal.get('post_work_items', 'MyProjectId', 'a').resource_id == 'MyProjectId/WI-1'
+        assert journal.get('post_work_items', 'MyProjectId', 'b').attempts == 2
+        assert journal.get('post_work_items', 'OtherProject', 'a') is None
+        assert [entry.key for entry in journal.entries('post_work_items', 'MyProjectId', PENDING)] == ['b']
+        with pytest.raises(ValueError):
+            journal.record('post_work_items', 'MyProjectId', 'a', 'unknown')
+        print("\n✓ Mock: Journal outcomes recorded")
+
+    def test_journal_replay_skips_created_work_items(self, mock_work_items_api, journal):
+        """Test that replaying a journaled bulk create only sends missing items"""
+        items = [{"attributes": {"type": "task", "title": f"Task {i}"}} for i in range(4)]
+        mock_work_items_api._session.post.side_effect = [
+            _response(201, {"data": [{"id": "MyProjectId/WI-1"}, {"id": "MyProjectId/WI-2"}]}),
+            _response(400, {"errors": [{"status": "400", "detail": "Invalid"}]}),
+            _response(400, {"errors": [{"status": "400", "detail": "Invalid"}]}),
+            _response(201, {"data": [{"id": "MyProjectId/WI-4"}]}),
+        ]
+
+        first = mock_work_items_api.bulk_post_work_items("MyProjectId", items, chunk_size=2, max_workers=1,
+                                                         journal=journal)
+
+        assert [item.status for item in first.items] == ['created', 'created', 'failed', 'created']
+        failed_key = content_key({'type': 'workitems', **items[2]})
+        assert journal.get('post_work_items', 'MyProjectId', failed_key).status == FAILED
+
+        mock_work_items_api._session.post.side_effect = _created("MyProjectId/WI-NEW")
+        second = mock_work_items_api.bulk_post_work_items("MyProjectId", items, chunk_size=2, max_workers=1,
+                                                          journal=journal)
+
+        assert [item.status for item in second.items] == ['skipped', 'skipped', 'created', 'skipped']
+        assert second.ids == ["MyProjectId/WI-1", "MyProjectId/WI-2", "MyProjectId/WI-NEW-1", "MyProjectId/WI-4"]
+        assert second.requests_sent == 1
+        print("\n✓ Mock: Replay skipped created items")
+
+    def test_journal_reconciles_unknown_outcome(self, mock_work_items_api, journal):
+        """Test that items with an unknown outcome are looked up before being resent"""
+        items = [{"attributes": {"type": "task", "title": "Applied"}},
+                 {"attributes": {"type": "task", "title": "Lost", "importKey": "lost-1"}}]
+        mock_work_items_api._session.post.side_effect = requests.Timeout("Read timed out")
+
+        first = mock_work_items_api.bulk_post_work_items("MyProjectId", items, journal=journal,
+                                                         key_attribute="importKey")
+
+        assert first.failed_count == 2
+        assert len(journal.entries('post_work_items', 'MyProjectId', PENDING)) == 2
+        sent = mock_work_items_api._session.post.call_args[1]['json']['data']
+        applied_key = sent[0]['attributes']['importKey']
+        assert sent[1]['attributes']['importKey'] == "lost-1"
+
+        def get(url, params=None, **kwargs):
+            if applied_key in params['query']:
+                return _response(200, {"data": [{"type": "workitems", "id": "MyProjectId/WI-7"}]})
+            return _response(200, {"data": []})
+
+        mock_work_items_api._session.get.side_effect = get
+        mock_work_items_api._session.post.side_effect = _created("MyProjectId/WI-NEW")
+
+        second = mock_work_items_api.bulk_post_work_items("MyProjectId", items, journal=journal,
+                                                          key_attribute="importKey")
+
+        assert [item.status for item in second.items] == ['skipped', 'created']
+        assert second.ids == ["MyProjectId/WI-7", "MyProjectId/WI-NEW-1"]
+        resent = mock_work_items_api._session.post.call_args[1]['json']['data']
+        assert [item['attributes']['title'] for item in resent] == ["Lost"]
+        assert mock_work_items_api._session.get.call_args[1]['params']['query'] == 'importKey:"lost-1"'
+        assert journal.entries('post_work_items', 'MyProjectId', PENDING) == []
+        print("\n✓ Mock: Unknown outcomes reconciled")
+
+    def test_journal_retries_only_unprocessed_failures(self, journal):
+        """Test that retries resend 503 responses but leave ambiguous failures pending"""
+        request = Mock(side_effect=[_response(503), _response(201, {"data": [{"id": "MyProjectId/WI-1"}]})])
+
+        created = run_journaled(journal, 'post_work_items', 'MyProjectId', request, [{"title": "Task"}],
+                                created_ids, retries=2, backoff=0)
+
+        assert created.ids == ["MyProjectId/WI-1"]
+        assert request.call_count == 2
+
+        for failure in (_response(502), requests.ReadTimeout("Read timed out")):
+            request = Mock(side_effect=[failure, _response(201, {"data": [{"id": "MyProjectId/WI-2"}]})])
+            items = [{"title": f"Ambiguous {failure!r}"}]
+
+            result = run_journaled(journal, 'post_work_items', 'MyProjectId', request, items, created_ids,
+                                   retries=2, backoff=0)
+
+            assert result.failed_count == 1
+            assert request.call_count == 1
+            assert journal.get('post_work_items', 'MyProjectId', content_key(items[0])).status == PENDING
+        print("\n✓ Mock: Only unprocessed failures retried")
+
+    def test_journal_test_runs_lookup(self, mock_test_runs_api, journal):
+        """Test that pending test runs are checked with get_test_run"""
+        runs = [{"attributes": {"id": "Run-1"}}, {"attributes": {"id": "Run-2"}}]
+        journal.mark_pending('post_test_runs', 'MyProjectId', ['Run-1', 'Run-2'])
+        mock_test_runs_api._session.get.side_effect = [_response(200), _response(404)]
+        mock_test_runs_api._session.post.return_value = _response(201, {"data": [{"id": "MyProjectId/Run-2"}]})
+
+        result = mock_test_runs_api.bulk_post_test_runs("MyProjectId", runs, journal=journal)
+
+        assert [item.status for item in result.items] == ['skipped', 'created']
+        assert result.ids == ["MyProjectId/Run-1", "MyProjectId/Run-2"]
+        posted = mock_test_runs_api._session.post.call_args[1]['json']['data']
+        assert posted == [{"type": "testruns", "attributes": {"id": "Run-2"}}]
+        assert journal.get('post_test_runs', 'MyProjectId', 'Run-2').status == CREATED
+        print("\n✓ Mock: Test runs reconciled")
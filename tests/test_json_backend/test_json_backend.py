@@ -0,0 +1,134 @@
+"""
+Pytest tests for the pluggable JSON backend.
+
+Tests that request bodies are encoded and responses decoded with the selected
+backend, the stdlib fallback, and the benchmark of the installed backends.
+Uses a fake transport adapter to avoid hitting real API.
+
+Run with:
+    pytest test_json_backend.py -v
+"""
+import json
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from unittest.mock import Mock
+
+from modules import json_backend
+from modules.json_backend import JsonBackend, JsonSession, JsonResponse, set_backend, get_backend, response_json
+from modules.json_benchmark import benchmark, sample_payload
+from modules.work_items import WorkItems
+
+
+class _Adapter(BaseAdapter):
+    """Transport answering every request with a JSON body and keeping the requests"""
+
+    def __init__(self, body):
+        super().__init__()
+        self.body = body
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(self.body).encode("utf-8")
+        response.headers["Content-Type"] = "application/json"
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def counting_backend():
+    """Backend delegating to the stdlib and counting its calls"""
+    calls = {"dumps": 0, "loads": 0}
+
+    def dumps(obj):
+        calls["dumps"] += 1
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(data):
+        calls["loads"] += 1
+        return json.loads(data)
+
+    previous = set_backend(JsonBackend("counting", dumps, loads))
+    yield calls
+    set_backend(previous)
+
+
+def _work_items(body):
+    api = WorkItems("https://test.polarion.com/polarion/rest/v1", token="test_token")
+    adapter = _Adapter(body)
+    api._session.mount("https://", adapter)
+    return api, adapter
+
+
+class TestJsonBackend:
+    """Unit tests for the JSON backend using a fake transport"""
+
+    def test_default_backend(self):
+        """Test that orjson is used when installed, the stdlib json module otherwise"""
+        expected = "orjson" if json_backend.orjson is not None else "json"
+        assert get_backend().name == expected
+        assert json.loads(json_backend.dumps({"title": "Ä", "n": [1, 2.5, None]})) == {"title": "Ä", "n": [1, 2.5, None]}
+        with pytest.raises(ValueError, match="Unknown or not installed JSON backend"):
+            set_backend("simdjson")
+        print(f"\n✓ Mock: {expected} backend selected")
+
+    def test_request_bodies_encoded_with_backend(self, counting_backend):
+        """Test that json= bodies of POST, PATCH and DELETE are encoded by the backend"""
+        api, adapter = _work_items({"data": [{"type": "workitems", "id": "MyProjectId/WI-1"}]})
+        body = {"data": [{"type": "workitems", "id": "MyProjectId/WI-1", "attributes": {"title": "Title"}}]}
+
+        api.post_work_items("MyProjectId", body)
+        api.patch_work_items("MyProjectId", body)
+        api.delete_work_items("MyProjectId", body)
+
+        assert isinstance(api._session, JsonSession)
+        assert counting_backend["dumps"] == 3
+        assert [request.method for request in adapter.requests] == ["POST", "PATCH", "DELETE"]
+        for request in adapter.requests:
+            assert json.loads(request.body) == body
+            assert request.headers["Content-Type"] == "application/json"
+            assert request.headers["Authorization"] == "Bearer test_token"
+        print("\n✓ Mock: Request bodies encoded by the backend")
+
+    def test_responses_decoded_with_backend(self, counting_backend):
+        """Test that response.json() and the decode paths use the backend"""
+        api, _ = _work_items({"data": [{"type": "workitems", "id": "MyProjectId/WI-1",
+                                        "attributes": {"title": "Title"}}]})
+
+        response = api.get_work_items("MyProjectId")
+
+        assert isinstance(response, JsonResponse)
+        assert response.json()["data"][0]["id"] == "MyProjectId/WI-1"
+        assert api.decode(response).data[0]["title"] == "Title"
+        assert api.decode_models(response)[0].title == "Title"
+        assert counting_backend["loads"] >= 3
+        print("\n✓ Mock: Responses decoded by the backend")
+
+    def test_plain_session_and_mock_responses(self):
+        """Test that other sessions keep json= and responses without content use json()"""
+        session = Mock()
+        session.headers = {}
+        api = WorkItems("https://test.polarion.com/polarion/rest/v1", token="test_token", session=session)
+
+        api.post_work_items("MyProjectId", {"data": []})
+
+        assert session.post.call_args[1]["json"] == {"data": []}
+        response = Mock()
+        response.json.return_value = {"data": None}
+        assert response_json(response) == {"data": None}
+        print("\n✓ Mock: Fallbacks used")
+
+    def test_benchmark(self):
+        """Test that the benchmark times every installed backend"""
+        results = benchmark(sample_payload(count=100), repeat=2)
+
+        assert set(results) == set(json_backend.BACKENDS)
+        assert all(times["dumps"] > 0 and times["loads"] > 0 for times in results.values())
+        print(f"\n✓ Mock: Benchmark {results}")
@@ -0,0 +1,127 @@
+"""
+Pytest tests for bulk_post_linked_work_items method in LinkedWorkItems class.
+
+Tests grouping by source, deduplication against existing links and
+per-link results of the bulk link importer.
+Uses mocks to avoid hitting real API.
+
+Run with:
+    pytest test_bulk_post_linked_work_items.py -v
+"""
+import pytest
+import requests
+from unittest.mock import Mock
+
+
+def _response(status_code, body=None):
+    """Build a response with the given status code and JSON body"""
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.headers = {}
+    mock_response.text = ""
+    mock_response.json.return_value = body or {}
+    return mock_response
+
+
+def _existing(url, params=None, **kwargs):
+    """Session.get side effect returning the existing links of WI-1"""
+    if "/workitems/WI-1/" in url:
+        return _response(200, {"data": [
+            {"type": "linkedworkitems", "id": "MyProjectId/WI-1/relates_to/MyProjectId/WI-2"}
+        ]})
+    return _response(200, {"data": []})
+
+
+def _created(url, json=None, **kwargs):
+    """Session.post side effect creating every posted link"""
+    source = url.split('/projects/')[1].split('/linkedworkitems')[0].replace('/workitems/', '/')
+    return _response(201, {"data": [
+        {"type": "linkedworkitems",
+         "id": f"{source}/{item['attributes']['role']}/{item['relationships']['workItem']['data']['id']}"}
+        for item in json['data']
+    ]})
+
+
+class TestBulkPostLinkedWorkItems:
+    """Unit tests for bulk_post_linked_work_items method using mocks"""
+
+    def test_bulk_post_links_grouped_and_deduplicated(self, mock_linked_work_items_api):
+        """Test that links are grouped by source and existing links are skipped"""
+        mock_linked_work_items_api._session.get.side_effect = _existing
+        mock_linked_work_items_api._session.post.side_effect = _created
+        links = [
+            ("WI-1", "relates_to", "WI-2"),
+            ("WI-1", "relates_to", "WI-3"),
+            ("WI-4", "parent", "OtherProject/WI-9"),
+            ("MyProjectId/WI-1", "relates_to", "WI-3"),
+            ("WI-1", "parent", "WI-5"),
+        ]
+
+        result = mock_linked_work_items_api.bulk_post_linked_work_items("MyProjectId", links, max_workers=2)
+
+        assert [item.status for item in result.items] == ['skipped', 'created', 'created', 'skipped', 'created']
+        assert result.ids == [
+            "MyProjectId/WI-1/relates_to/MyProjectId/WI-2",
+            "MyProjectId/WI-1/relates_to/MyProjectId/WI-3",
+            "MyProjectId/WI-4/parent/OtherProject/WI-9",
+            "MyProjectId/WI-1/relates_to/MyProjectId/WI-3",
+            "MyProjectId/WI-1/parent/MyProjectId/WI-5",
+        ]
+        assert mock_linked_work_items_api._session.post.call_count == 2
+        urls = sorted(call[0][0] for call in mock_linked_work_items_api._session.post.call_args_list)
+        assert urls[0].endswith("projects/MyProjectId/workitems/WI-1/linkedworkitems")
+        for call in mock_linked_work_items_api._session.post.call_args_list:
+            if call[0][0].endswith("WI-1/linkedworkitems"):
+                assert call[1]['json']['data'] == [
+                    {"type": "linkedworkitems", "attributes": {"role": "relates_to"},
+                     "relationships": {"workItem": {"data": {"type": "workitems", "id": "MyProjectId/WI-3"}}}},
+                    {"type": "linkedworkitems", "attributes": {"role": "parent"},
+                     "relationships": {"workItem": {"data": {"type": "workitems", "id": "MyProjectId/WI-5"}}}},
+                ]
+        print("\n✓ Mock: Links grouped and deduplicated")
+
+    def test_bulk_post_links_chunked_without_lookup(self, mock_linked_work_items_api):
+        """Test that links of one source are chunked and no lookup is made"""
+        mock_linked_work_items_api._session.post.side_effect = _created
+        links = [("WI-1", "relates_to", f"WI-{i}") for i in range(2, 7)]
+
+        result = mock_linked_work_items_api.bulk_post_linked_work_items(
+            "MyProjectId", links, chunk_size=2, skip_existing=False, suspect=False
+        )
+
+        assert result.ok
+        assert result.requests_sent == 3
+        mock_linked_work_items_api._session.get.assert_not_called()
+        sent = mock_linked_work_items_api._session.post.call_args_list[0][1]['json']['data']
+        assert sent[0]['attributes'] == {"role": "relates_to", "suspect": False}
+        print("\n✓ Mock: Links chunked per source")
+
+    def test_bulk_post_links_reports_failures(self, mock_linked_work_items_api):
+        """Test that failures are reported per link"""
+        mock_linked_work_items_api._session.get.side_effect = requests.ConnectionError("Connection refused")
+        mock_linked_work_items_api._session.post.return_value = _response(
+            403, {"errors": [{"status": "403", "detail": "Forbidden"}]}
+        )
+
+        result = mock_linked_work_items_api.bulk_post_linked_work_items(
+            "MyProjectId", [("WI-1", "relates_to", "WI-2")]
+        )
+
+        assert result.failed[0].id == "MyProjectId/WI-1/relates_to/MyProjectId/WI-2"
+        assert "Connection refused" in result.failed[0].error
+        mock_linked_work_items_api._session.post.assert_not_called()
+
+        mock_linked_work_items_api._session.get.side_effect = _existing
+        result = mock_linked_work_items_api.bulk_post_linked_work_items(
+            "MyProjectId", [("WI-7", "relates_to", "WI-2")]
+        )
+
+        assert result.failed[0].id == "MyProjectId/WI-7/relates_to/MyProjectId/WI-2"
+        assert result.failed[0].error == "Forbidden"
+        print("\n✓ Mock: Failures reported per link")
+
+    def test_bulk_post_links_invalid_triple(self, mock_linked_work_items_api):
+        """Test that an invalid triple raises ValueError"""
+        with pytest.raises(ValueError):
+            mock_linked_work_items_api.bulk_post_linked_work_items("MyProjectId", [("WI-1", "WI-2")])
+        print("\n✓ Mock: Invalid triple rejected")
@@ -0,0 +1,132 @@
+"""
+Pytest tests for the typed resource models generated from the OpenAPI specification.
+
+Tests that models.py is reproducible from data/openapi_official.json, lazy decoding
+of the attributes, the generated fields and the memory use of large result sets.
+Uses mocks to avoid hitting real API.
+
+Run with:
+    pytest test_generated_models.py -v
+"""
+import json
+import tracemalloc
+from pathlib import Path
+import pytest
+import requests
+from unittest.mock import Mock
+
+import modules.models as models
+from modules.model import Model, decode_models, to_model
+from modules.model_generator import generate_models, field_name, main
+
+
+ROOT = Path(__file__).resolve().parents[2]
+SPEC = ROOT / "data" / "openapi_official.json"
+MODELS = ROOT / "polarion_rest_api" / "modules" / "models.py"
+
+
+def _work_item(number):
+    return {
+        "type": "workitems", "id": f"MyProjectId/WI-{number}", "revision": "1234",
+        "attributes": {
+            "id": f"WI-{number}", "type": "requirement", "title": f"Requirement {number}",
+            "status": "open", "severity": "major", "priority": "90.0", "dueDate": "2026-01-01",
+            "created": "2026-01-01T00:00:00Z", "updated": "2026-01-02T00:00:00Z",
+            "description": {"type": "text/html", "value": f"<p>Description of {number}</p>"},
+            "hyperlinks": [{"role": "ref_ext", "uri": "https://example.com"}],
+        },
+        "relationships": {
+            "author": {"data": {"type": "users", "id": "user1"}},
+            "assignee": {"data": [{"type": "users", "id": "user2"}, {"type": "users", "id": "user3"}]},
+        },
+        "links": {"self": f"https://example.com/polarion/rest/v1/projects/MyProjectId/workitems/WI-{number}"},
+    }
+
+
+def _response(body, status_code=200):
+    response = Mock(status_code=status_code)
+    response.json.return_value = body
+    return response
+
+
+class TestGeneratedModels:
+    """Unit tests for the generated models using mocks"""
+
+    def test_models_reproducible_from_spec(self, tmp_path):
+        """Test that generating from the specification gives the committed models.py"""
+        spec = json.loads(SPEC.read_text(encoding="utf-8"))
+
+        source = generate_models(spec)
+
+        assert source == generate_models(spec)
+        assert source == MODELS.read_text(encoding="utf-8")
+        output = tmp_path / "models.py"
+        assert main([str(SPEC), "-o", str(output), "--check"]) == 1
+        assert main([str(SPEC), "-o", str(output)]) == 0
+        assert main([str(SPEC), "-o", str(output), "--check"]) == 0
+        print("\n✓ Mock: models.py reproducible from the specification")
+
+    def test_generated_classes(self):
+        """Test the classes, fields and registry generated for the resource types"""
+        assert models.MODELS["workitems"] is models.WorkItem
+        assert models.MODELS["testruns"].__name__ == "TestRun"
+        assert models.WorkItem.__slots__ == () and "dueDate" in models.WorkItem.attribute_names
+        assert "linkedWorkItems" in models.WorkItem.relationship_names
+        assert [field_name(name) for name in ("dueDate", "workItemURI", "type", "id")] == [
+            "due_date", "work_item_uri", "type_", "id_"]
+        work_item = models.WorkItem(_work_item(1))
+        with pytest.raises(AttributeError):
+            work_item.anything = 1
+        print("\n✓ Mock: Classes generated")
+
+    def test_attributes_decoded_on_first_access(self, mock_work_items_api):
+        """Test that attributes are kept as JSON until first accessed"""
+        mock_work_items_api._session.get.return_value = _response({"data": [_work_item(i) for i in range(3)]})
+
+        work_items = mock_work_items_api.decode_models(mock_work_items_api.get_work_items("MyProjectId"))
+
+        first = work_items[0]
+        assert isinstance(first, models.WorkItem) and first.type == "workitems"
+        assert (first.id, first.revision, first.loaded) == ("MyProjectId/WI-0", "1234", False)
+        assert first.title == "Requirement 0" and first.loaded
+        assert first.due_date == "2026-01-01" and first.type_ == "requirement" and first.id_ == "WI-0"
+        assert first.description["value"] == "<p>Description of 0</p>"
+        assert first.resolution is None and first.get("resolution", "-") == "-"
+        assert first["status"] == "open"
+        assert first.related_ids("assignee") == ["user2", "user3"] and first.related_ids("votes") == []
+        assert not work_items[1].loaded
+        assert work_items[1].to_dict() == _work_item(1) and not work_items[1].loaded
+        assert first.to_dict() == _work_item(0)
+        print("\n✓ Mock: Attributes decoded lazily")
+
+    def test_single_and_unknown_resources(self):
+        """Test single resources, unknown types and error responses"""
+        project = decode_models({"data": {"type": "projects", "id": "MyProjectId",
+                                          "attributes": {"name": "My Project"}}})
+        other = to_model({"type": "futureresources", "id": "x"})
+
+        assert isinstance(project, models.Project) and project.name == "My Project"
+        assert project.revision is None
+        assert type(other) is Model and other.type == "futureresources" and other.attributes == {}
+        assert decode_models({"data": None}) is None
+        with pytest.raises(requests.HTTPError, match="Work Item not found"):
+            decode_models(_response({"errors": [{"status": "404", "detail": "Work Item not found"}]}, 404))
+        print("\n✓ Mock: Single and unknown resources decoded")
+
+    def test_models_smaller_than_dicts(self):
+        """Test that a large result set takes much less memory as models than as dicts"""
+        pages = [json.dumps({"data": [_work_item(page * 100 + i) for i in range(100)]}) for page in range(20)]
+
+        def measure(decode):
+            tracemalloc.start()
+            kept = [item for page in pages for item in decode(json.loads(page))]
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            assert len(kept) == 2000
+            return size
+
+        dict_size = measure(lambda body: body["data"])
+        model_size = measure(decode_models)
+
+        assert model_size * 2 < dict_size
+        print(f"\n✓ Mock: 2000 work items take {model_size} bytes as models, {dict_size} as dicts")
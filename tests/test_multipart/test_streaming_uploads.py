@@ -0,0 +1,156 @@
+"""
+Pytest tests for the streaming multipart uploads.
+
+Tests the multipart encoder reading files in chunks, batching several files per
+request, titles, failed requests and files changing while uploading.
+Uses mocks to avoid hitting real API.
+
+Run with:
+    pytest test_streaming_uploads.py -v
+"""
+import email
+import io
+import json
+import pytest
+import requests
+from unittest.mock import Mock
+
+from modules.multipart import MultipartEncoder, batch_files
+
+
+class _RecordingFile(io.BytesIO):
+    """BytesIO remembering the size of the largest read"""
+    largest_read = 0
+
+    def read(self, size=-1):
+        self.largest_read = max(self.largest_read, size)
+        return super().read(size)
+
+
+def _parse(body, content_type):
+    """Split a multipart body into (name, filename, content) parts"""
+    message = email.message_from_bytes(b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + body)
+    return [(part.get_param('name', header='content-disposition'), part.get_filename(),
+             part.get_payload(decode=True)) for part in message.get_payload()]
+
+
+def _consuming_post(bodies, status_codes=None):
+    """session.post side effect reading the streamed body like the transport would"""
+    status_codes = list(status_codes or [])
+
+    def post(url, data=None, headers=None, **kwargs):
+        chunks = iter(lambda: data.read(8192), b"")
+        bodies.append((b"".join(chunks), headers['Content-Type']))
+        response = Mock(status_code=status_codes.pop(0) if status_codes else 201)
+        return response
+    return post
+
+
+class TestStreamingUploads:
+    """Unit tests for the streaming multipart uploads using mocks"""
+
+    def test_encoder_streams_files_in_chunks(self, tmp_path):
+        """Test that the body is read chunk by chunk and matches the announced length"""
+        log = tmp_path / "build.log"
+        log.write_bytes(b"x" * 100000)
+        video = _RecordingFile(b"v" * 50000)
+        encoder = MultipartEncoder({"resource": {"data": [{"type": "testrun_attachments"}]}},
+                                   [("files", str(log)), ("files", ("run.mp4", video))],
+                                   chunk_size=4096)
+
+        prepared = requests.Request("POST", "https://test.polarion.com", data=encoder,
+                                    headers={"Content-Type": encoder.content_type}).prepare()
+        assert prepared.body is encoder
+        assert prepared.headers["Content-Length"] == str(encoder.len)
+
+        body = b"".join(iter(lambda: encoder.read(1000), b""))
+        assert len(body) == encoder.len
+        assert video.largest_read == 4096
+        parts = _parse(body, encoder.content_type)
+        assert parts[0] == ("resource", None, b'{"data": [{"type": "testrun_attachments"}]}')
+        assert parts[1] == ("files", "build.log", b"x" * 100000)
+        assert parts[2] == ("files", "run.mp4", b"v" * 50000)
+        assert "video/mp4" in body.decode("latin-1")
+        print("\n✓ Mock: Multipart body streamed in chunks")
+
+    def test_iterator_source_has_unknown_length(self):
+        """Test that iterator contents are sent without Content-Length (chunked)"""
+        encoder = MultipartEncoder(files=[("files", ("data.csv", iter([b"a,b\n", b"1,2\n"])))])
+
+        prepared = requests.Request("POST", "https://test.polarion.com", data=encoder).prepare()
+
+        assert encoder.len is None
+        assert prepared.headers["Transfer-Encoding"] == "chunked"
+        assert _parse(b"".join(encoder), encoder.content_type) == [("files", "data.csv", b"a,b\n1,2\n")]
+        print("\n✓ Mock: Iterator uploaded with chunked encoding")
+
+    def test_file_changed_while_uploading(self, tmp_path):
+        """Test that a file shorter than announced raises ValueError"""
+        log = tmp_path / "growing.log"
+        log.write_bytes(b"12345")
+        encoder = MultipartEncoder(files=[("files", log)])
+        log.write_bytes(b"123")
+
+        with pytest.raises(ValueError, match="changed while uploading"):
+            encoder.read()
+        print("\n✓ Mock: Changed file rejected")
+
+    def test_batch_files(self, tmp_path):
+        """Test batching by file count and total size, keeping the order"""
+        files = [("a.log", b"a" * 10), ("b.log", b"b" * 10), ("c.log", b"c" * 30),
+                 ("d.log", iter([b"d"])), ("e.log", b"e")]
+
+        batches = batch_files(files, max_files=2, max_bytes=25)
+
+        assert [[f.filename for f in batch] for batch in batches] == [
+            ["a.log", "b.log"], ["c.log"], ["d.log"], ["e.log"]]
+        with pytest.raises(ValueError):
+            batch_files([io.BytesIO(b"no name")])
+        print("\n✓ Mock: Files batched")
+
+    def test_upload_document_attachments_batches(self, mock_document_attachments_api, tmp_path):
+        """Test that several attachments are sent per request with their resources"""
+        paths = []
+        for name in ("a.log", "b.log", "c.log"):
+            paths.append(tmp_path / name)
+            paths[-1].write_bytes(name.encode() * 1000)
+        bodies = []
+        mock_document_attachments_api._session.post.side_effect = _consuming_post(bodies)
+
+        responses = mock_document_attachments_api.upload_document_attachments(
+            "MyProjectId", "_default", "MyDoc", paths, titles=["A", None, "C"], max_files=2)
+
+        assert [r.status_code for r in responses] == [201, 201]
+        call_args = mock_document_attachments_api._session.post.call_args_list
+        assert call_args[0][0][0].endswith("projects/MyProjectId/spaces/_default/documents/MyDoc/attachments")
+        assert "Authorization" in call_args[0][1]["headers"]
+        first = _parse(*bodies[0])
+        assert json.loads(first[0][2]) == {"data": [
+            {"type": "document_attachments", "attributes": {"fileName": "a.log", "title": "A"}},
+            {"type": "document_attachments", "attributes": {"fileName": "b.log"}}]}
+        assert [(name, filename) for name, filename, _ in first[1:]] == [("files", "a.log"), ("files", "b.log")]
+        assert first[2][2] == b"b.log" * 1000
+        second = _parse(*bodies[1])
+        assert json.loads(second[0][2])["data"][0]["attributes"] == {"fileName": "c.log", "title": "C"}
+        print("\n✓ Mock: Attachments uploaded in batches")
+
+    def test_upload_stops_at_failed_request(self, mock_icons_api):
+        """Test that no further batch is sent after a failed request"""
+        bodies = []
+        mock_icons_api._session.post.side_effect = _consuming_post(bodies, status_codes=[500])
+
+        responses = mock_icons_api.upload_project_icons(
+            "MyProjectId", [("a.png", b"a"), ("b.png", b"b")], max_files=1)
+
+        assert [r.status_code for r in responses] == [500]
+        assert len(bodies) == 1
+        assert json.loads(_parse(*bodies[0])[0][2]) == {"data": [{"type": "icons"}]}
+        print("\n✓ Mock: Upload stopped at failed request")
+
+    def test_titles_must_match_files(self, mock_test_record_attachments_api):
+        """Test that titles of another length raise ValueError"""
+        with pytest.raises(ValueError, match="titles"):
+            mock_test_record_attachments_api.upload_test_record_attachments(
+                "MyProjectId", "RUN-1", "MyProjectId", "TC-1", "0", [("a.log", b"a")], titles=["A", "B"])
+        mock_test_record_attachments_api._session.post.assert_not_called()
+        print("\n✓ Mock: Titles validated")
@@ -0,0 +1,70 @@
+"""
+Pytest tests for the pagination helpers.
+
+Tests iter_pages and iter_resources from the pagination module.
+Uses mocks to avoid making real API calls.
+
+Run with:
+    pytest test_iter_resources.py -v
+"""
+import pytest
+import requests
+from unittest.mock import Mock
+
+from modules.pagination import iter_pages, iter_resources
+
+
+def _page(ids, total=None):
+    """Build a list response page"""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    body = {"data": [{"type": "workitems", "id": resource_id} for resource_id in ids]}
+    if total is not None:
+        body["meta"] = {"totalCount": total}
+    mock_response.json.return_value = body
+    return mock_response
+
+
+class TestIterResourcesMocked:
+    """Unit tests for pagination helpers using mocks"""
+
+    def test_iter_resources_all_pages(self, mock_work_items_api, test_params):
+        """Test that pages are requested until a short page is returned"""
+        mock_work_items_api._session.get.side_effect = [
+            _page(["WI-1", "WI-2"]),
+            _page(["WI-3", "WI-4"]),
+            _page(["WI-5"]),
+        ]
+
+        ids = [resource['id'] for resource in iter_resources(
+            mock_work_items_api.get_work_items, test_params['project_id'], page_size=2, query="type:task"
+        )]
+
+        assert ids == ["WI-1", "WI-2", "WI-3", "WI-4", "WI-5"]
+        assert mock_work_items_api._session.get.call_count == 3
+        params = mock_work_items_api._session.get.call_args[1]['params']
+        assert params['page[number]'] == 3
+        assert params['page[size]'] == 2
+        assert params['query'] == "type:task"
+        print("\n✓ Mock: All pages iterated")
+
+    def test_iter_pages_stops_at_total_count(self, mock_work_items_api, test_params):
+        """Test that iteration stops once meta.totalCount resources were returned"""
+        mock_work_items_api._session.get.side_effect = [_page(["WI-1", "WI-2"], total=2)]
+
+        pages = list(iter_pages(mock_work_items_api.get_work_items, test_params['project_id'], page_size=2))
+
+        assert len(pages) == 1
+        assert mock_work_items_api._session.get.call_count == 1
+        print("\n✓ Mock: Iteration stopped at totalCount")
+
+    def test_iter_resources_error(self, mock_work_items_api, test_params):
+        """Test that a failed page request raises HTTPError"""
+        mock_response = Mock()
+        mock_response.status_code = 401
+        mock_response.json.return_value = {"errors": [{"status": "401", "title": "Unauthorized"}]}
+        mock_work_items_api._session.get.return_value = mock_response
+
+        with pytest.raises(requests.HTTPError):
+            list(iter_resources(mock_work_items_api.get_work_items, test_params['project_id']))
+        print("\n✓ Mock: Failed page raises HTTPError")
@@ -0,0 +1,205 @@
+"""
+Pytest tests for the incremental project mirror.
+
+Tests the initial full load into SQLite, incremental syncs requesting only the
+entities updated since the watermark, replacing links and test records of updated
+owners, deleting entities on full syncs and keeping watermarks after failures.
+Uses mocks to avoid hitting real API.
+
+Run with:
+    pytest test_project_mirror.py -v
+"""
+import importlib
+import re
+import threading
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from modules.project_mirror import ProjectMirror, updated_since
+
+# Client attribute -> (module, class) of the modules used by the mirror
+MIRROR_MODULES = {
+    'work_items': ('work_items', 'WorkItems'),
+    'linked_work_items': ('linked_work_items', 'LinkedWorkItems'),
+    'documents': ('documents', 'Documents'),
+    'plans': ('plans', 'Plans'),
+    'test_runs': ('test_runs', 'TestRuns'),
+    'test_records': ('test_records', 'TestRecords'),
+}
+
+
+def _work_item(number, updated, status="open", document=None):
+    resource = {"type": "workitems", "id": f"P/WI-{number}",
+                "attributes": {"type": "requirement", "title": f"Requirement {number}", "status": status,
+                               "severity": "major", "updated": updated}}
+    if document:
+        resource["relationships"] = {"module": {"data": {"type": "documents", "id": document}}}
+    return resource
+
+
+def _link(source, role, target):
+    return {"type": "linkedworkitems", "id": f"P/{source}/{role}/P/{target}", "attributes": {"role": role},
+            "relationships": {"workItem": {"data": {"type": "workitems", "id": f"P/{target}"}}}}
+
+
+def _test_record(run, test_case, result):
+    return {"type": "testrecords", "id": f"P/{run}/P/{test_case}/0", "attributes": {"result": result},
+            "relationships": {"testCase": {"data": {"type": "workitems", "id": f"P/{test_case}"}}}}
+
+
+class _Server:
+    """Fake Polarion answering the list and document requests, filtering by 'updated' queries"""
+
+    def __init__(self):
+        self.work_items = {
+            "WI-1": _work_item(1, "2026-01-10T09:00:00.000Z", document="P/_default/Spec"),
+            "WI-2": _work_item(2, "2026-01-12T09:00:00.000Z"),
+            "WI-3": _work_item(3, "2026-01-15T09:00:00.000Z"),
+        }
+        self.links = {"WI-1": [_link("WI-1", "verifies", "WI-2")], "WI-2": [], "WI-3": []}
+        self.plans = [{"type": "plans", "id": "P/R1", "attributes": {"name": "Release 1", "status": "open",
+                                                                     "updated": "2026-01-01T00:00:00.000Z"}}]
+        self.test_runs = {"RUN-1": {"type": "testruns", "id": "P/RUN-1",
+                                    "attributes": {"title": "Nightly", "status": "finished",
+                                                   "updated": "2026-01-11T00:00:00.000Z"}}}
+        self.test_records = {"RUN-1": [_test_record("RUN-1", "WI-1", "passed")]}
+        self.failing = set()
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def get(self, url, params=None, **kwargs):
+        path = url.split('/rest/v1/', 1)[1]
+        params = params or {}
+        with self.lock:
+            self.requests.append((path, params.get('query')))
+        response = Mock(status_code=200, headers={})
+        if path in self.failing:
+            response.status_code = 503
+            response.json.return_value = {"errors": [{"status": "503", "detail": "Unavailable"}]}
+            return response
+        if path == "projects/P/spaces/_default/documents/Spec":
+            response.json.return_value = {"data": {"type": "documents", "id": "P/_default/Spec",
+                                                   "attributes": {"title": "Specification", "type": "req"}}}
+            return response
+        lists = {
+            "projects/P/workitems": list(self.work_items.values()),
+            "projects/P/plans": self.plans,
+            "projects/P/testruns": list(self.test_runs.values()),
+        }
+        lists.update({f"projects/P/workitems/{wi}/linkedworkitems": links for wi, links in self.links.items()})
+        lists.update({f"projects/P/testruns/{run}/testrecords": records for run, records in self.test_records.items()})
+        data = lists[path]
+        since = re.search(r'updated:\[(\d{8}) TO', params.get('query') or '')
+        if since:
+            data = [resource for resource in data
+                    if resource["attributes"]["updated"][:10].replace('-', '') >= since.group(1)]
+        size, number = params.get('page[size]', 100), params.get('page[number]', 1)
+        response.json.return_value = {"data": data[(number - 1) * size:number * size],
+                                      "meta": {"totalCount": len(data)}}
+        return response
+
+
+@pytest.fixture
+def mirror_api():
+    """Modules of one client sharing a session answered by a fake server"""
+    server = _Server()
+    session = Mock()
+    session.headers = {}
+    session.get.side_effect = server.get
+    api = SimpleNamespace()
+    for name, (module, class_name) in MIRROR_MODULES.items():
+        module_class = getattr(importlib.import_module(f"modules.{module}"), class_name)
+        setattr(api, name, module_class("https://test.polarion.com/polarion/rest/v1", "test_token", session=session))
+    return api, server
+
+
+class TestProjectMirror:
+    """Unit tests for ProjectMirror using mocks"""
+
+    def test_initial_full_load(self, mirror_api):
+        """Test that the first sync loads every entity into indexed tables"""
+        api, server = mirror_api
+
+        with ProjectMirror(api, max_workers=2, page_size=2) as mirror:
+            result = mirror.sync("P")
+
+            assert result.ok, result.failed
+            assert result.stored == {"work_items": 3, "links": 1, "documents": 1, "plans": 1,
+                                     "test_runs": 1, "test_records": 1}
+            assert mirror.query("SELECT id, status, document FROM work_items ORDER BY id") == [
+                ("P/WI-1", "open", "P/_default/Spec"), ("P/WI-2", "open", None), ("P/WI-3", "open", None)]
+            assert mirror.query("SELECT source, role, target FROM links") == [("P/WI-1", "verifies", "P/WI-2")]
+            assert mirror.query("SELECT test_run, test_case, result FROM test_records") == [
+                ("P/RUN-1", "P/WI-1", "passed")]
+            assert mirror.query("SELECT name FROM plans") == [("Release 1",)]
+            assert mirror.query("SELECT json_extract(resource, '$.attributes.severity') FROM work_items "
+                                "WHERE id = 'P/WI-2'") == [("major",)]
+            assert [resource["id"] for resource in mirror.resources("documents")] == ["P/_default/Spec"]
+            assert mirror.watermark("P", "work_items") == "2026-01-15T09:00:00.000Z"
+            assert all(query is None for _, query in server.requests)
+        print("\n✓ Mock: Project loaded into the mirror")
+
+    def test_incremental_sync_requests_only_updated(self, mirror_api, tmp_path):
+        """Test that later syncs only request and store the entities updated since the watermark"""
+        api, server = mirror_api
+        path = str(tmp_path / "mirror.db")
+        with ProjectMirror(api, path) as mirror:
+            mirror.sync("P")
+        server.work_items["WI-2"] = _work_item(2, "2026-01-20T10:00:00.000Z", status="done")
+        server.links["WI-2"] = [_link("WI-2", "relates_to", "WI-3")]
+        server.requests.clear()
+
+        with ProjectMirror(api, path) as mirror:
+            result = mirror.sync("P")
+
+            assert result.ok and not result.full
+            assert result.stored["work_items"] == 1  # WI-3 is returned again (overlap day) but unchanged
+            assert result.stored["plans"] == 0 and result.stored["test_runs"] == 0
+            assert ("projects/P/workitems", updated_since("2026-01-15T09:00:00.000Z")) in server.requests
+            assert "projects/P/workitems/WI-1/linkedworkitems" not in [path for path, _ in server.requests]
+            assert "projects/P/testruns/RUN-1/testrecords" not in [path for path, _ in server.requests]
+            assert mirror.query("SELECT status FROM work_items WHERE id = 'P/WI-2'") == [("done",)]
+            assert mirror.query("SELECT source, target FROM links ORDER BY source") == [
+                ("P/WI-1", "P/WI-2"), ("P/WI-2", "P/WI-3")]
+            assert mirror.watermark("P", "work_items") == "2026-01-20T10:00:00.000Z"
+        print("\n✓ Mock: Incremental sync requests only updated entities")
+
+    def test_full_sync_deletes_missing(self, mirror_api):
+        """Test that a full sync removes deleted entities with their links and test records"""
+        api, server = mirror_api
+        with ProjectMirror(api) as mirror:
+            mirror.sync("P")
+            del server.work_items["WI-1"], server.links["WI-1"]
+            server.test_runs.clear()
+
+            result = mirror.sync("P", full=True)
+
+            assert result.deleted["work_items"] == 1 and result.deleted["test_runs"] == 1
+            assert mirror.query("SELECT count(*) FROM links") == [(0,)]
+            assert mirror.query("SELECT count(*) FROM test_records") == [(0,)]
+            assert mirror.query("SELECT id FROM work_items ORDER BY id") == [("P/WI-2",), ("P/WI-3",)]
+        print("\n✓ Mock: Full sync deletes missing entities")
+
+    def test_failed_children_keep_watermark(self, mirror_api):
+        """Test that owners whose children could not be fetched are synced again"""
+        api, server = mirror_api
+        with ProjectMirror(api) as mirror:
+            mirror.sync("P")
+            server.work_items["WI-3"] = _work_item(3, "2026-02-01T00:00:00.000Z")
+            server.failing.add("projects/P/workitems/WI-3/linkedworkitems")
+
+            result = mirror.sync("P")
+
+            assert not result.ok
+            assert [(table, owner) for table, owner, _ in result.failed] == [("links", "P/WI-3")]
+            assert mirror.watermark("P", "work_items") == "2026-01-15T09:00:00.000Z"
+            server.failing.clear()
+            assert mirror.sync("P").ok
+            assert mirror.watermark("P", "work_items") == "2026-02-01T00:00:00.000Z"
+        print("\n✓ Mock: Watermark kept after failures")
+
+    def test_updated_since_query(self):
+        """Test the day-granular query with one day of overlap"""
+        assert updated_since("2026-03-01T00:30:00.000Z") == "updated:[20260228 TO 99991231]"
+        print("\n✓ Mock: Updated-since query")
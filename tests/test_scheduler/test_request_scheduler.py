@@ -0,0 +1,111 @@
+"""
+Pytest tests for the request scheduler.
+
+Tests priority ordering, per-class concurrency caps, queue statistics and the
+priority class of requests sent from worker threads.
+Uses mocks to avoid making real API calls.
+
+Run with:
+    pytest test_request_scheduler.py -v
+"""
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+
+from modules.fanout import FanOut
+from modules.scheduler import RequestScheduler, INTERACTIVE, BATCH, run_in_context
+
+
+def _wait_until(condition, timeout=5.0):
+    """Poll a condition until it is true"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
+
+class TestRequestScheduler:
+    """Unit tests for RequestScheduler"""
+
+    def test_interactive_requests_go_ahead_of_queued_batch(self):
+        """Test that a freed slot goes to the interactive request first"""
+        scheduler = RequestScheduler(max_concurrent=1)
+        admitted = []
+
+        def request(name):
+            with scheduler.slot(name):
+                admitted.append(name)
+
+        scheduler.acquire(BATCH)
+        threads = [threading.Thread(target=request, args=(BATCH,)) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        _wait_until(lambda: scheduler.stats()[BATCH].queued == 3)
+        threads.append(threading.Thread(target=request, args=(INTERACTIVE,)))
+        threads[-1].start()
+        _wait_until(lambda: scheduler.stats()[INTERACTIVE].queued == 1)
+
+        scheduler.release(BATCH)
+        for thread in threads:
+            thread.join()
+
+        assert admitted == [INTERACTIVE, BATCH, BATCH, BATCH]
+        stats = scheduler.stats()
+        assert stats[BATCH].admitted == 4 and stats[BATCH].queued == 0 and stats[BATCH].active == 0
+        assert stats[INTERACTIVE].max_wait > 0
+        print("\n✓ Interactive request admitted before queued batch requests")
+
+    def test_per_class_cap(self, mock_work_items_api):
+        """Test that batch requests never exceed their cap and leave slots for interactive ones"""
+        scheduler = RequestScheduler(max_concurrent=4, limits={INTERACTIVE: 4, BATCH: 2})
+        mock_work_items_api._scheduler = scheduler
+        lock = threading.Lock()
+        running = {"now": 0, "max": 0}
+        release = threading.Event()
+
+        def get(url, params=None, **kwargs):
+            with lock:
+                running["now"] += 1
+                running["max"] = max(running["max"], running["now"])
+            if url.endswith("WI-batch"):
+                release.wait(5)
+            with lock:
+                running["now"] -= 1
+            return Mock(status_code=200)
+
+        mock_work_items_api._session.get.side_effect = get
+
+        with scheduler.priority(BATCH):
+            fan_out = FanOut(mock_work_items_api.get_work_item,
+                             [("MyProjectId", "WI-batch")] * 6, max_workers=6)
+            consumer = threading.Thread(target=run_in_context(fan_out.results))
+            consumer.start()
+        _wait_until(lambda: scheduler.stats()[BATCH].queued == 4)
+
+        assert scheduler.stats()[BATCH].active == 2
+        response = mock_work_items_api.get_work_item("MyProjectId", "WI-interactive")
+        assert response.status_code == 200
+
+        release.set()
+        consumer.join()
+
+        stats = scheduler.stats()
+        assert running["max"] == 3
+        assert stats[BATCH].admitted == 6 and stats[INTERACTIVE].admitted == 1
+        assert stats[INTERACTIVE].max_wait < stats[BATCH].max_wait
+        print("\n✓ Batch cap honoured, interactive request not queued")
+
+    def test_unknown_class(self):
+        """Test that invalid configurations and unknown classes raise ValueError"""
+        scheduler = RequestScheduler()
+
+        with pytest.raises(ValueError):
+            with scheduler.priority("urgent"):
+                pass
+        with pytest.raises(ValueError):
+            RequestScheduler(limits={BATCH: 0})
+        with pytest.raises(ValueError):
+            RequestScheduler(limits={BATCH: 2}, default_class=INTERACTIVE)
+        assert scheduler.current_class() == INTERACTIVE
+        print("\n✓ Unknown classes rejected")
@@ -0,0 +1,136 @@
+"""
+Tests for TestRecords.ingest_test_records method.
+
+This module contains unit tests for the streaming ingestion of test records,
+covering chunking, progress counters, failures and upserts.
+"""
+import pytest
+from unittest.mock import Mock
+
+
+def _record(test_case_id, result="passed"):
+    """Build a test record resource for a test case"""
+    return {
+        "attributes": {"result": result},
+        "relationships": {
+            "testCase": {"data": {"type": "workitems", "id": f"elibrary/{test_case_id}"}}
+        }
+    }
+
+
+def _post_side_effect(url, json=None, **kwargs):
+    """Session.post side effect creating one record per item"""
+    mock_response = Mock()
+    mock_response.status_code = 201
+    mock_response.json.return_value = {
+        "data": [
+            {"type": "testrecords",
+             "id": f"elibrary/MyTestRunId/{item['relationships']['testCase']['data']['id']}/0"}
+            for item in json['data']
+        ]
+    }
+    return mock_response
+
+
+class TestIngestTestRecords:
+    """Test class for ingest_test_records method"""
+
+    def test_ingest_test_records_from_generator(self, mock_test_records_api):
+        """Test that a generator is streamed in chunks with progress counters"""
+        mock_test_records_api._session.post.side_effect = _post_side_effect
+        progress = []
+        records = (_record(f"TC-{i}") for i in range(250))
+
+        result = mock_test_records_api.ingest_test_records(
+            "elibrary",
+            "MyTestRunId",
+            records,
+            chunk_size=100,
+            max_workers=2,
+            on_progress=lambda r: progress.append(r.processed)
+        )
+
+        assert result.ok
+        assert result.processed == 250
+        assert result.requests_sent == 3
+        assert sorted(progress) == progress
+        assert progress[-1] == 250
+        assert result.items == []
+        assert result.items_per_second > 0
+        sent = mock_test_records_api._session.post.call_args_list[0][1]['json']['data']
+        assert sent[0]['type'] == 'testrecords'
+        assert mock_test_records_api._session.post.call_args[0][0].endswith(
+            "projects/elibrary/testruns/MyTestRunId/testrecords")
+        print("\n✓ Mock: Test records ingested from a generator")
+
+    def test_ingest_test_records_keep_results(self, mock_test_records_api):
+        """Test that successful results are kept on request"""
+        mock_test_records_api._session.post.side_effect = _post_side_effect
+
+        result = mock_test_records_api.ingest_test_records(
+            "elibrary", "MyTestRunId", [_record("TC-1"), _record("TC-2")], keep_results=True
+        )
+
+        assert result.ids == ["elibrary/MyTestRunId/elibrary/TC-1/0", "elibrary/MyTestRunId/elibrary/TC-2/0"]
+        print("\n✓ Mock: Test record results kept")
+
+    def test_ingest_test_records_reports_failures(self, mock_test_records_api):
+        """Test that failed records are kept with their input index"""
+        mock_response = Mock()
+        mock_response.status_code = 500
+        mock_response.json.return_value = {
+            "errors": [{"status": "500", "title": "Internal Server Error", "detail": "Server error"}]
+        }
+        mock_test_records_api._session.post.return_value = mock_response
+
+        result = mock_test_records_api.ingest_test_records(
+            "elibrary", "MyTestRunId", [_record("TC-1"), _record("TC-2")]
+        )
+
+        assert result.failed_count == 2
+        assert [item.index for item in result.failed] == [0, 1]
+        assert result.failed[0].error == "Server error"
+        print("\n✓ Mock: Test record failures reported")
+
+    def test_ingest_test_records_upsert(self, mock_test_records_api):
+        """Test that records of test cases already in the run are patched"""
+        existing_response = Mock()
+        existing_response.status_code = 200
+        existing_response.json.return_value = {
+            "data": [
+                {"type": "testrecords", "id": "elibrary/MyTestRunId/elibrary/TC-1/0"},
+                {"type": "testrecords", "id": "elibrary/MyTestRunId/elibrary/TC-1/1"},
+            ],
+            "meta": {"totalCount": 2}
+        }
+        mock_test_records_api._session.get.return_value = existing_response
+        mock_test_records_api._session.post.side_effect = _post_side_effect
+        patch_response = Mock()
+        patch_response.status_code = 204
+        mock_test_records_api._session.patch.return_value = patch_response
+        record = _record("TC-1", result="failed")
+        record["relationships"]["defect"] = {"data": {"type": "workitems", "id": "elibrary/BUG-1"}}
+
+        result = mock_test_records_api.ingest_test_records(
+            "elibrary", "MyTestRunId", [record, _record("TC-2")], upsert=True, keep_results=True
+        )
+
+        assert result.ok
+        assert [item.status for item in result.items] == ['updated', 'created']
+        patched = mock_test_records_api._session.patch.call_args[1]['json']['data']
+        assert patched == [{
+            "type": "testrecords",
+            "id": "elibrary/MyTestRunId/elibrary/TC-1/1",
+            "attributes": {"result": "failed"},
+            "relationships": {"defect": {"data": {"type": "workitems", "id": "elibrary/BUG-1"}}}
+        }]
+        assert "testCase" in record["relationships"]
+        posted = mock_test_records_api._session.post.call_args[1]['json']['data']
+        assert len(posted) == 1
+        print("\n✓ Mock: Test records upserted")
+
+    def test_ingest_test_records_invalid_chunk_size(self, mock_test_records_api):
+        """Test that an invalid chunk size raises ValueError"""
+        with pytest.raises(ValueError):
+            mock_test_records_api.ingest_test_records("elibrary", "MyTestRunId", [], chunk_size=0)
+        print("\n✓ Mock: Invalid chunk size rejected")
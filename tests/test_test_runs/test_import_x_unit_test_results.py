@@ -0,0 +1,182 @@
+"""
+Pytest tests for the xUnit result import.
+
+Tests streaming the report from disk, splitting it into shards of whole suites,
+and importing the shards into per-shard Test Runs whose jobs are waited for
+together.
+Uses mocks to avoid hitting real API.
+
+Run with:
+    pytest test_import_x_unit_test_results.py -v
+"""
+import threading
+import xml.etree.ElementTree as ET
+import pytest
+from unittest.mock import Mock
+
+from modules.jobs import shared_job_waiter
+from modules.xunit import shard_xunit, iter_suites
+
+
+def _write_report(path, suites=10, cases=20):
+    """Write a <testsuites> report of suites with cases each"""
+    with open(path, "w", encoding="utf-8") as file:
+        file.write('<?xml version="1.0" encoding="UTF-8"?>\n<testsuites name="monorepo" tests="%d">\n'
+                   % (suites * cases))
+        for suite in range(suites):
+            file.write(f'  <testsuite name="suite-{suite}" tests="{cases}">\n')
+            for case in range(cases):
+                file.write(f'    <testcase classname="pkg.Suite{suite}" name="test_{case}" time="0.01"/>\n')
+            file.write('  </testsuite>\n')
+        file.write('</testsuites>\n')
+    return path
+
+
+def _response(status_code, body=None):
+    response = Mock(status_code=status_code, headers={})
+    response.json.return_value = body or {}
+    return response
+
+
+class _Server:
+    """Fake Polarion creating test runs, accepting imports and finishing their jobs"""
+
+    def __init__(self, failing_runs=()):
+        self.failing_runs = set(failing_runs)
+        self.created = []
+        self.imported = {}
+        self.lock = threading.Lock()
+
+    def post(self, url, data=None, json=None, headers=None, **kwargs):
+        if url.endswith("/testruns"):
+            run_id = json["data"][0]["attributes"]["id"]
+            with self.lock:
+                self.created.append(json["data"][0]["attributes"])
+            if run_id in self.failing_runs:
+                return _response(409, {"errors": [{"status": "409", "detail": f"{run_id} exists"}]})
+            return _response(201)
+        assert headers["Content-Type"] == "application/octet-stream"
+        run_id = url.split("/testruns/")[1].split("/")[0]
+        with self.lock:
+            self.imported[run_id] = data.read()
+        return _response(202, {"data": {"type": "jobs", "id": f"Job-{run_id}"}})
+
+    def get(self, url, params=None, **kwargs):
+        job_id = url.rsplit("/", 1)[1]
+        return _response(200, {"data": {"type": "jobs", "id": job_id, "attributes": {
+            "jobId": job_id, "state": "FINISHED", "status": {"type": "OK"}}}})
+
+
+@pytest.fixture
+def xunit_server(mock_test_runs_api):
+    """TestRuns module answered by a fake server"""
+    server = _Server()
+    mock_test_runs_api._session.post.side_effect = server.post
+    mock_test_runs_api._session.get.side_effect = server.get
+    shared_job_waiter(mock_test_runs_api).initial_interval = 0.001
+    return mock_test_runs_api, server
+
+
+class TestImportXUnitTestResults:
+    """Unit tests for the xUnit result import using mocks"""
+
+    def test_import_streams_file_from_disk(self, mock_test_runs_api, tmp_path):
+        """Test that a path is sent as a file object with the octet-stream content type"""
+        report = _write_report(tmp_path / "junit.xml", suites=1)
+        sent = {}
+
+        def post(url, data=None, headers=None, **kwargs):
+            sent["read"] = hasattr(data, "read")
+            sent["content"] = data.read()
+            return _response(202)
+        mock_test_runs_api._session.post.side_effect = post
+
+        response = mock_test_runs_api.import_x_unit_test_results("MyProjectId", "MyTestRunId", report)
+
+        assert response.status_code == 202
+        assert sent == {"read": True, "content": report.read_bytes()}
+        call_args = mock_test_runs_api._session.post.call_args
+        assert call_args[0][0].endswith("projects/MyProjectId/testruns/MyTestRunId/actions/importXUnitTestResults")
+        assert call_args[1]["headers"]["Content-Type"] == "application/octet-stream"
+        assert call_args[1]["headers"]["Authorization"] == "Bearer test_token"
+        print("\n✓ Mock: xUnit report streamed from disk")
+
+    def test_shard_keeps_suites_whole(self, tmp_path):
+        """Test that shards hold whole suites and together the whole report"""
+        report = _write_report(tmp_path / "junit.xml", suites=10)
+        suite_size = max(len(suite) for _, suite in iter_suites(report))
+        (tmp_path / "shards").mkdir()
+
+        shards = shard_xunit(report, tmp_path / "shards", shard_size=3 * suite_size + 200)
+
+        assert [shard.suites for shard in shards] == [3, 3, 3, 1]
+        names = []
+        for shard in shards:
+            root = ET.parse(shard.path).getroot()
+            assert root.tag == "testsuites" and root.get("name") == "monorepo"
+            assert shard.size == (tmp_path / "shards" / f"junit-{shard.index:04d}.xml").stat().st_size
+            for suite in root:
+                assert len(suite) == 20
+                names.append(suite.get("name"))
+        assert names == [f"suite-{i}" for i in range(10)]
+        print("\n✓ Mock: Report sharded by suite")
+
+    def test_shard_invalid_report(self, tmp_path):
+        """Test that a truncated report raises ValueError"""
+        report = tmp_path / "junit.xml"
+        report.write_text("<testsuites><testsuite name='a'>")
+
+        with pytest.raises(ValueError, match="Invalid xUnit report"):
+            shard_xunit(report, tmp_path)
+        print("\n✓ Mock: Invalid report rejected")
+
+    def test_shard_namespaced_and_empty_reports(self, tmp_path):
+        """Test that namespaced suites are sharded without namespace and reports without suites raise"""
+        report = tmp_path / "junit.xml"
+        report.write_text('<testsuites xmlns="urn:junit" name="ns"><testsuite name="a"><testcase name="t"/>'
+                          '</testsuite><testsuite name="b"/></testsuites>')
+
+        shards = shard_xunit(report, tmp_path)
+
+        root = ET.parse(shards[0].path).getroot()
+        assert [(suite.tag, suite.get("name")) for suite in root] == [("testsuite", "a"), ("testsuite", "b")]
+        assert root[0][0].tag == "testcase"
+        report.write_text('<testsuites name="empty"></testsuites>')
+        with pytest.raises(ValueError, match="no <testsuite> elements"):
+            shard_xunit(report, tmp_path)
+        print("\n✓ Mock: Namespaced and empty reports")
+
+    def test_ingest_shards_into_test_runs(self, xunit_server, tmp_path):
+        """Test that shards are imported into their own Test Runs and all jobs are awaited"""
+        test_runs, server = xunit_server
+        server.failing_runs = {"Nightly-0001"}
+        report = _write_report(tmp_path / "junit.xml", suites=6)
+        suite_size = max(len(suite) for _, suite in iter_suites(report))
+
+        result = test_runs.ingest_x_unit_test_results(
+            "MyProjectId", "Nightly", report, shard_size=2 * suite_size + 200, max_workers=3,
+            test_run_attributes={"title": "Nightly", "type": "automated"}, timeout=5)
+
+        assert result.test_run_ids == ["Nightly-0000", "Nightly-0001", "Nightly-0002"]
+        assert not result.ok
+        assert [(f.test_run_id, f.error) for f in result.failed] == [
+            ("Nightly-0001", "Test Run not created: Nightly-0001 exists")]
+        assert sorted(server.imported) == ["Nightly-0000", "Nightly-0002"]
+        assert all(shard_import.job.ok for shard_import in result.imports if shard_import.test_run_id != "Nightly-0001")
+        suites = [s.get("name") for s in ET.fromstring(server.imported["Nightly-0002"])]
+        assert suites == ["suite-4", "suite-5"]
+        assert {"id": "Nightly-0000", "title": "Nightly", "type": "automated"} in server.created
+        assert list(tmp_path.iterdir()) == [report]
+        print("\n✓ Mock: Shards imported in parallel")
+
+    def test_ingest_without_sharding(self, xunit_server, tmp_path):
+        """Test that without shard_size the report is imported whole into the Test Run"""
+        test_runs, server = xunit_server
+        report = _write_report(tmp_path / "junit.xml", suites=2)
+
+        result = test_runs.ingest_x_unit_test_results("MyProjectId", "MyTestRunId", report, timeout=5)
+
+        assert result.ok and result.test_run_ids == ["MyTestRunId"]
+        assert result.imports[0].job.job_id == "Job-MyTestRunId"
+        assert server.imported == {"MyTestRunId": report.read_bytes()} and server.created == []
+        print("\n✓ Mock: Report imported whole")
@@ -0,0 +1,156 @@
+"""
+Pytest tests for bulk_post_test_step_results method.
+
+Tests the bulk_post_test_step_results method from TestStepResults class.
+Uses mocks to avoid making real API calls.
+
+Run with:
+    pytest test_bulk_post_test_step_results.py -v
+"""
+import pytest
+import requests
+from unittest.mock import Mock
+
+
+def _created_response(url, json=None, **kwargs):
+    """Build a 201 response with one step result ID per posted item"""
+    record = url.split('/testrecords/')[1].split('/teststepresults')[0]
+    mock_response = Mock()
+    mock_response.status_code = 201
+    mock_response.json.return_value = {
+        "data": [
+            {"type": "teststep_results", "id": f"MyProjectId/MyTestRunId/{record}/{step}"}
+            for step in range(1, len(json['data']) + 1)
+        ]
+    }
+    return mock_response
+
+
+def _response(status_code):
+    """Build a response with the given status code"""
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.headers = {}
+    mock_response.json.return_value = {}
+    mock_response.text = ""
+    return mock_response
+
+
+class TestBulkPostTestStepResultsMocked:
+    """Unit tests for bulk_post_test_step_results method using mocks"""
+
+    def test_bulk_post_one_call_per_test_record(self, mock_test_step_results_api):
+        """Test that step results of every test record are posted in one call"""
+        mock_test_step_results_api._session.post.side_effect = _created_response
+        step_results = {
+            ("MyProjectId", "TC-1", 0): [{"attributes": {"result": "passed"}}, {"attributes": {"result": "failed"}}],
+            "MyProjectId/TC-2/0": [{"attributes": {"result": "passed"}}],
+            "MyProjectId/MyTestRunId/MyProjectId/TC-3/1": [{"attributes": {"result": "blocked"}}],
+        }
+
+        result = mock_test_step_results_api.bulk_post_test_step_results(
+            "MyProjectId", "MyTestRunId", step_results, max_workers=3
+        )
+
+        assert result.ok
+        assert result.requests_sent == 3
+        assert result.ids == [
+            "MyProjectId/MyTestRunId/MyProjectId/TC-1/0/1",
+            "MyProjectId/MyTestRunId/MyProjectId/TC-1/0/2",
+            "MyProjectId/MyTestRunId/MyProjectId/TC-2/0/1",
+            "MyProjectId/MyTestRunId/MyProjectId/TC-3/1/1",
+        ]
+        urls = sorted(call[0][0] for call in mock_test_step_results_api._session.post.call_args_list)
+        assert urls[2].endswith(
+            "projects/MyProjectId/testruns/MyTestRunId/testrecords/MyProjectId/TC-3/1/teststepresults")
+        sent = mock_test_step_results_api._session.post.call_args_list[0][1]['json']['data']
+        assert all(item['type'] == 'teststep_results' for item in sent)
+        print("\n✓ Mock: One call per test record")
+
+    def test_bulk_post_batches_updates(self, mock_test_step_results_api):
+        """Test that step results with IDs are sent through patch_test_step_results"""
+        mock_test_step_results_api._session.post.side_effect = _created_response
+        mock_test_step_results_api._session.patch.return_value = _response(204)
+        step_results = [
+            (("MyProjectId", "TC-1", "0"), [
+                {"id": "MyProjectId/MyTestRunId/MyProjectId/TC-1/0/1", "attributes": {"result": "passed"}},
+                {"id": "MyProjectId/MyTestRunId/MyProjectId/TC-1/0/2", "attributes": {"result": "passed"}},
+                {"attributes": {"result": "failed"}},
+            ]),
+        ]
+
+        result = mock_test_step_results_api.bulk_post_test_step_results(
+            "MyProjectId", "MyTestRunId", step_results
+        )
+
+        assert [item.status for item in result.items] == ['updated', 'updated', 'created']
+        mock_test_step_results_api._session.patch.assert_called_once()
+        patched = mock_test_step_results_api._session.patch.call_args[1]['json']['data']
+        assert len(patched) == 2
+        posted = mock_test_step_results_api._session.post.call_args[1]['json']['data']
+        assert posted == [{"type": "teststep_results", "attributes": {"result": "failed"}}]
+        print("\n✓ Mock: Updates batched into patch_test_step_results")
+
+    def test_bulk_post_retries_transient_failures(self, mock_test_step_results_api):
+        """Test that transient failures are retried"""
+        mock_test_step_results_api._session.post.side_effect = [
+            _response(503),
+            requests.exceptions.ConnectTimeout("Connection to test timed out"),
+            _created_response(
+                "https://test/projects/MyProjectId/testruns/MyTestRunId/testrecords/MyProjectId/TC-1/0/teststepresults",
+                json={"data": [{}]}
+            ),
+        ]
+
+        result = mock_test_step_results_api.bulk_post_test_step_results(
+            "MyProjectId", "MyTestRunId", {"MyProjectId/TC-1/0": [{"attributes": {"result": "passed"}}]},
+            retries=3, backoff=0
+        )
+
+        assert result.ok
+        assert result.requests_sent == 3
+        print("\n✓ Mock: Transient failures retried")
+
+    def test_bulk_post_does_not_retry_ambiguous_creates(self, mock_test_step_results_api):
+        """Test that creates are not retried when the server may already have applied them, updates are"""
+        record = {"MyProjectId/TC-1/0": [{"attributes": {"result": "passed"}}]}
+        for failure in (_response(502), requests.ReadTimeout("Read timed out"),
+                        requests.ConnectionError("Connection reset by peer")):
+            mock_test_step_results_api._session.post.reset_mock()
+            mock_test_step_results_api._session.post.side_effect = [failure]
+
+            result = mock_test_step_results_api.bulk_post_test_step_results(
+                "MyProjectId", "MyTestRunId", record, retries=3, backoff=0)
+
+            assert not result.ok and result.requests_sent == 1
+        mock_test_step_results_api._session.patch.side_effect = [_response(502), _response(204)]
+
+        result = mock_test_step_results_api.bulk_post_test_step_results(
+            "MyProjectId", "MyTestRunId",
+            {"MyProjectId/TC-1/0": [{"id": "MyProjectId/MyTestRunId/MyProjectId/TC-1/0/1",
+                                     "attributes": {"result": "failed"}}]},
+            retries=3, backoff=0)
+
+        assert result.ok and result.requests_sent == 2
+        print("\n✓ Mock: Ambiguous creates not retried")
+
+    def test_bulk_post_gives_up_after_retries(self, mock_test_step_results_api):
+        """Test that a persistent failure is reported after the last retry"""
+        mock_test_step_results_api._session.post.return_value = _response(503)
+
+        result = mock_test_step_results_api.bulk_post_test_step_results(
+            "MyProjectId", "MyTestRunId", {"MyProjectId/TC-1/0": [{"attributes": {"result": "passed"}}]},
+            retries=2, backoff=0
+        )
+
+        assert result.failed[0].status_code == 503
+        assert result.requests_sent == 3
+        print("\n✓ Mock: Failure reported after retries")
+
+    def test_bulk_post_invalid_record_key(self, mock_test_step_results_api):
+        """Test that an invalid test record reference raises ValueError"""
+        with pytest.raises(ValueError):
+            mock_test_step_results_api.bulk_post_test_step_results(
+                "MyProjectId", "MyTestRunId", {"TC-1": [{"attributes": {"result": "passed"}}]}
+            )
+        print("\n✓ Mock: Invalid test record reference rejected")
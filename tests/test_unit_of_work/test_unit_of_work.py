@@ -0,0 +1,200 @@
+"""
+Pytest tests for UnitOfWork class.
+
+Tests queueing, coalescing, flushing thresholds and dependency ordering
+of the write-behind unit of work.
+Uses mocks to avoid making real API calls.
+
+Run with:
+    pytest test_unit_of_work.py -v
+"""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from modules.unit_of_work import UnitOfWork
+
+
+def _response(status_code, body=None):
+    """Build a response with the given status code and JSON body"""
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.json.return_value = body or {}
+    return mock_response
+
+
+@pytest.fixture
+def mock_api(mock_work_items_api, mock_linked_work_items_api):
+    """API-like object exposing mocked modules"""
+    return SimpleNamespace(work_items=mock_work_items_api, linked_work_items=mock_linked_work_items_api)
+
+
+class TestUnitOfWorkMocked:
+    """Unit tests for UnitOfWork using mocks"""
+
+    def test_unit_of_work_coalesces_and_flushes_on_close(self, mock_api):
+        """Test that updates of one work item are merged and sent on close"""
+        mock_api.work_items._session.patch.return_value = _response(204)
+
+        with UnitOfWork(mock_api, max_delay=60) as uow:
+            first = uow.patch_work_item("MyProjectId", "WI-1", attributes={"status": "open"})
+            second = uow.patch_work_item("MyProjectId", "WI-1", attributes={"title": "New"})
+            other = uow.patch_work_item("MyProjectId", "WI-2", attributes={"status": "done"})
+            mock_api.work_items._session.patch.assert_not_called()
+
+        mock_api.work_items._session.patch.assert_called_once()
+        sent = mock_api.work_items._session.patch.call_args[1]['json']['data']
+        assert sent == [
+            {"type": "workitems", "id": "MyProjectId/WI-1", "attributes": {"status": "open", "title": "New"}},
+            {"type": "workitems", "id": "MyProjectId/WI-2", "attributes": {"status": "done"}},
+        ]
+        assert first.result().ok and second.result() is first.result()
+        assert other.result().id == "MyProjectId/WI-2"
+        assert uow.requests_sent == 1
+        print("\n✓ Mock: Updates coalesced and flushed on close")
+
+    def test_unit_of_work_flushes_on_size(self, mock_api):
+        """Test that a full buffer is flushed without waiting for the delay"""
+        mock_api.work_items._session.patch.return_value = _response(204)
+        uow = UnitOfWork(mock_api, max_batch_size=3, max_delay=60)
+        try:
+            futures = [uow.patch_work_item("MyProjectId", f"WI-{i}", attributes={"status": "done"})
+                       for i in range(3)]
+            assert all(future.result(timeout=5).ok for future in futures)
+        finally:
+            uow.close()
+        print("\n✓ Mock: Buffer flushed when full")
+
+    def test_unit_of_work_flushes_on_delay(self, mock_api):
+        """Test that queued mutations are flushed after max_delay"""
+        mock_api.work_items._session.patch.return_value = _response(204)
+        uow = UnitOfWork(mock_api, max_delay=0.05)
+        try:
+            future = uow.patch_work_item("MyProjectId", "WI-1", attributes={"status": "done"})
+            assert future.result(timeout=5).status == 'updated'
+        finally:
+            uow.close()
+        print("\n✓ Mock: Buffer flushed after delay")
+
+    def test_unit_of_work_orders_dependent_operations(self, mock_api):
+        """Test that work items are created before links referencing them"""
+        calls = []
+
+        def post(url, json=None, **kwargs):
+            calls.append(url)
+            if url.endswith("/workitems"):
+                return _response(201, {"data": [{"type": "workitems", "id": "MyProjectId/WI-42"}]})
+            return _response(201, {"data": [{"type": "linkedworkitems",
+                                             "id": "MyProjectId/WI-42/relates_to/MyProjectId/WI-1"}]})
+
+        mock_api.work_items._session.post.side_effect = post
+        mock_api.linked_work_items._session.post.side_effect = post
+
+        with UnitOfWork(mock_api, max_delay=60) as uow:
+            link = uow.post_linked_work_item("MyProjectId", None, {"attributes": {"role": "relates_to"}})
+            created = uow.post_work_item("MyProjectId", {"attributes": {"type": "task", "title": "New"}})
+            dependent = uow.post_linked_work_item("MyProjectId", created, {
+                "attributes": {"role": "relates_to"},
+                "relationships": {"workItem": {"data": {"type": "workitems", "id": "MyProjectId/WI-1"}}}
+            })
+
+        assert created.result().id == "MyProjectId/WI-42"
+        assert dependent.result().ok
+        assert calls[0].endswith("projects/MyProjectId/workitems")
+        assert any(url.endswith("projects/MyProjectId/workitems/WI-42/linkedworkitems") for url in calls[1:])
+        assert link.result().ok
+        print("\n✓ Mock: Dependent operations ordered")
+
+    def test_unit_of_work_creates_test_records_before_updates(self, mock_test_records_api):
+        """Test that queued test record creations are sent before queued test record updates"""
+        calls = []
+        session = mock_test_records_api._session
+        session.post.side_effect = lambda url, **kwargs: calls.append("post") or _response(
+            201, {"data": [{"type": "testrecords", "id": "MyProjectId/MyTestRunId/MyProjectId/TC-2/0"}]})
+        session.patch.side_effect = lambda url, **kwargs: calls.append("patch") or _response(204)
+
+        with UnitOfWork(SimpleNamespace(test_records=mock_test_records_api), max_delay=60) as uow:
+            updated = uow.add('patch_test_records', "MyProjectId", "MyTestRunId",
+                              item={"id": "MyProjectId/MyTestRunId/MyProjectId/TC-1/0",
+                                    "attributes": {"result": "passed"}})
+            created = uow.add('post_test_records', "MyProjectId", "MyTestRunId",
+                              item={"attributes": {"result": "failed"}})
+
+        assert calls == ["post", "patch"]
+        assert created.result().ok and updated.result().ok
+        print("\n✓ Mock: Test records created before updates")
+
+    def test_unit_of_work_failed_dependency(self, mock_api):
+        """Test that operations depending on a failed creation fail"""
+        mock_api.work_items._session.post.return_value = _response(
+            403, {"errors": [{"status": "403", "detail": "Not allowed"}]}
+        )
+
+        with UnitOfWork(mock_api, max_delay=60) as uow:
+            created = uow.post_work_item("MyProjectId", {"attributes": {"type": "task"}})
+            patched = uow.patch_work_item("MyProjectId", created, attributes={"status": "done"})
+
+        assert not created.result().ok
+        assert not patched.result(timeout=5).ok
+        assert "Not allowed" in patched.result().error
+        mock_api.work_items._session.patch.assert_not_called()
+        print("\n✓ Mock: Failed dependency propagated")
+
+    def test_unit_of_work_chained_operations_under_max_pending(self, mock_api):
+        """Test that updates chained on created work items do not wait for max_pending"""
+        counter = iter(range(1, 10000))
+
+        def post(url, json=None, **kwargs):
+            return _response(201, {"data": [{"type": "workitems", "id": f"MyProjectId/WI-{next(counter)}"}
+                                            for _ in json['data']]})
+
+        mock_api.work_items._session.post.side_effect = post
+        mock_api.work_items._session.patch.return_value = _response(204)
+        uow = UnitOfWork(mock_api, max_batch_size=5, max_pending=10, max_delay=0.01)
+        patched = []
+        try:
+            for i in range(200):
+                created = uow.post_work_item("MyProjectId", {"attributes": {"type": "task", "title": f"T{i}"}})
+                patched.append(uow.patch_work_item("MyProjectId", created, attributes={"status": "done"}))
+            assert all(future.result(timeout=10).ok for future in patched)
+        finally:
+            uow.close()
+        print("\n✓ Mock: Chained operations not held back by max_pending")
+
+    def test_unit_of_work_chained_queue_error(self, mock_api):
+        """Test that an error queueing a chained operation resolves its future"""
+        mock_api.work_items._session.post.return_value = _response(
+            201, {"data": [{"type": "workitems", "id": "MyProjectId/WI-1"}]})
+
+        with UnitOfWork(mock_api, max_delay=60) as uow:
+            created = uow.post_work_item("MyProjectId", {"attributes": {"type": "task"}})
+            chained = uow._after(created, lambda wid: uow.add('delete_everything', item={"id": wid}))
+
+        assert not chained.result(timeout=5).ok
+        assert "Unknown operation" in chained.result().error
+        print("\n✓ Mock: Chained queue error resolves the future")
+
+    def test_unit_of_work_unknown_operation(self, mock_api):
+        """Test that an unknown operation raises ValueError"""
+        with UnitOfWork(mock_api) as uow:
+            with pytest.raises(ValueError):
+                uow.add('delete_everything', "MyProjectId", item={"id": "x"})
+        with pytest.raises(RuntimeError):
+            uow.post_work_item("MyProjectId", {"attributes": {}})
+        print("\n✓ Mock: Unknown operation rejected")
+
+    def test_unit_of_work_rejects_invalid_items(self, mock_api):
+        """Test that with validation enabled only the invalid mutation of a batch fails"""
+        mock_api.work_items.validate_requests = True
+        mock_api.work_items._session.patch.return_value = _response(204)
+
+        with UnitOfWork(mock_api, max_delay=60) as uow:
+            valid = uow.patch_work_item("MyProjectId", "WI-1", attributes={"title": "New"})
+            invalid = uow.patch_work_item("MyProjectId", "WI-2", attributes={"title": 3})
+
+        assert valid.result(timeout=5).ok
+        assert not invalid.result().ok
+        assert invalid.result().error.startswith("Invalid item: ")
+        sent = mock_api.work_items._session.patch.call_args[1]['json']['data']
+        assert [item["id"] for item in sent] == ["MyProjectId/WI-1"]
+        print("\n✓ Mock: Invalid mutation rejected on its own")
@@ -0,0 +1,230 @@
+"""
+Pytest tests for client-side request body validation.
+
+Tests that request_schemas.py is reproducible from data/openapi_official.json,
+the compiled validators and their cache, validation of single requests and
+per-item validation in bulk methods (invalid items are never sent).
+Uses mocks to avoid hitting real API.
+
+Run with:
+    pytest test_request_validation.py -v
+"""
+import json
+from pathlib import Path
+import pytest
+from unittest.mock import Mock
+
+from modules.bulk import bulk_delete
+from modules.schema_generator import generate_request_schemas, main
+from modules.validation import (ValidationError, compile_schema, item_validator, request_validator,
+                                schema_checker)
+
+
+ROOT = Path(__file__).resolve().parents[2]
+SPEC = ROOT / "data" / "openapi_official.json"
+REQUEST_SCHEMAS = ROOT / "polarion_rest_api" / "modules" / "request_schemas.py"
+
+
+def _work_item(title="Title", work_item_type="task"):
+    return {"type": "workitems", "attributes": {"type": work_item_type, "title": title}}
+
+
+def _created_response(body, resource_type="workitems"):
+    response = Mock(status_code=201)
+    response.json.return_value = {
+        "data": [{"type": resource_type, "id": f"TEST_PROJECT/WI-{n}"} for n in range(len(body["data"]))]
+    }
+    return response
+
+
+def _test_record(result="passed"):
+    return {"attributes": {"result": result},
+            "relationships": {"testCase": {"data": {"type": "workitems", "id": "TEST_PROJECT/TC-1"}}}}
+
+
+class TestRequestValidation:
+    """Unit tests for request validation using mocks"""
+
+    def test_request_schemas_reproducible_from_spec(self, tmp_path):
+        """Test that generating from the specification gives the committed request_schemas.py"""
+        spec = json.loads(SPEC.read_text(encoding="utf-8"))
+
+        source = generate_request_schemas(spec)
+
+        assert source == generate_request_schemas(spec)
+        assert source == REQUEST_SCHEMAS.read_text(encoding="utf-8")
+        output = tmp_path / "request_schemas.py"
+        assert main([str(SPEC), "-o", str(output), "--check"]) == 1
+        assert main([str(SPEC), "-o", str(output)]) == 0
+        assert main([str(SPEC), "-o", str(output), "--check"]) == 0
+        print("\n✓ Mock: request_schemas.py reproducible from the specification")
+
+    def test_endpoints_resolved_to_schemas(self):
+        """Test that endpoints are matched to the request schema of their operation"""
+        assert request_validator("POST", "projects/P/workitems").schema == "workitemsListPostRequest"
+        assert request_validator("PATCH", "projects/P/testruns/R/testrecords").schema == "testrecordsListPatchRequest"
+        assert request_validator("POST", "/projects/P/spaces/S/documents").schema == "documentsListPostRequest"
+        assert request_validator("GET", "projects/P/workitems") is None
+        assert request_validator("POST", "unknown/endpoint") is None
+        print("\n✓ Mock: Endpoints resolved to request schemas")
+
+    def test_validators_compiled_once(self):
+        """Test that validators and schema checkers are cached"""
+        assert request_validator("POST", "projects/P/workitems") is request_validator("POST", "projects/P/workitems")
+        assert request_validator("POST", "projects/A/workitems") is request_validator("POST", "projects/B/workitems")
+        assert schema_checker("workitemsListPostRequest") is schema_checker("workitemsListPostRequest")
+        print("\n✓ Mock: Validators compiled once")
+
+    def test_schema_keywords(self):
+        """Test the checked schema keywords and the error paths"""
+        check = compile_schema({
+            "type": "object",
+            "required": ["name"],
+            "properties": {
+                "name": {"type": "string"},
+                "count": {"type": "integer", "nullable": True},
+                "kind": {"type": "string", "enum": ["a", "b"]},
+                "due": {"type": "string", "format": "date"},
+                "tags": {"type": "array", "maxItems": 2, "items": {"type": "string"}},
+            },
+        })
+        errors = []
+
+        check({"count": True, "kind": "c", "due": "tomorrow", "tags": ["x", 1, "z"], "custom": 1}, "", errors)
+
+        assert errors == [
+            ("", "missing required property 'name'"),
+            ("count", "expected integer, got bool"),
+            ("kind", "'c' is not one of ['a', 'b']"),
+            ("due", "'tomorrow' is not a valid date"),
+            ("tags", "expected at most 2 items, got 3"),
+            ("tags[1]", "expected string, got int"),
+        ]
+        errors = []
+        check({"name": "n", "count": None, "kind": "a", "due": "2026-01-01", "tags": []}, "", errors)
+        assert errors == []
+        print("\n✓ Mock: Schema keywords checked")
+
+    def test_invalid_items_reported_with_paths(self):
+        """Test the error paths of an invalid request body"""
+        validator = request_validator("POST", "projects/P/workitems")
+        body = {"data": [_work_item(), {"type": "workitems", "attributes": {"title": 3}}]}
+
+        with pytest.raises(ValidationError) as error:
+            validator.validate(body)
+
+        assert error.value.schema == "workitemsListPostRequest"
+        assert error.value.errors == [
+            ("data[1].attributes", "missing required property 'type'"),
+            ("data[1].attributes.title", "expected string, got int"),
+        ]
+        assert "data[1].attributes.title: expected string, got int" in str(error.value)
+        assert item_validator("POST", "projects/P/workitems")(_work_item()) == []
+        print("\n✓ Mock: Invalid items reported with paths")
+
+    @pytest.mark.parametrize("fixture, call, body", [
+        ("mock_work_items_api", lambda api, body: api.post_work_items("P", body),
+         {"data": [{"type": "workitems", "attributes": {"title": ["not", "a", "string"]}}]}),
+        ("mock_test_records_api", lambda api, body: api.patch_test_records("P", "R", body),
+         {"data": [{"type": "testrecords", "id": "P/R/P/TC-1/0", "attributes": {"duration": "fast"}}]}),
+        ("mock_documents_api", lambda api, body: api.post_documents("P", "S", body),
+         {"data": [{"type": "documents", "attributes": {"moduleName": 1}}]}),
+    ])
+    def test_invalid_body_not_sent(self, request, fixture, call, body):
+        """Test that an invalid body raises before any request is sent"""
+        api = request.getfixturevalue(fixture)
+        api.validate_requests = True
+
+        with pytest.raises(ValidationError):
+            call(api, body)
+
+        assert not api._session.post.called and not api._session.patch.called
+        print(f"\n✓ Mock: Invalid body not sent ({fixture})")
+
+    def test_validation_disabled_by_default(self, mock_work_items_api):
+        """Test that bodies are sent unchecked unless validation is enabled"""
+        mock_work_items_api._session.post.return_value = Mock(status_code=400)
+
+        response = mock_work_items_api.post_work_items("P", {"data": [{"attributes": {"title": 3}}]})
+
+        assert response.status_code == 400
+        assert mock_work_items_api._session.post.called
+        print("\n✓ Mock: Validation disabled by default")
+
+    def test_bulk_post_skips_invalid_items(self, mock_work_items_api, test_params):
+        """Test that invalid bulk items fail locally and only valid items are sent"""
+        mock_work_items_api.validate_requests = True
+        mock_work_items_api._session.post.side_effect = lambda url, json=None, **kwargs: _created_response(json)
+        items = [_work_item(f"Item {n}") for n in range(10)]
+        items[3] = {"attributes": {"type": "task", "title": 17}}
+        items[7] = {"attributes": {"title": "No type"}}
+
+        result = mock_work_items_api.bulk_post_work_items(test_params['project_id'], items, chunk_size=5,
+                                                          max_workers=1)
+
+        assert [failure.index for failure in result.failed] == [3, 7]
+        assert result.failed[0].error == "Invalid item: attributes.title: expected string, got int"
+        assert result.failed[1].error == "Invalid item: attributes: missing required property 'type'"
+        assert len(result.succeeded) == 8
+        sent = [item for call in mock_work_items_api._session.post.call_args_list for item in call[1]['json']['data']]
+        assert len(sent) == 8 and items[3] not in sent
+        print("\n✓ Mock: Invalid bulk items not sent")
+
+    def test_bulk_all_invalid_sends_nothing(self, mock_work_items_api, test_params):
+        """Test that a chunk of invalid items sends no request"""
+        mock_work_items_api.validate_requests = True
+
+        result = mock_work_items_api.bulk_patch_work_items(
+            test_params['project_id'], [{"id": "TEST_PROJECT/WI-1", "attributes": {"title": 1}}])
+
+        assert result.failed[0].id == "TEST_PROJECT/WI-1"
+        assert result.requests_sent == 0
+        assert not mock_work_items_api._session.patch.called
+        print("\n✓ Mock: No request for invalid items")
+
+    def test_ingest_test_records_skips_invalid_items(self, mock_test_records_api, test_params):
+        """Test that an invalid ingested record fails alone, with a path relative to the record"""
+        mock_test_records_api.validate_requests = True
+        mock_test_records_api._session.post.side_effect = (
+            lambda url, json=None, **kwargs: _created_response(json, "testrecords"))
+        records = [_test_record() for _ in range(8)]
+        records[7] = _test_record(result=7)
+
+        result = mock_test_records_api.ingest_test_records(test_params['project_id'], "MyTestRunId", records,
+                                                           chunk_size=2, max_workers=1)
+
+        assert [failure.index for failure in result.failed] == [7]
+        assert result.failed[0].error == "Invalid item: attributes.result: expected string, got int"
+        sent = [item for call in mock_test_records_api._session.post.call_args_list for item in call[1]['json']['data']]
+        assert len(sent) == 7
+        print("\n✓ Mock: Invalid ingested record not sent")
+
+    def test_bulk_links_and_deletes_skip_invalid_items(self, mock_linked_work_items_api, mock_work_items_api,
+                                                       test_params):
+        """Test that bulk link creation and bulk deletes reject invalid items one by one"""
+        project_id = test_params['project_id']
+        mock_linked_work_items_api.validate_requests = True
+        mock_linked_work_items_api._session.post.side_effect = (
+            lambda url, json=None, **kwargs: _created_response(json, "linkedworkitems"))
+
+        result = mock_linked_work_items_api.bulk_post_linked_work_items(
+            project_id, [("WI-1", "relates_to", "WI-2"), ("WI-1", 5, "WI-3")], skip_existing=False)
+
+        assert [(failure.index, failure.error) for failure in result.failed] == [
+            (1, "Invalid item: attributes.role: expected string, got int")]
+        assert result.failed[0].id == f"{project_id}/WI-1/5/{project_id}/WI-3"
+        assert len(mock_linked_work_items_api._session.post.call_args[1]['json']['data']) == 1
+
+        mock_work_items_api.validate_requests = True
+        mock_work_items_api._session.request.return_value = Mock(status_code=204)
+
+        result = bulk_delete(mock_work_items_api.delete_work_items, project_id,
+                             resources=[f"{project_id}/WI-1", 5], resource_type="workitems")
+
+        assert [(failure.index, failure.error) for failure in result.failed] == [
+            (1, "Invalid item: id: expected string, got int")]
+        assert mock_work_items_api._session.request.call_args[1]['json'] == {
+            "data": [{"type": "workitems", "id": f"{project_id}/WI-1"}]}
+        with pytest.raises(ValidationError):
+            mock_work_items_api.delete_work_items(project_id, {"data": [{"type": "workitems", "id": 5}]})
+        print("\n✓ Mock: Invalid links and deletes not sent")
@@ -0,0 +1,124 @@
+"""
+Pytest tests for bulk_patch_work_items method.
+
+Tests the bulk_patch_work_items method from WorkItems class.
+Uses mocks to avoid making real API calls.
+
+Run with:
+    pytest test_bulk_patch_work_items.py -v
+"""
+import pytest
+from unittest.mock import Mock
+
+from modules.bulk import UpdateCollector
+
+
+@pytest.fixture
+def no_content_response():
+    """Create a 204 No Content response"""
+    mock_response = Mock()
+    mock_response.status_code = 204
+    return mock_response
+
+
+class TestBulkPatchWorkItemsMocked:
+    """Unit tests for bulk_patch_work_items method using mocks"""
+
+    def test_bulk_patch_work_items_coalesces_updates(self, mock_work_items_api, test_params,
+                                                     no_content_response):
+        """Test that several updates of the same work item are merged into one payload"""
+        mock_work_items_api._session.patch.return_value = no_content_response
+        project_id = test_params['project_id']
+        updates = [
+            {"id": f"{project_id}/WI-1", "attributes": {"status": "open", "title": "Old"}},
+            {"id": f"{project_id}/WI-2", "attributes": {"status": "done"}},
+            {"id": f"{project_id}/WI-1", "attributes": {"title": "New"}},
+            {"id": f"{project_id}/WI-1", "relationships": {
+                "assignee": {"data": [{"type": "users", "id": "jdoe"}]}}},
+        ]
+
+        result = mock_work_items_api.bulk_patch_work_items(project_id, updates)
+
+        assert result.ok
+        assert result.requests_sent == 1
+        assert result.requests_saved == 3
+        sent = mock_work_items_api._session.patch.call_args[1]['json']['data']
+        assert sent == [
+            {
+                "type": "workitems",
+                "id": f"{project_id}/WI-1",
+                "attributes": {"status": "open", "title": "New"},
+                "relationships": {"assignee": {"data": [{"type": "users", "id": "jdoe"}]}}
+            },
+            {"type": "workitems", "id": f"{project_id}/WI-2", "attributes": {"status": "done"}}
+        ]
+        assert result.ids == [f"{project_id}/WI-1", f"{project_id}/WI-2"]
+        print("\n✓ Mock: Updates coalesced into one payload per work item")
+
+    def test_bulk_patch_work_items_groups_requests(self, mock_work_items_api, test_params,
+                                                   no_content_response):
+        """Test that merged updates are grouped into list requests of the configured size"""
+        mock_work_items_api._session.patch.return_value = no_content_response
+        updates = UpdateCollector('workitems')
+        for i in range(25):
+            updates.add(f"{test_params['project_id']}/WI-{i}", attributes={"status": "done"})
+
+        result = mock_work_items_api.bulk_patch_work_items(
+            test_params['project_id'],
+            updates,
+            chunk_size=10,
+            max_workers=2,
+            workflow_action="close"
+        )
+
+        assert result.requests_sent == 3
+        assert mock_work_items_api._session.patch.call_count == 3
+        call_args = mock_work_items_api._session.patch.call_args
+        assert call_args[1]['params']['workflowAction'] == 'close'
+        print("\n✓ Mock: Updates grouped into list requests")
+
+    def test_bulk_patch_work_items_dry_run(self, mock_work_items_api, test_params):
+        """Test that dry-run mode sends nothing and reports the requests saved"""
+        updates = [{"id": f"{test_params['project_id']}/WI-{i % 5}", "attributes": {"title": str(i)}}
+                   for i in range(40)]
+
+        result = mock_work_items_api.bulk_patch_work_items(
+            test_params['project_id'],
+            updates,
+            chunk_size=2,
+            dry_run=True
+        )
+
+        mock_work_items_api._session.patch.assert_not_called()
+        assert result.requests_sent == 0
+        assert result.requests_saved == 37
+        assert len(result) == 5
+        assert all(item.status == 'skipped' for item in result.items)
+        print("\n✓ Mock: Dry run reports requests saved")
+
+    def test_bulk_patch_work_items_missing_id(self, mock_work_items_api, test_params):
+        """Test that an update without ID raises ValueError"""
+        with pytest.raises(ValueError):
+            mock_work_items_api.bulk_patch_work_items(
+                test_params['project_id'],
+                [{"attributes": {"title": "No ID"}}]
+            )
+        print("\n✓ Mock: Update without ID rejected")
+
+    def test_bulk_patch_work_items_not_found(self, mock_work_items_api, test_params):
+        """Test that a failed request is reported per work item"""
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_response.json.return_value = {
+            "errors": [{"status": "404", "title": "Not Found", "detail": "Work item not found"}]
+        }
+        mock_work_items_api._session.patch.return_value = mock_response
+
+        result = mock_work_items_api.bulk_patch_work_items(
+            test_params['project_id'],
+            [{"id": f"{test_params['project_id']}/WI-404", "attributes": {"title": "Missing"}}]
+        )
+
+        assert result.failed[0].status_code == 404
+        assert result.failed[0].error == "Work item not found"
+        print("\n✓ Mock: Not found error reported per work item")
@@ -0,0 +1,148 @@
+"""
+Pytest tests for bulk_post_work_items method.
+
+Tests the bulk_post_work_items method from WorkItems class.
+Uses mocks to avoid making real API calls.
+
+Run with:
+    pytest test_bulk_post_work_items.py -v
+"""
+import pytest
+import requests
+from unittest.mock import Mock
+
+
+def _created_response(json_body, **kwargs):
+    """Build a 201 response echoing an ID for every posted work item"""
+    mock_response = Mock()
+    mock_response.status_code = 201
+    mock_response.json.return_value = {
+        "data": [
+            {"type": "workitems", "id": f"TEST_PROJECT/{item['attributes']['title']}"}
+            for item in json_body['data']
+        ]
+    }
+    return mock_response
+
+
+def _bad_request_response():
+    """Build a 400 response with a JSON:API error"""
+    mock_response = Mock()
+    mock_response.status_code = 400
+    mock_response.json.return_value = {
+        "errors": [{"status": "400", "title": "Bad Request", "detail": "Invalid work item type"}]
+    }
+    return mock_response
+
+
+def _post_side_effect(bad_titles=()):
+    """Session.post side effect rejecting every request containing a bad title"""
+    def side_effect(url, json=None, **kwargs):
+        titles = [item['attributes']['title'] for item in json['data']]
+        if any(title in bad_titles for title in titles):
+            return _bad_request_response()
+        return _created_response(json)
+    return side_effect
+
+
+class TestBulkPostWorkItemsMocked:
+    """Unit tests for bulk_post_work_items method using mocks"""
+
+    def test_bulk_post_work_items_chunks_requests(self, mock_work_items_api, test_params):
+        """Test that work items are split into chunks of the configured size"""
+        mock_work_items_api._session.post.side_effect = _post_side_effect()
+        work_items = [{"attributes": {"type": "task", "title": f"WI-{i}"}} for i in range(25)]
+
+        result = mock_work_items_api.bulk_post_work_items(
+            test_params['project_id'],
+            work_items,
+            chunk_size=10,
+            max_workers=3
+        )
+
+        assert result.ok
+        assert result.requests_sent == 3
+        assert mock_work_items_api._session.post.call_count == 3
+        sizes = sorted(len(call[1]['json']['data']) for call in mock_work_items_api._session.post.call_args_list)
+        assert sizes == [5, 10, 10]
+        print("\n✓ Mock: Work items sent in chunks")
+
+    def test_bulk_post_work_items_ids_in_input_order(self, mock_work_items_api, test_params):
+        """Test that created IDs are mapped back to input order"""
+        mock_work_items_api._session.post.side_effect = _post_side_effect()
+        work_items = [{"attributes": {"type": "task", "title": f"WI-{i}"}} for i in range(50)]
+
+        result = mock_work_items_api.bulk_post_work_items(
+            test_params['project_id'],
+            work_items,
+            chunk_size=7,
+            max_workers=4
+        )
+
+        assert result.ids == [f"TEST_PROJECT/WI-{i}" for i in range(50)]
+        assert [item.index for item in result.items] == list(range(50))
+        print("\n✓ Mock: Created IDs returned in input order")
+
+    def test_bulk_post_work_items_accepts_generator(self, mock_work_items_api, test_params):
+        """Test that a generator is consumed and default type is added"""
+        mock_work_items_api._session.post.side_effect = _post_side_effect()
+        work_items = ({"attributes": {"type": "task", "title": f"WI-{i}"}} for i in range(5))
+
+        result = mock_work_items_api.bulk_post_work_items(test_params['project_id'], work_items)
+
+        assert len(result) == 5
+        sent = mock_work_items_api._session.post.call_args[1]['json']['data']
+        assert all(item['type'] == 'workitems' for item in sent)
+        print("\n✓ Mock: Generator input handled correctly")
+
+    def test_bulk_post_work_items_isolates_invalid_items(self, mock_work_items_api, test_params):
+        """Test that a rejected chunk is split so only invalid items fail"""
+        mock_work_items_api._session.post.side_effect = _post_side_effect(bad_titles={"WI-3"})
+        work_items = [{"attributes": {"type": "task", "title": f"WI-{i}"}} for i in range(8)]
+
+        result = mock_work_items_api.bulk_post_work_items(
+            test_params['project_id'],
+            work_items,
+            chunk_size=8
+        )
+
+        assert not result.ok
+        assert [item.index for item in result.failed] == [3]
+        assert result.failed[0].status_code == 400
+        assert result.failed[0].error == "Invalid work item type"
+        assert result.ids[3] is None
+        assert result.ids[4] == "TEST_PROJECT/WI-4"
+        assert len(result.succeeded) == 7
+        print("\n✓ Mock: Invalid work item isolated")
+
+    def test_bulk_post_work_items_server_error_fails_chunk(self, mock_work_items_api, test_params):
+        """Test that a non-splittable error fails every item of the chunk"""
+        mock_response = Mock()
+        mock_response.status_code = 503
+        mock_response.json.side_effect = ValueError("No JSON")
+        mock_response.text = "Service Unavailable"
+        mock_work_items_api._session.post.return_value = mock_response
+        work_items = [{"attributes": {"type": "task", "title": f"WI-{i}"}} for i in range(4)]
+
+        result = mock_work_items_api.bulk_post_work_items(test_params['project_id'], work_items)
+
+        assert len(result.failed) == 4
+        assert result.requests_sent == 1
+        assert "503" in result.failed[0].error
+        print("\n✓ Mock: Server error reported per item")
+
+    def test_bulk_post_work_items_connection_error(self, mock_work_items_api, test_params):
+        """Test that connection errors are reported per item instead of raised"""
+        mock_work_items_api._session.post.side_effect = requests.ConnectionError("Connection reset")
+        work_items = [{"attributes": {"type": "task", "title": "WI-1"}}]
+
+        result = mock_work_items_api.bulk_post_work_items(test_params['project_id'], work_items)
+
+        assert result.failed[0].error == "Connection reset"
+        print("\n✓ Mock: Connection error reported per item")
+
+    def test_bulk_post_work_items_invalid_chunk_size(self, mock_work_items_api, test_params):
+        """Test that an invalid chunk size raises ValueError"""
+        with pytest.raises(ValueError):
+            mock_work_items_api.bulk_post_work_items(test_params['project_id'], [], chunk_size=0)
+        print("\n✓ Mock: Invalid chunk size rejected")